@@ -0,0 +1,251 @@
+#!/usr/bin/env python
+"""Benchmark `stdlb.cached_property`'s storage modes: memory per instance, and cached-read latency.
+
+Each class has one int attribute `x`, and a cached property `y`:
+- `__dict__`: a plain class (the value is cached in the instance dict);
+- `__slots__` + `slot=`: the value is cached in a reserved slot;
+- `@dataclass(slots=True)` + `slot=`: the same, with the slot declared as a field;
+- `__slots__` + `__weakref__` (`table=True`): the value is cached in the property's id-keyed table.
+
+Memory is measured with `tracemalloc`: bytes allocated per instance, after creating
+`-n` instances and reading `y` on each (including the table's entries). Latency is
+the best of `-r` `timeit` runs of a cached read, vs. a plain read of `x`.
+
+Then, for a plain class with two attributes and three cached properties, with and
+without `reserve=True`: bytes per instance for `-l` instances, with none, one and
+all of the properties read.
+
+Then, the cost of validity checks: cached-read latency with `ttl=`, `depends_on=`
+and both (values cached with their checks in the instance `__dict__`), vs. the table
+and `__dict__` without.
+
+Finally, contention: `-t` threads read a property of the same `-m` fresh instances
+(each starting at a different one), whose computation takes ~2ms (a sleep, releasing the GIL, like I/O would), with
+`functools.cached_property`, `cached_property` and `cached_property(lock=True)`:
+wall time, and how many times values were computed.
+
+```bash
+python scripts/benchmark_cached_property.py
+python scripts/benchmark_cached_property.py -n 1000000 -l 100000 -t 16
+```
+"""
+import argparse
+import functools
+import sys
+import threading
+import time
+import timeit
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from stdlb.cached_property import cached_property  # noqa: E402
+
+
+class Dict:
+    def __init__(self, x):
+        self.x = x
+
+    @cached_property
+    def y(self):
+        return self.x + 1
+
+
+class Slots:
+    __slots__ = ('x', '_y')
+
+    def __init__(self, x):
+        self.x = x
+
+    @cached_property(slot='_y')
+    def y(self):
+        return self.x + 1
+
+
+@dataclass(slots=True)
+class DataclassSlots:
+    x: int
+    _y: int = field(init=False, repr=False, compare=False)
+
+    @cached_property(slot='_y')
+    def y(self):
+        return self.x + 1
+
+
+class WeakrefSlots:
+    __slots__ = ('x', '__weakref__')
+
+    def __init__(self, x):
+        self.x = x
+
+    @cached_property(table=True)
+    def y(self):
+        return self.x + 1
+
+
+def layout_class(reserve):
+    class Record:
+        def __init__(self, x):
+            self.x = x
+            self.name = str(x)
+
+        @cached_property(reserve=reserve)
+        def a(self):
+            return self.x + 1
+
+        @cached_property(reserve=reserve)
+        def b(self):
+            return self.x + 2
+
+        @cached_property(reserve=reserve)
+        def c(self):
+            return self.x + 3
+
+    return Record
+
+
+def checked_class(**kwargs):
+    class Checked:
+        def __init__(self, x):
+            self.x = x
+
+        @cached_property(**kwargs)
+        def y(self):
+            return self.x + 1
+
+    return Checked
+
+
+CHECKED = {
+    'cached_property': Dict,
+    'table (no checks)': WeakrefSlots,
+    'ttl=60': checked_class(ttl=60),
+    "depends_on=('x',)": checked_class(depends_on=('x',)),
+    "ttl=60, depends_on=('x',)": checked_class(ttl=60, depends_on=('x',)),
+}
+
+
+def contended_class(decorator):
+    class Resource:
+        computed = 0
+
+        def __init__(self, x):
+            self.x = x
+
+        @decorator
+        def value(self):
+            Resource.computed += 1
+            time.sleep(0.002)
+            return self.x
+
+    return Resource
+
+
+CONTENDED = {
+    'functools.cached_property': functools.cached_property,
+    'cached_property': cached_property,
+    'cached_property(lock=True)': cached_property(lock=True),
+}
+
+
+def contend(decorator, threads, n):
+    """`(seconds, computations)` for `threads` threads reading `value` of the same `n` new instances."""
+    if isinstance(decorator, cached_property):
+        decorator = cached_property(lock=decorator.lock)
+    cls = contended_class(decorator)
+    instances = [cls(i) for i in range(n)]
+    barrier = threading.Barrier(threads + 1)
+
+    def read(offset):
+        barrier.wait()
+        for instance in instances[offset:] + instances[:offset]:
+            instance.value
+
+    # Each thread starts at a different instance, and reaches the others' later
+    workers = [threading.Thread(target=read, args=(i * n // threads,)) for i in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start, cls.computed
+
+
+CLASSES = {
+    '__dict__': Dict,
+    '__slots__ + slot=': Slots,
+    '@dataclass(slots=True) + slot=': DataclassSlots,
+    '__slots__ + __weakref__ (table)': WeakrefSlots,
+}
+
+
+def bytes_per_instance(cls, n, names=('y',)):
+    # Values past the small-int cache are allocated, as most cached values would be
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [cls(i + 1000) for i in range(n)]
+    for instance in instances:
+        for name in names:
+            getattr(instance, name)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # The list itself holds one pointer per instance
+    return (after - before) / n - 8
+
+
+def read_ns(expr, instance, number, repeat):
+    return min(timeit.repeat(expr, globals={'o': instance}, number=number, repeat=repeat)) / number * 1e9
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('-n', '--instances', type=int, default=100_000, help='Instances per class, for memory (default: %(default)s)')
+    parser.add_argument('-N', '--reads', type=int, default=1_000_000, help='Reads per timing run (default: %(default)s)')
+    parser.add_argument('-l', '--layout-instances', type=int, default=1_000_000, help='Instances per class, for dict layout (default: %(default)s)')
+    parser.add_argument('-m', '--contended-instances', type=int, default=50, help='Instances, for contention (default: %(default)s)')
+    parser.add_argument('-t', '--threads', type=int, default=8, help='Threads, for contention (default: %(default)s)')
+    parser.add_argument('-r', '--runs', type=int, default=5, help='Timing runs (default: %(default)s)')
+    args = parser.parse_args(args)
+
+    print(f"Python {sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}; {args.instances:,} instances, best of {args.runs} x {args.reads:,} reads")
+    print(f"{'':<34} {'bytes/instance':>15} {'read y':>9} {'read x':>9}")
+    for label, cls in CLASSES.items():
+        size = bytes_per_instance(cls, args.instances)
+        instance = cls(1000)
+        instance.y
+        y = read_ns('o.y', instance, args.reads, args.runs)
+        x = read_ns('o.x', instance, args.reads, args.runs)
+        print(f"{label:<34} {size:>15.1f} {y:>7.1f}ns {x:>7.1f}ns")
+
+    print(f"\nDict layout; bytes/instance for {args.layout_instances:,} instances, by cached properties read")
+    print(f"{'':<34} {'none':>8} {'one':>8} {'all 3':>8}")
+    for label, reserve in (('default', False), ('reserve=True', True)):
+        sizes = [
+            bytes_per_instance(layout_class(reserve), args.layout_instances, names)
+            for names in ((), ('a',), ('a', 'b', 'c'))
+        ]
+        print(f"{label:<34} " + ' '.join(f"{size:>8.1f}" for size in sizes))
+
+    print(f"\nValidity checks; best of {args.runs} x {args.reads:,} cached reads")
+    print(f"{'':<34} {'read y':>9}")
+    for label, cls in CHECKED.items():
+        instance = cls(1000)
+        instance.y
+        print(f"{label:<34} {read_ns('o.y', instance, args.reads, args.runs):>7.1f}ns")
+
+    print(f"\nContention; {args.threads} threads reading {args.contended_instances} new instances' property (~2ms to compute)")
+    print(f"{'':<34} {'wall':>9} {'computed':>9} {'read':>9}")
+    for label, decorator in CONTENDED.items():
+        elapsed, computed = contend(decorator, args.threads, args.contended_instances)
+        instance = contended_class(decorator)(0)
+        instance.value
+        read = read_ns('o.value', instance, args.reads, args.runs)
+        print(f"{label:<34} {elapsed * 1000:>7.1f}ms {computed:>9} {read:>7.1f}ns")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+"""Benchmark IPython's per-keystroke completion latency, with and without stdlb's indexed completer.
+
+In a fresh IPython shell whose namespace holds `from stdlb import *` (plus `-g` extra
+globals, to mimic a long notebook session), "types" each word one character at a
+time, completing after every keystroke. Compares IPython's stock completer (Jedi,
+if installed) with `%load_ext stdlb.ipython`, whose `StdlbCompleter` answers bare names
+from the export index and suppresses Jedi for them.
+
+```bash
+python scripts/benchmark_completer.py
+python scripts/benchmark_completer.py -n 5 -g 2000 -w urlencode -w OrderedDict
+```
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+repo_root = Path(__file__).parent.parent
+src_dir = repo_root / 'src'
+WORDS = ['urljoin', 'defaultdict', 'Path', 'sqrt', 'namedtuple', 'dt']
+
+# Runs in a fresh interpreter; prints a JSON report
+MEASURE_SCRIPT = '''
+import json, statistics, sys, time
+indexed, runs, extra, words = sys.argv[1] == '1', int(sys.argv[2]), int(sys.argv[3]), json.loads(sys.argv[4])
+from IPython.core.completer import provisionalcompleter
+from IPython.core.interactiveshell import InteractiveShell
+
+shell = InteractiveShell.instance()
+shell.run_cell("from stdlb import *").raise_error()
+shell.user_ns.update({f"var_{i}": i for i in range(extra)})
+if indexed:
+    shell.run_line_magic('load_ext', 'stdlb.ipython')
+
+keystrokes = [word[:i] for word in words for i in range(1, len(word) + 1)]
+times = {prefix: [] for prefix in keystrokes}
+matches = {}
+with provisionalcompleter():
+    for prefix in keystrokes:
+        list(shell.Completer.completions(prefix, len(prefix)))  # warm up
+    for _ in range(runs):
+        for prefix in keystrokes:
+            start = time.perf_counter()
+            completions = list(shell.Completer.completions(prefix, len(prefix)))
+            times[prefix].append((time.perf_counter() - start) * 1000)
+            matches[prefix] = len(completions)
+medians = sorted(statistics.median(ts) for ts in times.values())
+print(json.dumps({
+    'globals': len(shell.user_ns),
+    'median_ms': statistics.median(medians),
+    'p95_ms': medians[max(0, round(0.95 * len(medians)) - 1)],
+    'max_ms': medians[-1],
+    'words_ms': {word: sum(statistics.median(times[word[:i]]) for i in range(1, len(word) + 1)) for word in words},
+    'matches': {word: matches[word] for word in words},
+}))
+'''
+
+
+def measure(indexed, runs, extra, words):
+    env = dict(os.environ, PYTHONPATH=str(src_dir))
+    env.pop('STDLB_LAZY', None)
+    result = subprocess.run(
+        [sys.executable, '-c', MEASURE_SCRIPT, '1' if indexed else '0', str(runs), str(extra), json.dumps(words)],
+        capture_output=True, text=True, env=env, check=True,
+    )
+    return json.loads(result.stdout)
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('-n', '--runs', type=int, default=3, help='Timing runs per keystroke (default: %(default)s)')
+    parser.add_argument('-g', '--globals', type=int, default=0, help='Extra user globals to add to the namespace (default: %(default)s)')
+    parser.add_argument('-w', '--word', action='append', help=f"Word(s) to type (default: {' '.join(WORDS)})")
+    args = parser.parse_args(args)
+
+    try:
+        import IPython  # noqa: F401
+    except ImportError:
+        print('IPython is not installed', file=sys.stderr)
+        return 1
+    words = args.word or WORDS
+    stock, indexed = (measure(flag, args.runs, args.globals, words) for flag in (False, True))
+    print(f"Python {sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}, {stock['globals']} globals (medians of {args.runs} runs)")
+    print(f"{'':<26} {'IPython':>10} {'%load_ext stdlb.ipython':>23}")
+    for key, label in (('median_ms', 'per keystroke, median'), ('p95_ms', 'per keystroke, p95'), ('max_ms', 'per keystroke, max')):
+        print(f"{label + ' (ms)':<26} {stock[key]:>10.2f} {indexed[key]:>23.2f}")
+    for word in words:
+        label = f"typing {word!r} (ms)"
+        print(f"{label:<26} {stock['words_ms'][word]:>10.1f} {indexed['words_ms'][word]:>23.1f}   ({stock['matches'][word]} → {indexed['matches'][word]} matches)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
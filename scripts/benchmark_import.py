@@ -1,13 +1,16 @@
 #!/usr/bin/env python
 """Benchmark stdlb import time."""
+import os
 import sys
 import subprocess
+import statistics
 import time as time_module
 from pathlib import Path
 
 # Add parent directory to path
 repo_root = Path(__file__).parent.parent
 sys.path.insert(0, str(repo_root))
+src_dir = repo_root / 'src'
 
 def benchmark_import(runs=50):
     """Benchmark the import time."""
@@ -51,5 +54,44 @@ def benchmark_import(runs=50):
         print(f"✓ Import time is acceptable (<{20}ms)")
         return 0
 
+def time_star_import(module, runs):
+    """Times (ms) of `from <module> import *` in fresh interpreters, excluding interpreter startup."""
+    code = (
+        "import time; start = time.perf_counter()\n"
+        f"from {module} import *\n"
+        "print((time.perf_counter() - start) * 1000)"
+    )
+    env = dict(os.environ, PYTHONPATH=str(src_dir))
+    times = []
+    for _ in range(runs):
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True)
+        times.append(float(result.stdout))
+    return times
+
+
+def check_profile_budgets(runs=20):
+    """Check each profile's median import time against PROFILE_BUDGETS_MS."""
+    sys.path.insert(0, str(src_dir))
+    from stdlb._config import PROFILE_BUDGETS_MS
+
+    print(f"Python {sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}")
+    print(f"Profile import times (median over {runs} runs, excluding interpreter startup):")
+    over = []
+    for profile, budget_ms in PROFILE_BUDGETS_MS.items():
+        module = profile if profile == 'stdlb' else f"stdlb.{profile}"
+        median_ms = statistics.median(time_star_import(module, runs))
+        status = "✓" if median_ms <= budget_ms else "⚠️"
+        print(f"  {status} {module:<18} {median_ms:7.2f}ms  (budget {budget_ms}ms)")
+        if median_ms > budget_ms:
+            over.append(module)
+
+    if over:
+        print(f"⚠️  Over budget: {', '.join(over)}")
+        return 1
+    return 0
+
+
 if __name__ == "__main__":
+    if '--profiles' in sys.argv[1:]:
+        sys.exit(check_profile_budgets())
     sys.exit(benchmark_import())
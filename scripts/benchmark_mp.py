@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+"""Benchmark process-pool startup with and without `stdlb.mp.configure`.
+
+Measures the time from creating a `multiprocessing` pool to every worker having run
+`from stdlb import *` (in the pool initializer), for each start method, with and
+without preloading stdlb via `stdlb.mp.configure`. Each measurement runs in a fresh
+interpreter (the fork server is per-process), and includes starting the fork server.
+
+```bash
+python scripts/benchmark_mp.py               # 32 workers, 3 runs per configuration
+python scripts/benchmark_mp.py -w 8 -n 5 -p core
+```
+"""
+import argparse
+import multiprocessing
+import os
+import statistics
+import subprocess
+import sys
+import time as time_module
+from pathlib import Path
+
+repo_root = Path(__file__).parent.parent
+src_dir = repo_root / 'src'
+
+
+def init_worker(barrier, target):
+    exec(f"from {target} import *", {})
+    barrier.wait()
+
+
+def run_pool(method, workers, configured, profile):
+    """Time (ms) from creating a pool to all its workers having star-imported stdlb."""
+    start = time_module.perf_counter()
+    if configured:
+        import stdlb.mp
+        ctx = stdlb.mp.configure(method, profile=profile)
+    else:
+        ctx = multiprocessing.get_context(method)
+    target = 'stdlb' if profile is None else f"stdlb.{profile}"
+    barrier = ctx.Barrier(workers + 1)
+    pool = ctx.Pool(workers, initializer=init_worker, initargs=(barrier, target))
+    barrier.wait()
+    elapsed = (time_module.perf_counter() - start) * 1000
+    pool.terminate()
+    return elapsed
+
+
+def pool_startup_ms(method, workers, configured, profile):
+    """`run_pool` in a fresh interpreter (this script, run with `--pool`)."""
+    env = dict(os.environ, PYTHONPATH=str(src_dir))
+    cmd = [sys.executable, __file__, '--pool', method, '-w', str(workers)]
+    if configured:
+        cmd.append('--configured')
+    if profile:
+        cmd += ['-p', profile]
+    result = subprocess.run(cmd, capture_output=True, text=True, env=env, check=True)
+    return float(result.stdout)
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('-w', '--workers', type=int, default=32, help='Pool size (default: %(default)s)')
+    parser.add_argument('-n', '--runs', type=int, default=3, help='Runs per configuration (default: %(default)s)')
+    parser.add_argument('-p', '--profile', help='Profile workers star-import, e.g. core (default: all of stdlb)')
+    parser.add_argument('-m', '--method', action='append', choices=multiprocessing.get_all_start_methods(), help='Start method(s) (default: all)')
+    parser.add_argument('--pool', metavar='METHOD', help=argparse.SUPPRESS)
+    parser.add_argument('--configured', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args(args)
+
+    if args.pool:
+        print(run_pool(args.pool, args.workers, args.configured, args.profile))
+        return 0
+
+    target = 'stdlb' if args.profile is None else f"stdlb.{args.profile}"
+    print(f"Python {sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}, {os.cpu_count()} CPUs")
+    print(f"Pool startup: {args.workers} workers each running `from {target} import *` (median of {args.runs} runs)")
+    for method in args.method or multiprocessing.get_all_start_methods():
+        configurations = [False] if method == 'spawn' else [False, True]
+        for configured in configurations:
+            times = [pool_startup_ms(method, args.workers, configured, args.profile) for _ in range(args.runs)]
+            label = 'stdlb.mp.configure' if configured else 'plain'
+            print(f"  {method:<10} {label:<18} {statistics.median(times):9.1f}ms  (min {min(times):.1f}ms)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
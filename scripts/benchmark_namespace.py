@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+"""Benchmark `exec` throughput with a fresh stdlb environment per snippet: `stdlb.namespace()` vs. copying `vars(stdlb)`.
+
+Each evaluation creates its globals, then `exec`s one pre-compiled snippet in them:
+- `dict(vars(stdlb))`: a copy of the full namespace per evaluation;
+- `stdlb.namespace()`: an empty dict falling back to the shared table;
+- `stdlb.namespace(lazy=True)`: the same, with the table filled on first lookup;
+- one shared dict (no isolation between snippets; for reference).
+
+```bash
+python scripts/benchmark_namespace.py
+python scripts/benchmark_namespace.py -n 20000 -r 7
+```
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+SNIPPETS = [
+    "x = sqrt(2) * pi",
+    "p = Path('a') / 'b'; n = len(p.parts)",
+    "d = defaultdict(list)\nfor i in range(10):\n    d[i % 3].append(i)",
+    "s = json.dumps({'a': [1, 2]})",
+    "def f(xs):\n    return sorted(Counter(xs).items())\nr = f('abracadabra')",
+]
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('-n', '--evals', type=int, default=5000, help='Evaluations per run (default: %(default)s)')
+    parser.add_argument('-r', '--runs', type=int, default=5, help='Runs per variant (default: %(default)s)')
+    args = parser.parse_args(args)
+
+    import stdlb
+    codes = [compile(snippet, '<snippet>', 'exec') for snippet in SNIPPETS]
+    shared = dict(vars(stdlb))
+    variants = {
+        'dict(vars(stdlb))': lambda: dict(vars(stdlb)),
+        'stdlb.namespace()': stdlb.namespace,
+        'stdlb.namespace(lazy=True)': lambda: stdlb.namespace(lazy=True),
+        'shared dict (no isolation)': lambda: shared,
+    }
+
+    def run(make):
+        start = time.perf_counter()
+        for i in range(args.evals):
+            exec(codes[i % len(codes)], make())
+        return time.perf_counter() - start
+
+    print(f"Python {sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}, {len(stdlb.__all__)} names, {args.evals} evaluations (median of {args.runs} runs)")
+    print(f"{'':<28} {'µs/eval':>9} {'evals/s':>10}")
+    for label, make in variants.items():
+        run(make)  # warm up (and fill the lazy table)
+        elapsed = statistics.median(run(make) for _ in range(args.runs))
+        print(f"{label:<28} {elapsed / args.evals * 1e6:>9.1f} {args.evals / elapsed:>10,.0f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
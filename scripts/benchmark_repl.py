@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+"""Benchmark time-to-prompt: `python -m stdlb` and the `stdlb.startup` PYTHONSTARTUP vs. bare `python` and the star-import.
+
+Each command runs on a pseudo-terminal (so it starts an interactive REPL, with
+readline), and is timed from spawn until the first `>>> ` prompt is printed.
+Commands are interleaved across runs, so drift affects them all alike.
+
+```bash
+python scripts/benchmark_repl.py
+python scripts/benchmark_repl.py -n 30
+```
+"""
+import argparse
+import os
+import pty
+import select
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+repo_root = Path(__file__).parent.parent
+src_dir = repo_root / 'src'
+STARTUP = src_dir / 'stdlb' / 'startup.py'
+
+COMMANDS = {
+    'python': ([], {}),
+    'python -m stdlb': (['-m', 'stdlb'], {}),
+    'PYTHONSTARTUP=stdlb/startup.py': ([], {'PYTHONSTARTUP': str(STARTUP)}),
+    "python -i -c 'from stdlb.lazy import *'": (['-i', '-c', 'from stdlb.lazy import *'], {}),
+    "python -i -c 'from stdlb import *'": (['-i', '-c', 'from stdlb import *'], {}),
+}
+
+
+def time_to_prompt(args, env, timeout=30):
+    """Seconds from spawning `python <args>` on a pty until it prints its first prompt."""
+    master, slave = pty.openpty()
+    start = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, *args], stdin=slave, stdout=slave, stderr=slave, env=env, close_fds=True)
+    os.close(slave)
+    output = b''
+    try:
+        while b'>>> ' not in output:
+            ready, _, _ = select.select([master], [], [], timeout)
+            if not ready:
+                raise TimeoutError(f"No prompt from {args} after {timeout}s: {output!r}")
+            output += os.read(master, 4096)
+        return time.perf_counter() - start
+    finally:
+        proc.kill()
+        proc.wait()
+        os.close(master)
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('-n', '--runs', type=int, default=15, help='Runs per command (default: %(default)s)')
+    args = parser.parse_args(args)
+
+    with tempfile.TemporaryDirectory() as home:
+        # A scratch HOME keeps readline history out of the user's
+        base_env = dict(os.environ, PYTHONPATH=str(src_dir), HOME=home, TERM='dumb')
+        for var in ('PYTHONSTARTUP', 'STDLB_LAZY', 'STDLB_TRACE'):
+            base_env.pop(var, None)
+        times = {label: [] for label in COMMANDS}
+        for label, (cmd, env) in COMMANDS.items():
+            time_to_prompt(cmd, dict(base_env, **env))  # warm up (bytecode caches)
+        for _ in range(args.runs):
+            for label, (cmd, env) in COMMANDS.items():
+                times[label].append(time_to_prompt(cmd, dict(base_env, **env)) * 1000)
+
+    baseline = statistics.median(times['python'])
+    print(f"Python {sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}, time to first prompt ({args.runs} runs)")
+    print(f"{'':<42} {'median':>8} {'min':>8} {'vs. python':>11}")
+    for label, ts in times.items():
+        median = statistics.median(ts)
+        print(f"{label:<42} {median:>6.1f}ms {min(ts):>6.1f}ms {median - baseline:>+9.1f}ms")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
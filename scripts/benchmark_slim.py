@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+"""Benchmark namespace size and completion latency: `stdlb.slim` vs. full `stdlb`.
+
+For each variant, in a fresh interpreter that star-imports it, measures:
+- the number of globals, and the size of the globals dict;
+- `dir()` time;
+- completion latency for a few prefixes, with `rlcompleter` (the stdlib REPL's
+  completer) and, if IPython is installed, IPython's completer (Jedi, if installed,
+  plus IPython's own matchers).
+
+```bash
+python scripts/benchmark_slim.py
+python scripts/benchmark_slim.py -n 50 -x S -x get
+```
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+repo_root = Path(__file__).parent.parent
+src_dir = repo_root / 'src'
+PREFIXES = ['S', 'A', 'P', 'get', 'Se']
+
+# Runs in a fresh interpreter; prints a JSON report
+MEASURE_SCRIPT = '''
+import json, statistics, sys, time
+module, runs, prefixes = sys.argv[1], int(sys.argv[2]), json.loads(sys.argv[3])
+namespace = {'__name__': '__main__'}
+exec(f"from {module} import *", namespace)
+
+def median_ms(fn):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+def rlcomplete(text):
+    import rlcompleter
+    completer = rlcompleter.Completer(namespace)
+    matches, i = [], 0
+    while (match := completer.complete(text, i)) is not None:
+        matches.append(match)
+        i += 1
+    return matches
+
+report = {
+    'globals': len(namespace),
+    'globals_bytes': sys.getsizeof(namespace),
+    'dir_ms': median_ms(lambda: sorted(namespace)),
+    'rlcompleter_ms': {p: median_ms(lambda: rlcomplete(p)) for p in prefixes},
+    'matches': {p: len(rlcomplete(p)) for p in prefixes},
+}
+try:
+    from IPython.core.completer import provisionalcompleter
+    from IPython.core.interactiveshell import InteractiveShell
+except ImportError:
+    pass
+else:
+    shell = InteractiveShell.instance()
+    shell.user_ns.update(namespace)
+    complete = lambda p: list(shell.Completer.completions(p, len(p)))
+    with provisionalcompleter():
+        for p in prefixes:
+            complete(p)  # warm up
+        report['ipython_ms'] = {p: median_ms(lambda: complete(p)) for p in prefixes}
+print(json.dumps(report))
+'''
+
+
+def measure(module, runs, prefixes):
+    env = dict(os.environ, PYTHONPATH=str(src_dir))
+    result = subprocess.run(
+        [sys.executable, '-c', MEASURE_SCRIPT, module, str(runs), json.dumps(prefixes)],
+        capture_output=True, text=True, env=env, check=True,
+    )
+    return json.loads(result.stdout)
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('-n', '--runs', type=int, default=20, help='Timing runs per measurement (default: %(default)s)')
+    parser.add_argument('-x', '--prefix', action='append', help=f"Prefix(es) to complete (default: {' '.join(PREFIXES)})")
+    args = parser.parse_args(args)
+
+    prefixes = args.prefix or PREFIXES
+    full, slim = measure('stdlb', args.runs, prefixes), measure('stdlb.slim', args.runs, prefixes)
+    print(f"Python {sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro} (medians of {args.runs} runs)")
+    print(f"{'':<22} {'stdlb':>10} {'stdlb.slim':>11}")
+    print(f"{'globals':<22} {full['globals']:>10} {slim['globals']:>11}")
+    print(f"{'globals dict (KiB)':<22} {full['globals_bytes'] / 1024:>10.1f} {slim['globals_bytes'] / 1024:>11.1f}")
+    print(f"{'dir() (ms)':<22} {full['dir_ms']:>10.3f} {slim['dir_ms']:>11.3f}")
+    for completer in ('rlcompleter', 'ipython'):
+        key = f"{completer}_ms"
+        if key not in full:
+            continue
+        for p in prefixes:
+            label = f"{completer} {p!r} (ms)"
+            print(f"{label:<22} {full[key][p]:>10.2f} {slim[key][p]:>11.2f}   ({full['matches'][p]} → {slim['matches'][p]} matches)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
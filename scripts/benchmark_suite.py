@@ -0,0 +1,248 @@
+#!/usr/bin/env python
+"""Benchmark stdlb import time across interpreters, with warm and cold bytecode caches.
+
+For each interpreter (every `.venv/3.*/bin/python`, or this one), in parallel:
+- times `python -c "from <target> import *"` and a bare `python -c pass` baseline in
+  interleaved fresh interpreters, and reports the difference (import cost, net of
+  interpreter startup and shutdown);
+- "warm" runs use the normal `__pycache__`s (primed by one untimed run); "cold" runs
+  point `PYTHONPYCACHEPREFIX` at a fresh, empty directory, so stdlb and every stdlib
+  module it imports are compiled from source;
+- calibrates the number of runs (after `--min-runs` pilot runs) until the 95% CI of
+  the median is within `--precision` of it, up to `--max-runs`;
+- rejects outliers more than 3 scaled MADs from the median before summarizing.
+
+Results are printed and appended as one JSON record to a history file
+(`benchmarks/history.jsonl` by default), tagged with the git commit, stdlb version and
+machine, so import-time trends across versions can be compared on the same machine.
+
+```bash
+python scripts/benchmark_suite.py                     # all .venv/3.* interpreters
+python scripts/benchmark_suite.py -p python3.12 -m warm
+python scripts/benchmark_suite.py -t stdlb.core --no-history
+```
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time as time_module
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+repo_root = Path(__file__).parent.parent
+src_dir = repo_root / 'src'
+DEFAULT_HISTORY = repo_root / 'benchmarks' / 'history.jsonl'
+MODES = ('warm', 'cold')
+Z_95 = 1.96
+
+
+def interpreters():
+    """Every `.venv/3.*/bin/python` (see `scripts/test_all_versions.sh`), else this interpreter."""
+    venvs = sorted(repo_root.glob('.venv/3.*/bin/python'), key=lambda p: [int(n) for n in p.parent.parent.name.split('.')[:2]])
+    return [str(p) for p in venvs] or [sys.executable]
+
+
+def time_run(python, code, env):
+    """Wall-clock time (ms) of one fresh interpreter running `code`."""
+    start = time_module.perf_counter()
+    result = subprocess.run([python, '-c', code], capture_output=True, env=env)
+    elapsed = (time_module.perf_counter() - start) * 1000
+    if result.returncode != 0:
+        raise RuntimeError(f"{python} -c {code!r} failed:\n{result.stderr.decode()}")
+    return elapsed
+
+
+def run_pair(python, target, mode):
+    """Time one baseline and one `from <target> import *` run, in random order."""
+    env = dict(os.environ, PYTHONPATH=str(src_dir))
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    with tempfile.TemporaryDirectory(prefix='stdlb-pycache-') as pycache:
+        if mode == 'cold':
+            env['PYTHONPYCACHEPREFIX'] = pycache
+        codes = [('baseline', 'pass'), ('import', f"from {target} import *")]
+        random.shuffle(codes)
+        return {kind: time_run(python, code, env) for kind, code in codes}
+
+
+def reject_outliers(values, k=3):
+    """Drop values more than `k` scaled median absolute deviations from the median."""
+    median = statistics.median(values)
+    mad = statistics.median(abs(v - median) for v in values) * 1.4826
+    if mad == 0:
+        return list(values)
+    return [v for v in values if abs(v - median) <= k * mad]
+
+
+def median_ci(values):
+    """Median of `values`, and the half-width of its (normal-approximation) 95% CI."""
+    n = len(values)
+    median = statistics.median(values)
+    if n < 3:
+        return median, float('inf')
+    # Asymptotic standard error of the median, with the IQR as a robust spread estimate
+    q1, _, q3 = statistics.quantiles(values, n=4)
+    sigma = (q3 - q1) / 1.349
+    return median, Z_95 * 1.2533 * sigma / n ** 0.5
+
+
+def summarize(values):
+    kept = reject_outliers(values)
+    median, half_width = median_ci(kept)
+    return {
+        'median_ms': round(median, 3),
+        'ci95_ms': round(half_width, 3),
+        'mean_ms': round(statistics.fmean(kept), 3),
+        'stdev_ms': round(statistics.stdev(kept), 3) if len(kept) > 1 else 0.0,
+        'runs': len(values),
+        'outliers': len(values) - len(kept),
+    }
+
+
+def measure(python, target, mode, min_runs, max_runs, precision):
+    """Calibrated, outlier-robust net import time of `target` under `python` in `mode`."""
+    if mode == 'warm':
+        run_pair(python, target, mode)  # prime __pycache__s
+    baseline, total, net = [], [], []
+    while len(net) < max_runs:
+        pair = run_pair(python, target, mode)
+        baseline.append(pair['baseline'])
+        total.append(pair['import'])
+        net.append(pair['import'] - pair['baseline'])
+        if len(net) >= min_runs:
+            median, half_width = median_ci(reject_outliers(net))
+            if half_width <= precision * abs(median):
+                break
+    return {
+        'net': summarize(net),
+        'total': summarize(total),
+        'baseline': summarize(baseline),
+    }
+
+
+def benchmark_interpreter(python, target, modes, min_runs, max_runs, precision):
+    version = subprocess.run(
+        [python, '-c', "import sys; print(sys.version.split()[0]); print(sys.implementation.name)"],
+        capture_output=True, text=True, check=True,
+    ).stdout.split()
+    return {
+        'python': python,
+        'version': version[0],
+        'implementation': version[1],
+        'modes': {mode: measure(python, target, mode, min_runs, max_runs, precision) for mode in modes},
+    }
+
+
+def git_info():
+    def git(*args):
+        result = subprocess.run(['git', *args], cwd=repo_root, capture_output=True, text=True)
+        return result.stdout.strip() if result.returncode == 0 else None
+    return {
+        'commit': git('rev-parse', 'HEAD'),
+        'describe': git('describe', '--tags', '--always', '--dirty'),
+    }
+
+
+def stdlb_version():
+    for line in (repo_root / 'pyproject.toml').read_text().splitlines():
+        if line.startswith('version = '):
+            return line.split('"')[1]
+    return None
+
+
+def machine_info():
+    return {
+        'node': platform.node(),
+        'system': platform.system(),
+        'release': platform.release(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpus': os.cpu_count(),
+    }
+
+
+def previous_record(history, record):
+    """Most recent record in `history` from the same machine and target."""
+    if not history.exists():
+        return None
+    previous = None
+    for line in history.read_text().splitlines():
+        if not line.strip():
+            continue
+        prior = json.loads(line)
+        if prior.get('machine') == record['machine'] and prior.get('target') == record['target']:
+            previous = prior
+    return previous
+
+
+def print_results(record, previous=None):
+    print(f"`from {record['target']} import *`, net of interpreter startup (median ± 95% CI):")
+    prior = {r['version']: r for r in previous['results']} if previous else {}
+    for result in record['results']:
+        print(f"  Python {result['version']} ({result['python']})")
+        for mode, stats in result['modes'].items():
+            net = stats['net']
+            line = (
+                f"    {mode:<5} {net['median_ms']:7.2f}ms ± {net['ci95_ms']:.2f}"
+                f"  (baseline {stats['baseline']['median_ms']:.2f}ms,"
+                f" {net['runs']} runs, {net['outliers']} outliers)"
+            )
+            before = prior.get(result['version'], {}).get('modes', {}).get(mode)
+            if before:
+                delta = net['median_ms'] - before['net']['median_ms']
+                line += f"  {delta:+.2f}ms vs {previous['git']['describe']}"
+            print(line)
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('-p', '--python', action='append', help='Interpreter(s) to benchmark (default: .venv/3.*/bin/python, else this one)')
+    parser.add_argument('-t', '--target', default='stdlb', help='Module to star-import (default: %(default)s)')
+    parser.add_argument('-m', '--mode', action='append', choices=MODES, help='Cache mode(s) (default: both)')
+    parser.add_argument('--min-runs', type=int, default=10, help='Pilot runs before checking precision (default: %(default)s)')
+    parser.add_argument('--max-runs', type=int, default=100, help='Run cap per interpreter and mode (default: %(default)s)')
+    parser.add_argument('--precision', type=float, default=0.02, help='Target 95%% CI half-width, relative to the median (default: %(default)s)')
+    parser.add_argument('-j', '--jobs', type=int, help='Interpreters benchmarked concurrently (default: all; 1 for least interference)')
+    parser.add_argument('-H', '--history', type=Path, default=DEFAULT_HISTORY, help='JSONL file results are appended to (default: benchmarks/history.jsonl)')
+    parser.add_argument('--no-history', action='store_true', help="Don't append results to the history file")
+    args = parser.parse_args(args)
+
+    pythons = args.python or interpreters()
+    modes = args.mode or list(MODES)
+    with ThreadPoolExecutor(max_workers=args.jobs or len(pythons)) as executor:
+        results = list(executor.map(
+            lambda python: benchmark_interpreter(python, args.target, modes, args.min_runs, args.max_runs, args.precision),
+            pythons,
+        ))
+
+    record = {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'target': args.target,
+        'stdlb_version': stdlb_version(),
+        'git': git_info(),
+        'machine': machine_info(),
+        'settings': {
+            'min_runs': args.min_runs,
+            'max_runs': args.max_runs,
+            'precision': args.precision,
+            'parallel': min(args.jobs or len(pythons), len(pythons)),
+        },
+        'results': results,
+    }
+    print_results(record, None if args.no_history else previous_record(args.history, record))
+    if not args.no_history:
+        args.history.parent.mkdir(parents=True, exist_ok=True)
+        with args.history.open('a') as f:
+            f.write(json.dumps(record) + '\n')
+        print(f"Appended to {args.history}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+"""Benchmark `stdlb run` (forking a warm `stdlb serve` server) vs. a cold `python script.py`.
+
+Starts a server on a temporary socket, then times a short `from stdlb import *`
+script, wall-clock from spawn to exit, run:
+- cold: `python script.py`;
+- via the server, with the client run as `python -m stdlb run` and as
+  `python -S -E _zygote_client.py` (no `site`, no `stdlb` import);
+- `python -S -E -c pass`, the floor for any Python client.
+
+```bash
+python scripts/benchmark_zygote.py
+python scripts/benchmark_zygote.py -n 50
+```
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+repo_root = Path(__file__).parent.parent
+src_dir = repo_root / 'src'
+CLIENT = src_dir / 'stdlb' / '_zygote_client.py'
+SCRIPT = """from stdlb import *
+print(len(Path(__file__).read_text()), sqrt(16), dt(2024, 1, 2).isoformat())
+"""
+
+
+def wall_ms(cmd, env):
+    start = time.perf_counter()
+    subprocess.run(cmd, env=env, check=True, stdout=subprocess.DEVNULL)
+    return (time.perf_counter() - start) * 1000
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('-n', '--runs', type=int, default=20, help='Runs per command (default: %(default)s)')
+    args = parser.parse_args(args)
+    if not sys.platform.startswith('linux'):
+        print('stdlb serve requires Linux', file=sys.stderr)
+        return 1
+
+    with tempfile.TemporaryDirectory() as tmp:
+        script = Path(tmp) / 'script.py'
+        script.write_text(SCRIPT)
+        socket = Path(tmp) / 'run' / 'zygote.sock'
+        env = dict(os.environ, PYTHONPATH=str(src_dir), STDLB_ZYGOTE_SOCKET=str(socket))
+        for var in ('STDLB_LAZY', 'STDLB_TRACE'):
+            env.pop(var, None)
+        commands = {
+            'python script.py (cold)': [sys.executable, str(script)],
+            'python -m stdlb run script.py': [sys.executable, '-m', 'stdlb', 'run', str(script)],
+            'python -S -E _zygote_client.py script.py': [sys.executable, '-S', '-E', str(CLIENT), str(script)],
+            'python -S -E -c pass (floor)': [sys.executable, '-S', '-E', '-c', 'pass'],
+        }
+        # -E ignores PYTHON* variables; the client reads the socket path from the environment
+        server = subprocess.Popen([sys.executable, '-m', 'stdlb', 'serve'], env=env, stderr=subprocess.PIPE)
+        try:
+            server.stderr.readline()  # "listening on ..."
+            times = {label: [] for label in commands}
+            for cmd in commands.values():
+                wall_ms(cmd, env)  # warm up
+            for _ in range(args.runs):
+                for label, cmd in commands.items():
+                    times[label].append(wall_ms(cmd, env))
+        finally:
+            server.terminate()
+            server.wait()
+
+    print(f"Python {sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}, spawn to exit ({args.runs} runs)")
+    print(f"{'':<44} {'median':>8} {'min':>8}")
+    for label, ts in times.items():
+        print(f"{label:<44} {statistics.median(ts):>6.1f}ms {min(ts):>6.1f}ms")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
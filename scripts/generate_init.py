@@ -2,60 +2,84 @@
 # /// script
 # dependencies = []
 # ///
-"""Generate stdlb/__init__.py from stdlib analysis."""
+"""Generate stdlb/__init__.py (and its eager/lazy backends) from stdlib analysis."""
+import argparse
+import json
+import os
 import sys
-from typing import Dict, List, Set
-
-# Version requirements for modules
-VERSION_REQUIREMENTS = {
-    'graphlib': (3, 9),
-    'zoneinfo': (3, 9),
-    'tomllib': (3, 11),
-}
-
-# Modules that should preserve the module reference (not just import members)
-PRESERVE_MODULE = {
-    'datetime', 'shlex', 'time', 'glob', 'os', 'sys',
-}
-
-# Special handling for certain modules
-SPECIAL_ALIASES = {
-    'datetime': {
-        'dt': 'datetime.datetime',
-        'fromtimestamp': 'dt.fromtimestamp',
-        'fromisoformat': 'dt.fromisoformat',
-    },
-}
-
-# Known collisions with __builtins__ that we should preserve
-PRESERVE_BUILTINS = {
-    'open', 'compile', 'pow', 'copyright', 'BlockingIOError',
-    'TimeoutError', 'Warning', 'abs', 'enumerate', 'exit',
-    'filter', 'property', 'repr', 'slice', 'str',
-}
-
-# Additional preferences for collision resolution
-COLLISION_PREFERENCES = {
-    'path': 'os.path',  # prefer os.path over sys.path
-    'join': 'os.path.join',  # prefer os.path.join over shlex.join
-    'Path': 'pathlib.Path',  # prefer pathlib.Path over zipfile.Path
-    'error': 're.error',  # prefer re.error over zlib.error
-    'compress': 'itertools.compress',  # prefer itertools.compress over zlib.compress
-    'repeat': 'itertools.repeat',  # prefer itertools.repeat over timeit.repeat
-}
-
-# Modules that should have their submodule members imported
-# Format: {module: [submodules]} where we'll do "from module.submodule import *"
-IMPORT_SUBMODULE_MEMBERS = {
-    'os': ['path'],      # import basename, dirname, etc. from os.path
-    'urllib': ['parse'], # import urlparse, urlencode, etc. from urllib.parse
-}
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Where generated files are written
+PACKAGE_DIR = Path(__file__).parent.parent / 'src' / 'stdlb'
+
+# Load configuration (and the export-index builder) without running stdlb/__init__.py's
+# eager imports; the package is imported in lazy mode, and never touches its index here
+sys.path.insert(0, str(PACKAGE_DIR.parent))
+os.environ['STDLB_LAZY'] = '1'
+from stdlb._config import (  # noqa: E402
+    BUILTIN_COLLISIONS, COLLISION_PREFERENCES, IMPORT_SUBMODULE_MEMBERS, MODULES,
+    PRESERVE_BUILTINS, PRESERVE_MODULE, PROFILES, SPECIAL_ALIASES, VERSION_REQUIREMENTS,
+)
+from stdlb._index import (  # noqa: E402
+    build_candidates, build_exports, build_info, export_owners, fingerprint, index_key,
+)
 
 
 def generate_header() -> str:
     """Generate file header with docstring."""
     return '''"""Wildcard-import the Python standard library.
 
+This file is auto-generated by scripts/generate_init.py.
+Do not edit manually.
+
+`import stdlb` imports every module (see _eager.py); importing only a submodule
+(`stdlb.lazy`, `python -m stdlb`) defers that to the first use of the namespace. Set
+``STDLB_LAZY=1`` to instead resolve each name on first access (PEP 562), importing
+only the module that provides it.
+Either way, ``stdlb.preload()`` imports the modules on a background thread.
+"""
+import sys
+from os import environ as _environ
+'''
+
+
+def generate_dispatch() -> str:
+    """Generate the eager/lazy mode switch for __init__.py."""
+    return """from .cached_property import async_cached_property, cached_property, invalidate
+from .ipython import load_ipython_extension, unload_ipython_extension
+from ._lazy import install as _install, preload
+from .sandbox import namespace
+from .session import names, user_globals
+
+# STDLB_TRACE records which names are used (see _trace.py), and implies lazy mode
+_install(
+    globals(),
+    eager=_environ.get('STDLB_LAZY', '') in ('', '0'),
+    trace=_environ.get('STDLB_TRACE'),
+)
+"""
+
+
+def generate_eager_header() -> str:
+    """Generate _eager.py header with docstring."""
+    return '''"""Eagerly wildcard-import the Python standard library.
+
+This file is auto-generated by scripts/generate_init.py.
+Do not edit manually.
+"""
+import sys
+'''
+
+
+def generate_profile_header(profile: str, modules: List[str]) -> str:
+    """Generate a profile module's header with docstring."""
+    return f'''"""stdlb `{profile}` profile: wildcard-import {len(modules)} of stdlb's modules.
+
+`from stdlb.{profile} import *` applies the same builtin preservation and collision
+resolution as `from stdlb import *`, restricted to these modules (see PROFILES in
+_config.py).
+
 This file is auto-generated by scripts/generate_init.py.
 Do not edit manually.
 """
@@ -117,21 +141,25 @@ def generate_builtin_preservations(collisions: Dict[str, List[str]]) -> str:
     return '\n'.join(lines)
 
 
-def generate_special_handling() -> str:
-    """Generate special handling code."""
+def generate_special_handling(modules: List[str]) -> str:
+    """Generate special handling code (for aliases/preferences whose targets are in `modules`)."""
     lines = []
 
     # Handle datetime aliases
-    if 'datetime' in SPECIAL_ALIASES:
+    if 'datetime' in SPECIAL_ALIASES and 'datetime' in modules:
         lines.append("# Datetime convenience aliases")
         for alias, target in SPECIAL_ALIASES['datetime'].items():
             lines.append(f"{alias} = {target}")
         lines.append("")
 
     # Handle collision preferences
-    if COLLISION_PREFERENCES:
+    preferences = {
+        name: target for name, target in COLLISION_PREFERENCES.items()
+        if target.split('.')[0] in modules
+    }
+    if preferences:
         lines.append("# Collision resolution preferences")
-        for name, target in sorted(COLLISION_PREFERENCES.items()):
+        for name, target in sorted(preferences.items()):
             lines.append(f"{name} = {target}")
         lines.append("")
 
@@ -141,63 +169,252 @@ def generate_special_handling() -> str:
 def generate_custom_imports() -> str:
     """Generate custom imports (e.g., cached_property)."""
     return """# Custom implementations
-from .cached_property import cached_property
+from .cached_property import async_cached_property, cached_property
 """
 
 
-def generate_init_file(modules: List[str], collisions: Dict[str, List[str]]) -> str:
-    """Generate complete __init__.py content."""
+def generate_eager_file(modules: List[str], collisions: Dict[str, List[str]]) -> str:
+    """Generate complete _eager.py content."""
     parts = [
-        generate_header(),
+        generate_eager_header(),
         generate_module_imports(modules),
         generate_builtin_preservations(collisions),
-        generate_special_handling(),
+        generate_special_handling(modules),
         generate_custom_imports(),
     ]
 
     return '\n'.join(parts)
 
 
-def main():
-    """Main entry point."""
-    # For now, hardcode the list based on our discovery
-    # In a real implementation, this would read from discover_stdlib.py output
-    modules = [
-        'abc', 'array', 'ast', 'asyncio', 'base64', 'binascii', 'bisect',
-        'calendar', 'cmath', 'code', 'codecs', 'collections', 'configparser',
-        'contextlib', 'copy', 'csv', 'dataclasses', 'datetime', 'decimal',
-        'difflib', 'enum', 'fnmatch', 'fractions', 'functools', 'glob',
-        'graphlib', 'hashlib', 'heapq', 'hmac', 'html', 'http', 'io',
-        'itertools', 'json', 'locale', 'logging', 'math', 'mimetypes',
-        'numbers', 'operator', 'os', 'pathlib', 'pickle', 'platform',
-        'pprint', 'queue', 'random', 're', 'reprlib', 'secrets', 'shelve',
-        'shlex', 'shutil', 'signal', 'socket', 'sqlite3', 'statistics',
-        'string', 'struct', 'subprocess', 'sys', 'tempfile', 'textwrap',
-        'threading', 'time', 'timeit', 'tomllib', 'traceback', 'types',
-        'typing', 'unicodedata', 'urllib', 'uuid', 'warnings', 'weakref',
-        'xml', 'zipfile', 'zlib', 'zoneinfo',
-    ]
-
+def generate_profile_file(profile: str, modules: List[str], header: Optional[str] = None, custom: Optional[bool] = None) -> str:
+    """Generate complete stdlb/<profile>.py content."""
     collisions = {
-        'BlockingIOError': ['io'],
-        'TimeoutError': ['asyncio'],
-        'Warning': ['sqlite3'],
-        'abs': ['operator'],
-        'compile': ['re'],
-        'copyright': ['sys'],
-        'enumerate': ['threading'],
-        'exit': ['sys'],
-        'filter': ['fnmatch'],
-        'open': ['codecs', 'io', 'os', 'shelve'],
-        'pow': ['math', 'operator'],
-        'property': ['enum'],
-        'repr': ['reprlib'],
-        'slice': ['ast'],
-        'str': ['locale'],
+        name: colliding for name, colliding in BUILTIN_COLLISIONS.items()
+        if set(colliding) & set(modules)
     }
+    parts = [
+        header or generate_profile_header(profile, modules),
+        generate_module_imports(modules),
+        generate_builtin_preservations(collisions),
+        generate_special_handling(modules),
+    ]
+    if profile == 'core' if custom is None else custom:
+        parts.append(generate_custom_imports())
+
+    return '\n'.join(parts)
+
+
+def generate_slim_file() -> str:
+    """Generate stdlb/slim.py content."""
+    return '''"""stdlb `slim` variant: `from stdlb import *`, minus platform-specific constants.
+
+`from stdlb.slim import *` imports the same modules, and binds the same objects, as
+`from stdlb import *`, except for upper-case int constants like `AF_INET`,
+`IPPROTO_TCP`, `SIGINT`, `O_RDONLY` and `CLOCK_MONOTONIC` (see
+PLATFORM_CONSTANT_PREFIXES in _config.py). These remain reachable through their
+modules (`os.O_RDONLY`, `time.CLOCK_MONOTONIC`), or enums where stdlb binds the
+module's name to a member (`AddressFamily.AF_INET`, `Signals.SIGINT`; `socket` and
+`signal` are the class and function, as in `stdlb`). A smaller namespace makes
+`dir()` and IPython/Jedi completion faster.
+
+This file is auto-generated by scripts/generate_init.py.
+Do not edit manually.
+"""
+# The package's own (eager) namespace, so that every object is `stdlb`'s
+from . import *
+from ._index import is_platform_constant as _is_platform_constant
+
+__all__ = [
+    _name for _name, _value in list(globals().items())
+    if not _name.startswith('_') and not _is_platform_constant(_name, _value)
+]
+'''
+
+
+def generate_init_file() -> str:
+    """Generate complete __init__.py content."""
+    return '\n'.join([generate_header(), generate_dispatch()])
+
+
+def generate_index_file(exports: Dict[str, str], candidates: Dict[str, List[str]]) -> str:
+    """Generate the export index module for the running interpreter."""
+    fp = fingerprint()
+    lines = [
+        f'"""stdlb export index for {fp[0]} {fp[1][0]}.{fp[1][1]} on {fp[2]}.',
+        '',
+        'This file is auto-generated by scripts/generate_init.py.',
+        'Do not edit manually.',
+        '"""',
+        f"FINGERPRINT = {fp!r}",
+        '',
+        'EXPORTS = {',
+    ]
+    for name, spec in exports.items():
+        lines.append(f"    {name!r}: {spec!r},")
+    lines += [
+        '}',
+        '',
+        '# Names bound to more than one (distinct) object, with every candidate in binding order',
+        'CANDIDATES = {',
+    ]
+    for name, specs in candidates.items():
+        lines.append(f"    {name!r}: {specs!r},")
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+
+def generate_info_file(kinds: Dict[str, str], signatures: Dict[str, str]) -> str:
+    """Generate the export index's companion module (kinds and signatures) for the running interpreter."""
+    fp = fingerprint()
+    lines = [
+        f'"""Kinds and call signatures of stdlb\'s exports for {fp[0]} {fp[1][0]}.{fp[1][1]} on {fp[2]}.',
+        '',
+        'Read by completers (see `stdlb._index.load_info`), so they can describe names',
+        'without importing them.',
+        '',
+        'This file is auto-generated by scripts/generate_init.py.',
+        'Do not edit manually.',
+        '"""',
+        f"FINGERPRINT = {fp!r}",
+        '',
+        'KINDS = {',
+    ]
+    for name, kind in kinds.items():
+        lines.append(f"    {name!r}: {kind!r},")
+    lines += ['}', '', 'SIGNATURES = {']
+    for name, signature in signatures.items():
+        lines.append(f"    {name!r}: {signature!r},")
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+
+def generate_variant_file(exports: Dict[str, str]) -> str:
+    """Generate the running interpreter's eager namespace module (`stdlb._variants.<key>`) from its export index.
+
+    Binds each exported name with an explicit import of the object the index maps it
+    to, grouped by module, so there are no star-imports, version checks or collision
+    fix-ups left to run, and the module binds exactly the index's names.
+    """
+    fp = fingerprint()
+    package = PACKAGE_DIR.name
+    modules = {}  # module → ([(attr, name)], [name bound to the module itself])
+    derived = []  # names bound to attributes of attributes, e.g. `datetime.datetime.now`
+    for name, spec in exports.items():
+        module, _, attrs = spec.partition(':')
+        members, aliases = modules.setdefault(module, ([], []))
+        if not attrs:
+            aliases.append(name)
+        elif '.' in attrs:
+            derived.append((name, module, attrs))
+        else:
+            members.append((attrs, name))
+
+    lines = [
+        f'"""stdlb\'s eager namespace for {fp[0]} {fp[1][0]}.{fp[1][1]} on {fp[2]}: {len(exports)} names, imported explicitly.',
+        '',
+        'Equivalent to _eager.py on this interpreter (see `stdlb._index.variant_module`).',
+        '',
+        'This file is auto-generated by scripts/generate_init.py.',
+        'Do not edit manually.',
+        '"""',
+    ]
+    for module in sorted(modules):
+        members, aliases = modules[module]
+        # stdlb's own exports, relative to `stdlb._variants`
+        source = f"..{module[len(package) + 1:]}" if module.startswith(f"{package}.") else module
+        lines.append('')
+        for name in sorted(aliases):
+            lines.append(f"import {module}" if name == module else f"import {module} as {name}")
+        if members:
+            lines.append(f"from {source} import (")
+            for attr, name in sorted(members, key=lambda member: member[1]):
+                lines.append(f"    {attr}," if attr == name else f"    {attr} as {name},")
+            lines.append(')')
+    if derived:
+        lines.append('')
+        for module in sorted({module for _, module, _ in derived}):
+            lines.append(f"import {module} as _module_{module.replace('.', '_')}")
+        for name, module, attrs in derived:
+            lines.append(f"{name} = _module_{module.replace('.', '_')}.{attrs}")
+    lines += ['', f"_FINGERPRINT = {fp!r}"]
+    return '\n'.join(lines) + '\n'
+
+
+def generate_trace_header(profile: str, modules: List[str], trace: dict, used: List[str]) -> str:
+    """Generate a traced profile module's header with docstring."""
+    return f'''"""stdlb `{profile}` profile: the {len(modules)} modules providing the {len(used)} names used in {trace['runs']} traced runs.
+
+Generated from a ``STDLB_TRACE`` file (see _trace.py); `from stdlb.{profile} import *`
+binds every name from these modules, and resolves collisions as `from stdlb import *`
+does, so each traced name is bound to the same object.
+
+This file is auto-generated by scripts/generate_init.py --from-trace.
+Do not edit manually.
+"""
+import sys
+'''
+
+
+def traced_modules(trace: dict):
+    """Modules (and whether stdlb's own exports are) needed to bind `trace`'s names.
+
+    Returns `(modules, custom, used, missing)`; `missing` are traced names this
+    interpreter doesn't export (e.g. recorded under another Python version).
+    """
+    owners = export_owners()
+    used = [name for name in trace['names'] if name in owners]
+    missing = [name for name in trace['names'] if name not in owners]
+    modules = sorted({owners[name] for name in used} - {'builtins', None})
+    custom = any(owners[name] is None for name in used)
+    # Check the subset binds each traced name exactly as the full namespace does
+    full, subset = build_exports(), build_exports(modules, custom)
+    changed = [name for name in used if subset.get(name) != full[name]]
+    if changed:
+        raise ValueError(f"Trimmed profile would rebind: {', '.join(changed)}")
+    return modules, custom, used, missing
 
-    content = generate_init_file(modules, collisions)
-    print(content)
+
+def main():
+    """Main entry point.
+
+    Writes __init__.py, _eager.py, the profile modules, slim.py and the running interpreter's export index (and its `_info`
+    companion) and eager namespace variant; with `--index`, only the index and variant (run once per supported interpreter, e.g.
+    `for v in .venv/3.*/bin/python; do $v scripts/generate_init.py --index; done`); with
+    `--from-trace <path>`, only a profile (`stdlb.<--name>`) of the modules a trace used.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--index', action='store_true', help="Only write this interpreter's export index and namespace variant")
+    parser.add_argument('--from-trace', metavar='PATH', help='Only write a profile of the modules used in a STDLB_TRACE file')
+    parser.add_argument('--name', default='traced', help='Module name for --from-trace (default: %(default)s, i.e. stdlb.traced)')
+    args = parser.parse_args()
+
+    if args.from_trace:
+        with open(args.from_trace) as f:
+            trace = json.load(f)
+        modules, custom, used, missing = traced_modules(trace)
+        if missing:
+            print(f"⚠️  Not exported by this interpreter (skipped): {', '.join(missing)}", file=sys.stderr)
+        header = generate_trace_header(args.name, modules, trace, used)
+        path = PACKAGE_DIR / f"{args.name}.py"
+        path.write_text(generate_profile_file(args.name, modules, header=header, custom=custom))
+        print(f"✓ Wrote {path} ({len(modules)} of {len(MODULES)} modules: {', '.join(modules)})", file=sys.stderr)
+        return
+
+    exports = build_exports()
+    outputs = {
+        PACKAGE_DIR / '_indexes' / f"{index_key()}.py": generate_index_file(exports, build_candidates()),
+        PACKAGE_DIR / '_indexes' / f"{index_key()}_info.py": generate_info_file(*build_info(exports)),
+        PACKAGE_DIR / '_variants' / f"{index_key()}.py": generate_variant_file(exports),
+    }
+    if not args.index:
+        outputs[PACKAGE_DIR / '__init__.py'] = generate_init_file()
+        outputs[PACKAGE_DIR / '_eager.py'] = generate_eager_file(MODULES, BUILTIN_COLLISIONS)
+        for profile, modules in PROFILES.items():
+            outputs[PACKAGE_DIR / f"{profile}.py"] = generate_profile_file(profile, modules)
+        outputs[PACKAGE_DIR / 'slim.py'] = generate_slim_file()
+    for path, content in outputs.items():
+        path.write_text(content)
+        print(f"✓ Wrote {path}", file=sys.stderr)
 
 
 if __name__ == '__main__':
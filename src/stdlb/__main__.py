@@ -0,0 +1,209 @@
+"""Run Python with stdlb's names available, or query stdlb's exports from the precomputed index.
+
+```
+python -m stdlb                            # REPL; each stdlb name is imported on first use
+python -m stdlb -c 'print(Path.cwd())'     # run code (`-i`: then start the REPL)
+python -m stdlb [-i] script.py [args]      # run a script
+python -m stdlb which join open error      # where each name comes from, its signature, and what it beat
+python -m stdlb search '^url'              # names matching a regex
+python -m stdlb search -p url              # names with a prefix
+python -m stdlb complete ur                # bare prefix matches, one per line (for shell completion)
+python -m stdlb serve [-s socket]          # warm-interpreter server for `run` (Linux; see zygote.py)
+python -m stdlb run script.py [args]       # run a script in a child forked from the server
+```
+
+Code runs in a fresh `__main__` module whose builtins fall back to stdlb's exports
+(see `_repl.py`), so the prompt appears about as fast as bare `python`'s; the
+remaining modules are preloaded in the background once it's shown.
+
+Queries only load the export index (see `_index.py`) and, for `which`, its
+kinds/signatures companion, so they take a few milliseconds.
+"""
+import sys
+
+from . import _config
+from ._index import load_candidates, load_exports, load_info
+
+
+def _reason(name, spec):
+    """Why `spec` is the one stdlb binds to `name`."""
+    if spec.startswith('builtins:'):
+        return 'preserved builtin'
+    if name in _config.COLLISION_PREFERENCES:
+        return f"collision preference ({name} = {_config.COLLISION_PREFERENCES[name]})"
+    for module, aliases in _config.SPECIAL_ALIASES.items():
+        if name in aliases:
+            return f"{module} alias ({name} = {aliases[name]})"
+    module = spec.partition(':')[0]
+    if module in _config.PRESERVE_MODULE and name == module:
+        return 'preserved module'
+    return 'last star-import (modules are imported in sorted order)'
+
+
+def which(name):
+    """`{'name', 'spec', 'kind', 'signature', 'candidates', 'reason'}` for an exported `name`, or None."""
+    spec = load_exports().get(name)
+    if spec is None:
+        return None
+    candidates = load_candidates().get(name, [spec])
+    kinds, signatures = load_info()
+    return {
+        'name': name,
+        'spec': spec,
+        'kind': kinds[name],
+        'signature': signatures.get(name),
+        'candidates': candidates,
+        'reason': _reason(name, spec) if len(candidates) > 1 else None,
+    }
+
+
+def search(pattern=None, prefix=None):
+    """Exported names matching a regex `pattern` (`re.search`) and/or starting with `prefix`."""
+    names = load_exports()
+    if prefix:
+        names = [name for name in names if name.startswith(prefix)]
+    if pattern:
+        import re
+        regex = re.compile(pattern)
+        names = [name for name in names if regex.search(name)]
+    return list(names)
+
+
+def format_which(result):
+    lines = [f"{result['name']}: {result['spec']}", f"  {result['kind']} {result['name']}{result['signature'] or ''}"]
+    if result['reason']:
+        lines.append(f"  wins by: {result['reason']}")
+        lines.append('  candidates (in binding order):')
+        for spec in result['candidates']:
+            lines.append(f"    {spec}{'  ←' if spec == result['spec'] else ''}")
+    return '\n'.join(lines)
+
+
+COMMANDS = ('which', 'search', 'complete', 'serve', 'run')
+
+
+def main_namespace(file=None):
+    """A fresh `__main__` module's namespace, with stdlb's names available (see `_repl.install`)."""
+    from ._repl import install
+
+    module = type(sys)('__main__')
+    if file is not None:
+        module.__file__ = file
+    sys.modules['__main__'] = module
+    return install(vars(module))
+
+
+def run(source, filename, namespace):
+    """Run `source` in `namespace`, printing any traceback (minus this frame) as `python` would.
+
+    Returns the exit status.
+    """
+    try:
+        exec(compile(source, filename, 'exec'), namespace)
+    except SystemExit:
+        raise
+    except BaseException as e:
+        import traceback
+        traceback.print_exception(type(e), e, e.__traceback__.tb_next)
+        return 1
+    return 0
+
+
+def interact(namespace):
+    """The REPL: `code.InteractiveConsole` in `namespace`, with readline set up as `python` does."""
+    import code
+
+    hook = getattr(sys, '__interactivehook__', None)
+    if hook is not None:
+        hook()
+    banner = (
+        f"Python {sys.version} on {sys.platform}\n"
+        'Type "help", "copyright", "credits" or "license" for more information.\n'
+        "stdlb: the standard library's names are available, and imported on first use."
+    )
+    code.InteractiveConsole(namespace, filename='<stdin>').interact(banner=banner, exitmsg='')
+    return 0
+
+
+def execute(args):
+    """`python -m stdlb [-i] [-c code | script | -] [args]`: returns the exit status."""
+    interactive = args[:1] == ['-i']
+    if interactive:
+        args = args[1:]
+    if args[:1] == ['-c']:
+        if len(args) < 2:
+            print('Argument expected for the -c option', file=sys.stderr)
+            return 2
+        sys.argv = ['-c', *args[2:]]
+        namespace = main_namespace()
+        status = run(args[1], '<string>', namespace)
+    elif args and args[0] != '-':
+        import os
+        path = args[0]
+        sys.argv = list(args)
+        sys.path[0] = os.path.dirname(os.path.abspath(path))
+        try:
+            with open(path, 'rb') as f:
+                source = f.read()
+        except OSError as e:
+            print(f"python -m stdlb: can't open file {path!r}: [Errno {e.errno}] {e.strerror}", file=sys.stderr)
+            return 2
+        namespace = main_namespace(path)
+        status = run(source, path, namespace)
+    else:
+        sys.argv = list(args) or ['']
+        namespace = main_namespace()
+        if not interactive and sys.stdin.isatty():
+            return interact(namespace)
+        status = run(sys.stdin.read(), '<stdin>', namespace)
+    return interact(namespace) if interactive else status
+
+
+def main(args=None):
+    args = sys.argv[1:] if args is None else args
+    # Parsed by hand: argparse alone costs more than a query
+    if args[:1] in (['-h'], ['--help']):
+        print(__doc__.strip())
+        return 0
+    if not args or args[0] not in COMMANDS:
+        return execute(args)
+    command, *rest = args
+    if command == 'serve':
+        from .zygote import serve
+        path = rest[1] if rest[:1] in (['-s'], ['--socket']) and len(rest) > 1 else None
+        try:
+            return serve(path)
+        except RuntimeError as e:
+            print(f"stdlb serve: {e}", file=sys.stderr)
+            return 1
+    if command == 'run':
+        from ._zygote_client import main as run
+        return run(rest)
+    if command == 'which':
+        as_json = '--json' in rest
+        names = [arg for arg in rest if arg != '--json']
+        results = {name: which(name) for name in names}
+        if as_json:
+            import json
+            print(json.dumps(results, indent=2))
+        else:
+            for name, result in results.items():
+                print(format_which(result) if result else f"{name}: not exported by stdlb")
+        return 0 if all(results.values()) else 1
+    if command == 'search':
+        prefix = None
+        if rest[:1] in (['-p'], ['--prefix']):
+            if len(rest) < 2:
+                print('usage: python -m stdlb search [-p PREFIX] [PATTERN]', file=sys.stderr)
+                return 2
+            prefix, rest = rest[1], rest[2:]
+        names = search(rest[0] if rest else None, prefix)
+    else:
+        names = search(prefix=rest[0] if rest else '')
+    for name in names:
+        print(name)
+    return 0 if names else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
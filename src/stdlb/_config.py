@@ -0,0 +1,154 @@
+"""Configuration for which modules stdlb exports, and how name collisions resolve.
+
+Shared by scripts/generate_init.py (code generation) and `stdlb._index` (building
+an export index at runtime, for interpreters without a precomputed one).
+"""
+
+# Modules whose members are star-imported
+MODULES = [
+    'abc', 'array', 'ast', 'asyncio', 'base64', 'binascii', 'bisect',
+    'calendar', 'cmath', 'code', 'codecs', 'collections', 'configparser',
+    'contextlib', 'copy', 'csv', 'dataclasses', 'datetime', 'decimal',
+    'difflib', 'enum', 'fnmatch', 'fractions', 'functools', 'glob',
+    'graphlib', 'hashlib', 'heapq', 'hmac', 'html', 'http', 'io',
+    'itertools', 'json', 'locale', 'logging', 'math', 'mimetypes',
+    'numbers', 'operator', 'os', 'pathlib', 'pickle', 'platform',
+    'pprint', 'queue', 'random', 're', 'reprlib', 'secrets', 'shelve',
+    'shlex', 'shutil', 'signal', 'socket', 'sqlite3', 'statistics',
+    'string', 'struct', 'subprocess', 'sys', 'tempfile', 'textwrap',
+    'threading', 'time', 'timeit', 'tomllib', 'traceback', 'types',
+    'typing', 'unicodedata', 'urllib', 'uuid', 'warnings', 'weakref',
+    'xml', 'zipfile', 'zlib', 'zoneinfo',
+]
+
+# Version requirements for modules
+VERSION_REQUIREMENTS = {
+    'graphlib': (3, 9),
+    'zoneinfo': (3, 9),
+    'tomllib': (3, 11),
+}
+
+# Modules that should preserve the module reference (not just import members)
+PRESERVE_MODULE = {
+    'datetime', 'shlex', 'time', 'glob', 'os', 'sys',
+}
+
+# Special handling for certain modules
+SPECIAL_ALIASES = {
+    'datetime': {
+        'dt': 'datetime.datetime',
+        'fromtimestamp': 'dt.fromtimestamp',
+        'fromisoformat': 'dt.fromisoformat',
+    },
+}
+
+# Known collisions with __builtins__ that we should preserve
+PRESERVE_BUILTINS = {
+    'open', 'compile', 'pow', 'copyright', 'BlockingIOError',
+    'TimeoutError', 'Warning', 'abs', 'enumerate', 'exit',
+    'filter', 'property', 'repr', 'slice', 'str',
+}
+
+# Modules known to shadow each builtin in PRESERVE_BUILTINS
+BUILTIN_COLLISIONS = {
+    'BlockingIOError': ['io'],
+    'TimeoutError': ['asyncio'],
+    'Warning': ['sqlite3'],
+    'abs': ['operator'],
+    'compile': ['re'],
+    'copyright': ['sys'],
+    'enumerate': ['threading'],
+    'exit': ['sys'],
+    'filter': ['fnmatch'],
+    'open': ['codecs', 'io', 'os', 'shelve'],
+    'pow': ['math', 'operator'],
+    'property': ['enum'],
+    'repr': ['reprlib'],
+    'slice': ['ast'],
+    'str': ['locale'],
+}
+
+# Additional preferences for collision resolution
+COLLISION_PREFERENCES = {
+    'path': 'os.path',  # prefer os.path over sys.path
+    'join': 'os.path.join',  # prefer os.path.join over shlex.join
+    'Path': 'pathlib.Path',  # prefer pathlib.Path over zipfile.Path
+    'error': 're.error',  # prefer re.error over zlib.error
+    'compress': 'itertools.compress',  # prefer itertools.compress over zlib.compress
+    'repeat': 'itertools.repeat',  # prefer itertools.repeat over timeit.repeat
+}
+
+# Modules that should have their submodule members imported
+# Format: {module: [submodules]} where we'll do "from module.submodule import *"
+IMPORT_SUBMODULE_MEMBERS = {
+    'os': ['path'],      # import basename, dirname, etc. from os.path
+    'urllib': ['parse'], # import urlparse, urlencode, etc. from urllib.parse
+}
+
+# Themed subsets of MODULES, generated as `stdlb.<profile>` (e.g. `from stdlb.core import *`),
+# for code that wants part of the namespace without paying for the rest. Every module belongs
+# to exactly one profile, so `stdlb` is their union. Custom implementations live in `core`.
+PROFILES = {
+    'core': [
+        'abc', 'ast', 'bisect', 'code', 'collections', 'contextlib', 'copy',
+        'dataclasses', 'datetime', 'enum', 'fnmatch', 'functools', 'glob',
+        'heapq', 'io', 'itertools', 'json', 'locale', 'logging', 'math',
+        'numbers', 'operator', 'os', 'pathlib', 'platform', 'pprint', 'random',
+        're', 'reprlib', 'shlex', 'shutil', 'string', 'sys', 'tempfile',
+        'textwrap', 'time', 'timeit', 'traceback', 'types', 'typing',
+        'warnings', 'weakref',
+    ],
+    'data': [
+        'array', 'base64', 'binascii', 'calendar', 'cmath', 'codecs',
+        'configparser', 'csv', 'decimal', 'difflib', 'fractions', 'graphlib',
+        'hashlib', 'hmac', 'pickle', 'secrets', 'shelve', 'sqlite3',
+        'statistics', 'struct', 'tomllib', 'unicodedata', 'uuid', 'xml',
+        'zipfile', 'zlib', 'zoneinfo',
+    ],
+    'net': [
+        'html', 'http', 'mimetypes', 'socket', 'urllib',
+    ],
+    'concurrency': [
+        'asyncio', 'queue', 'signal', 'subprocess', 'threading',
+    ],
+}
+
+# Import-time budget (ms, median over fresh interpreters, excluding interpreter startup) for
+# `from stdlb.<profile> import *`, on the machine where the README's ~57ms full import was
+# measured; checked by `scripts/benchmark_import.py --profiles`
+PROFILE_BUDGETS_MS = {
+    'core': 30,
+    'data': 40,
+    'net': 15,
+    'concurrency': 25,
+    'stdlb': 60,
+}
+
+# Modules `stdlb.preload()` imports first, roughly most-used first (the rest follow by name)
+PRELOAD_PRIORITY = [
+    'os', 're', 'json', 'pathlib', 'collections', 'itertools', 'functools',
+    'datetime', 'typing', 'dataclasses', 'math', 'subprocess', 'shutil', 'glob',
+    'time', 'random', 'io', 'csv', 'logging', 'contextlib', 'tempfile',
+    'statistics', 'hashlib', 'urllib', 'asyncio', 'sqlite3', 'textwrap',
+    'pprint', 'copy', 'enum', 'uuid', 'base64', 'zipfile', 'decimal',
+]
+
+# Prefixes of platform-specific int constants (the ones tests/test_exports_snapshot.py allows to
+# vary by platform), left out of `stdlb.slim`'s star export; still reachable as e.g. `socket.AF_INET`
+PLATFORM_CONSTANT_PREFIXES = (
+    # Socket/network constants
+    'AF_', 'AI_', 'EAI_', 'IPPROTO_', 'IP_', 'IPV6_', 'SO_',
+    'MSG_', 'NI_', 'SHUT_', 'TCP_', 'PF_', 'SCM_', 'LOCAL_', 'SYSPROTO_', 'CMSG_',
+    # Signal/process constants
+    'SIG', 'CLD_', 'ITIMER_',
+    # Clock/time constants
+    'CLOCK_',
+    # File/OS constants
+    'O_', 'EX_', 'F_', 'P_', 'PRIO_', 'POSIX_SPAWN_', 'RTLD_', 'ST_', 'SEEK_',
+    # Locale categories
+    'LC_',
+    # Resource limits, scheduling, terminal I/O control
+    'RLIM_', 'RLIMIT_', 'SCHED_', 'TIOCGPGRP', 'TIOCSPGRP',
+    # `os.wait*` options, spelled out: a bare 'W' would also catch `WARNING`, `WEDNESDAY`, …
+    'WCONTINUED', 'WEXITED', 'WNOHANG', 'WNOWAIT', 'WSTOPPED', 'WUNTRACED',
+)
@@ -0,0 +1,314 @@
+"""Per-interpreter export index: each stdlb name → the `module[:attr]` spec providing it.
+
+Exports differ by Python version and platform, so scripts/generate_init.py
+writes one index module per interpreter fingerprint into `stdlb._indexes`.
+`load_exports` imports the matching one directly (no stdlib modules are
+imported to read it), and only falls back to `build_exports` (which imports
+every module, like the eager path) when no precomputed index matches. Each
+index has a companion `<key>_info` module describing the exported objects (kind
+and call signature, see `load_info`), for completers that mustn't import them, and
+a generated eager namespace module (see `variant_module`).
+"""
+import sys
+
+from . import _config
+
+
+def fingerprint():
+    """Identify the interpreter family whose exports an index describes."""
+    return (sys.implementation.name, sys.version_info[:2], sys.platform)
+
+
+def index_key(fp=None):
+    """Module name (within `stdlb._indexes`) of the index for fingerprint `fp`."""
+    implementation, (major, minor), platform = fp or fingerprint()
+    return f"{implementation}{major}{minor}_{platform}"
+
+
+_exports = None
+_candidates = None
+_info = None
+
+
+def _load_index(suffix=''):
+    """The precomputed index module (or its `suffix` companion) for the running interpreter, or None."""
+    try:
+        index = __import__(f"{__package__}._indexes.{index_key()}{suffix}", fromlist=['FINGERPRINT'])
+    except ImportError:
+        return None
+    return index if index.FINGERPRINT == fingerprint() else None
+
+
+def variant_module():
+    """Name of the module whose import binds the full eager namespace on this interpreter.
+
+    That's its generated `stdlb._variants` module (explicit imports of the indexed
+    names, see scripts/generate_init.py), written alongside its export index, if
+    there is one, else `stdlb._eager`, whose star-imports and fix-ups work on any
+    interpreter (and build: see `_lazy.import_eager`).
+    """
+    name = f"{__package__}._variants.{index_key()}"
+    return name if _load_index() is not None else f"{__package__}._eager"
+
+
+def load_exports():
+    """Return the export index for the running interpreter (cached after first call)."""
+    global _exports
+    if _exports is None:
+        index = _load_index()
+        _exports = index.EXPORTS if index is not None else build_exports()
+    return _exports
+
+
+def load_candidates():
+    """Map each contested name to the specs of every (distinct) object bound to it, in binding order.
+
+    Includes the builtin a name shadows, if any; the winner is the name's spec in
+    `load_exports()`. Names with a single candidate are omitted.
+    """
+    global _candidates
+    if _candidates is None:
+        index = _load_index()
+        _candidates = index.CANDIDATES if index is not None else build_candidates()
+    return _candidates
+
+
+def load_info():
+    """`(kinds, signatures)` describing each exported object, without importing it.
+
+    `kinds` maps every exported name to `'module'`, `'class'`, `'exception'`,
+    `'function'` or `'constant'`; `signatures` maps callables with an introspectable signature to
+    it, as a string (e.g. `'(a, *p)'` for `join`). Cached after first call.
+    """
+    global _info
+    if _info is None:
+        index = _load_index('_info')
+        _info = (index.KINDS, index.SIGNATURES) if index is not None else build_info()
+    return _info
+
+
+def is_exception(name):
+    """Whether the export `name` is an exception class (per `load_info`).
+
+    Those must be bound as themselves, not as proxies: `except` clauses only accept
+    actual `BaseException` subclasses.
+    """
+    return load_info()[0].get(name) == 'exception'
+
+
+def _public_names(module):
+    """Names bound by `from module import *`."""
+    if hasattr(module, '__all__'):
+        return list(module.__all__)
+    return [name for name in vars(module) if not name.startswith('_')]
+
+
+def is_platform_constant(name, value):
+    """Whether `name` is an upper-case int constant with a `PLATFORM_CONSTANT_PREFIXES` prefix."""
+    return (
+        name.startswith(_config.PLATFORM_CONSTANT_PREFIXES)
+        and name.isupper()
+        and isinstance(value, int)
+    )
+
+
+def _join_spec(spec, attr):
+    """Extend a `module[:attr]` spec by one attribute, preferring submodules."""
+    if ':' in spec:
+        return f"{spec}.{attr}"
+    if f"{spec}.{attr}" in sys.modules:
+        return f"{spec}.{attr}"
+    return f"{spec}:{attr}"
+
+
+def _member_spec(module_name, name):
+    """Spec for member `name` of `module_name`, as bound by a star import."""
+    import importlib
+    from types import ModuleType
+
+    module = sys.modules[module_name]
+    try:
+        value = getattr(module, name)
+    except AttributeError:
+        # Star-importing a package imports submodules listed in its __all__
+        value = importlib.import_module(f"{module_name}.{name}")
+    if isinstance(value, ModuleType):
+        submodule = f"{module_name}.{name}"
+        for spec in (submodule, value.__name__):
+            if sys.modules.get(spec) is value:
+                return spec
+        # Not importable by its name (e.g. 3.12's `sys.monitoring`): look it up as an attribute
+    return f"{module_name}:{name}"
+
+
+def _replay(modules=None, custom=True):
+    """`({name: (spec, owner)}, {name: [spec, ...]})` for the exports of `modules`.
+
+    Replays the eager statements (see `build_exports`). `owner` is the entry of
+    `modules` whose statements bind the name (e.g. `'os'` for `join`, via the
+    `os.path.join` preference), `'builtins'` for preserved builtins, or `None` for
+    stdlb's own exports. The second dict lists every spec bound to each name, in order.
+    """
+    import builtins
+    import importlib
+    import warnings
+
+    modules = _config.MODULES if modules is None else modules
+    exports = {}
+    bindings = {}
+
+    def bind(name, spec, owner):
+        exports[name] = (spec, owner)
+        bindings.setdefault(name, []).append(spec)
+
+    def star(module_name, owner):
+        module = importlib.import_module(module_name)
+        for name in _public_names(module):
+            bind(name, _member_spec(module_name, name), owner)
+
+    bind('sys', 'sys', 'sys')
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for module in sorted(modules):
+            version_req = _config.VERSION_REQUIREMENTS.get(module)
+            if version_req and sys.version_info < version_req:
+                continue
+            if module in _config.PRESERVE_MODULE:
+                star(module, module)
+                bind(module, module, module)
+            else:
+                bind(module, module, module)
+                star(module, module)
+            if not version_req:
+                for submodule in _config.IMPORT_SUBMODULE_MEMBERS.get(module, []):
+                    star(f"{module}.{submodule}", module)
+
+    for name in sorted(_config.PRESERVE_BUILTINS):
+        colliding = _config.BUILTIN_COLLISIONS.get(name, ())
+        if set(colliding) & set(modules) and name in vars(builtins):
+            bind(name, f"builtins:{name}", 'builtins')
+
+    def lookup(target):
+        first, *attrs = target.split('.')
+        spec = exports[first][0]
+        for attr in attrs:
+            spec = _join_spec(spec, attr)
+        return spec
+
+    if 'datetime' in modules:
+        for alias, target in _config.SPECIAL_ALIASES.get('datetime', {}).items():
+            bind(alias, lookup(target), 'datetime')
+    for name, target in sorted(_config.COLLISION_PREFERENCES.items()):
+        root = target.split('.')[0]
+        if root in modules:
+            bind(name, lookup(target), root)
+
+    if custom:
+        bind('async_cached_property', f"{__package__}.cached_property:async_cached_property", None)
+        bind('cached_property', f"{__package__}.cached_property:cached_property", None)
+    # Some modules list private names in __all__; stdlb's own star-export skips them
+    exports = {name: value for name, value in sorted(exports.items()) if not name.startswith('_')}
+    return exports, bindings
+
+
+def build_exports(modules=None, custom=True):
+    """Map each exported name to the `module[:attr]` spec the eager path binds it to.
+
+    Replays the statements scripts/generate_init.py emits into `_eager.py` (or, for
+    a subset of `modules`, a profile module), in order, on the running interpreter:
+    later star-imports, module preservation, builtin preservation, aliases and
+    collision preferences win exactly as they do there. This imports every module
+    in `modules` (default: all of them). `custom` includes stdlb's own exports.
+    """
+    exports, _ = _replay(modules, custom)
+    return {name: spec for name, (spec, _) in exports.items()}
+
+
+def module_owner(module_name):
+    """The `_config.MODULES` entry that `module_name` (e.g. `os.path`, `xml.dom.minidom`) belongs to, or None."""
+    if module_name in _config.MODULES:
+        return module_name
+    top = module_name.split('.')[0]
+    return top if top in _config.MODULES else None
+
+
+def export_owners(modules=None, custom=True):
+    """Map each exported name to the entry of `modules` (see `_replay`) that binds it."""
+    exports, _ = _replay(modules, custom)
+    return {name: owner for name, (_, owner) in exports.items()}
+
+
+def build_candidates():
+    """Build `load_candidates()`'s map by introspection (imports every module)."""
+    import builtins
+
+    from ._lazy import resolve
+
+    exports, bindings = _replay()
+    candidates = {}
+    for name in exports:
+        specs = bindings[name]
+        if name in vars(builtins) and f"builtins:{name}" not in specs:
+            specs = [f"builtins:{name}"] + specs
+        # Several specs can name one object (e.g. `io:open` is the builtin `open`); keep
+        # the last, so that the winner is listed under its own spec
+        distinct, seen = [], []
+        for spec in reversed(specs):
+            value = resolve(spec)
+            if spec not in distinct and not any(value is other for other in seen):
+                distinct.append(spec)
+                seen.append(value)
+        if len(distinct) > 1:
+            candidates[name] = distinct[::-1]
+    return candidates
+
+
+def kind_of(value):
+    """`load_info()`'s kind of `value`: `'module'`, `'class'`, `'exception'`, `'function'` or `'constant'`."""
+    from types import ModuleType
+
+    if isinstance(value, ModuleType):
+        return 'module'
+    if isinstance(value, type) and issubclass(value, BaseException):
+        return 'exception'
+    # typing's aliases and special forms (`List`, `Counter`, `Union`) subclass like classes
+    if isinstance(value, type) or hasattr(type(value), '__mro_entries__'):
+        return 'class'
+    return 'function' if callable(value) else 'constant'
+
+
+def signature_of(value):
+    """`str(inspect.signature(value))`, or None if `value` has no introspectable signature.
+
+    Object addresses in default values' reprs are dropped (`<function copy2>`), and the
+    running interpreter's path is spelled `sys.executable`, so the result doesn't vary
+    between runs or machines.
+    """
+    import inspect
+    import re
+    import sys
+
+    try:
+        signature = str(inspect.signature(value))
+    except (TypeError, ValueError):
+        return None
+    signature = re.sub(r' at 0x[0-9a-f]+', '', signature)
+    if sys.executable:
+        signature = signature.replace(repr(sys.executable), 'sys.executable')
+    return signature
+
+
+def build_info(exports=None):
+    """Build `load_info()`'s maps by introspection (imports every module)."""
+    from ._lazy import resolve
+
+    exports = load_exports() if exports is None else exports
+    kinds, signatures = {}, {}
+    for name, spec in exports.items():
+        value = resolve(spec)
+        kinds[name] = kind_of(value)
+        if kinds[name] in ('class', 'exception', 'function'):
+            signature = signature_of(value)
+            if signature is not None:
+                signatures[name] = signature
+    return kinds, signatures
@@ -0,0 +1 @@
+"""Precomputed export indexes, one module per interpreter fingerprint (see `stdlb._index`)."""
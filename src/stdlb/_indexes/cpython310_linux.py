@@ -0,0 +1,2534 @@
+"""stdlb export index for cpython 3.10 on linux.
+
+This file is auto-generated by scripts/generate_init.py.
+Do not edit manually.
+"""
+FINGERPRINT = ('cpython', (3, 10), 'linux')
+
+EXPORTS = {
+    'A': 're:A',
+    'ABC': 'abc:ABC',
+    'ABCMeta': 'abc:ABCMeta',
+    'ADDITEMS': 'pickle:ADDITEMS',
+    'AF_ALG': 'socket:AF_ALG',
+    'AF_APPLETALK': 'socket:AF_APPLETALK',
+    'AF_ASH': 'socket:AF_ASH',
+    'AF_ATMPVC': 'socket:AF_ATMPVC',
+    'AF_ATMSVC': 'socket:AF_ATMSVC',
+    'AF_AX25': 'socket:AF_AX25',
+    'AF_BRIDGE': 'socket:AF_BRIDGE',
+    'AF_CAN': 'socket:AF_CAN',
+    'AF_DECnet': 'socket:AF_DECnet',
+    'AF_ECONET': 'socket:AF_ECONET',
+    'AF_INET': 'socket:AF_INET',
+    'AF_INET6': 'socket:AF_INET6',
+    'AF_IPX': 'socket:AF_IPX',
+    'AF_IRDA': 'socket:AF_IRDA',
+    'AF_KEY': 'socket:AF_KEY',
+    'AF_LLC': 'socket:AF_LLC',
+    'AF_NETBEUI': 'socket:AF_NETBEUI',
+    'AF_NETLINK': 'socket:AF_NETLINK',
+    'AF_NETROM': 'socket:AF_NETROM',
+    'AF_PACKET': 'socket:AF_PACKET',
+    'AF_PPPOX': 'socket:AF_PPPOX',
+    'AF_QIPCRTR': 'socket:AF_QIPCRTR',
+    'AF_RDS': 'socket:AF_RDS',
+    'AF_ROSE': 'socket:AF_ROSE',
+    'AF_ROUTE': 'socket:AF_ROUTE',
+    'AF_SECURITY': 'socket:AF_SECURITY',
+    'AF_SNA': 'socket:AF_SNA',
+    'AF_TIPC': 'socket:AF_TIPC',
+    'AF_UNIX': 'socket:AF_UNIX',
+    'AF_UNSPEC': 'socket:AF_UNSPEC',
+    'AF_VSOCK': 'socket:AF_VSOCK',
+    'AF_WANPIPE': 'socket:AF_WANPIPE',
+    'AF_X25': 'socket:AF_X25',
+    'AI_ADDRCONFIG': 'socket:AI_ADDRCONFIG',
+    'AI_ALL': 'socket:AI_ALL',
+    'AI_CANONNAME': 'socket:AI_CANONNAME',
+    'AI_NUMERICHOST': 'socket:AI_NUMERICHOST',
+    'AI_NUMERICSERV': 'socket:AI_NUMERICSERV',
+    'AI_PASSIVE': 'socket:AI_PASSIVE',
+    'AI_V4MAPPED': 'socket:AI_V4MAPPED',
+    'ALG_OP_DECRYPT': 'socket:ALG_OP_DECRYPT',
+    'ALG_OP_ENCRYPT': 'socket:ALG_OP_ENCRYPT',
+    'ALG_OP_SIGN': 'socket:ALG_OP_SIGN',
+    'ALG_OP_VERIFY': 'socket:ALG_OP_VERIFY',
+    'ALG_SET_AEAD_ASSOCLEN': 'socket:ALG_SET_AEAD_ASSOCLEN',
+    'ALG_SET_AEAD_AUTHSIZE': 'socket:ALG_SET_AEAD_AUTHSIZE',
+    'ALG_SET_IV': 'socket:ALG_SET_IV',
+    'ALG_SET_KEY': 'socket:ALG_SET_KEY',
+    'ALG_SET_OP': 'socket:ALG_SET_OP',
+    'ALG_SET_PUBKEY': 'socket:ALG_SET_PUBKEY',
+    'ALL_COMPLETED': 'asyncio:ALL_COMPLETED',
+    'APPEND': 'pickle:APPEND',
+    'APPENDS': 'pickle:APPENDS',
+    'ASCII': 're:ASCII',
+    'AST': 'ast:AST',
+    'AbstractAsyncContextManager': 'contextlib:AbstractAsyncContextManager',
+    'AbstractChildWatcher': 'asyncio:AbstractChildWatcher',
+    'AbstractContextManager': 'contextlib:AbstractContextManager',
+    'AbstractEventLoop': 'asyncio:AbstractEventLoop',
+    'AbstractEventLoopPolicy': 'asyncio:AbstractEventLoopPolicy',
+    'AbstractServer': 'asyncio:AbstractServer',
+    'AbstractSet': 'typing:AbstractSet',
+    'Add': 'ast:Add',
+    'AddressFamily': 'socket:AddressFamily',
+    'And': 'ast:And',
+    'AnnAssign': 'ast:AnnAssign',
+    'Annotated': 'typing:Annotated',
+    'Any': 'typing:Any',
+    'AnyStr': 'typing:AnyStr',
+    'ArrayType': 'array:ArrayType',
+    'Assert': 'ast:Assert',
+    'Assign': 'ast:Assign',
+    'AsyncContextManager': 'typing:AsyncContextManager',
+    'AsyncExitStack': 'contextlib:AsyncExitStack',
+    'AsyncFor': 'ast:AsyncFor',
+    'AsyncFunctionDef': 'ast:AsyncFunctionDef',
+    'AsyncGenerator': 'typing:AsyncGenerator',
+    'AsyncGeneratorType': 'types:AsyncGeneratorType',
+    'AsyncIterable': 'typing:AsyncIterable',
+    'AsyncIterator': 'typing:AsyncIterator',
+    'AsyncWith': 'ast:AsyncWith',
+    'Attribute': 'ast:Attribute',
+    'AugAssign': 'ast:AugAssign',
+    'AugLoad': 'ast:AugLoad',
+    'AugStore': 'ast:AugStore',
+    'Await': 'ast:Await',
+    'Awaitable': 'typing:Awaitable',
+    'BASIC_FORMAT': 'logging:BASIC_FORMAT',
+    'BINBYTES': 'pickle:BINBYTES',
+    'BINBYTES8': 'pickle:BINBYTES8',
+    'BINFLOAT': 'pickle:BINFLOAT',
+    'BINGET': 'pickle:BINGET',
+    'BININT': 'pickle:BININT',
+    'BININT1': 'pickle:BININT1',
+    'BININT2': 'pickle:BININT2',
+    'BINPERSID': 'pickle:BINPERSID',
+    'BINPUT': 'pickle:BINPUT',
+    'BINSTRING': 'pickle:BINSTRING',
+    'BINUNICODE': 'pickle:BINUNICODE',
+    'BINUNICODE8': 'pickle:BINUNICODE8',
+    'BOM': 'codecs:BOM',
+    'BOM32_BE': 'codecs:BOM32_BE',
+    'BOM32_LE': 'codecs:BOM32_LE',
+    'BOM64_BE': 'codecs:BOM64_BE',
+    'BOM64_LE': 'codecs:BOM64_LE',
+    'BOM_BE': 'codecs:BOM_BE',
+    'BOM_LE': 'codecs:BOM_LE',
+    'BOM_UTF16': 'codecs:BOM_UTF16',
+    'BOM_UTF16_BE': 'codecs:BOM_UTF16_BE',
+    'BOM_UTF16_LE': 'codecs:BOM_UTF16_LE',
+    'BOM_UTF32': 'codecs:BOM_UTF32',
+    'BOM_UTF32_BE': 'codecs:BOM_UTF32_BE',
+    'BOM_UTF32_LE': 'codecs:BOM_UTF32_LE',
+    'BOM_UTF8': 'codecs:BOM_UTF8',
+    'BUILD': 'pickle:BUILD',
+    'BYTEARRAY8': 'pickle:BYTEARRAY8',
+    'BadZipFile': 'zipfile:BadZipFile',
+    'BadZipfile': 'zipfile:BadZipfile',
+    'Barrier': 'threading:Barrier',
+    'BaseEventLoop': 'asyncio:BaseEventLoop',
+    'BaseProtocol': 'asyncio:BaseProtocol',
+    'BaseTransport': 'asyncio:BaseTransport',
+    'BasicContext': 'decimal:BasicContext',
+    'BasicInterpolation': 'configparser:BasicInterpolation',
+    'BinOp': 'ast:BinOp',
+    'Binary': 'sqlite3:Binary',
+    'BinaryIO': 'typing:BinaryIO',
+    'BitAnd': 'ast:BitAnd',
+    'BitOr': 'ast:BitOr',
+    'BitXor': 'ast:BitXor',
+    'BlockingIOError': 'builtins:BlockingIOError',
+    'BoolOp': 'ast:BoolOp',
+    'BoundedSemaphore': 'threading:BoundedSemaphore',
+    'Break': 'ast:Break',
+    'BrokenBarrierError': 'threading:BrokenBarrierError',
+    'BsdDbShelf': 'shelve:BsdDbShelf',
+    'BufferedIOBase': 'io:BufferedIOBase',
+    'BufferedProtocol': 'asyncio:BufferedProtocol',
+    'BufferedRWPair': 'io:BufferedRWPair',
+    'BufferedRandom': 'io:BufferedRandom',
+    'BufferedReader': 'io:BufferedReader',
+    'BufferedWriter': 'io:BufferedWriter',
+    'BufferingFormatter': 'logging:BufferingFormatter',
+    'BuiltinFunctionType': 'types:BuiltinFunctionType',
+    'BuiltinMethodType': 'types:BuiltinMethodType',
+    'ByteString': 'typing:ByteString',
+    'Bytes': 'ast:Bytes',
+    'BytesIO': 'io:BytesIO',
+    'CAN_BCM': 'socket:CAN_BCM',
+    'CAN_BCM_CAN_FD_FRAME': 'socket:CAN_BCM_CAN_FD_FRAME',
+    'CAN_BCM_RX_ANNOUNCE_RESUME': 'socket:CAN_BCM_RX_ANNOUNCE_RESUME',
+    'CAN_BCM_RX_CHANGED': 'socket:CAN_BCM_RX_CHANGED',
+    'CAN_BCM_RX_CHECK_DLC': 'socket:CAN_BCM_RX_CHECK_DLC',
+    'CAN_BCM_RX_DELETE': 'socket:CAN_BCM_RX_DELETE',
+    'CAN_BCM_RX_FILTER_ID': 'socket:CAN_BCM_RX_FILTER_ID',
+    'CAN_BCM_RX_NO_AUTOTIMER': 'socket:CAN_BCM_RX_NO_AUTOTIMER',
+    'CAN_BCM_RX_READ': 'socket:CAN_BCM_RX_READ',
+    'CAN_BCM_RX_RTR_FRAME': 'socket:CAN_BCM_RX_RTR_FRAME',
+    'CAN_BCM_RX_SETUP': 'socket:CAN_BCM_RX_SETUP',
+    'CAN_BCM_RX_STATUS': 'socket:CAN_BCM_RX_STATUS',
+    'CAN_BCM_RX_TIMEOUT': 'socket:CAN_BCM_RX_TIMEOUT',
+    'CAN_BCM_SETTIMER': 'socket:CAN_BCM_SETTIMER',
+    'CAN_BCM_STARTTIMER': 'socket:CAN_BCM_STARTTIMER',
+    'CAN_BCM_TX_ANNOUNCE': 'socket:CAN_BCM_TX_ANNOUNCE',
+    'CAN_BCM_TX_COUNTEVT': 'socket:CAN_BCM_TX_COUNTEVT',
+    'CAN_BCM_TX_CP_CAN_ID': 'socket:CAN_BCM_TX_CP_CAN_ID',
+    'CAN_BCM_TX_DELETE': 'socket:CAN_BCM_TX_DELETE',
+    'CAN_BCM_TX_EXPIRED': 'socket:CAN_BCM_TX_EXPIRED',
+    'CAN_BCM_TX_READ': 'socket:CAN_BCM_TX_READ',
+    'CAN_BCM_TX_RESET_MULTI_IDX': 'socket:CAN_BCM_TX_RESET_MULTI_IDX',
+    'CAN_BCM_TX_SEND': 'socket:CAN_BCM_TX_SEND',
+    'CAN_BCM_TX_SETUP': 'socket:CAN_BCM_TX_SETUP',
+    'CAN_BCM_TX_STATUS': 'socket:CAN_BCM_TX_STATUS',
+    'CAN_EFF_FLAG': 'socket:CAN_EFF_FLAG',
+    'CAN_EFF_MASK': 'socket:CAN_EFF_MASK',
+    'CAN_ERR_FLAG': 'socket:CAN_ERR_FLAG',
+    'CAN_ERR_MASK': 'socket:CAN_ERR_MASK',
+    'CAN_ISOTP': 'socket:CAN_ISOTP',
+    'CAN_J1939': 'socket:CAN_J1939',
+    'CAN_RAW': 'socket:CAN_RAW',
+    'CAN_RAW_ERR_FILTER': 'socket:CAN_RAW_ERR_FILTER',
+    'CAN_RAW_FD_FRAMES': 'socket:CAN_RAW_FD_FRAMES',
+    'CAN_RAW_FILTER': 'socket:CAN_RAW_FILTER',
+    'CAN_RAW_JOIN_FILTERS': 'socket:CAN_RAW_JOIN_FILTERS',
+    'CAN_RAW_LOOPBACK': 'socket:CAN_RAW_LOOPBACK',
+    'CAN_RAW_RECV_OWN_MSGS': 'socket:CAN_RAW_RECV_OWN_MSGS',
+    'CAN_RTR_FLAG': 'socket:CAN_RTR_FLAG',
+    'CAN_SFF_MASK': 'socket:CAN_SFF_MASK',
+    'CAPI': 'socket:CAPI',
+    'CHAR_MAX': 'locale:CHAR_MAX',
+    'CLD_CONTINUED': 'os:CLD_CONTINUED',
+    'CLD_DUMPED': 'os:CLD_DUMPED',
+    'CLD_EXITED': 'os:CLD_EXITED',
+    'CLD_KILLED': 'os:CLD_KILLED',
+    'CLD_STOPPED': 'os:CLD_STOPPED',
+    'CLD_TRAPPED': 'os:CLD_TRAPPED',
+    'CLOCK_BOOTTIME': 'time:CLOCK_BOOTTIME',
+    'CLOCK_MONOTONIC': 'time:CLOCK_MONOTONIC',
+    'CLOCK_MONOTONIC_RAW': 'time:CLOCK_MONOTONIC_RAW',
+    'CLOCK_PROCESS_CPUTIME_ID': 'time:CLOCK_PROCESS_CPUTIME_ID',
+    'CLOCK_REALTIME': 'time:CLOCK_REALTIME',
+    'CLOCK_TAI': 'time:CLOCK_TAI',
+    'CLOCK_THREAD_CPUTIME_ID': 'time:CLOCK_THREAD_CPUTIME_ID',
+    'CMSG_LEN': 'socket:CMSG_LEN',
+    'CMSG_SPACE': 'socket:CMSG_SPACE',
+    'CRITICAL': 'logging:CRITICAL',
+    'Calendar': 'calendar:Calendar',
+    'Call': 'ast:Call',
+    'Callable': 'typing:Callable',
+    'CallableProxyType': 'weakref:CallableProxyType',
+    'CalledProcessError': 'subprocess:CalledProcessError',
+    'CancelledError': 'asyncio:CancelledError',
+    'CellType': 'types:CellType',
+    'ChainMap': 'typing:ChainMap',
+    'Clamped': 'decimal:Clamped',
+    'ClassDef': 'ast:ClassDef',
+    'ClassMethodDescriptorType': 'types:ClassMethodDescriptorType',
+    'ClassVar': 'typing:ClassVar',
+    'CodeType': 'types:CodeType',
+    'Codec': 'codecs:Codec',
+    'CodecInfo': 'codecs:CodecInfo',
+    'Collection': 'typing:Collection',
+    'Compare': 'ast:Compare',
+    'CompletedProcess': 'subprocess:CompletedProcess',
+    'Complex': 'numbers:Complex',
+    'Concatenate': 'typing:Concatenate',
+    'Condition': 'threading:Condition',
+    'ConfigParser': 'configparser:ConfigParser',
+    'Connection': 'sqlite3:Connection',
+    'Constant': 'ast:Constant',
+    'Container': 'typing:Container',
+    'Context': 'decimal:Context',
+    'ContextDecorator': 'contextlib:ContextDecorator',
+    'ContextManager': 'typing:ContextManager',
+    'Continue': 'ast:Continue',
+    'ConversionSyntax': 'decimal:ConversionSyntax',
+    'ConverterMapping': 'configparser:ConverterMapping',
+    'Coroutine': 'typing:Coroutine',
+    'CoroutineType': 'types:CoroutineType',
+    'Counter': 'typing:Counter',
+    'Cursor': 'sqlite3:Cursor',
+    'CycleError': 'graphlib:CycleError',
+    'DEBUG': 'logging:DEBUG',
+    'DEFAULTSECT': 'configparser:DEFAULTSECT',
+    'DEFAULT_PROTOCOL': 'pickle:DEFAULT_PROTOCOL',
+    'DEFLATED': 'zlib:DEFLATED',
+    'DEF_BUF_SIZE': 'zlib:DEF_BUF_SIZE',
+    'DEF_MEM_LEVEL': 'zlib:DEF_MEM_LEVEL',
+    'DEVNULL': 'subprocess:DEVNULL',
+    'DICT': 'pickle:DICT',
+    'DOTALL': 're:DOTALL',
+    'DUP': 'pickle:DUP',
+    'DataError': 'sqlite3:DataError',
+    'DatabaseError': 'sqlite3:DatabaseError',
+    'DatagramProtocol': 'asyncio:DatagramProtocol',
+    'DatagramTransport': 'asyncio:DatagramTransport',
+    'Date': 'sqlite3:Date',
+    'DateFromTicks': 'sqlite3:DateFromTicks',
+    'DbfilenameShelf': 'shelve:DbfilenameShelf',
+    'Decimal': 'decimal:Decimal',
+    'DecimalException': 'decimal:DecimalException',
+    'DecimalTuple': 'decimal:DecimalTuple',
+    'DefaultContext': 'decimal:DefaultContext',
+    'DefaultDict': 'typing:DefaultDict',
+    'DefaultEventLoopPolicy': 'asyncio:DefaultEventLoopPolicy',
+    'DefragResult': 'urllib.parse:DefragResult',
+    'DefragResultBytes': 'urllib.parse:DefragResultBytes',
+    'Del': 'ast:Del',
+    'Delete': 'ast:Delete',
+    'Deque': 'typing:Deque',
+    'Dialect': 'csv:Dialect',
+    'Dict': 'typing:Dict',
+    'DictComp': 'ast:DictComp',
+    'DictReader': 'csv:DictReader',
+    'DictWriter': 'csv:DictWriter',
+    'Differ': 'difflib:Differ',
+    'DirEntry': 'os:DirEntry',
+    'Div': 'ast:Div',
+    'DivisionByZero': 'decimal:DivisionByZero',
+    'DivisionImpossible': 'decimal:DivisionImpossible',
+    'DivisionUndefined': 'decimal:DivisionUndefined',
+    'DuplicateOptionError': 'configparser:DuplicateOptionError',
+    'DuplicateSectionError': 'configparser:DuplicateSectionError',
+    'DynamicClassAttribute': 'types:DynamicClassAttribute',
+    'EAI_ADDRFAMILY': 'socket:EAI_ADDRFAMILY',
+    'EAI_AGAIN': 'socket:EAI_AGAIN',
+    'EAI_BADFLAGS': 'socket:EAI_BADFLAGS',
+    'EAI_FAIL': 'socket:EAI_FAIL',
+    'EAI_FAMILY': 'socket:EAI_FAMILY',
+    'EAI_MEMORY': 'socket:EAI_MEMORY',
+    'EAI_NODATA': 'socket:EAI_NODATA',
+    'EAI_NONAME': 'socket:EAI_NONAME',
+    'EAI_OVERFLOW': 'socket:EAI_OVERFLOW',
+    'EAI_SERVICE': 'socket:EAI_SERVICE',
+    'EAI_SOCKTYPE': 'socket:EAI_SOCKTYPE',
+    'EAI_SYSTEM': 'socket:EAI_SYSTEM',
+    'EFD_CLOEXEC': 'os:EFD_CLOEXEC',
+    'EFD_NONBLOCK': 'os:EFD_NONBLOCK',
+    'EFD_SEMAPHORE': 'os:EFD_SEMAPHORE',
+    'EMPTY_DICT': 'pickle:EMPTY_DICT',
+    'EMPTY_LIST': 'pickle:EMPTY_LIST',
+    'EMPTY_SET': 'pickle:EMPTY_SET',
+    'EMPTY_TUPLE': 'pickle:EMPTY_TUPLE',
+    'ERROR': 'logging:ERROR',
+    'EXT1': 'pickle:EXT1',
+    'EXT2': 'pickle:EXT2',
+    'EXT4': 'pickle:EXT4',
+    'EX_CANTCREAT': 'os:EX_CANTCREAT',
+    'EX_CONFIG': 'os:EX_CONFIG',
+    'EX_DATAERR': 'os:EX_DATAERR',
+    'EX_IOERR': 'os:EX_IOERR',
+    'EX_NOHOST': 'os:EX_NOHOST',
+    'EX_NOINPUT': 'os:EX_NOINPUT',
+    'EX_NOPERM': 'os:EX_NOPERM',
+    'EX_NOUSER': 'os:EX_NOUSER',
+    'EX_OK': 'os:EX_OK',
+    'EX_OSERR': 'os:EX_OSERR',
+    'EX_OSFILE': 'os:EX_OSFILE',
+    'EX_PROTOCOL': 'os:EX_PROTOCOL',
+    'EX_SOFTWARE': 'os:EX_SOFTWARE',
+    'EX_TEMPFAIL': 'os:EX_TEMPFAIL',
+    'EX_UNAVAILABLE': 'os:EX_UNAVAILABLE',
+    'EX_USAGE': 'os:EX_USAGE',
+    'Ellipsis': 'ast:Ellipsis',
+    'EllipsisType': 'types:EllipsisType',
+    'Empty': 'queue:Empty',
+    'EncodedFile': 'codecs:EncodedFile',
+    'Enum': 'uuid:Enum',
+    'EnumMeta': 'enum:EnumMeta',
+    'Eq': 'ast:Eq',
+    'Error': 'sqlite3:Error',
+    'Event': 'threading:Event',
+    'ExceptHandler': 'ast:ExceptHandler',
+    'ExceptHookArgs': 'threading:ExceptHookArgs',
+    'ExecError': 'shutil:ExecError',
+    'ExitStack': 'contextlib:ExitStack',
+    'Expr': 'ast:Expr',
+    'Expression': 'ast:Expression',
+    'ExtSlice': 'ast:ExtSlice',
+    'ExtendedContext': 'decimal:ExtendedContext',
+    'ExtendedInterpolation': 'configparser:ExtendedInterpolation',
+    'FALSE': 'pickle:FALSE',
+    'FATAL': 'logging:FATAL',
+    'FIRST_COMPLETED': 'asyncio:FIRST_COMPLETED',
+    'FIRST_EXCEPTION': 'asyncio:FIRST_EXCEPTION',
+    'FLOAT': 'pickle:FLOAT',
+    'FRAME': 'pickle:FRAME',
+    'FRIDAY': 'calendar:FRIDAY',
+    'FROZENSET': 'pickle:FROZENSET',
+    'F_LOCK': 'os:F_LOCK',
+    'F_OK': 'os:F_OK',
+    'F_TEST': 'os:F_TEST',
+    'F_TLOCK': 'os:F_TLOCK',
+    'F_ULOCK': 'os:F_ULOCK',
+    'FastChildWatcher': 'asyncio:FastChildWatcher',
+    'Field': 'dataclasses:Field',
+    'FileHandler': 'logging:FileHandler',
+    'FileIO': 'io:FileIO',
+    'Filter': 'logging:Filter',
+    'Final': 'typing:Final',
+    'Flag': 'enum:Flag',
+    'FloatOperation': 'decimal:FloatOperation',
+    'FloorDiv': 'ast:FloorDiv',
+    'For': 'ast:For',
+    'FormattedValue': 'ast:FormattedValue',
+    'Formatter': 'string:Formatter',
+    'ForwardRef': 'typing:ForwardRef',
+    'Fraction': 'fractions:Fraction',
+    'FrameSummary': 'traceback:FrameSummary',
+    'FrameType': 'types:FrameType',
+    'FrozenInstanceError': 'dataclasses:FrozenInstanceError',
+    'FrozenSet': 'typing:FrozenSet',
+    'Full': 'queue:Full',
+    'FunctionDef': 'ast:FunctionDef',
+    'FunctionType': 'types:FunctionType',
+    'Future': 'asyncio:Future',
+    'GET': 'pickle:GET',
+    'GLOBAL': 'pickle:GLOBAL',
+    'GRND_NONBLOCK': 'os:GRND_NONBLOCK',
+    'GRND_RANDOM': 'os:GRND_RANDOM',
+    'Generator': 'typing:Generator',
+    'GeneratorExp': 'ast:GeneratorExp',
+    'GeneratorType': 'types:GeneratorType',
+    'Generic': 'typing:Generic',
+    'GenericAlias': 'types:GenericAlias',
+    'GetSetDescriptorType': 'types:GetSetDescriptorType',
+    'Global': 'ast:Global',
+    'Gt': 'ast:Gt',
+    'GtE': 'ast:GtE',
+    'HAVE_CONTEXTVAR': 'decimal:HAVE_CONTEXTVAR',
+    'HAVE_THREADS': 'decimal:HAVE_THREADS',
+    'HIGHEST_PROTOCOL': 'pickle:HIGHEST_PROTOCOL',
+    'HMAC': 'hmac:HMAC',
+    'HTMLCalendar': 'calendar:HTMLCalendar',
+    'HTTPStatus': 'http:HTTPStatus',
+    'Handle': 'asyncio:Handle',
+    'Handler': 'logging:Handler',
+    'Handlers': 'signal:Handlers',
+    'Hashable': 'typing:Hashable',
+    'HtmlDiff': 'difflib:HtmlDiff',
+    'I': 're:I',
+    'IGNORECASE': 're:IGNORECASE',
+    'INADDR_ALLHOSTS_GROUP': 'socket:INADDR_ALLHOSTS_GROUP',
+    'INADDR_ANY': 'socket:INADDR_ANY',
+    'INADDR_BROADCAST': 'socket:INADDR_BROADCAST',
+    'INADDR_LOOPBACK': 'socket:INADDR_LOOPBACK',
+    'INADDR_MAX_LOCAL_GROUP': 'socket:INADDR_MAX_LOCAL_GROUP',
+    'INADDR_NONE': 'socket:INADDR_NONE',
+    'INADDR_UNSPEC_GROUP': 'socket:INADDR_UNSPEC_GROUP',
+    'INFO': 'logging:INFO',
+    'INST': 'pickle:INST',
+    'INT': 'pickle:INT',
+    'IO': 'typing:IO',
+    'IOBase': 'io:IOBase',
+    'IOCTL_VM_SOCKETS_GET_LOCAL_CID': 'socket:IOCTL_VM_SOCKETS_GET_LOCAL_CID',
+    'IPPORT_RESERVED': 'socket:IPPORT_RESERVED',
+    'IPPORT_USERRESERVED': 'socket:IPPORT_USERRESERVED',
+    'IPPROTO_AH': 'socket:IPPROTO_AH',
+    'IPPROTO_DSTOPTS': 'socket:IPPROTO_DSTOPTS',
+    'IPPROTO_EGP': 'socket:IPPROTO_EGP',
+    'IPPROTO_ESP': 'socket:IPPROTO_ESP',
+    'IPPROTO_FRAGMENT': 'socket:IPPROTO_FRAGMENT',
+    'IPPROTO_GRE': 'socket:IPPROTO_GRE',
+    'IPPROTO_HOPOPTS': 'socket:IPPROTO_HOPOPTS',
+    'IPPROTO_ICMP': 'socket:IPPROTO_ICMP',
+    'IPPROTO_ICMPV6': 'socket:IPPROTO_ICMPV6',
+    'IPPROTO_IDP': 'socket:IPPROTO_IDP',
+    'IPPROTO_IGMP': 'socket:IPPROTO_IGMP',
+    'IPPROTO_IP': 'socket:IPPROTO_IP',
+    'IPPROTO_IPIP': 'socket:IPPROTO_IPIP',
+    'IPPROTO_IPV6': 'socket:IPPROTO_IPV6',
+    'IPPROTO_MPTCP': 'socket:IPPROTO_MPTCP',
+    'IPPROTO_NONE': 'socket:IPPROTO_NONE',
+    'IPPROTO_PIM': 'socket:IPPROTO_PIM',
+    'IPPROTO_PUP': 'socket:IPPROTO_PUP',
+    'IPPROTO_RAW': 'socket:IPPROTO_RAW',
+    'IPPROTO_ROUTING': 'socket:IPPROTO_ROUTING',
+    'IPPROTO_RSVP': 'socket:IPPROTO_RSVP',
+    'IPPROTO_SCTP': 'socket:IPPROTO_SCTP',
+    'IPPROTO_TCP': 'socket:IPPROTO_TCP',
+    'IPPROTO_TP': 'socket:IPPROTO_TP',
+    'IPPROTO_UDP': 'socket:IPPROTO_UDP',
+    'IPPROTO_UDPLITE': 'socket:IPPROTO_UDPLITE',
+    'IPV6_CHECKSUM': 'socket:IPV6_CHECKSUM',
+    'IPV6_DONTFRAG': 'socket:IPV6_DONTFRAG',
+    'IPV6_DSTOPTS': 'socket:IPV6_DSTOPTS',
+    'IPV6_HOPLIMIT': 'socket:IPV6_HOPLIMIT',
+    'IPV6_HOPOPTS': 'socket:IPV6_HOPOPTS',
+    'IPV6_JOIN_GROUP': 'socket:IPV6_JOIN_GROUP',
+    'IPV6_LEAVE_GROUP': 'socket:IPV6_LEAVE_GROUP',
+    'IPV6_MULTICAST_HOPS': 'socket:IPV6_MULTICAST_HOPS',
+    'IPV6_MULTICAST_IF': 'socket:IPV6_MULTICAST_IF',
+    'IPV6_MULTICAST_LOOP': 'socket:IPV6_MULTICAST_LOOP',
+    'IPV6_NEXTHOP': 'socket:IPV6_NEXTHOP',
+    'IPV6_PATHMTU': 'socket:IPV6_PATHMTU',
+    'IPV6_PKTINFO': 'socket:IPV6_PKTINFO',
+    'IPV6_RECVDSTOPTS': 'socket:IPV6_RECVDSTOPTS',
+    'IPV6_RECVHOPLIMIT': 'socket:IPV6_RECVHOPLIMIT',
+    'IPV6_RECVHOPOPTS': 'socket:IPV6_RECVHOPOPTS',
+    'IPV6_RECVPATHMTU': 'socket:IPV6_RECVPATHMTU',
+    'IPV6_RECVPKTINFO': 'socket:IPV6_RECVPKTINFO',
+    'IPV6_RECVRTHDR': 'socket:IPV6_RECVRTHDR',
+    'IPV6_RECVTCLASS': 'socket:IPV6_RECVTCLASS',
+    'IPV6_RTHDR': 'socket:IPV6_RTHDR',
+    'IPV6_RTHDRDSTOPTS': 'socket:IPV6_RTHDRDSTOPTS',
+    'IPV6_RTHDR_TYPE_0': 'socket:IPV6_RTHDR_TYPE_0',
+    'IPV6_TCLASS': 'socket:IPV6_TCLASS',
+    'IPV6_UNICAST_HOPS': 'socket:IPV6_UNICAST_HOPS',
+    'IPV6_V6ONLY': 'socket:IPV6_V6ONLY',
+    'IP_ADD_MEMBERSHIP': 'socket:IP_ADD_MEMBERSHIP',
+    'IP_DEFAULT_MULTICAST_LOOP': 'socket:IP_DEFAULT_MULTICAST_LOOP',
+    'IP_DEFAULT_MULTICAST_TTL': 'socket:IP_DEFAULT_MULTICAST_TTL',
+    'IP_DROP_MEMBERSHIP': 'socket:IP_DROP_MEMBERSHIP',
+    'IP_HDRINCL': 'socket:IP_HDRINCL',
+    'IP_MAX_MEMBERSHIPS': 'socket:IP_MAX_MEMBERSHIPS',
+    'IP_MULTICAST_IF': 'socket:IP_MULTICAST_IF',
+    'IP_MULTICAST_LOOP': 'socket:IP_MULTICAST_LOOP',
+    'IP_MULTICAST_TTL': 'socket:IP_MULTICAST_TTL',
+    'IP_OPTIONS': 'socket:IP_OPTIONS',
+    'IP_RECVOPTS': 'socket:IP_RECVOPTS',
+    'IP_RECVRETOPTS': 'socket:IP_RECVRETOPTS',
+    'IP_RECVTOS': 'socket:IP_RECVTOS',
+    'IP_RETOPTS': 'socket:IP_RETOPTS',
+    'IP_TOS': 'socket:IP_TOS',
+    'IP_TRANSPARENT': 'socket:IP_TRANSPARENT',
+    'IP_TTL': 'socket:IP_TTL',
+    'IS_CHARACTER_JUNK': 'difflib:IS_CHARACTER_JUNK',
+    'IS_LINE_JUNK': 'difflib:IS_LINE_JUNK',
+    'ITIMER_PROF': 'signal:ITIMER_PROF',
+    'ITIMER_REAL': 'signal:ITIMER_REAL',
+    'ITIMER_VIRTUAL': 'signal:ITIMER_VIRTUAL',
+    'If': 'ast:If',
+    'IfExp': 'ast:IfExp',
+    'IllegalMonthError': 'calendar:IllegalMonthError',
+    'IllegalWeekdayError': 'calendar:IllegalWeekdayError',
+    'Import': 'ast:Import',
+    'ImportFrom': 'ast:ImportFrom',
+    'In': 'ast:In',
+    'Incomplete': 'binascii:Incomplete',
+    'IncompleteReadError': 'asyncio:IncompleteReadError',
+    'IncrementalDecoder': 'codecs:IncrementalDecoder',
+    'IncrementalEncoder': 'codecs:IncrementalEncoder',
+    'Index': 'ast:Index',
+    'Inexact': 'decimal:Inexact',
+    'InitVar': 'dataclasses:InitVar',
+    'IntEnum': 'enum:IntEnum',
+    'IntFlag': 'enum:IntFlag',
+    'Integral': 'numbers:Integral',
+    'IntegrityError': 'sqlite3:IntegrityError',
+    'Interactive': 'ast:Interactive',
+    'InteractiveConsole': 'code:InteractiveConsole',
+    'InteractiveInterpreter': 'code:InteractiveInterpreter',
+    'InterfaceError': 'sqlite3:InterfaceError',
+    'InternalError': 'sqlite3:InternalError',
+    'Interpolation': 'configparser:Interpolation',
+    'InterpolationDepthError': 'configparser:InterpolationDepthError',
+    'InterpolationError': 'configparser:InterpolationError',
+    'InterpolationMissingOptionError': 'configparser:InterpolationMissingOptionError',
+    'InterpolationSyntaxError': 'configparser:InterpolationSyntaxError',
+    'InvalidContext': 'decimal:InvalidContext',
+    'InvalidOperation': 'decimal:InvalidOperation',
+    'InvalidStateError': 'asyncio:InvalidStateError',
+    'InvalidTZPathWarning': 'zoneinfo:InvalidTZPathWarning',
+    'Invert': 'ast:Invert',
+    'Is': 'ast:Is',
+    'IsNot': 'ast:IsNot',
+    'ItemsView': 'typing:ItemsView',
+    'Iterable': 'typing:Iterable',
+    'Iterator': 'typing:Iterator',
+    'ItimerError': 'signal:ItimerError',
+    'J1939_EE_INFO_NONE': 'socket:J1939_EE_INFO_NONE',
+    'J1939_EE_INFO_TX_ABORT': 'socket:J1939_EE_INFO_TX_ABORT',
+    'J1939_FILTER_MAX': 'socket:J1939_FILTER_MAX',
+    'J1939_IDLE_ADDR': 'socket:J1939_IDLE_ADDR',
+    'J1939_MAX_UNICAST_ADDR': 'socket:J1939_MAX_UNICAST_ADDR',
+    'J1939_NLA_BYTES_ACKED': 'socket:J1939_NLA_BYTES_ACKED',
+    'J1939_NLA_PAD': 'socket:J1939_NLA_PAD',
+    'J1939_NO_ADDR': 'socket:J1939_NO_ADDR',
+    'J1939_NO_NAME': 'socket:J1939_NO_NAME',
+    'J1939_NO_PGN': 'socket:J1939_NO_PGN',
+    'J1939_PGN_ADDRESS_CLAIMED': 'socket:J1939_PGN_ADDRESS_CLAIMED',
+    'J1939_PGN_ADDRESS_COMMANDED': 'socket:J1939_PGN_ADDRESS_COMMANDED',
+    'J1939_PGN_MAX': 'socket:J1939_PGN_MAX',
+    'J1939_PGN_PDU1_MAX': 'socket:J1939_PGN_PDU1_MAX',
+    'J1939_PGN_REQUEST': 'socket:J1939_PGN_REQUEST',
+    'JSONDecodeError': 'json:JSONDecodeError',
+    'JSONDecoder': 'json:JSONDecoder',
+    'JSONEncoder': 'json:JSONEncoder',
+    'JoinedStr': 'ast:JoinedStr',
+    'KW_ONLY': 'dataclasses:KW_ONLY',
+    'KeysView': 'typing:KeysView',
+    'L': 're:L',
+    'LC_ALL': 'locale:LC_ALL',
+    'LC_COLLATE': 'locale:LC_COLLATE',
+    'LC_CTYPE': 'locale:LC_CTYPE',
+    'LC_MESSAGES': 'locale:LC_MESSAGES',
+    'LC_MONETARY': 'locale:LC_MONETARY',
+    'LC_NUMERIC': 'locale:LC_NUMERIC',
+    'LC_TIME': 'locale:LC_TIME',
+    'LIST': 'pickle:LIST',
+    'LOCALE': 're:LOCALE',
+    'LONG': 'pickle:LONG',
+    'LONG1': 'pickle:LONG1',
+    'LONG4': 'pickle:LONG4',
+    'LONG_BINGET': 'pickle:LONG_BINGET',
+    'LONG_BINPUT': 'pickle:LONG_BINPUT',
+    'LShift': 'ast:LShift',
+    'Lambda': 'ast:Lambda',
+    'LambdaType': 'types:LambdaType',
+    'LargeZipFile': 'zipfile:LargeZipFile',
+    'LegacyInterpolation': 'configparser:LegacyInterpolation',
+    'LifoQueue': 'queue:LifoQueue',
+    'LimitOverrunError': 'asyncio:LimitOverrunError',
+    'List': 'typing:List',
+    'ListComp': 'ast:ListComp',
+    'Literal': 'typing:Literal',
+    'Load': 'ast:Load',
+    'LocaleHTMLCalendar': 'calendar:LocaleHTMLCalendar',
+    'LocaleTextCalendar': 'calendar:LocaleTextCalendar',
+    'Lock': 'threading:Lock',
+    'LogRecord': 'logging:LogRecord',
+    'Logger': 'logging:Logger',
+    'LoggerAdapter': 'logging:LoggerAdapter',
+    'Lt': 'ast:Lt',
+    'LtE': 'ast:LtE',
+    'M': 're:M',
+    'MARK': 'pickle:MARK',
+    'MAXYEAR': 'datetime:MAXYEAR',
+    'MAX_EMAX': 'decimal:MAX_EMAX',
+    'MAX_INTERPOLATION_DEPTH': 'configparser:MAX_INTERPOLATION_DEPTH',
+    'MAX_PREC': 'decimal:MAX_PREC',
+    'MAX_WBITS': 'zlib:MAX_WBITS',
+    'MEMOIZE': 'pickle:MEMOIZE',
+    'MFD_ALLOW_SEALING': 'os:MFD_ALLOW_SEALING',
+    'MFD_CLOEXEC': 'os:MFD_CLOEXEC',
+    'MFD_HUGETLB': 'os:MFD_HUGETLB',
+    'MFD_HUGE_16GB': 'os:MFD_HUGE_16GB',
+    'MFD_HUGE_16MB': 'os:MFD_HUGE_16MB',
+    'MFD_HUGE_1GB': 'os:MFD_HUGE_1GB',
+    'MFD_HUGE_1MB': 'os:MFD_HUGE_1MB',
+    'MFD_HUGE_256MB': 'os:MFD_HUGE_256MB',
+    'MFD_HUGE_2GB': 'os:MFD_HUGE_2GB',
+    'MFD_HUGE_2MB': 'os:MFD_HUGE_2MB',
+    'MFD_HUGE_32MB': 'os:MFD_HUGE_32MB',
+    'MFD_HUGE_512KB': 'os:MFD_HUGE_512KB',
+    'MFD_HUGE_512MB': 'os:MFD_HUGE_512MB',
+    'MFD_HUGE_64KB': 'os:MFD_HUGE_64KB',
+    'MFD_HUGE_8MB': 'os:MFD_HUGE_8MB',
+    'MFD_HUGE_MASK': 'os:MFD_HUGE_MASK',
+    'MFD_HUGE_SHIFT': 'os:MFD_HUGE_SHIFT',
+    'MINYEAR': 'datetime:MINYEAR',
+    'MIN_EMIN': 'decimal:MIN_EMIN',
+    'MIN_ETINY': 'decimal:MIN_ETINY',
+    'MISSING': 'dataclasses:MISSING',
+    'MONDAY': 'calendar:MONDAY',
+    'MSG_CMSG_CLOEXEC': 'socket:MSG_CMSG_CLOEXEC',
+    'MSG_CONFIRM': 'socket:MSG_CONFIRM',
+    'MSG_CTRUNC': 'socket:MSG_CTRUNC',
+    'MSG_DONTROUTE': 'socket:MSG_DONTROUTE',
+    'MSG_DONTWAIT': 'socket:MSG_DONTWAIT',
+    'MSG_EOR': 'socket:MSG_EOR',
+    'MSG_ERRQUEUE': 'socket:MSG_ERRQUEUE',
+    'MSG_FASTOPEN': 'socket:MSG_FASTOPEN',
+    'MSG_MORE': 'socket:MSG_MORE',
+    'MSG_NOSIGNAL': 'socket:MSG_NOSIGNAL',
+    'MSG_OOB': 'socket:MSG_OOB',
+    'MSG_PEEK': 'socket:MSG_PEEK',
+    'MSG_TRUNC': 'socket:MSG_TRUNC',
+    'MSG_WAITALL': 'socket:MSG_WAITALL',
+    'MULTILINE': 're:MULTILINE',
+    'Mapping': 'typing:Mapping',
+    'MappingProxyType': 'types:MappingProxyType',
+    'MappingView': 'typing:MappingView',
+    'MatMult': 'ast:MatMult',
+    'Match': 'typing:Match',
+    'MatchAs': 'ast:MatchAs',
+    'MatchClass': 'ast:MatchClass',
+    'MatchMapping': 'ast:MatchMapping',
+    'MatchOr': 'ast:MatchOr',
+    'MatchSequence': 'ast:MatchSequence',
+    'MatchSingleton': 'ast:MatchSingleton',
+    'MatchStar': 'ast:MatchStar',
+    'MatchValue': 'ast:MatchValue',
+    'MemberDescriptorType': 'types:MemberDescriptorType',
+    'MethodDescriptorType': 'types:MethodDescriptorType',
+    'MethodType': 'types:MethodType',
+    'MethodWrapperType': 'types:MethodWrapperType',
+    'MimeTypes': 'mimetypes:MimeTypes',
+    'MissingSectionHeaderError': 'configparser:MissingSectionHeaderError',
+    'Mod': 'ast:Mod',
+    'Module': 'ast:Module',
+    'ModuleType': 'types:ModuleType',
+    'Mult': 'ast:Mult',
+    'MultiLoopChildWatcher': 'asyncio:MultiLoopChildWatcher',
+    'MutableMapping': 'typing:MutableMapping',
+    'MutableSequence': 'typing:MutableSequence',
+    'MutableSet': 'typing:MutableSet',
+    'NAMESPACE_DNS': 'uuid:NAMESPACE_DNS',
+    'NAMESPACE_OID': 'uuid:NAMESPACE_OID',
+    'NAMESPACE_URL': 'uuid:NAMESPACE_URL',
+    'NAMESPACE_X500': 'uuid:NAMESPACE_X500',
+    'NETLINK_CRYPTO': 'socket:NETLINK_CRYPTO',
+    'NETLINK_DNRTMSG': 'socket:NETLINK_DNRTMSG',
+    'NETLINK_FIREWALL': 'socket:NETLINK_FIREWALL',
+    'NETLINK_IP6_FW': 'socket:NETLINK_IP6_FW',
+    'NETLINK_NFLOG': 'socket:NETLINK_NFLOG',
+    'NETLINK_ROUTE': 'socket:NETLINK_ROUTE',
+    'NETLINK_USERSOCK': 'socket:NETLINK_USERSOCK',
+    'NETLINK_XFRM': 'socket:NETLINK_XFRM',
+    'NEWFALSE': 'pickle:NEWFALSE',
+    'NEWOBJ': 'pickle:NEWOBJ',
+    'NEWOBJ_EX': 'pickle:NEWOBJ_EX',
+    'NEWTRUE': 'pickle:NEWTRUE',
+    'NEXT_BUFFER': 'pickle:NEXT_BUFFER',
+    'NGROUPS_MAX': 'os:NGROUPS_MAX',
+    'NI_DGRAM': 'socket:NI_DGRAM',
+    'NI_MAXHOST': 'socket:NI_MAXHOST',
+    'NI_MAXSERV': 'socket:NI_MAXSERV',
+    'NI_NAMEREQD': 'socket:NI_NAMEREQD',
+    'NI_NOFQDN': 'socket:NI_NOFQDN',
+    'NI_NUMERICHOST': 'socket:NI_NUMERICHOST',
+    'NI_NUMERICSERV': 'socket:NI_NUMERICSERV',
+    'NONE': 'pickle:NONE',
+    'NOTSET': 'logging:NOTSET',
+    'NSIG': 'signal:NSIG',
+    'Name': 'ast:Name',
+    'NameConstant': 'ast:NameConstant',
+    'NamedExpr': 'ast:NamedExpr',
+    'NamedTemporaryFile': 'tempfile:NamedTemporaryFile',
+    'NamedTuple': 'typing:NamedTuple',
+    'NewType': 'typing:NewType',
+    'NoOptionError': 'configparser:NoOptionError',
+    'NoReturn': 'typing:NoReturn',
+    'NoSectionError': 'configparser:NoSectionError',
+    'NodeTransformer': 'ast:NodeTransformer',
+    'NodeVisitor': 'ast:NodeVisitor',
+    'NoneType': 'types:NoneType',
+    'Nonlocal': 'ast:Nonlocal',
+    'NormalDist': 'statistics:NormalDist',
+    'Not': 'ast:Not',
+    'NotEq': 'ast:NotEq',
+    'NotImplementedType': 'types:NotImplementedType',
+    'NotIn': 'ast:NotIn',
+    'NotSupportedError': 'sqlite3:NotSupportedError',
+    'NullHandler': 'logging:NullHandler',
+    'Num': 'ast:Num',
+    'Number': 'numbers:Number',
+    'OBJ': 'pickle:OBJ',
+    'O_ACCMODE': 'os:O_ACCMODE',
+    'O_APPEND': 'os:O_APPEND',
+    'O_ASYNC': 'os:O_ASYNC',
+    'O_CLOEXEC': 'os:O_CLOEXEC',
+    'O_CREAT': 'os:O_CREAT',
+    'O_DIRECT': 'os:O_DIRECT',
+    'O_DIRECTORY': 'os:O_DIRECTORY',
+    'O_DSYNC': 'os:O_DSYNC',
+    'O_EXCL': 'os:O_EXCL',
+    'O_FSYNC': 'os:O_FSYNC',
+    'O_LARGEFILE': 'os:O_LARGEFILE',
+    'O_NDELAY': 'os:O_NDELAY',
+    'O_NOATIME': 'os:O_NOATIME',
+    'O_NOCTTY': 'os:O_NOCTTY',
+    'O_NOFOLLOW': 'os:O_NOFOLLOW',
+    'O_NONBLOCK': 'os:O_NONBLOCK',
+    'O_PATH': 'os:O_PATH',
+    'O_RDONLY': 'os:O_RDONLY',
+    'O_RDWR': 'os:O_RDWR',
+    'O_RSYNC': 'os:O_RSYNC',
+    'O_SYNC': 'os:O_SYNC',
+    'O_TMPFILE': 'os:O_TMPFILE',
+    'O_TRUNC': 'os:O_TRUNC',
+    'O_WRONLY': 'os:O_WRONLY',
+    'OperationalError': 'sqlite3:OperationalError',
+    'Optional': 'typing:Optional',
+    'Or': 'ast:Or',
+    'OrderedDict': 'typing:OrderedDict',
+    'Overflow': 'decimal:Overflow',
+    'PACKET_BROADCAST': 'socket:PACKET_BROADCAST',
+    'PACKET_FASTROUTE': 'socket:PACKET_FASTROUTE',
+    'PACKET_HOST': 'socket:PACKET_HOST',
+    'PACKET_LOOPBACK': 'socket:PACKET_LOOPBACK',
+    'PACKET_MULTICAST': 'socket:PACKET_MULTICAST',
+    'PACKET_OTHERHOST': 'socket:PACKET_OTHERHOST',
+    'PACKET_OUTGOING': 'socket:PACKET_OUTGOING',
+    'PARSE_COLNAMES': 'sqlite3:PARSE_COLNAMES',
+    'PARSE_DECLTYPES': 'sqlite3:PARSE_DECLTYPES',
+    'PERSID': 'pickle:PERSID',
+    'PF_CAN': 'socket:PF_CAN',
+    'PF_PACKET': 'socket:PF_PACKET',
+    'PF_RDS': 'socket:PF_RDS',
+    'PIPE': 'subprocess:PIPE',
+    'POP': 'pickle:POP',
+    'POP_MARK': 'pickle:POP_MARK',
+    'POSIX_FADV_DONTNEED': 'os:POSIX_FADV_DONTNEED',
+    'POSIX_FADV_NOREUSE': 'os:POSIX_FADV_NOREUSE',
+    'POSIX_FADV_NORMAL': 'os:POSIX_FADV_NORMAL',
+    'POSIX_FADV_RANDOM': 'os:POSIX_FADV_RANDOM',
+    'POSIX_FADV_SEQUENTIAL': 'os:POSIX_FADV_SEQUENTIAL',
+    'POSIX_FADV_WILLNEED': 'os:POSIX_FADV_WILLNEED',
+    'POSIX_SPAWN_CLOSE': 'os:POSIX_SPAWN_CLOSE',
+    'POSIX_SPAWN_DUP2': 'os:POSIX_SPAWN_DUP2',
+    'POSIX_SPAWN_OPEN': 'os:POSIX_SPAWN_OPEN',
+    'PRIO_PGRP': 'os:PRIO_PGRP',
+    'PRIO_PROCESS': 'os:PRIO_PROCESS',
+    'PRIO_USER': 'os:PRIO_USER',
+    'PROTO': 'pickle:PROTO',
+    'PUT': 'pickle:PUT',
+    'P_ALL': 'os:P_ALL',
+    'P_NOWAIT': 'os:P_NOWAIT',
+    'P_NOWAITO': 'os:P_NOWAITO',
+    'P_PGID': 'os:P_PGID',
+    'P_PID': 'os:P_PID',
+    'P_PIDFD': 'os:P_PIDFD',
+    'P_WAIT': 'os:P_WAIT',
+    'Param': 'ast:Param',
+    'ParamSpec': 'typing:ParamSpec',
+    'ParamSpecArgs': 'typing:ParamSpecArgs',
+    'ParamSpecKwargs': 'typing:ParamSpecKwargs',
+    'ParseResult': 'urllib.parse:ParseResult',
+    'ParseResultBytes': 'urllib.parse:ParseResultBytes',
+    'ParsingError': 'configparser:ParsingError',
+    'Pass': 'ast:Pass',
+    'Path': 'pathlib:Path',
+    'Pattern': 'typing:Pattern',
+    'PickleBuffer': 'pickle:PickleBuffer',
+    'PickleError': 'pickle:PickleError',
+    'Pickler': 'pickle:Pickler',
+    'PicklingError': 'pickle:PicklingError',
+    'PidfdChildWatcher': 'asyncio:PidfdChildWatcher',
+    'Popen': 'subprocess:Popen',
+    'PosixPath': 'pathlib:PosixPath',
+    'Pow': 'ast:Pow',
+    'PrepareProtocol': 'sqlite3:PrepareProtocol',
+    'PrettyPrinter': 'pprint:PrettyPrinter',
+    'PriorityQueue': 'queue:PriorityQueue',
+    'ProgrammingError': 'sqlite3:ProgrammingError',
+    'Protocol': 'typing:Protocol',
+    'ProxyType': 'weakref:ProxyType',
+    'ProxyTypes': 'weakref:ProxyTypes',
+    'PurePath': 'pathlib:PurePath',
+    'PurePosixPath': 'pathlib:PurePosixPath',
+    'PureWindowsPath': 'pathlib:PureWindowsPath',
+    'PyCF_ALLOW_TOP_LEVEL_AWAIT': 'ast:PyCF_ALLOW_TOP_LEVEL_AWAIT',
+    'PyCF_ONLY_AST': 'ast:PyCF_ONLY_AST',
+    'PyCF_TYPE_COMMENTS': 'ast:PyCF_TYPE_COMMENTS',
+    'PyZipFile': 'zipfile:PyZipFile',
+    'QUOTE_ALL': 'csv:QUOTE_ALL',
+    'QUOTE_MINIMAL': 'csv:QUOTE_MINIMAL',
+    'QUOTE_NONE': 'csv:QUOTE_NONE',
+    'QUOTE_NONNUMERIC': 'csv:QUOTE_NONNUMERIC',
+    'Queue': 'queue:Queue',
+    'QueueEmpty': 'asyncio:QueueEmpty',
+    'QueueFull': 'asyncio:QueueFull',
+    'READONLY_BUFFER': 'pickle:READONLY_BUFFER',
+    'REDUCE': 'pickle:REDUCE',
+    'RESERVED_FUTURE': 'uuid:RESERVED_FUTURE',
+    'RESERVED_MICROSOFT': 'uuid:RESERVED_MICROSOFT',
+    'RESERVED_NCS': 'uuid:RESERVED_NCS',
+    'RFC_4122': 'uuid:RFC_4122',
+    'RLock': 'threading:RLock',
+    'ROUND_05UP': 'decimal:ROUND_05UP',
+    'ROUND_CEILING': 'decimal:ROUND_CEILING',
+    'ROUND_DOWN': 'decimal:ROUND_DOWN',
+    'ROUND_FLOOR': 'decimal:ROUND_FLOOR',
+    'ROUND_HALF_DOWN': 'decimal:ROUND_HALF_DOWN',
+    'ROUND_HALF_EVEN': 'decimal:ROUND_HALF_EVEN',
+    'ROUND_HALF_UP': 'decimal:ROUND_HALF_UP',
+    'ROUND_UP': 'decimal:ROUND_UP',
+    'RShift': 'ast:RShift',
+    'RTLD_DEEPBIND': 'os:RTLD_DEEPBIND',
+    'RTLD_GLOBAL': 'os:RTLD_GLOBAL',
+    'RTLD_LAZY': 'os:RTLD_LAZY',
+    'RTLD_LOCAL': 'os:RTLD_LOCAL',
+    'RTLD_NODELETE': 'os:RTLD_NODELETE',
+    'RTLD_NOLOAD': 'os:RTLD_NOLOAD',
+    'RTLD_NOW': 'os:RTLD_NOW',
+    'RWF_APPEND': 'os:RWF_APPEND',
+    'RWF_DSYNC': 'os:RWF_DSYNC',
+    'RWF_HIPRI': 'os:RWF_HIPRI',
+    'RWF_NOWAIT': 'os:RWF_NOWAIT',
+    'RWF_SYNC': 'os:RWF_SYNC',
+    'R_OK': 'os:R_OK',
+    'Raise': 'ast:Raise',
+    'Random': 'random:Random',
+    'Rational': 'numbers:Rational',
+    'RawConfigParser': 'configparser:RawConfigParser',
+    'RawIOBase': 'io:RawIOBase',
+    'ReadTransport': 'asyncio:ReadTransport',
+    'Real': 'numbers:Real',
+    'ReferenceType': 'weakref:ReferenceType',
+    'Repr': 'reprlib:Repr',
+    'Return': 'ast:Return',
+    'Reversible': 'typing:Reversible',
+    'Rounded': 'decimal:Rounded',
+    'Row': 'sqlite3:Row',
+    'S': 're:S',
+    'SATURDAY': 'calendar:SATURDAY',
+    'SCHED_BATCH': 'os:SCHED_BATCH',
+    'SCHED_FIFO': 'os:SCHED_FIFO',
+    'SCHED_IDLE': 'os:SCHED_IDLE',
+    'SCHED_OTHER': 'os:SCHED_OTHER',
+    'SCHED_RESET_ON_FORK': 'os:SCHED_RESET_ON_FORK',
+    'SCHED_RR': 'os:SCHED_RR',
+    'SCM_CREDENTIALS': 'socket:SCM_CREDENTIALS',
+    'SCM_J1939_DEST_ADDR': 'socket:SCM_J1939_DEST_ADDR',
+    'SCM_J1939_DEST_NAME': 'socket:SCM_J1939_DEST_NAME',
+    'SCM_J1939_ERRQUEUE': 'socket:SCM_J1939_ERRQUEUE',
+    'SCM_J1939_PRIO': 'socket:SCM_J1939_PRIO',
+    'SCM_RIGHTS': 'socket:SCM_RIGHTS',
+    'SEEK_CUR': 'os:SEEK_CUR',
+    'SEEK_DATA': 'os:SEEK_DATA',
+    'SEEK_END': 'os:SEEK_END',
+    'SEEK_HOLE': 'os:SEEK_HOLE',
+    'SEEK_SET': 'os:SEEK_SET',
+    'SETITEM': 'pickle:SETITEM',
+    'SETITEMS': 'pickle:SETITEMS',
+    'SHORT_BINBYTES': 'pickle:SHORT_BINBYTES',
+    'SHORT_BINSTRING': 'pickle:SHORT_BINSTRING',
+    'SHORT_BINUNICODE': 'pickle:SHORT_BINUNICODE',
+    'SHUT_RD': 'socket:SHUT_RD',
+    'SHUT_RDWR': 'socket:SHUT_RDWR',
+    'SHUT_WR': 'socket:SHUT_WR',
+    'SIGABRT': 'signal:SIGABRT',
+    'SIGALRM': 'signal:SIGALRM',
+    'SIGBUS': 'signal:SIGBUS',
+    'SIGCHLD': 'signal:SIGCHLD',
+    'SIGCLD': 'signal:SIGCLD',
+    'SIGCONT': 'signal:SIGCONT',
+    'SIGFPE': 'signal:SIGFPE',
+    'SIGHUP': 'signal:SIGHUP',
+    'SIGILL': 'signal:SIGILL',
+    'SIGINT': 'signal:SIGINT',
+    'SIGIO': 'signal:SIGIO',
+    'SIGIOT': 'signal:SIGIOT',
+    'SIGKILL': 'signal:SIGKILL',
+    'SIGPIPE': 'signal:SIGPIPE',
+    'SIGPOLL': 'signal:SIGPOLL',
+    'SIGPROF': 'signal:SIGPROF',
+    'SIGPWR': 'signal:SIGPWR',
+    'SIGQUIT': 'signal:SIGQUIT',
+    'SIGRTMAX': 'signal:SIGRTMAX',
+    'SIGRTMIN': 'signal:SIGRTMIN',
+    'SIGSEGV': 'signal:SIGSEGV',
+    'SIGSTOP': 'signal:SIGSTOP',
+    'SIGSYS': 'signal:SIGSYS',
+    'SIGTERM': 'signal:SIGTERM',
+    'SIGTRAP': 'signal:SIGTRAP',
+    'SIGTSTP': 'signal:SIGTSTP',
+    'SIGTTIN': 'signal:SIGTTIN',
+    'SIGTTOU': 'signal:SIGTTOU',
+    'SIGURG': 'signal:SIGURG',
+    'SIGUSR1': 'signal:SIGUSR1',
+    'SIGUSR2': 'signal:SIGUSR2',
+    'SIGVTALRM': 'signal:SIGVTALRM',
+    'SIGWINCH': 'signal:SIGWINCH',
+    'SIGXCPU': 'signal:SIGXCPU',
+    'SIGXFSZ': 'signal:SIGXFSZ',
+    'SIG_BLOCK': 'signal:SIG_BLOCK',
+    'SIG_DFL': 'signal:SIG_DFL',
+    'SIG_IGN': 'signal:SIG_IGN',
+    'SIG_SETMASK': 'signal:SIG_SETMASK',
+    'SIG_UNBLOCK': 'signal:SIG_UNBLOCK',
+    'SOCK_CLOEXEC': 'socket:SOCK_CLOEXEC',
+    'SOCK_DGRAM': 'socket:SOCK_DGRAM',
+    'SOCK_NONBLOCK': 'socket:SOCK_NONBLOCK',
+    'SOCK_RAW': 'socket:SOCK_RAW',
+    'SOCK_RDM': 'socket:SOCK_RDM',
+    'SOCK_SEQPACKET': 'socket:SOCK_SEQPACKET',
+    'SOCK_STREAM': 'socket:SOCK_STREAM',
+    'SOL_ALG': 'socket:SOL_ALG',
+    'SOL_CAN_BASE': 'socket:SOL_CAN_BASE',
+    'SOL_CAN_RAW': 'socket:SOL_CAN_RAW',
+    'SOL_IP': 'socket:SOL_IP',
+    'SOL_RDS': 'socket:SOL_RDS',
+    'SOL_SOCKET': 'socket:SOL_SOCKET',
+    'SOL_TCP': 'socket:SOL_TCP',
+    'SOL_TIPC': 'socket:SOL_TIPC',
+    'SOL_UDP': 'socket:SOL_UDP',
+    'SOMAXCONN': 'socket:SOMAXCONN',
+    'SO_ACCEPTCONN': 'socket:SO_ACCEPTCONN',
+    'SO_BINDTODEVICE': 'socket:SO_BINDTODEVICE',
+    'SO_BROADCAST': 'socket:SO_BROADCAST',
+    'SO_DEBUG': 'socket:SO_DEBUG',
+    'SO_DOMAIN': 'socket:SO_DOMAIN',
+    'SO_DONTROUTE': 'socket:SO_DONTROUTE',
+    'SO_ERROR': 'socket:SO_ERROR',
+    'SO_J1939_ERRQUEUE': 'socket:SO_J1939_ERRQUEUE',
+    'SO_J1939_FILTER': 'socket:SO_J1939_FILTER',
+    'SO_J1939_PROMISC': 'socket:SO_J1939_PROMISC',
+    'SO_J1939_SEND_PRIO': 'socket:SO_J1939_SEND_PRIO',
+    'SO_KEEPALIVE': 'socket:SO_KEEPALIVE',
+    'SO_LINGER': 'socket:SO_LINGER',
+    'SO_MARK': 'socket:SO_MARK',
+    'SO_OOBINLINE': 'socket:SO_OOBINLINE',
+    'SO_PASSCRED': 'socket:SO_PASSCRED',
+    'SO_PASSSEC': 'socket:SO_PASSSEC',
+    'SO_PEERCRED': 'socket:SO_PEERCRED',
+    'SO_PEERSEC': 'socket:SO_PEERSEC',
+    'SO_PRIORITY': 'socket:SO_PRIORITY',
+    'SO_PROTOCOL': 'socket:SO_PROTOCOL',
+    'SO_RCVBUF': 'socket:SO_RCVBUF',
+    'SO_RCVLOWAT': 'socket:SO_RCVLOWAT',
+    'SO_RCVTIMEO': 'socket:SO_RCVTIMEO',
+    'SO_REUSEADDR': 'socket:SO_REUSEADDR',
+    'SO_REUSEPORT': 'socket:SO_REUSEPORT',
+    'SO_SNDBUF': 'socket:SO_SNDBUF',
+    'SO_SNDLOWAT': 'socket:SO_SNDLOWAT',
+    'SO_SNDTIMEO': 'socket:SO_SNDTIMEO',
+    'SO_TYPE': 'socket:SO_TYPE',
+    'SO_VM_SOCKETS_BUFFER_MAX_SIZE': 'socket:SO_VM_SOCKETS_BUFFER_MAX_SIZE',
+    'SO_VM_SOCKETS_BUFFER_MIN_SIZE': 'socket:SO_VM_SOCKETS_BUFFER_MIN_SIZE',
+    'SO_VM_SOCKETS_BUFFER_SIZE': 'socket:SO_VM_SOCKETS_BUFFER_SIZE',
+    'SPLICE_F_MORE': 'os:SPLICE_F_MORE',
+    'SPLICE_F_MOVE': 'os:SPLICE_F_MOVE',
+    'SPLICE_F_NONBLOCK': 'os:SPLICE_F_NONBLOCK',
+    'SQLITE_ALTER_TABLE': 'sqlite3:SQLITE_ALTER_TABLE',
+    'SQLITE_ANALYZE': 'sqlite3:SQLITE_ANALYZE',
+    'SQLITE_ATTACH': 'sqlite3:SQLITE_ATTACH',
+    'SQLITE_CREATE_INDEX': 'sqlite3:SQLITE_CREATE_INDEX',
+    'SQLITE_CREATE_TABLE': 'sqlite3:SQLITE_CREATE_TABLE',
+    'SQLITE_CREATE_TEMP_INDEX': 'sqlite3:SQLITE_CREATE_TEMP_INDEX',
+    'SQLITE_CREATE_TEMP_TABLE': 'sqlite3:SQLITE_CREATE_TEMP_TABLE',
+    'SQLITE_CREATE_TEMP_TRIGGER': 'sqlite3:SQLITE_CREATE_TEMP_TRIGGER',
+    'SQLITE_CREATE_TEMP_VIEW': 'sqlite3:SQLITE_CREATE_TEMP_VIEW',
+    'SQLITE_CREATE_TRIGGER': 'sqlite3:SQLITE_CREATE_TRIGGER',
+    'SQLITE_CREATE_VIEW': 'sqlite3:SQLITE_CREATE_VIEW',
+    'SQLITE_CREATE_VTABLE': 'sqlite3:SQLITE_CREATE_VTABLE',
+    'SQLITE_DELETE': 'sqlite3:SQLITE_DELETE',
+    'SQLITE_DENY': 'sqlite3:SQLITE_DENY',
+    'SQLITE_DETACH': 'sqlite3:SQLITE_DETACH',
+    'SQLITE_DONE': 'sqlite3:SQLITE_DONE',
+    'SQLITE_DROP_INDEX': 'sqlite3:SQLITE_DROP_INDEX',
+    'SQLITE_DROP_TABLE': 'sqlite3:SQLITE_DROP_TABLE',
+    'SQLITE_DROP_TEMP_INDEX': 'sqlite3:SQLITE_DROP_TEMP_INDEX',
+    'SQLITE_DROP_TEMP_TABLE': 'sqlite3:SQLITE_DROP_TEMP_TABLE',
+    'SQLITE_DROP_TEMP_TRIGGER': 'sqlite3:SQLITE_DROP_TEMP_TRIGGER',
+    'SQLITE_DROP_TEMP_VIEW': 'sqlite3:SQLITE_DROP_TEMP_VIEW',
+    'SQLITE_DROP_TRIGGER': 'sqlite3:SQLITE_DROP_TRIGGER',
+    'SQLITE_DROP_VIEW': 'sqlite3:SQLITE_DROP_VIEW',
+    'SQLITE_DROP_VTABLE': 'sqlite3:SQLITE_DROP_VTABLE',
+    'SQLITE_FUNCTION': 'sqlite3:SQLITE_FUNCTION',
+    'SQLITE_IGNORE': 'sqlite3:SQLITE_IGNORE',
+    'SQLITE_INSERT': 'sqlite3:SQLITE_INSERT',
+    'SQLITE_OK': 'sqlite3:SQLITE_OK',
+    'SQLITE_PRAGMA': 'sqlite3:SQLITE_PRAGMA',
+    'SQLITE_READ': 'sqlite3:SQLITE_READ',
+    'SQLITE_RECURSIVE': 'sqlite3:SQLITE_RECURSIVE',
+    'SQLITE_REINDEX': 'sqlite3:SQLITE_REINDEX',
+    'SQLITE_SAVEPOINT': 'sqlite3:SQLITE_SAVEPOINT',
+    'SQLITE_SELECT': 'sqlite3:SQLITE_SELECT',
+    'SQLITE_TRANSACTION': 'sqlite3:SQLITE_TRANSACTION',
+    'SQLITE_UPDATE': 'sqlite3:SQLITE_UPDATE',
+    'STACK_GLOBAL': 'pickle:STACK_GLOBAL',
+    'STDOUT': 'subprocess:STDOUT',
+    'STOP': 'pickle:STOP',
+    'STRING': 'pickle:STRING',
+    'ST_APPEND': 'os:ST_APPEND',
+    'ST_MANDLOCK': 'os:ST_MANDLOCK',
+    'ST_NOATIME': 'os:ST_NOATIME',
+    'ST_NODEV': 'os:ST_NODEV',
+    'ST_NODIRATIME': 'os:ST_NODIRATIME',
+    'ST_NOEXEC': 'os:ST_NOEXEC',
+    'ST_NOSUID': 'os:ST_NOSUID',
+    'ST_RDONLY': 'os:ST_RDONLY',
+    'ST_RELATIME': 'os:ST_RELATIME',
+    'ST_SYNCHRONOUS': 'os:ST_SYNCHRONOUS',
+    'ST_WRITE': 'os:ST_WRITE',
+    'SUNDAY': 'calendar:SUNDAY',
+    'SafeChildWatcher': 'asyncio:SafeChildWatcher',
+    'SafeConfigParser': 'configparser:SafeConfigParser',
+    'SafeUUID': 'uuid:SafeUUID',
+    'SameFileError': 'shutil:SameFileError',
+    'SectionProxy': 'configparser:SectionProxy',
+    'SelectorEventLoop': 'asyncio:SelectorEventLoop',
+    'Semaphore': 'threading:Semaphore',
+    'SendfileNotAvailableError': 'asyncio:SendfileNotAvailableError',
+    'Sequence': 'typing:Sequence',
+    'SequenceMatcher': 'difflib:SequenceMatcher',
+    'Server': 'asyncio:Server',
+    'Set': 'typing:Set',
+    'SetComp': 'ast:SetComp',
+    'Shelf': 'shelve:Shelf',
+    'Sigmasks': 'signal:Sigmasks',
+    'Signals': 'signal:Signals',
+    'SimpleNamespace': 'types:SimpleNamespace',
+    'SimpleQueue': 'queue:SimpleQueue',
+    'Sized': 'typing:Sized',
+    'Slice': 'ast:Slice',
+    'Sniffer': 'csv:Sniffer',
+    'SocketKind': 'socket:SocketKind',
+    'SocketType': 'socket:SocketType',
+    'SpecialFileError': 'shutil:SpecialFileError',
+    'SplitResult': 'urllib.parse:SplitResult',
+    'SplitResultBytes': 'urllib.parse:SplitResultBytes',
+    'SpooledTemporaryFile': 'tempfile:SpooledTemporaryFile',
+    'StackSummary': 'traceback:StackSummary',
+    'Starred': 'ast:Starred',
+    'StatisticsError': 'statistics:StatisticsError',
+    'Store': 'ast:Store',
+    'Str': 'ast:Str',
+    'StreamHandler': 'logging:StreamHandler',
+    'StreamReader': 'codecs:StreamReader',
+    'StreamReaderProtocol': 'asyncio:StreamReaderProtocol',
+    'StreamReaderWriter': 'codecs:StreamReaderWriter',
+    'StreamRecoder': 'codecs:StreamRecoder',
+    'StreamWriter': 'codecs:StreamWriter',
+    'StringIO': 'io:StringIO',
+    'Struct': 'struct:Struct',
+    'Sub': 'ast:Sub',
+    'Subnormal': 'decimal:Subnormal',
+    'SubprocessError': 'subprocess:SubprocessError',
+    'SubprocessProtocol': 'asyncio:SubprocessProtocol',
+    'SubprocessTransport': 'asyncio:SubprocessTransport',
+    'Subscript': 'ast:Subscript',
+    'Suite': 'ast:Suite',
+    'SupportsAbs': 'typing:SupportsAbs',
+    'SupportsBytes': 'typing:SupportsBytes',
+    'SupportsComplex': 'typing:SupportsComplex',
+    'SupportsFloat': 'typing:SupportsFloat',
+    'SupportsIndex': 'typing:SupportsIndex',
+    'SupportsInt': 'typing:SupportsInt',
+    'SupportsRound': 'typing:SupportsRound',
+    'SystemRandom': 'secrets:SystemRandom',
+    'TCP_CONGESTION': 'socket:TCP_CONGESTION',
+    'TCP_CORK': 'socket:TCP_CORK',
+    'TCP_DEFER_ACCEPT': 'socket:TCP_DEFER_ACCEPT',
+    'TCP_FASTOPEN': 'socket:TCP_FASTOPEN',
+    'TCP_INFO': 'socket:TCP_INFO',
+    'TCP_KEEPCNT': 'socket:TCP_KEEPCNT',
+    'TCP_KEEPIDLE': 'socket:TCP_KEEPIDLE',
+    'TCP_KEEPINTVL': 'socket:TCP_KEEPINTVL',
+    'TCP_LINGER2': 'socket:TCP_LINGER2',
+    'TCP_MAXSEG': 'socket:TCP_MAXSEG',
+    'TCP_NODELAY': 'socket:TCP_NODELAY',
+    'TCP_NOTSENT_LOWAT': 'socket:TCP_NOTSENT_LOWAT',
+    'TCP_QUICKACK': 'socket:TCP_QUICKACK',
+    'TCP_SYNCNT': 'socket:TCP_SYNCNT',
+    'TCP_USER_TIMEOUT': 'socket:TCP_USER_TIMEOUT',
+    'TCP_WINDOW_CLAMP': 'socket:TCP_WINDOW_CLAMP',
+    'THURSDAY': 'calendar:THURSDAY',
+    'TIMEOUT_MAX': 'threading:TIMEOUT_MAX',
+    'TIPC_ADDR_ID': 'socket:TIPC_ADDR_ID',
+    'TIPC_ADDR_NAME': 'socket:TIPC_ADDR_NAME',
+    'TIPC_ADDR_NAMESEQ': 'socket:TIPC_ADDR_NAMESEQ',
+    'TIPC_CFG_SRV': 'socket:TIPC_CFG_SRV',
+    'TIPC_CLUSTER_SCOPE': 'socket:TIPC_CLUSTER_SCOPE',
+    'TIPC_CONN_TIMEOUT': 'socket:TIPC_CONN_TIMEOUT',
+    'TIPC_CRITICAL_IMPORTANCE': 'socket:TIPC_CRITICAL_IMPORTANCE',
+    'TIPC_DEST_DROPPABLE': 'socket:TIPC_DEST_DROPPABLE',
+    'TIPC_HIGH_IMPORTANCE': 'socket:TIPC_HIGH_IMPORTANCE',
+    'TIPC_IMPORTANCE': 'socket:TIPC_IMPORTANCE',
+    'TIPC_LOW_IMPORTANCE': 'socket:TIPC_LOW_IMPORTANCE',
+    'TIPC_MEDIUM_IMPORTANCE': 'socket:TIPC_MEDIUM_IMPORTANCE',
+    'TIPC_NODE_SCOPE': 'socket:TIPC_NODE_SCOPE',
+    'TIPC_PUBLISHED': 'socket:TIPC_PUBLISHED',
+    'TIPC_SRC_DROPPABLE': 'socket:TIPC_SRC_DROPPABLE',
+    'TIPC_SUBSCR_TIMEOUT': 'socket:TIPC_SUBSCR_TIMEOUT',
+    'TIPC_SUB_CANCEL': 'socket:TIPC_SUB_CANCEL',
+    'TIPC_SUB_PORTS': 'socket:TIPC_SUB_PORTS',
+    'TIPC_SUB_SERVICE': 'socket:TIPC_SUB_SERVICE',
+    'TIPC_TOP_SRV': 'socket:TIPC_TOP_SRV',
+    'TIPC_WAIT_FOREVER': 'socket:TIPC_WAIT_FOREVER',
+    'TIPC_WITHDRAWN': 'socket:TIPC_WITHDRAWN',
+    'TIPC_ZONE_SCOPE': 'socket:TIPC_ZONE_SCOPE',
+    'TMP_MAX': 'tempfile:TMP_MAX',
+    'TRUE': 'pickle:TRUE',
+    'TUESDAY': 'calendar:TUESDAY',
+    'TUPLE': 'pickle:TUPLE',
+    'TUPLE1': 'pickle:TUPLE1',
+    'TUPLE2': 'pickle:TUPLE2',
+    'TUPLE3': 'pickle:TUPLE3',
+    'TYPE_CHECKING': 'typing:TYPE_CHECKING',
+    'TZPATH': 'zoneinfo:TZPATH',
+    'Task': 'asyncio:Task',
+    'Template': 'string:Template',
+    'TemporaryDirectory': 'tempfile:TemporaryDirectory',
+    'TemporaryFile': 'tempfile:TemporaryFile',
+    'Text': 'typing:Text',
+    'TextCalendar': 'calendar:TextCalendar',
+    'TextIO': 'typing:TextIO',
+    'TextIOBase': 'io:TextIOBase',
+    'TextIOWrapper': 'io:TextIOWrapper',
+    'TextWrapper': 'textwrap:TextWrapper',
+    'Thread': 'threading:Thread',
+    'ThreadError': 'threading:ThreadError',
+    'ThreadedChildWatcher': 'asyncio:ThreadedChildWatcher',
+    'Time': 'sqlite3:Time',
+    'TimeFromTicks': 'sqlite3:TimeFromTicks',
+    'TimeoutError': 'builtins:TimeoutError',
+    'TimeoutExpired': 'subprocess:TimeoutExpired',
+    'Timer': 'timeit:Timer',
+    'TimerHandle': 'asyncio:TimerHandle',
+    'Timestamp': 'sqlite3:Timestamp',
+    'TimestampFromTicks': 'sqlite3:TimestampFromTicks',
+    'TopologicalSorter': 'graphlib:TopologicalSorter',
+    'TracebackException': 'traceback:TracebackException',
+    'TracebackType': 'types:TracebackType',
+    'Transport': 'asyncio:Transport',
+    'Try': 'ast:Try',
+    'Tuple': 'typing:Tuple',
+    'Type': 'typing:Type',
+    'TypeAlias': 'typing:TypeAlias',
+    'TypeGuard': 'typing:TypeGuard',
+    'TypeIgnore': 'ast:TypeIgnore',
+    'TypeVar': 'typing:TypeVar',
+    'TypedDict': 'typing:TypedDict',
+    'U': 're:U',
+    'UAdd': 'ast:UAdd',
+    'UCD': 'unicodedata:UCD',
+    'UDPLITE_RECV_CSCOV': 'socket:UDPLITE_RECV_CSCOV',
+    'UDPLITE_SEND_CSCOV': 'socket:UDPLITE_SEND_CSCOV',
+    'UNICODE': 're:UNICODE',
+    'USub': 'ast:USub',
+    'UUID': 'uuid:UUID',
+    'UnaryOp': 'ast:UnaryOp',
+    'Underflow': 'decimal:Underflow',
+    'Union': 'typing:Union',
+    'UnionType': 'types:UnionType',
+    'Unpickler': 'pickle:Unpickler',
+    'UnpicklingError': 'pickle:UnpicklingError',
+    'UnsupportedOperation': 'io:UnsupportedOperation',
+    'UserDict': 'collections:UserDict',
+    'UserList': 'collections:UserList',
+    'UserString': 'collections:UserString',
+    'VERBOSE': 're:VERBOSE',
+    'VMADDR_CID_ANY': 'socket:VMADDR_CID_ANY',
+    'VMADDR_CID_HOST': 'socket:VMADDR_CID_HOST',
+    'VMADDR_PORT_ANY': 'socket:VMADDR_PORT_ANY',
+    'VM_SOCKETS_INVALID_VERSION': 'socket:VM_SOCKETS_INVALID_VERSION',
+    'ValuesView': 'typing:ValuesView',
+    'WARN': 'logging:WARN',
+    'WARNING': 'logging:WARNING',
+    'WCONTINUED': 'os:WCONTINUED',
+    'WCOREDUMP': 'os:WCOREDUMP',
+    'WEDNESDAY': 'calendar:WEDNESDAY',
+    'WEXITED': 'os:WEXITED',
+    'WEXITSTATUS': 'os:WEXITSTATUS',
+    'WIFCONTINUED': 'os:WIFCONTINUED',
+    'WIFEXITED': 'os:WIFEXITED',
+    'WIFSIGNALED': 'os:WIFSIGNALED',
+    'WIFSTOPPED': 'os:WIFSTOPPED',
+    'WNOHANG': 'os:WNOHANG',
+    'WNOWAIT': 'os:WNOWAIT',
+    'WRAPPER_ASSIGNMENTS': 'functools:WRAPPER_ASSIGNMENTS',
+    'WRAPPER_UPDATES': 'functools:WRAPPER_UPDATES',
+    'WSTOPPED': 'os:WSTOPPED',
+    'WSTOPSIG': 'os:WSTOPSIG',
+    'WTERMSIG': 'os:WTERMSIG',
+    'WUNTRACED': 'os:WUNTRACED',
+    'W_OK': 'os:W_OK',
+    'Warning': 'builtins:Warning',
+    'WeakKeyDictionary': 'weakref:WeakKeyDictionary',
+    'WeakMethod': 'weakref:WeakMethod',
+    'WeakSet': 'weakref:WeakSet',
+    'WeakValueDictionary': 'weakref:WeakValueDictionary',
+    'While': 'ast:While',
+    'WindowsPath': 'pathlib:WindowsPath',
+    'With': 'ast:With',
+    'WrapperDescriptorType': 'types:WrapperDescriptorType',
+    'WriteTransport': 'asyncio:WriteTransport',
+    'X': 're:X',
+    'XATTR_CREATE': 'os:XATTR_CREATE',
+    'XATTR_REPLACE': 'os:XATTR_REPLACE',
+    'XATTR_SIZE_MAX': 'os:XATTR_SIZE_MAX',
+    'X_OK': 'os:X_OK',
+    'Yield': 'ast:Yield',
+    'YieldFrom': 'ast:YieldFrom',
+    'ZIP_BZIP2': 'zipfile:ZIP_BZIP2',
+    'ZIP_DEFLATED': 'zipfile:ZIP_DEFLATED',
+    'ZIP_LZMA': 'zipfile:ZIP_LZMA',
+    'ZIP_STORED': 'zipfile:ZIP_STORED',
+    'ZLIB_RUNTIME_VERSION': 'zlib:ZLIB_RUNTIME_VERSION',
+    'ZLIB_VERSION': 'zlib:ZLIB_VERSION',
+    'Z_BEST_COMPRESSION': 'zlib:Z_BEST_COMPRESSION',
+    'Z_BEST_SPEED': 'zlib:Z_BEST_SPEED',
+    'Z_BLOCK': 'zlib:Z_BLOCK',
+    'Z_DEFAULT_COMPRESSION': 'zlib:Z_DEFAULT_COMPRESSION',
+    'Z_DEFAULT_STRATEGY': 'zlib:Z_DEFAULT_STRATEGY',
+    'Z_FILTERED': 'zlib:Z_FILTERED',
+    'Z_FINISH': 'zlib:Z_FINISH',
+    'Z_FIXED': 'zlib:Z_FIXED',
+    'Z_FULL_FLUSH': 'zlib:Z_FULL_FLUSH',
+    'Z_HUFFMAN_ONLY': 'zlib:Z_HUFFMAN_ONLY',
+    'Z_NO_COMPRESSION': 'zlib:Z_NO_COMPRESSION',
+    'Z_NO_FLUSH': 'zlib:Z_NO_FLUSH',
+    'Z_PARTIAL_FLUSH': 'zlib:Z_PARTIAL_FLUSH',
+    'Z_RLE': 'zlib:Z_RLE',
+    'Z_SYNC_FLUSH': 'zlib:Z_SYNC_FLUSH',
+    'Z_TREES': 'zlib:Z_TREES',
+    'ZipFile': 'zipfile:ZipFile',
+    'ZipInfo': 'zipfile:ZipInfo',
+    'ZoneInfo': 'zoneinfo:ZoneInfo',
+    'ZoneInfoNotFoundError': 'zoneinfo:ZoneInfoNotFoundError',
+    'a2b_base64': 'binascii:a2b_base64',
+    'a2b_hex': 'binascii:a2b_hex',
+    'a2b_hqx': 'binascii:a2b_hqx',
+    'a2b_qp': 'binascii:a2b_qp',
+    'a2b_uu': 'binascii:a2b_uu',
+    'a85decode': 'base64:a85decode',
+    'a85encode': 'base64:a85encode',
+    'abc': 'abc',
+    'abiflags': 'sys:abiflags',
+    'abort': 'os:abort',
+    'abs': 'builtins:abs',
+    'abspath': 'os.path:abspath',
+    'abstractclassmethod': 'abc:abstractclassmethod',
+    'abstractmethod': 'abc:abstractmethod',
+    'abstractproperty': 'abc:abstractproperty',
+    'abstractstaticmethod': 'abc:abstractstaticmethod',
+    'access': 'os:access',
+    'accumulate': 'itertools:accumulate',
+    'aclosing': 'contextlib:aclosing',
+    'acos': 'math:acos',
+    'acosh': 'math:acosh',
+    'active_count': 'threading:active_count',
+    'adapt': 'sqlite3:adapt',
+    'adapters': 'sqlite3:adapters',
+    'add': 'operator:add',
+    'addLevelName': 'logging:addLevelName',
+    'add_type': 'mimetypes:add_type',
+    'addaudithook': 'sys:addaudithook',
+    'adler32': 'zlib:adler32',
+    'alarm': 'signal:alarm',
+    'algorithms_available': 'hashlib:algorithms_available',
+    'algorithms_guaranteed': 'hashlib:algorithms_guaranteed',
+    'alias': 'ast:alias',
+    'all_tasks': 'asyncio:all_tasks',
+    'altsep': 'os.path:altsep',
+    'altzone': 'time:altzone',
+    'and_': 'operator:and_',
+    'api_version': 'sys:api_version',
+    'apilevel': 'sqlite3:apilevel',
+    'architecture': 'platform:architecture',
+    'arg': 'ast:arg',
+    'arguments': 'ast:arguments',
+    'argv': 'sys:argv',
+    'array': 'array:array',
+    'as_completed': 'asyncio:as_completed',
+    'ascii_letters': 'string:ascii_letters',
+    'ascii_lowercase': 'string:ascii_lowercase',
+    'ascii_uppercase': 'string:ascii_uppercase',
+    'asctime': 'time:asctime',
+    'asdict': 'dataclasses:asdict',
+    'asin': 'math:asin',
+    'asinh': 'math:asinh',
+    'ast': 'ast',
+    'astuple': 'dataclasses:astuple',
+    'async_cached_property': 'stdlb.cached_property:async_cached_property',
+    'asynccontextmanager': 'contextlib:asynccontextmanager',
+    'asyncio': 'asyncio',
+    'atan': 'math:atan',
+    'atan2': 'math:atan2',
+    'atanh': 'math:atanh',
+    'atof': 'locale:atof',
+    'atoi': 'locale:atoi',
+    'attrgetter': 'operator:attrgetter',
+    'audit': 'sys:audit',
+    'auto': 'enum:auto',
+    'available_timezones': 'zoneinfo:available_timezones',
+    'b16decode': 'base64:b16decode',
+    'b16encode': 'base64:b16encode',
+    'b2a_base64': 'binascii:b2a_base64',
+    'b2a_hex': 'binascii:b2a_hex',
+    'b2a_hqx': 'binascii:b2a_hqx',
+    'b2a_qp': 'binascii:b2a_qp',
+    'b2a_uu': 'binascii:b2a_uu',
+    'b32decode': 'base64:b32decode',
+    'b32encode': 'base64:b32encode',
+    'b32hexdecode': 'base64:b32hexdecode',
+    'b32hexencode': 'base64:b32hexencode',
+    'b64decode': 'base64:b64decode',
+    'b64encode': 'base64:b64encode',
+    'b85decode': 'base64:b85decode',
+    'b85encode': 'base64:b85encode',
+    'backslashreplace_errors': 'codecs:backslashreplace_errors',
+    'base64': 'base64',
+    'base_exec_prefix': 'sys:base_exec_prefix',
+    'base_prefix': 'sys:base_prefix',
+    'basename': 'os.path:basename',
+    'basicConfig': 'logging:basicConfig',
+    'betavariate': 'random:betavariate',
+    'bidirectional': 'unicodedata:bidirectional',
+    'binascii': 'binascii',
+    'bisect': 'bisect:bisect',
+    'bisect_left': 'bisect:bisect_left',
+    'bisect_right': 'bisect:bisect_right',
+    'blake2b': 'hashlib:blake2b',
+    'blake2s': 'hashlib:blake2s',
+    'boolop': 'ast:boolop',
+    'breakpointhook': 'sys:breakpointhook',
+    'builtin_module_names': 'sys:builtin_module_names',
+    'byteorder': 'sys:byteorder',
+    'bytes_': 'uuid:bytes_',
+    'cache': 'functools:cache',
+    'cached_property': 'stdlb.cached_property:cached_property',
+    'calcsize': 'struct:calcsize',
+    'calendar': 'calendar:calendar',
+    'call': 'subprocess:call',
+    'call_tracing': 'sys:call_tracing',
+    'captureWarnings': 'logging:captureWarnings',
+    'capwords': 'string:capwords',
+    'cast': 'typing:cast',
+    'catch_warnings': 'warnings:catch_warnings',
+    'category': 'unicodedata:category',
+    'ceil': 'math:ceil',
+    'chain': 'itertools:chain',
+    'chdir': 'os:chdir',
+    'check_call': 'subprocess:check_call',
+    'check_output': 'subprocess:check_output',
+    'chmod': 'os:chmod',
+    'choice': 'secrets:choice',
+    'choices': 'random:choices',
+    'chown': 'shutil:chown',
+    'chroot': 'os:chroot',
+    'clear_frames': 'traceback:clear_frames',
+    'clock_getres': 'time:clock_getres',
+    'clock_gettime': 'time:clock_gettime',
+    'clock_gettime_ns': 'time:clock_gettime_ns',
+    'clock_settime': 'time:clock_settime',
+    'clock_settime_ns': 'time:clock_settime_ns',
+    'close': 'socket:close',
+    'closerange': 'os:closerange',
+    'closing': 'contextlib:closing',
+    'cmath': 'cmath',
+    'cmp_to_key': 'functools:cmp_to_key',
+    'cmpop': 'ast:cmpop',
+    'code': 'code',
+    'codecs': 'codecs',
+    'collections': 'collections',
+    'comb': 'math:comb',
+    'combinations': 'itertools:combinations',
+    'combinations_with_replacement': 'itertools:combinations_with_replacement',
+    'combining': 'unicodedata:combining',
+    'common_types': 'mimetypes:common_types',
+    'commonpath': 'os.path:commonpath',
+    'commonprefix': 'os.path:commonprefix',
+    'compare_digest': 'secrets:compare_digest',
+    'compile': 'builtins:compile',
+    'compile_command': 'code:compile_command',
+    'complete_statement': 'sqlite3:complete_statement',
+    'comprehension': 'ast:comprehension',
+    'compress': 'itertools:compress',
+    'compressobj': 'zlib:compressobj',
+    'concat': 'operator:concat',
+    'configparser': 'configparser',
+    'confstr': 'os:confstr',
+    'confstr_names': 'os:confstr_names',
+    'connect': 'sqlite3:connect',
+    'contains': 'operator:contains',
+    'context_diff': 'difflib:context_diff',
+    'contextlib': 'contextlib',
+    'contextmanager': 'contextlib:contextmanager',
+    'converters': 'sqlite3:converters',
+    'copy': 'shutil:copy',
+    'copy2': 'shutil:copy2',
+    'copy_file_range': 'os:copy_file_range',
+    'copy_location': 'ast:copy_location',
+    'copyfile': 'shutil:copyfile',
+    'copyfileobj': 'shutil:copyfileobj',
+    'copymode': 'shutil:copymode',
+    'copyright': 'builtins:copyright',
+    'copysign': 'math:copysign',
+    'copystat': 'shutil:copystat',
+    'copytree': 'shutil:copytree',
+    'coroutine': 'types:coroutine',
+    'correlation': 'statistics:correlation',
+    'cos': 'math:cos',
+    'cosh': 'math:cosh',
+    'count': 'itertools:count',
+    'countOf': 'operator:countOf',
+    'covariance': 'statistics:covariance',
+    'cpu_count': 'os:cpu_count',
+    'crc32': 'zlib:crc32',
+    'crc_hqx': 'binascii:crc_hqx',
+    'create_connection': 'socket:create_connection',
+    'create_server': 'socket:create_server',
+    'create_subprocess_exec': 'asyncio:create_subprocess_exec',
+    'create_subprocess_shell': 'asyncio:create_subprocess_shell',
+    'create_task': 'asyncio:create_task',
+    'critical': 'logging:critical',
+    'csv': 'csv',
+    'ctermid': 'os:ctermid',
+    'ctime': 'time:ctime',
+    'curdir': 'os.path:curdir',
+    'currency': 'locale:currency',
+    'current_task': 'asyncio:current_task',
+    'current_thread': 'threading:current_thread',
+    'cycle': 'itertools:cycle',
+    'dataclass': 'dataclasses:dataclass',
+    'dataclasses': 'dataclasses',
+    'date': 'datetime:date',
+    'datetime': 'datetime',
+    'day_abbr': 'calendar:day_abbr',
+    'day_name': 'calendar:day_name',
+    'daylight': 'time:daylight',
+    'dbapi2': 'sqlite3.dbapi2',
+    'debug': 'logging:debug',
+    'decimal': 'unicodedata:decimal',
+    'decode': 'codecs:decode',
+    'decodebytes': 'base64:decodebytes',
+    'decomposition': 'unicodedata:decomposition',
+    'decompress': 'zlib:decompress',
+    'decompressobj': 'zlib:decompressobj',
+    'dedent': 'textwrap:dedent',
+    'deepcopy': 'copy:deepcopy',
+    'default_int_handler': 'signal:default_int_handler',
+    'default_timer': 'timeit:default_timer',
+    'defaultdict': 'collections:defaultdict',
+    'defpath': 'os.path:defpath',
+    'degrees': 'math:degrees',
+    'delitem': 'operator:delitem',
+    'deque': 'collections:deque',
+    'device_encoding': 'os:device_encoding',
+    'devnull': 'os.path:devnull',
+    'diff_bytes': 'difflib:diff_bytes',
+    'difflib': 'difflib',
+    'digest': 'hmac:digest',
+    'digest_size': 'hmac:digest_size',
+    'digit': 'unicodedata:digit',
+    'digits': 'string:digits',
+    'dirname': 'os.path:dirname',
+    'disable': 'logging:disable',
+    'disk_usage': 'shutil:disk_usage',
+    'displayhook': 'sys:displayhook',
+    'dist': 'math:dist',
+    'dom': 'xml.dom',
+    'dont_write_bytecode': 'sys:dont_write_bytecode',
+    'dropwhile': 'itertools:dropwhile',
+    'dt': 'datetime:datetime',
+    'dump': 'pickle:dump',
+    'dumps': 'pickle:dumps',
+    'dup': 'socket:dup',
+    'dup2': 'os:dup2',
+    'e': 'math:e',
+    'east_asian_width': 'unicodedata:east_asian_width',
+    'enable_callback_tracebacks': 'sqlite3:enable_callback_tracebacks',
+    'enable_shared_cache': 'sqlite3:enable_shared_cache',
+    'encode': 'codecs:encode',
+    'encodebytes': 'base64:encodebytes',
+    'encodings_map': 'mimetypes:encodings_map',
+    'ensure_future': 'asyncio:ensure_future',
+    'enum': 'enum',
+    'enumerate': 'builtins:enumerate',
+    'environ': 'os:environ',
+    'environb': 'os:environb',
+    'eq': 'operator:eq',
+    'erf': 'math:erf',
+    'erfc': 'math:erfc',
+    'error': 're:error',
+    'escape': 're:escape',
+    'etree': 'xml.etree',
+    'eventfd': 'os:eventfd',
+    'eventfd_read': 'os:eventfd_read',
+    'eventfd_write': 'os:eventfd_write',
+    'exc_info': 'sys:exc_info',
+    'excel': 'csv:excel',
+    'excel_tab': 'csv:excel_tab',
+    'excepthandler': 'ast:excepthandler',
+    'excepthook': 'threading:excepthook',
+    'exception': 'logging:exception',
+    'exec_prefix': 'sys:exec_prefix',
+    'execl': 'os:execl',
+    'execle': 'os:execle',
+    'execlp': 'os:execlp',
+    'execlpe': 'os:execlpe',
+    'executable': 'sys:executable',
+    'execv': 'os:execv',
+    'execve': 'os:execve',
+    'execvp': 'os:execvp',
+    'execvpe': 'os:execvpe',
+    'exists': 'os.path:exists',
+    'exit': 'builtins:exit',
+    'exp': 'math:exp',
+    'expanduser': 'os.path:expanduser',
+    'expandvars': 'os.path:expandvars',
+    'expm1': 'math:expm1',
+    'expovariate': 'random:expovariate',
+    'expr': 'ast:expr',
+    'expr_context': 'ast:expr_context',
+    'extract_stack': 'traceback:extract_stack',
+    'extract_tb': 'traceback:extract_tb',
+    'extsep': 'os.path:extsep',
+    'fabs': 'math:fabs',
+    'factorial': 'math:factorial',
+    'fatal': 'logging:fatal',
+    'fchdir': 'os:fchdir',
+    'fchmod': 'os:fchmod',
+    'fchown': 'os:fchown',
+    'fdatasync': 'os:fdatasync',
+    'fdopen': 'os:fdopen',
+    'field': 'dataclasses:field',
+    'field_size_limit': 'csv:field_size_limit',
+    'fields': 'dataclasses:fields',
+    'fill': 'textwrap:fill',
+    'filter': 'builtins:filter',
+    'filterfalse': 'itertools:filterfalse',
+    'filterwarnings': 'warnings:filterwarnings',
+    'final': 'typing:final',
+    'finalize': 'weakref:finalize',
+    'findall': 're:findall',
+    'finditer': 're:finditer',
+    'firstweekday': 'calendar:firstweekday',
+    'fix_missing_locations': 'ast:fix_missing_locations',
+    'flags': 'sys:flags',
+    'float_info': 'sys:float_info',
+    'float_repr_style': 'sys:float_repr_style',
+    'floor': 'math:floor',
+    'floordiv': 'operator:floordiv',
+    'fmean': 'statistics:fmean',
+    'fmod': 'math:fmod',
+    'fnmatch': 'fnmatch:fnmatch',
+    'fnmatchcase': 'fnmatch:fnmatchcase',
+    'fork': 'os:fork',
+    'forkpty': 'os:forkpty',
+    'format': 'locale:format',
+    'format_exc': 'traceback:format_exc',
+    'format_exception': 'traceback:format_exception',
+    'format_exception_only': 'traceback:format_exception_only',
+    'format_list': 'traceback:format_list',
+    'format_stack': 'traceback:format_stack',
+    'format_string': 'locale:format_string',
+    'format_tb': 'traceback:format_tb',
+    'formatwarning': 'warnings:formatwarning',
+    'fpathconf': 'os:fpathconf',
+    'fractions': 'fractions',
+    'freedesktop_os_release': 'platform:freedesktop_os_release',
+    'frexp': 'math:frexp',
+    'fromfd': 'socket:fromfd',
+    'fromisoformat': 'datetime:datetime.fromisoformat',
+    'fromtimestamp': 'datetime:datetime.fromtimestamp',
+    'fsdecode': 'os:fsdecode',
+    'fsencode': 'os:fsencode',
+    'fspath': 'os:fspath',
+    'fstat': 'os:fstat',
+    'fstatvfs': 'os:fstatvfs',
+    'fsum': 'math:fsum',
+    'fsync': 'os:fsync',
+    'ftruncate': 'os:ftruncate',
+    'fullmatch': 're:fullmatch',
+    'functools': 'functools',
+    'fwalk': 'os:fwalk',
+    'gaierror': 'socket:gaierror',
+    'gamma': 'math:gamma',
+    'gammavariate': 'random:gammavariate',
+    'gather': 'asyncio:gather',
+    'gauss': 'random:gauss',
+    'gcd': 'math:gcd',
+    'ge': 'operator:ge',
+    'geometric_mean': 'statistics:geometric_mean',
+    'getLevelName': 'logging:getLevelName',
+    'getLogRecordFactory': 'logging:getLogRecordFactory',
+    'getLogger': 'logging:getLogger',
+    'getLoggerClass': 'logging:getLoggerClass',
+    'get_archive_formats': 'shutil:get_archive_formats',
+    'get_args': 'typing:get_args',
+    'get_asyncgen_hooks': 'sys:get_asyncgen_hooks',
+    'get_blocking': 'os:get_blocking',
+    'get_cache_token': 'abc:get_cache_token',
+    'get_child_watcher': 'asyncio:get_child_watcher',
+    'get_clock_info': 'time:get_clock_info',
+    'get_close_matches': 'difflib:get_close_matches',
+    'get_coroutine_origin_tracking_depth': 'sys:get_coroutine_origin_tracking_depth',
+    'get_dialect': 'csv:get_dialect',
+    'get_docstring': 'ast:get_docstring',
+    'get_event_loop': 'asyncio:get_event_loop',
+    'get_event_loop_policy': 'asyncio:get_event_loop_policy',
+    'get_exec_path': 'os:get_exec_path',
+    'get_ident': 'threading:get_ident',
+    'get_inheritable': 'os:get_inheritable',
+    'get_int_max_str_digits': 'sys:get_int_max_str_digits',
+    'get_native_id': 'threading:get_native_id',
+    'get_origin': 'typing:get_origin',
+    'get_running_loop': 'asyncio:get_running_loop',
+    'get_source_segment': 'ast:get_source_segment',
+    'get_terminal_size': 'shutil:get_terminal_size',
+    'get_type_hints': 'typing:get_type_hints',
+    'get_unpack_formats': 'shutil:get_unpack_formats',
+    'getaddrinfo': 'socket:getaddrinfo',
+    'getallocatedblocks': 'sys:getallocatedblocks',
+    'getatime': 'os.path:getatime',
+    'getcontext': 'decimal:getcontext',
+    'getctime': 'os.path:getctime',
+    'getcwd': 'os:getcwd',
+    'getcwdb': 'os:getcwdb',
+    'getdecoder': 'codecs:getdecoder',
+    'getdefaultencoding': 'sys:getdefaultencoding',
+    'getdefaultlocale': 'locale:getdefaultlocale',
+    'getdefaulttimeout': 'socket:getdefaulttimeout',
+    'getdlopenflags': 'sys:getdlopenflags',
+    'getegid': 'os:getegid',
+    'getencoder': 'codecs:getencoder',
+    'getenv': 'os:getenv',
+    'getenvb': 'os:getenvb',
+    'geteuid': 'os:geteuid',
+    'getfilesystemencodeerrors': 'sys:getfilesystemencodeerrors',
+    'getfilesystemencoding': 'sys:getfilesystemencoding',
+    'getfqdn': 'socket:getfqdn',
+    'getgid': 'os:getgid',
+    'getgrouplist': 'os:getgrouplist',
+    'getgroups': 'os:getgroups',
+    'gethostbyaddr': 'socket:gethostbyaddr',
+    'gethostbyname': 'socket:gethostbyname',
+    'gethostbyname_ex': 'socket:gethostbyname_ex',
+    'gethostname': 'socket:gethostname',
+    'getincrementaldecoder': 'codecs:getincrementaldecoder',
+    'getincrementalencoder': 'codecs:getincrementalencoder',
+    'getitem': 'operator:getitem',
+    'getitimer': 'signal:getitimer',
+    'getloadavg': 'os:getloadavg',
+    'getlocale': 'locale:getlocale',
+    'getlogin': 'os:getlogin',
+    'getmtime': 'os.path:getmtime',
+    'getnameinfo': 'socket:getnameinfo',
+    'getnode': 'uuid:getnode',
+    'getoutput': 'subprocess:getoutput',
+    'getpgid': 'os:getpgid',
+    'getpgrp': 'os:getpgrp',
+    'getpid': 'os:getpid',
+    'getppid': 'os:getppid',
+    'getpreferredencoding': 'locale:getpreferredencoding',
+    'getpriority': 'os:getpriority',
+    'getprofile': 'threading:getprofile',
+    'getprotobyname': 'socket:getprotobyname',
+    'getrandbits': 'random:getrandbits',
+    'getrandom': 'os:getrandom',
+    'getreader': 'codecs:getreader',
+    'getrecursionlimit': 'sys:getrecursionlimit',
+    'getrefcount': 'sys:getrefcount',
+    'getresgid': 'os:getresgid',
+    'getresuid': 'os:getresuid',
+    'getservbyname': 'socket:getservbyname',
+    'getservbyport': 'socket:getservbyport',
+    'getsid': 'os:getsid',
+    'getsignal': 'signal:getsignal',
+    'getsize': 'os.path:getsize',
+    'getsizeof': 'sys:getsizeof',
+    'getstate': 'random:getstate',
+    'getstatusoutput': 'subprocess:getstatusoutput',
+    'getswitchinterval': 'sys:getswitchinterval',
+    'gettempdir': 'tempfile:gettempdir',
+    'gettempdirb': 'tempfile:gettempdirb',
+    'gettempprefix': 'tempfile:gettempprefix',
+    'gettempprefixb': 'tempfile:gettempprefixb',
+    'gettrace': 'threading:gettrace',
+    'getuid': 'os:getuid',
+    'getweakrefcount': 'weakref:getweakrefcount',
+    'getweakrefs': 'weakref:getweakrefs',
+    'getwriter': 'codecs:getwriter',
+    'getxattr': 'os:getxattr',
+    'glob': 'glob',
+    'gmtime': 'time:gmtime',
+    'graphlib': 'graphlib',
+    'groupby': 'itertools:groupby',
+    'gt': 'operator:gt',
+    'guess_all_extensions': 'mimetypes:guess_all_extensions',
+    'guess_extension': 'mimetypes:guess_extension',
+    'guess_type': 'mimetypes:guess_type',
+    'harmonic_mean': 'statistics:harmonic_mean',
+    'has_dualstack_ipv6': 'socket:has_dualstack_ipv6',
+    'has_ipv6': 'socket:has_ipv6',
+    'hash_info': 'sys:hash_info',
+    'hashlib': 'hashlib',
+    'heapify': 'heapq:heapify',
+    'heappop': 'heapq:heappop',
+    'heappush': 'heapq:heappush',
+    'heappushpop': 'heapq:heappushpop',
+    'heapq': 'heapq',
+    'heapreplace': 'heapq:heapreplace',
+    'herror': 'socket:herror',
+    'hexdigits': 'string:hexdigits',
+    'hexlify': 'binascii:hexlify',
+    'hexversion': 'sys:hexversion',
+    'hmac': 'hmac',
+    'html': 'html',
+    'htonl': 'socket:htonl',
+    'htons': 'socket:htons',
+    'http': 'http',
+    'hypot': 'math:hypot',
+    'iadd': 'operator:iadd',
+    'iand': 'operator:iand',
+    'iconcat': 'operator:iconcat',
+    'if_indextoname': 'socket:if_indextoname',
+    'if_nameindex': 'socket:if_nameindex',
+    'if_nametoindex': 'socket:if_nametoindex',
+    'ifloordiv': 'operator:ifloordiv',
+    'iglob': 'glob:iglob',
+    'ignore_errors': 'codecs:ignore_errors',
+    'ignore_patterns': 'shutil:ignore_patterns',
+    'ilshift': 'operator:ilshift',
+    'imatmul': 'operator:imatmul',
+    'imod': 'operator:imod',
+    'implementation': 'sys:implementation',
+    'imul': 'operator:imul',
+    'increment_lineno': 'ast:increment_lineno',
+    'indent': 'textwrap:indent',
+    'index': 'operator:index',
+    'indexOf': 'operator:indexOf',
+    'inet_aton': 'socket:inet_aton',
+    'inet_ntoa': 'socket:inet_ntoa',
+    'inet_ntop': 'socket:inet_ntop',
+    'inet_pton': 'socket:inet_pton',
+    'inf': 'math:inf',
+    'infj': 'cmath:infj',
+    'info': 'logging:info',
+    'init': 'mimetypes:init',
+    'inited': 'mimetypes:inited',
+    'initgroups': 'os:initgroups',
+    'insort': 'bisect:insort',
+    'insort_left': 'bisect:insort_left',
+    'insort_right': 'bisect:insort_right',
+    'int_': 'uuid:int_',
+    'int_info': 'sys:int_info',
+    'interact': 'code:interact',
+    'intern': 'sys:intern',
+    'inv': 'operator:inv',
+    'invert': 'operator:invert',
+    'io': 'io',
+    'ior': 'operator:ior',
+    'ipow': 'operator:ipow',
+    'irshift': 'operator:irshift',
+    'is_': 'operator:is_',
+    'is_dataclass': 'dataclasses:is_dataclass',
+    'is_finalizing': 'sys:is_finalizing',
+    'is_normalized': 'unicodedata:is_normalized',
+    'is_not': 'operator:is_not',
+    'is_typeddict': 'typing:is_typeddict',
+    'is_zipfile': 'zipfile:is_zipfile',
+    'isabs': 'os.path:isabs',
+    'isatty': 'os:isatty',
+    'isclose': 'math:isclose',
+    'iscoroutine': 'asyncio:iscoroutine',
+    'iscoroutinefunction': 'asyncio:iscoroutinefunction',
+    'isdir': 'os.path:isdir',
+    'isfile': 'os.path:isfile',
+    'isfinite': 'math:isfinite',
+    'isfuture': 'asyncio:isfuture',
+    'isinf': 'math:isinf',
+    'isleap': 'calendar:isleap',
+    'islice': 'itertools:islice',
+    'islink': 'os.path:islink',
+    'ismount': 'os.path:ismount',
+    'isnan': 'math:isnan',
+    'isqrt': 'math:isqrt',
+    'isreadable': 'pprint:isreadable',
+    'isrecursive': 'pprint:isrecursive',
+    'isub': 'operator:isub',
+    'itemgetter': 'operator:itemgetter',
+    'iter_child_nodes': 'ast:iter_child_nodes',
+    'iter_fields': 'ast:iter_fields',
+    'iter_unpack': 'struct:iter_unpack',
+    'iterdecode': 'codecs:iterdecode',
+    'iterencode': 'codecs:iterencode',
+    'itertools': 'itertools',
+    'itruediv': 'operator:itruediv',
+    'ixor': 'operator:ixor',
+    'java_ver': 'platform:java_ver',
+    'join': 'os.path:join',
+    'json': 'json',
+    'keyword': 'ast:keyword',
+    'kill': 'os:kill',
+    'killpg': 'os:killpg',
+    'knownfiles': 'mimetypes:knownfiles',
+    'lastResort': 'logging:lastResort',
+    'lchown': 'os:lchown',
+    'lcm': 'math:lcm',
+    'ldexp': 'math:ldexp',
+    'le': 'operator:le',
+    'leapdays': 'calendar:leapdays',
+    'length_hint': 'operator:length_hint',
+    'lexists': 'os.path:lexists',
+    'lgamma': 'math:lgamma',
+    'libc_ver': 'platform:libc_ver',
+    'linear_regression': 'statistics:linear_regression',
+    'linesep': 'os:linesep',
+    'link': 'os:link',
+    'list_dialects': 'csv:list_dialects',
+    'listdir': 'os:listdir',
+    'listxattr': 'os:listxattr',
+    'literal_eval': 'ast:literal_eval',
+    'load': 'pickle:load',
+    'loads': 'pickle:loads',
+    'local': 'threading:local',
+    'localcontext': 'decimal:localcontext',
+    'locale': 'locale',
+    'localeconv': 'locale:localeconv',
+    'localtime': 'time:localtime',
+    'lockf': 'os:lockf',
+    'log': 'math:log',
+    'log10': 'math:log10',
+    'log1p': 'math:log1p',
+    'log2': 'math:log2',
+    'logging': 'logging',
+    'lognormvariate': 'random:lognormvariate',
+    'lookup': 'unicodedata:lookup',
+    'lookup_error': 'codecs:lookup_error',
+    'lru_cache': 'functools:lru_cache',
+    'lseek': 'os:lseek',
+    'lshift': 'operator:lshift',
+    'lstat': 'os:lstat',
+    'lt': 'operator:lt',
+    'mac_ver': 'platform:mac_ver',
+    'machine': 'platform:machine',
+    'main': 'ast:main',
+    'main_thread': 'threading:main_thread',
+    'major': 'os:major',
+    'makeLogRecord': 'logging:makeLogRecord',
+    'make_archive': 'shutil:make_archive',
+    'make_dataclass': 'dataclasses:make_dataclass',
+    'makedev': 'os:makedev',
+    'makedirs': 'os:makedirs',
+    'match': 're:match',
+    'match_case': 'ast:match_case',
+    'math': 'math',
+    'matmul': 'operator:matmul',
+    'maxsize': 'sys:maxsize',
+    'maxunicode': 'sys:maxunicode',
+    'md5': 'hashlib:md5',
+    'mean': 'statistics:mean',
+    'median': 'statistics:median',
+    'median_grouped': 'statistics:median_grouped',
+    'median_high': 'statistics:median_high',
+    'median_low': 'statistics:median_low',
+    'memfd_create': 'os:memfd_create',
+    'merge': 'heapq:merge',
+    'meta_path': 'sys:meta_path',
+    'methodcaller': 'operator:methodcaller',
+    'mimetypes': 'mimetypes',
+    'minor': 'os:minor',
+    'mirrored': 'unicodedata:mirrored',
+    'mkdir': 'os:mkdir',
+    'mkdtemp': 'tempfile:mkdtemp',
+    'mkfifo': 'os:mkfifo',
+    'mknod': 'os:mknod',
+    'mkstemp': 'tempfile:mkstemp',
+    'mktemp': 'tempfile:mktemp',
+    'mktime': 'time:mktime',
+    'mod': 'operator:mod',
+    'mode': 'statistics:mode',
+    'modf': 'math:modf',
+    'modules': 'sys:modules',
+    'monotonic': 'time:monotonic',
+    'monotonic_ns': 'time:monotonic_ns',
+    'month': 'calendar:month',
+    'month_abbr': 'calendar:month_abbr',
+    'month_name': 'calendar:month_name',
+    'monthcalendar': 'calendar:monthcalendar',
+    'monthrange': 'calendar:monthrange',
+    'move': 'shutil:move',
+    'mul': 'operator:mul',
+    'multimode': 'statistics:multimode',
+    'name': 'unicodedata:name',
+    'namedtuple': 'collections:namedtuple',
+    'namereplace_errors': 'codecs:namereplace_errors',
+    'nan': 'math:nan',
+    'nanj': 'cmath:nanj',
+    'ndiff': 'difflib:ndiff',
+    'ne': 'operator:ne',
+    'neg': 'operator:neg',
+    'new': 'hmac:new',
+    'new_class': 'types:new_class',
+    'new_event_loop': 'asyncio:new_event_loop',
+    'nextafter': 'math:nextafter',
+    'nice': 'os:nice',
+    'nlargest': 'heapq:nlargest',
+    'no_type_check': 'typing:no_type_check',
+    'no_type_check_decorator': 'typing:no_type_check_decorator',
+    'node': 'platform:node',
+    'normalize': 'unicodedata:normalize',
+    'normalvariate': 'random:normalvariate',
+    'normcase': 'os.path:normcase',
+    'normpath': 'os.path:normpath',
+    'not_': 'operator:not_',
+    'nsmallest': 'heapq:nsmallest',
+    'ntohl': 'socket:ntohl',
+    'ntohs': 'socket:ntohs',
+    'nullcontext': 'contextlib:nullcontext',
+    'numbers': 'numbers',
+    'numeric': 'unicodedata:numeric',
+    'octdigits': 'string:octdigits',
+    'open': 'builtins:open',
+    'open_code': 'io:open_code',
+    'open_connection': 'asyncio:open_connection',
+    'open_unix_connection': 'asyncio:open_unix_connection',
+    'openpty': 'os:openpty',
+    'operator': 'operator',
+    'or_': 'operator:or_',
+    'orig_argv': 'sys:orig_argv',
+    'os': 'os',
+    'overload': 'typing:overload',
+    'pack': 'struct:pack',
+    'pack_into': 'struct:pack_into',
+    'pairwise': 'itertools:pairwise',
+    'paramstyle': 'sqlite3:paramstyle',
+    'pardir': 'os.path:pardir',
+    'paretovariate': 'random:paretovariate',
+    'parse': 'urllib.parse',
+    'parse_qs': 'urllib.parse:parse_qs',
+    'parse_qsl': 'urllib.parse:parse_qsl',
+    'parsers': 'xml.parsers',
+    'partial': 'functools:partial',
+    'partialmethod': 'functools:partialmethod',
+    'path': 'os.path',
+    'path_hooks': 'sys:path_hooks',
+    'path_importer_cache': 'sys:path_importer_cache',
+    'pathconf': 'os:pathconf',
+    'pathconf_names': 'os:pathconf_names',
+    'pathlib': 'pathlib',
+    'pathsep': 'os.path:pathsep',
+    'pattern': 'ast:pattern',
+    'pause': 'signal:pause',
+    'pbkdf2_hmac': 'hashlib:pbkdf2_hmac',
+    'perf_counter': 'time:perf_counter',
+    'perf_counter_ns': 'time:perf_counter_ns',
+    'perm': 'math:perm',
+    'permutations': 'itertools:permutations',
+    'pformat': 'pprint:pformat',
+    'phase': 'cmath:phase',
+    'pi': 'math:pi',
+    'pickle': 'pickle',
+    'pidfd_open': 'os:pidfd_open',
+    'pidfd_send_signal': 'signal:pidfd_send_signal',
+    'pipe': 'os:pipe',
+    'pipe2': 'os:pipe2',
+    'platform': 'platform',
+    'platlibdir': 'sys:platlibdir',
+    'polar': 'cmath:polar',
+    'popen': 'os:popen',
+    'pos': 'operator:pos',
+    'posix_fadvise': 'os:posix_fadvise',
+    'posix_fallocate': 'os:posix_fallocate',
+    'posix_spawn': 'os:posix_spawn',
+    'posix_spawnp': 'os:posix_spawnp',
+    'pow': 'builtins:pow',
+    'pp': 'pprint:pp',
+    'pprint': 'pprint:pprint',
+    'prcal': 'calendar:prcal',
+    'pread': 'os:pread',
+    'preadv': 'os:preadv',
+    'prefix': 'sys:prefix',
+    'prepare_class': 'types:prepare_class',
+    'print_exc': 'traceback:print_exc',
+    'print_exception': 'traceback:print_exception',
+    'print_last': 'traceback:print_last',
+    'print_stack': 'traceback:print_stack',
+    'print_tb': 'traceback:print_tb',
+    'printable': 'string:printable',
+    'prmonth': 'calendar:prmonth',
+    'process_time': 'time:process_time',
+    'process_time_ns': 'time:process_time_ns',
+    'processor': 'platform:processor',
+    'prod': 'math:prod',
+    'product': 'itertools:product',
+    'property': 'builtins:property',
+    'proxy': 'weakref:proxy',
+    'pstdev': 'statistics:pstdev',
+    'pthread_getcpuclockid': 'time:pthread_getcpuclockid',
+    'pthread_kill': 'signal:pthread_kill',
+    'pthread_sigmask': 'signal:pthread_sigmask',
+    'punctuation': 'string:punctuation',
+    'purge': 're:purge',
+    'putenv': 'os:putenv',
+    'pvariance': 'statistics:pvariance',
+    'pwrite': 'os:pwrite',
+    'pwritev': 'os:pwritev',
+    'pycache_prefix': 'sys:pycache_prefix',
+    'python_branch': 'platform:python_branch',
+    'python_build': 'platform:python_build',
+    'python_compiler': 'platform:python_compiler',
+    'python_implementation': 'platform:python_implementation',
+    'python_revision': 'platform:python_revision',
+    'python_version': 'platform:python_version',
+    'python_version_tuple': 'platform:python_version_tuple',
+    'quantiles': 'statistics:quantiles',
+    'queue': 'queue',
+    'quote': 'urllib.parse:quote',
+    'quote_from_bytes': 'urllib.parse:quote_from_bytes',
+    'quote_plus': 'urllib.parse:quote_plus',
+    'radians': 'math:radians',
+    'raiseExceptions': 'logging:raiseExceptions',
+    'raise_signal': 'signal:raise_signal',
+    'randbelow': 'secrets:randbelow',
+    'randbits': 'secrets:randbits',
+    'randbytes': 'random:randbytes',
+    'randint': 'random:randint',
+    'random': 'random:random',
+    'randrange': 'random:randrange',
+    're': 're',
+    'read': 'os:read',
+    'read_mime_types': 'mimetypes:read_mime_types',
+    'reader': 'csv:reader',
+    'readlink': 'os:readlink',
+    'readv': 'os:readv',
+    'realpath': 'os.path:realpath',
+    'rect': 'cmath:rect',
+    'recursive_repr': 'reprlib:recursive_repr',
+    'recv_fds': 'socket:recv_fds',
+    'redirect_stderr': 'contextlib:redirect_stderr',
+    'redirect_stdout': 'contextlib:redirect_stdout',
+    'reduce': 'functools:reduce',
+    'ref': 'weakref:ref',
+    'register': 'codecs:register',
+    'register_adapter': 'sqlite3:register_adapter',
+    'register_archive_format': 'shutil:register_archive_format',
+    'register_at_fork': 'os:register_at_fork',
+    'register_converter': 'sqlite3:register_converter',
+    'register_dialect': 'csv:register_dialect',
+    'register_error': 'codecs:register_error',
+    'register_unpack_format': 'shutil:register_unpack_format',
+    'release': 'platform:release',
+    'relpath': 'os.path:relpath',
+    'remainder': 'math:remainder',
+    'remove': 'os:remove',
+    'removedirs': 'os:removedirs',
+    'removexattr': 'os:removexattr',
+    'rename': 'os:rename',
+    'renames': 'os:renames',
+    'repeat': 'itertools:repeat',
+    'replace': 'os:replace',
+    'replace_errors': 'codecs:replace_errors',
+    'repr': 'builtins:repr',
+    'reprlib': 'reprlib',
+    'reset_tzpath': 'zoneinfo:reset_tzpath',
+    'resetlocale': 'locale:resetlocale',
+    'resetwarnings': 'warnings:resetwarnings',
+    'resolve_bases': 'types:resolve_bases',
+    'restore': 'difflib:restore',
+    'rlecode_hqx': 'binascii:rlecode_hqx',
+    'rledecode_hqx': 'binascii:rledecode_hqx',
+    'rmdir': 'os:rmdir',
+    'rmtree': 'shutil:rmtree',
+    'rshift': 'operator:rshift',
+    'run': 'subprocess:run',
+    'run_coroutine_threadsafe': 'asyncio:run_coroutine_threadsafe',
+    'runtime_checkable': 'typing:runtime_checkable',
+    'saferepr': 'pprint:saferepr',
+    'samefile': 'os.path:samefile',
+    'sameopenfile': 'os.path:sameopenfile',
+    'samestat': 'os.path:samestat',
+    'sample': 'random:sample',
+    'sax': 'xml.sax',
+    'scandir': 'os:scandir',
+    'sched_get_priority_max': 'os:sched_get_priority_max',
+    'sched_get_priority_min': 'os:sched_get_priority_min',
+    'sched_getaffinity': 'os:sched_getaffinity',
+    'sched_getparam': 'os:sched_getparam',
+    'sched_getscheduler': 'os:sched_getscheduler',
+    'sched_param': 'os:sched_param',
+    'sched_rr_get_interval': 'os:sched_rr_get_interval',
+    'sched_setaffinity': 'os:sched_setaffinity',
+    'sched_setparam': 'os:sched_setparam',
+    'sched_setscheduler': 'os:sched_setscheduler',
+    'sched_yield': 'os:sched_yield',
+    'search': 're:search',
+    'secrets': 'secrets',
+    'seed': 'random:seed',
+    'send_fds': 'socket:send_fds',
+    'sendfile': 'os:sendfile',
+    'sep': 'os.path:sep',
+    'setLogRecordFactory': 'logging:setLogRecordFactory',
+    'setLoggerClass': 'logging:setLoggerClass',
+    'set_asyncgen_hooks': 'sys:set_asyncgen_hooks',
+    'set_blocking': 'os:set_blocking',
+    'set_child_watcher': 'asyncio:set_child_watcher',
+    'set_coroutine_origin_tracking_depth': 'sys:set_coroutine_origin_tracking_depth',
+    'set_event_loop': 'asyncio:set_event_loop',
+    'set_event_loop_policy': 'asyncio:set_event_loop_policy',
+    'set_inheritable': 'os:set_inheritable',
+    'set_int_max_str_digits': 'sys:set_int_max_str_digits',
+    'set_wakeup_fd': 'signal:set_wakeup_fd',
+    'setcontext': 'decimal:setcontext',
+    'setdefaulttimeout': 'socket:setdefaulttimeout',
+    'setdlopenflags': 'sys:setdlopenflags',
+    'setegid': 'os:setegid',
+    'seteuid': 'os:seteuid',
+    'setfirstweekday': 'calendar:setfirstweekday',
+    'setgid': 'os:setgid',
+    'setgroups': 'os:setgroups',
+    'sethostname': 'socket:sethostname',
+    'setitem': 'operator:setitem',
+    'setitimer': 'signal:setitimer',
+    'setlocale': 'locale:setlocale',
+    'setpgid': 'os:setpgid',
+    'setpgrp': 'os:setpgrp',
+    'setpriority': 'os:setpriority',
+    'setprofile': 'threading:setprofile',
+    'setrecursionlimit': 'sys:setrecursionlimit',
+    'setregid': 'os:setregid',
+    'setresgid': 'os:setresgid',
+    'setresuid': 'os:setresuid',
+    'setreuid': 'os:setreuid',
+    'setsid': 'os:setsid',
+    'setstate': 'random:setstate',
+    'setswitchinterval': 'sys:setswitchinterval',
+    'settrace': 'threading:settrace',
+    'setuid': 'os:setuid',
+    'setxattr': 'os:setxattr',
+    'sha1': 'hashlib:sha1',
+    'sha224': 'hashlib:sha224',
+    'sha256': 'hashlib:sha256',
+    'sha384': 'hashlib:sha384',
+    'sha3_224': 'hashlib:sha3_224',
+    'sha3_256': 'hashlib:sha3_256',
+    'sha3_384': 'hashlib:sha3_384',
+    'sha3_512': 'hashlib:sha3_512',
+    'sha512': 'hashlib:sha512',
+    'shake_128': 'hashlib:shake_128',
+    'shake_256': 'hashlib:shake_256',
+    'shelve': 'shelve',
+    'shield': 'asyncio:shield',
+    'shlex': 'shlex',
+    'shorten': 'textwrap:shorten',
+    'showwarning': 'warnings:showwarning',
+    'shuffle': 'random:shuffle',
+    'shutdown': 'logging:shutdown',
+    'shutil': 'shutil',
+    'siginterrupt': 'signal:siginterrupt',
+    'signal': 'signal:signal',
+    'sigpending': 'signal:sigpending',
+    'sigtimedwait': 'signal:sigtimedwait',
+    'sigwait': 'signal:sigwait',
+    'sigwaitinfo': 'signal:sigwaitinfo',
+    'simplefilter': 'warnings:simplefilter',
+    'sin': 'math:sin',
+    'singledispatch': 'functools:singledispatch',
+    'singledispatchmethod': 'functools:singledispatchmethod',
+    'sinh': 'math:sinh',
+    'sleep': 'time:sleep',
+    'slice': 'builtins:slice',
+    'socket': 'socket:socket',
+    'socketpair': 'socket:socketpair',
+    'spawnl': 'os:spawnl',
+    'spawnle': 'os:spawnle',
+    'spawnlp': 'os:spawnlp',
+    'spawnlpe': 'os:spawnlpe',
+    'spawnv': 'os:spawnv',
+    'spawnve': 'os:spawnve',
+    'spawnvp': 'os:spawnvp',
+    'spawnvpe': 'os:spawnvpe',
+    'splice': 'os:splice',
+    'split': 'shlex:split',
+    'splitdrive': 'os.path:splitdrive',
+    'splitext': 'os.path:splitext',
+    'sqlite3': 'sqlite3',
+    'sqlite_version': 'sqlite3:sqlite_version',
+    'sqlite_version_info': 'sqlite3:sqlite_version_info',
+    'sqrt': 'math:sqrt',
+    'stack_size': 'threading:stack_size',
+    'standard_b64decode': 'base64:standard_b64decode',
+    'standard_b64encode': 'base64:standard_b64encode',
+    'starmap': 'itertools:starmap',
+    'start_server': 'asyncio:start_server',
+    'start_unix_server': 'asyncio:start_unix_server',
+    'stat': 'os:stat',
+    'stat_result': 'os:stat_result',
+    'statistics': 'statistics',
+    'statvfs': 'os:statvfs',
+    'statvfs_result': 'os:statvfs_result',
+    'stderr': 'sys:stderr',
+    'stdev': 'statistics:stdev',
+    'stdin': 'sys:stdin',
+    'stdlib_module_names': 'sys:stdlib_module_names',
+    'stdout': 'sys:stdout',
+    'stmt': 'ast:stmt',
+    'str': 'builtins:str',
+    'strcoll': 'locale:strcoll',
+    'strerror': 'os:strerror',
+    'strftime': 'time:strftime',
+    'strict_errors': 'codecs:strict_errors',
+    'string': 'string',
+    'strptime': 'time:strptime',
+    'strsignal': 'signal:strsignal',
+    'struct': 'struct',
+    'struct_siginfo': 'signal:struct_siginfo',
+    'struct_time': 'time:struct_time',
+    'strxfrm': 'locale:strxfrm',
+    'sub': 're:sub',
+    'subn': 're:subn',
+    'subprocess': 'subprocess',
+    'suffix_map': 'mimetypes:suffix_map',
+    'supports_bytes_environ': 'os:supports_bytes_environ',
+    'supports_unicode_filenames': 'os.path:supports_unicode_filenames',
+    'suppress': 'contextlib:suppress',
+    'symlink': 'os:symlink',
+    'sync': 'os:sync',
+    'sys': 'sys',
+    'sysconf': 'os:sysconf',
+    'sysconf_names': 'os:sysconf_names',
+    'system': 'platform:system',
+    'system_alias': 'platform:system_alias',
+    'takewhile': 'itertools:takewhile',
+    'tan': 'math:tan',
+    'tanh': 'math:tanh',
+    'tau': 'math:tau',
+    'tcgetpgrp': 'os:tcgetpgrp',
+    'tcsetpgrp': 'os:tcsetpgrp',
+    'tee': 'itertools:tee',
+    'tempdir': 'tempfile:tempdir',
+    'tempfile': 'tempfile',
+    'template': 're:template',
+    'terminal_size': 'os:terminal_size',
+    'textwrap': 'textwrap',
+    'thread_info': 'sys:thread_info',
+    'thread_time': 'time:thread_time',
+    'thread_time_ns': 'time:thread_time_ns',
+    'threading': 'threading',
+    'threadsafety': 'sqlite3:threadsafety',
+    'time': 'time',
+    'time_ns': 'time:time_ns',
+    'timedelta': 'datetime:timedelta',
+    'timegm': 'calendar:timegm',
+    'timeit': 'timeit:timeit',
+    'timeout': 'socket:timeout',
+    'times': 'os:times',
+    'times_result': 'os:times_result',
+    'timezone': 'time:timezone',
+    'to_thread': 'asyncio:to_thread',
+    'token_bytes': 'secrets:token_bytes',
+    'token_hex': 'secrets:token_hex',
+    'token_urlsafe': 'secrets:token_urlsafe',
+    'total_ordering': 'functools:total_ordering',
+    'traceback': 'traceback',
+    'trans_36': 'hmac:trans_36',
+    'trans_5C': 'hmac:trans_5C',
+    'translate': 'fnmatch:translate',
+    'triangular': 'random:triangular',
+    'truediv': 'operator:truediv',
+    'trunc': 'math:trunc',
+    'truncate': 'os:truncate',
+    'truth': 'operator:truth',
+    'ttyname': 'os:ttyname',
+    'type_ignore': 'ast:type_ignore',
+    'typecodes': 'array:typecodes',
+    'types': 'types',
+    'types_map': 'mimetypes:types_map',
+    'typing': 'typing',
+    'tzinfo': 'datetime:tzinfo',
+    'tzname': 'time:tzname',
+    'tzset': 'time:tzset',
+    'ucd_3_2_0': 'unicodedata:ucd_3_2_0',
+    'ulp': 'math:ulp',
+    'umask': 'os:umask',
+    'uname': 'platform:uname',
+    'uname_result': 'platform:uname_result',
+    'unaryop': 'ast:unaryop',
+    'unescape': 'html:unescape',
+    'unhexlify': 'binascii:unhexlify',
+    'unicodedata': 'unicodedata',
+    'unidata_version': 'unicodedata:unidata_version',
+    'unified_diff': 'difflib:unified_diff',
+    'uniform': 'random:uniform',
+    'unique': 'enum:unique',
+    'unix_dialect': 'csv:unix_dialect',
+    'unlink': 'os:unlink',
+    'unpack': 'struct:unpack',
+    'unpack_archive': 'shutil:unpack_archive',
+    'unpack_from': 'struct:unpack_from',
+    'unparse': 'ast:unparse',
+    'unquote': 'urllib.parse:unquote',
+    'unquote_plus': 'urllib.parse:unquote_plus',
+    'unquote_to_bytes': 'urllib.parse:unquote_to_bytes',
+    'unraisablehook': 'sys:unraisablehook',
+    'unregister_archive_format': 'shutil:unregister_archive_format',
+    'unregister_dialect': 'csv:unregister_dialect',
+    'unregister_unpack_format': 'shutil:unregister_unpack_format',
+    'unsetenv': 'os:unsetenv',
+    'update_abstractmethods': 'abc:update_abstractmethods',
+    'update_wrapper': 'functools:update_wrapper',
+    'urandom': 'os:urandom',
+    'urldefrag': 'urllib.parse:urldefrag',
+    'urlencode': 'urllib.parse:urlencode',
+    'urljoin': 'urllib.parse:urljoin',
+    'urllib': 'urllib',
+    'urlparse': 'urllib.parse:urlparse',
+    'urlsafe_b64decode': 'base64:urlsafe_b64decode',
+    'urlsafe_b64encode': 'base64:urlsafe_b64encode',
+    'urlsplit': 'urllib.parse:urlsplit',
+    'urlunparse': 'urllib.parse:urlunparse',
+    'urlunsplit': 'urllib.parse:urlunsplit',
+    'utime': 'os:utime',
+    'uuid': 'uuid',
+    'uuid1': 'uuid:uuid1',
+    'uuid3': 'uuid:uuid3',
+    'uuid4': 'uuid:uuid4',
+    'uuid5': 'uuid:uuid5',
+    'valid_signals': 'signal:valid_signals',
+    'variance': 'statistics:variance',
+    'version': 'sys:version',
+    'version_info': 'sys:version_info',
+    'vonmisesvariate': 'random:vonmisesvariate',
+    'wait': 'os:wait',
+    'wait3': 'os:wait3',
+    'wait4': 'os:wait4',
+    'wait_for': 'asyncio:wait_for',
+    'waitid': 'os:waitid',
+    'waitid_result': 'os:waitid_result',
+    'waitpid': 'os:waitpid',
+    'waitstatus_to_exitcode': 'os:waitstatus_to_exitcode',
+    'walk': 'os:walk',
+    'walk_stack': 'traceback:walk_stack',
+    'walk_tb': 'traceback:walk_tb',
+    'warn': 'warnings:warn',
+    'warn_explicit': 'warnings:warn_explicit',
+    'warning': 'logging:warning',
+    'warnings': 'warnings',
+    'warnoptions': 'sys:warnoptions',
+    'weakref': 'weakref',
+    'weekday': 'calendar:weekday',
+    'weekheader': 'calendar:weekheader',
+    'weibullvariate': 'random:weibullvariate',
+    'which': 'shutil:which',
+    'whitespace': 'string:whitespace',
+    'win32_edition': 'platform:win32_edition',
+    'win32_is_iot': 'platform:win32_is_iot',
+    'win32_ver': 'platform:win32_ver',
+    'withitem': 'ast:withitem',
+    'wrap': 'textwrap:wrap',
+    'wrap_future': 'asyncio:wrap_future',
+    'wraps': 'functools:wraps',
+    'write': 'os:write',
+    'writer': 'csv:writer',
+    'writev': 'os:writev',
+    'xml': 'xml',
+    'xmlcharrefreplace_errors': 'codecs:xmlcharrefreplace_errors',
+    'xor': 'operator:xor',
+    'zip_longest': 'itertools:zip_longest',
+    'zipfile': 'zipfile',
+    'zlib': 'zlib',
+    'zoneinfo': 'zoneinfo',
+}
+
+# Names bound to more than one (distinct) object, with every candidate in binding order
+CANDIDATES = {
+    'BoundedSemaphore': ['asyncio:BoundedSemaphore', 'threading:BoundedSemaphore'],
+    'ChainMap': ['collections:ChainMap', 'typing:ChainMap'],
+    'Condition': ['asyncio:Condition', 'threading:Condition'],
+    'Counter': ['collections:Counter', 'typing:Counter'],
+    'Dict': ['ast:Dict', 'typing:Dict'],
+    'Ellipsis': ['builtins:Ellipsis', 'ast:Ellipsis'],
+    'Error': ['binascii:Error', 'copy:Error', 'csv:Error', 'locale:Error', 'shutil:Error', 'sqlite3:Error'],
+    'Event': ['asyncio:Event', 'threading:Event'],
+    'Formatter': ['logging:Formatter', 'string:Formatter'],
+    'FunctionType': ['ast:FunctionType', 'types:FunctionType'],
+    'LifoQueue': ['asyncio:LifoQueue', 'queue:LifoQueue'],
+    'List': ['ast:List', 'typing:List'],
+    'Lock': ['asyncio:Lock', 'threading:Lock'],
+    'Match': ['ast:Match', 'difflib:Match', 're:Match', 'typing:Match'],
+    'OrderedDict': ['collections:OrderedDict', 'typing:OrderedDict'],
+    'Path': ['zipfile:Path', 'pathlib:Path'],
+    'Pattern': ['re:Pattern', 'typing:Pattern'],
+    'PriorityQueue': ['asyncio:PriorityQueue', 'queue:PriorityQueue'],
+    'Protocol': ['asyncio:Protocol', 'typing:Protocol'],
+    'Queue': ['asyncio:Queue', 'queue:Queue'],
+    'Semaphore': ['asyncio:Semaphore', 'threading:Semaphore'],
+    'Set': ['ast:Set', 'typing:Set'],
+    'StreamReader': ['asyncio:StreamReader', 'codecs:StreamReader'],
+    'StreamWriter': ['asyncio:StreamWriter', 'codecs:StreamWriter'],
+    'TimeoutError': ['asyncio:TimeoutError', 'builtins:TimeoutError'],
+    'Timer': ['threading:Timer', 'timeit:Timer'],
+    'Tuple': ['ast:Tuple', 'typing:Tuple'],
+    'UNICODE': ['pickle:UNICODE', 're:UNICODE'],
+    'Warning': ['sqlite3:Warning', 'builtins:Warning'],
+    'abs': ['operator:abs', 'builtins:abs'],
+    'acos': ['cmath:acos', 'math:acos'],
+    'acosh': ['cmath:acosh', 'math:acosh'],
+    'array': ['array', 'array:array'],
+    'asin': ['cmath:asin', 'math:asin'],
+    'asinh': ['cmath:asinh', 'math:asinh'],
+    'atan': ['cmath:atan', 'math:atan'],
+    'atanh': ['cmath:atanh', 'math:atanh'],
+    'bisect': ['bisect', 'bisect:bisect'],
+    'cached_property': ['functools:cached_property', 'stdlb.cached_property:cached_property'],
+    'calendar': ['calendar', 'calendar:calendar'],
+    'choice': ['random:choice', 'secrets:choice'],
+    'chown': ['os:chown', 'shutil:chown'],
+    'close': ['os:close', 'socket:close'],
+    'compile': ['re:compile', 'builtins:compile'],
+    'compress': ['zlib:compress', 'itertools:compress'],
+    'copy': ['copy', 'copy:copy', 'shutil:copy'],
+    'copyright': ['sys:copyright', 'builtins:copyright'],
+    'coroutine': ['asyncio:coroutine', 'types:coroutine'],
+    'cos': ['cmath:cos', 'math:cos'],
+    'cosh': ['cmath:cosh', 'math:cosh'],
+    'crc32': ['binascii:crc32', 'zlib:crc32'],
+    'datetime': ['datetime:datetime', 'datetime'],
+    'decimal': ['decimal', 'unicodedata:decimal'],
+    'decode': ['base64:decode', 'codecs:decode'],
+    'dump': ['ast:dump', 'json:dump', 'pickle:dump'],
+    'dumps': ['json:dumps', 'pickle:dumps'],
+    'dup': ['os:dup', 'socket:dup'],
+    'e': ['cmath:e', 'math:e'],
+    'encode': ['base64:encode', 'codecs:encode'],
+    'enumerate': ['threading:enumerate', 'builtins:enumerate'],
+    'error': ['logging:error', 'socket:error', 'struct:error', 'zipfile:error', 'zlib:error', 're:error'],
+    'escape': ['glob:escape', 'html:escape', 're:escape'],
+    'excepthook': ['sys:excepthook', 'threading:excepthook'],
+    'exit': ['sys:exit', 'builtins:exit'],
+    'exp': ['cmath:exp', 'math:exp'],
+    'filter': ['fnmatch:filter', 'builtins:filter'],
+    'fnmatch': ['fnmatch', 'fnmatch:fnmatch'],
+    'format': ['builtins:format', 'locale:format'],
+    'get_terminal_size': ['os:get_terminal_size', 'shutil:get_terminal_size'],
+    'getprofile': ['sys:getprofile', 'threading:getprofile'],
+    'gettrace': ['sys:gettrace', 'threading:gettrace'],
+    'glob': ['glob:glob', 'glob'],
+    'inf': ['cmath:inf', 'math:inf'],
+    'isclose': ['cmath:isclose', 'math:isclose'],
+    'isfinite': ['cmath:isfinite', 'math:isfinite'],
+    'isinf': ['cmath:isinf', 'math:isinf'],
+    'isnan': ['cmath:isnan', 'math:isnan'],
+    'join': ['shlex:join', 'os.path:join'],
+    'load': ['json:load', 'pickle:load'],
+    'loads': ['json:loads', 'pickle:loads'],
+    'log': ['cmath:log', 'logging:log', 'math:log'],
+    'log10': ['cmath:log10', 'math:log10'],
+    'lookup': ['codecs:lookup', 'unicodedata:lookup'],
+    'mod': ['ast:mod', 'operator:mod'],
+    'name': ['os:name', 'unicodedata:name'],
+    'nan': ['cmath:nan', 'math:nan'],
+    'new': ['hashlib:new', 'hmac:new'],
+    'normalize': ['locale:normalize', 'unicodedata:normalize'],
+    'open': ['codecs:open', 'os:open', 'shelve:open', 'builtins:open'],
+    'operator': ['ast:operator', 'operator'],
+    'parse': ['ast:parse', 'urllib.parse'],
+    'path': ['sys:path', 'os.path'],
+    'pi': ['cmath:pi', 'math:pi'],
+    'platform': ['platform:platform', 'sys:platform', 'platform'],
+    'pow': ['math:pow', 'operator:pow', 'builtins:pow'],
+    'pprint': ['pprint', 'pprint:pprint'],
+    'quote': ['shlex:quote', 'urllib.parse:quote'],
+    'random': ['random', 'random:random'],
+    'repeat': ['timeit:repeat', 'itertools:repeat'],
+    'replace': ['dataclasses:replace', 'os:replace'],
+    'repr': ['reprlib:repr', 'builtins:repr'],
+    'run': ['asyncio:run', 'subprocess:run'],
+    'setprofile': ['sys:setprofile', 'threading:setprofile'],
+    'settrace': ['sys:settrace', 'threading:settrace'],
+    'shlex': ['shlex:shlex', 'shlex'],
+    'signal': ['signal', 'signal:signal'],
+    'sin': ['cmath:sin', 'math:sin'],
+    'sinh': ['cmath:sinh', 'math:sinh'],
+    'sleep': ['asyncio:sleep', 'time:sleep'],
+    'slice': ['ast:slice', 'builtins:slice'],
+    'socket': ['socket', 'socket:socket'],
+    'split': ['os.path:split', 're:split', 'shlex:split'],
+    'sqrt': ['cmath:sqrt', 'math:sqrt'],
+    'str': ['locale:str', 'builtins:str'],
+    'sub': ['operator:sub', 're:sub'],
+    'system': ['os:system', 'platform:system'],
+    'tan': ['cmath:tan', 'math:tan'],
+    'tanh': ['cmath:tanh', 'math:tanh'],
+    'tau': ['cmath:tau', 'math:tau'],
+    'time': ['datetime:time', 'time:time', 'time'],
+    'timeit': ['timeit', 'timeit:timeit'],
+    'timezone': ['datetime:timezone', 'time:timezone'],
+    'uname': ['os:uname', 'platform:uname'],
+    'uname_result': ['os:uname_result', 'platform:uname_result'],
+    'version': ['platform:version', 'sqlite3:version', 'sys:version'],
+    'version_info': ['sqlite3:version_info', 'sys:version_info'],
+    'wait': ['asyncio:wait', 'os:wait'],
+    'walk': ['ast:walk', 'os:walk'],
+    'warn': ['logging:warn', 'warnings:warn'],
+}
@@ -0,0 +1,3742 @@
+"""Kinds and call signatures of stdlb's exports for cpython 3.11 on linux.
+
+Read by completers (see `stdlb._index.load_info`), so they can describe names
+without importing them.
+
+This file is auto-generated by scripts/generate_init.py.
+Do not edit manually.
+"""
+FINGERPRINT = ('cpython', (3, 11), 'linux')
+
+KINDS = {
+    'A': 'constant',
+    'ABC': 'class',
+    'ABCMeta': 'class',
+    'ADDITEMS': 'constant',
+    'AF_ALG': 'constant',
+    'AF_APPLETALK': 'constant',
+    'AF_ASH': 'constant',
+    'AF_ATMPVC': 'constant',
+    'AF_ATMSVC': 'constant',
+    'AF_AX25': 'constant',
+    'AF_BRIDGE': 'constant',
+    'AF_CAN': 'constant',
+    'AF_DECnet': 'constant',
+    'AF_ECONET': 'constant',
+    'AF_INET': 'constant',
+    'AF_INET6': 'constant',
+    'AF_IPX': 'constant',
+    'AF_IRDA': 'constant',
+    'AF_KEY': 'constant',
+    'AF_LLC': 'constant',
+    'AF_NETBEUI': 'constant',
+    'AF_NETLINK': 'constant',
+    'AF_NETROM': 'constant',
+    'AF_PACKET': 'constant',
+    'AF_PPPOX': 'constant',
+    'AF_QIPCRTR': 'constant',
+    'AF_RDS': 'constant',
+    'AF_ROSE': 'constant',
+    'AF_ROUTE': 'constant',
+    'AF_SECURITY': 'constant',
+    'AF_SNA': 'constant',
+    'AF_TIPC': 'constant',
+    'AF_UNIX': 'constant',
+    'AF_UNSPEC': 'constant',
+    'AF_VSOCK': 'constant',
+    'AF_WANPIPE': 'constant',
+    'AF_X25': 'constant',
+    'AI_ADDRCONFIG': 'constant',
+    'AI_ALL': 'constant',
+    'AI_CANONNAME': 'constant',
+    'AI_NUMERICHOST': 'constant',
+    'AI_NUMERICSERV': 'constant',
+    'AI_PASSIVE': 'constant',
+    'AI_V4MAPPED': 'constant',
+    'ALG_OP_DECRYPT': 'constant',
+    'ALG_OP_ENCRYPT': 'constant',
+    'ALG_OP_SIGN': 'constant',
+    'ALG_OP_VERIFY': 'constant',
+    'ALG_SET_AEAD_ASSOCLEN': 'constant',
+    'ALG_SET_AEAD_AUTHSIZE': 'constant',
+    'ALG_SET_IV': 'constant',
+    'ALG_SET_KEY': 'constant',
+    'ALG_SET_OP': 'constant',
+    'ALG_SET_PUBKEY': 'constant',
+    'ALL_COMPLETED': 'constant',
+    'APPEND': 'constant',
+    'APPENDS': 'constant',
+    'ASCII': 'constant',
+    'AST': 'class',
+    'AbstractAsyncContextManager': 'class',
+    'AbstractChildWatcher': 'class',
+    'AbstractContextManager': 'class',
+    'AbstractEventLoop': 'class',
+    'AbstractEventLoopPolicy': 'class',
+    'AbstractServer': 'class',
+    'AbstractSet': 'class',
+    'Add': 'class',
+    'AddressFamily': 'class',
+    'And': 'class',
+    'AnnAssign': 'class',
+    'Annotated': 'class',
+    'Any': 'class',
+    'AnyStr': 'constant',
+    'ArrayType': 'class',
+    'Assert': 'class',
+    'Assign': 'class',
+    'AsyncContextManager': 'class',
+    'AsyncExitStack': 'class',
+    'AsyncFor': 'class',
+    'AsyncFunctionDef': 'class',
+    'AsyncGenerator': 'class',
+    'AsyncGeneratorType': 'class',
+    'AsyncIterable': 'class',
+    'AsyncIterator': 'class',
+    'AsyncWith': 'class',
+    'Attribute': 'class',
+    'AugAssign': 'class',
+    'AugLoad': 'class',
+    'AugStore': 'class',
+    'Await': 'class',
+    'Awaitable': 'class',
+    'BASIC_FORMAT': 'constant',
+    'BINBYTES': 'constant',
+    'BINBYTES8': 'constant',
+    'BINFLOAT': 'constant',
+    'BINGET': 'constant',
+    'BININT': 'constant',
+    'BININT1': 'constant',
+    'BININT2': 'constant',
+    'BINPERSID': 'constant',
+    'BINPUT': 'constant',
+    'BINSTRING': 'constant',
+    'BINUNICODE': 'constant',
+    'BINUNICODE8': 'constant',
+    'BOM': 'constant',
+    'BOM32_BE': 'constant',
+    'BOM32_LE': 'constant',
+    'BOM64_BE': 'constant',
+    'BOM64_LE': 'constant',
+    'BOM_BE': 'constant',
+    'BOM_LE': 'constant',
+    'BOM_UTF16': 'constant',
+    'BOM_UTF16_BE': 'constant',
+    'BOM_UTF16_LE': 'constant',
+    'BOM_UTF32': 'constant',
+    'BOM_UTF32_BE': 'constant',
+    'BOM_UTF32_LE': 'constant',
+    'BOM_UTF8': 'constant',
+    'BUILD': 'constant',
+    'BYTEARRAY8': 'constant',
+    'BadZipFile': 'exception',
+    'BadZipfile': 'exception',
+    'Barrier': 'class',
+    'BaseEventLoop': 'class',
+    'BaseProtocol': 'class',
+    'BaseTransport': 'class',
+    'BasicContext': 'constant',
+    'BasicInterpolation': 'class',
+    'BinOp': 'class',
+    'Binary': 'class',
+    'BinaryIO': 'class',
+    'BitAnd': 'class',
+    'BitOr': 'class',
+    'BitXor': 'class',
+    'Blob': 'class',
+    'BlockingIOError': 'exception',
+    'BoolOp': 'class',
+    'BoundedSemaphore': 'class',
+    'Break': 'class',
+    'BrokenBarrierError': 'exception',
+    'BsdDbShelf': 'class',
+    'BufferedIOBase': 'class',
+    'BufferedProtocol': 'class',
+    'BufferedRWPair': 'class',
+    'BufferedRandom': 'class',
+    'BufferedReader': 'class',
+    'BufferedWriter': 'class',
+    'BufferingFormatter': 'class',
+    'BuiltinFunctionType': 'class',
+    'BuiltinMethodType': 'class',
+    'ByteString': 'class',
+    'Bytes': 'class',
+    'BytesIO': 'class',
+    'CAN_BCM': 'constant',
+    'CAN_BCM_CAN_FD_FRAME': 'constant',
+    'CAN_BCM_RX_ANNOUNCE_RESUME': 'constant',
+    'CAN_BCM_RX_CHANGED': 'constant',
+    'CAN_BCM_RX_CHECK_DLC': 'constant',
+    'CAN_BCM_RX_DELETE': 'constant',
+    'CAN_BCM_RX_FILTER_ID': 'constant',
+    'CAN_BCM_RX_NO_AUTOTIMER': 'constant',
+    'CAN_BCM_RX_READ': 'constant',
+    'CAN_BCM_RX_RTR_FRAME': 'constant',
+    'CAN_BCM_RX_SETUP': 'constant',
+    'CAN_BCM_RX_STATUS': 'constant',
+    'CAN_BCM_RX_TIMEOUT': 'constant',
+    'CAN_BCM_SETTIMER': 'constant',
+    'CAN_BCM_STARTTIMER': 'constant',
+    'CAN_BCM_TX_ANNOUNCE': 'constant',
+    'CAN_BCM_TX_COUNTEVT': 'constant',
+    'CAN_BCM_TX_CP_CAN_ID': 'constant',
+    'CAN_BCM_TX_DELETE': 'constant',
+    'CAN_BCM_TX_EXPIRED': 'constant',
+    'CAN_BCM_TX_READ': 'constant',
+    'CAN_BCM_TX_RESET_MULTI_IDX': 'constant',
+    'CAN_BCM_TX_SEND': 'constant',
+    'CAN_BCM_TX_SETUP': 'constant',
+    'CAN_BCM_TX_STATUS': 'constant',
+    'CAN_EFF_FLAG': 'constant',
+    'CAN_EFF_MASK': 'constant',
+    'CAN_ERR_FLAG': 'constant',
+    'CAN_ERR_MASK': 'constant',
+    'CAN_ISOTP': 'constant',
+    'CAN_J1939': 'constant',
+    'CAN_RAW': 'constant',
+    'CAN_RAW_FD_FRAMES': 'constant',
+    'CAN_RAW_FILTER': 'constant',
+    'CAN_RAW_JOIN_FILTERS': 'constant',
+    'CAN_RAW_LOOPBACK': 'constant',
+    'CAN_RAW_RECV_OWN_MSGS': 'constant',
+    'CAN_RTR_FLAG': 'constant',
+    'CAN_SFF_MASK': 'constant',
+    'CAPI': 'constant',
+    'CHAR_MAX': 'constant',
+    'CLD_CONTINUED': 'constant',
+    'CLD_DUMPED': 'constant',
+    'CLD_EXITED': 'constant',
+    'CLD_KILLED': 'constant',
+    'CLD_STOPPED': 'constant',
+    'CLD_TRAPPED': 'constant',
+    'CLOCK_BOOTTIME': 'constant',
+    'CLOCK_MONOTONIC': 'constant',
+    'CLOCK_MONOTONIC_RAW': 'constant',
+    'CLOCK_PROCESS_CPUTIME_ID': 'constant',
+    'CLOCK_REALTIME': 'constant',
+    'CLOCK_TAI': 'constant',
+    'CLOCK_THREAD_CPUTIME_ID': 'constant',
+    'CMSG_LEN': 'function',
+    'CMSG_SPACE': 'function',
+    'CONFORM': 'constant',
+    'CONTINUOUS': 'constant',
+    'CRITICAL': 'constant',
+    'Calendar': 'class',
+    'Call': 'class',
+    'Callable': 'class',
+    'CallableProxyType': 'class',
+    'CalledProcessError': 'exception',
+    'CancelledError': 'exception',
+    'CellType': 'class',
+    'ChainMap': 'class',
+    'Clamped': 'exception',
+    'ClassDef': 'class',
+    'ClassMethodDescriptorType': 'class',
+    'ClassVar': 'class',
+    'CodeType': 'class',
+    'Codec': 'class',
+    'CodecInfo': 'class',
+    'Collection': 'class',
+    'Compare': 'class',
+    'CompletedProcess': 'class',
+    'Complex': 'class',
+    'Concatenate': 'class',
+    'Condition': 'class',
+    'ConfigParser': 'class',
+    'Connection': 'class',
+    'Constant': 'class',
+    'Container': 'class',
+    'Context': 'class',
+    'ContextDecorator': 'class',
+    'ContextManager': 'class',
+    'Continue': 'class',
+    'ConversionSyntax': 'exception',
+    'ConverterMapping': 'class',
+    'Coroutine': 'class',
+    'CoroutineType': 'class',
+    'Counter': 'class',
+    'Cursor': 'class',
+    'CycleError': 'exception',
+    'DEBUG': 'constant',
+    'DEFAULTSECT': 'constant',
+    'DEFAULT_BUFFER_SIZE': 'constant',
+    'DEFAULT_PROTOCOL': 'constant',
+    'DEFLATED': 'constant',
+    'DEF_BUF_SIZE': 'constant',
+    'DEF_MEM_LEVEL': 'constant',
+    'DEVNULL': 'constant',
+    'DICT': 'constant',
+    'DOTALL': 'constant',
+    'DUP': 'constant',
+    'DataError': 'exception',
+    'DatabaseError': 'exception',
+    'DatagramProtocol': 'class',
+    'DatagramTransport': 'class',
+    'Date': 'class',
+    'DateFromTicks': 'function',
+    'DbfilenameShelf': 'class',
+    'Decimal': 'class',
+    'DecimalException': 'exception',
+    'DecimalTuple': 'class',
+    'DefaultContext': 'constant',
+    'DefaultDict': 'class',
+    'DefaultEventLoopPolicy': 'class',
+    'DefragResult': 'class',
+    'DefragResultBytes': 'class',
+    'Del': 'class',
+    'Delete': 'class',
+    'Deque': 'class',
+    'Dialect': 'class',
+    'Dict': 'class',
+    'DictComp': 'class',
+    'DictReader': 'class',
+    'DictWriter': 'class',
+    'Differ': 'class',
+    'DirEntry': 'class',
+    'Div': 'class',
+    'DivisionByZero': 'exception',
+    'DivisionImpossible': 'exception',
+    'DivisionUndefined': 'exception',
+    'DuplicateOptionError': 'exception',
+    'DuplicateSectionError': 'exception',
+    'DynamicClassAttribute': 'class',
+    'EAI_ADDRFAMILY': 'constant',
+    'EAI_AGAIN': 'constant',
+    'EAI_BADFLAGS': 'constant',
+    'EAI_FAIL': 'constant',
+    'EAI_FAMILY': 'constant',
+    'EAI_MEMORY': 'constant',
+    'EAI_NODATA': 'constant',
+    'EAI_NONAME': 'constant',
+    'EAI_OVERFLOW': 'constant',
+    'EAI_SERVICE': 'constant',
+    'EAI_SOCKTYPE': 'constant',
+    'EAI_SYSTEM': 'constant',
+    'EFD_CLOEXEC': 'constant',
+    'EFD_NONBLOCK': 'constant',
+    'EFD_SEMAPHORE': 'constant',
+    'EJECT': 'constant',
+    'EMPTY_DICT': 'constant',
+    'EMPTY_LIST': 'constant',
+    'EMPTY_SET': 'constant',
+    'EMPTY_TUPLE': 'constant',
+    'ERROR': 'constant',
+    'EXT1': 'constant',
+    'EXT2': 'constant',
+    'EXT4': 'constant',
+    'EX_CANTCREAT': 'constant',
+    'EX_CONFIG': 'constant',
+    'EX_DATAERR': 'constant',
+    'EX_IOERR': 'constant',
+    'EX_NOHOST': 'constant',
+    'EX_NOINPUT': 'constant',
+    'EX_NOPERM': 'constant',
+    'EX_NOUSER': 'constant',
+    'EX_OK': 'constant',
+    'EX_OSERR': 'constant',
+    'EX_OSFILE': 'constant',
+    'EX_PROTOCOL': 'constant',
+    'EX_SOFTWARE': 'constant',
+    'EX_TEMPFAIL': 'constant',
+    'EX_UNAVAILABLE': 'constant',
+    'EX_USAGE': 'constant',
+    'Ellipsis': 'class',
+    'EllipsisType': 'class',
+    'Empty': 'exception',
+    'EncodedFile': 'function',
+    'Enum': 'class',
+    'EnumCheck': 'class',
+    'EnumMeta': 'class',
+    'EnumType': 'class',
+    'Eq': 'class',
+    'Error': 'exception',
+    'Event': 'class',
+    'ExceptHandler': 'class',
+    'ExceptHookArgs': 'class',
+    'ExecError': 'exception',
+    'ExitStack': 'class',
+    'Expr': 'class',
+    'Expression': 'class',
+    'ExtSlice': 'class',
+    'ExtendedContext': 'constant',
+    'ExtendedInterpolation': 'class',
+    'FALSE': 'constant',
+    'FATAL': 'constant',
+    'FIRST_COMPLETED': 'constant',
+    'FIRST_EXCEPTION': 'constant',
+    'FLOAT': 'constant',
+    'FRAME': 'constant',
+    'FRIDAY': 'constant',
+    'FROZENSET': 'constant',
+    'F_LOCK': 'constant',
+    'F_OK': 'constant',
+    'F_TEST': 'constant',
+    'F_TLOCK': 'constant',
+    'F_ULOCK': 'constant',
+    'FastChildWatcher': 'class',
+    'Field': 'class',
+    'FileHandler': 'class',
+    'FileIO': 'class',
+    'Filter': 'class',
+    'Final': 'class',
+    'Flag': 'class',
+    'FlagBoundary': 'class',
+    'FloatOperation': 'exception',
+    'FloorDiv': 'class',
+    'For': 'class',
+    'FormattedValue': 'class',
+    'Formatter': 'class',
+    'ForwardRef': 'class',
+    'Fraction': 'class',
+    'FrameSummary': 'class',
+    'FrameType': 'class',
+    'FrozenInstanceError': 'exception',
+    'FrozenSet': 'class',
+    'Full': 'exception',
+    'FunctionDef': 'class',
+    'FunctionType': 'class',
+    'Future': 'class',
+    'GET': 'constant',
+    'GLOBAL': 'constant',
+    'GRND_NONBLOCK': 'constant',
+    'GRND_RANDOM': 'constant',
+    'Generator': 'class',
+    'GeneratorExp': 'class',
+    'GeneratorType': 'class',
+    'Generic': 'class',
+    'GenericAlias': 'class',
+    'GetSetDescriptorType': 'class',
+    'Global': 'class',
+    'Gt': 'class',
+    'GtE': 'class',
+    'HAVE_CONTEXTVAR': 'constant',
+    'HAVE_THREADS': 'constant',
+    'HIGHEST_PROTOCOL': 'constant',
+    'HMAC': 'class',
+    'HTMLCalendar': 'class',
+    'HTTPMethod': 'class',
+    'HTTPStatus': 'class',
+    'Handle': 'class',
+    'Handler': 'class',
+    'Handlers': 'class',
+    'Hashable': 'class',
+    'HtmlDiff': 'class',
+    'I': 'constant',
+    'IGNORECASE': 'constant',
+    'INADDR_ALLHOSTS_GROUP': 'constant',
+    'INADDR_ANY': 'constant',
+    'INADDR_BROADCAST': 'constant',
+    'INADDR_LOOPBACK': 'constant',
+    'INADDR_MAX_LOCAL_GROUP': 'constant',
+    'INADDR_NONE': 'constant',
+    'INADDR_UNSPEC_GROUP': 'constant',
+    'INFO': 'constant',
+    'INST': 'constant',
+    'INT': 'constant',
+    'IO': 'class',
+    'IOBase': 'class',
+    'IOCTL_VM_SOCKETS_GET_LOCAL_CID': 'constant',
+    'IPPORT_RESERVED': 'constant',
+    'IPPORT_USERRESERVED': 'constant',
+    'IPPROTO_AH': 'constant',
+    'IPPROTO_DSTOPTS': 'constant',
+    'IPPROTO_EGP': 'constant',
+    'IPPROTO_ESP': 'constant',
+    'IPPROTO_FRAGMENT': 'constant',
+    'IPPROTO_GRE': 'constant',
+    'IPPROTO_HOPOPTS': 'constant',
+    'IPPROTO_ICMP': 'constant',
+    'IPPROTO_ICMPV6': 'constant',
+    'IPPROTO_IDP': 'constant',
+    'IPPROTO_IGMP': 'constant',
+    'IPPROTO_IP': 'constant',
+    'IPPROTO_IPIP': 'constant',
+    'IPPROTO_IPV6': 'constant',
+    'IPPROTO_MPTCP': 'constant',
+    'IPPROTO_NONE': 'constant',
+    'IPPROTO_PIM': 'constant',
+    'IPPROTO_PUP': 'constant',
+    'IPPROTO_RAW': 'constant',
+    'IPPROTO_ROUTING': 'constant',
+    'IPPROTO_RSVP': 'constant',
+    'IPPROTO_SCTP': 'constant',
+    'IPPROTO_TCP': 'constant',
+    'IPPROTO_TP': 'constant',
+    'IPPROTO_UDP': 'constant',
+    'IPPROTO_UDPLITE': 'constant',
+    'IPV6_CHECKSUM': 'constant',
+    'IPV6_DONTFRAG': 'constant',
+    'IPV6_DSTOPTS': 'constant',
+    'IPV6_HOPLIMIT': 'constant',
+    'IPV6_HOPOPTS': 'constant',
+    'IPV6_JOIN_GROUP': 'constant',
+    'IPV6_LEAVE_GROUP': 'constant',
+    'IPV6_MULTICAST_HOPS': 'constant',
+    'IPV6_MULTICAST_IF': 'constant',
+    'IPV6_MULTICAST_LOOP': 'constant',
+    'IPV6_NEXTHOP': 'constant',
+    'IPV6_PATHMTU': 'constant',
+    'IPV6_PKTINFO': 'constant',
+    'IPV6_RECVDSTOPTS': 'constant',
+    'IPV6_RECVHOPLIMIT': 'constant',
+    'IPV6_RECVHOPOPTS': 'constant',
+    'IPV6_RECVPATHMTU': 'constant',
+    'IPV6_RECVPKTINFO': 'constant',
+    'IPV6_RECVRTHDR': 'constant',
+    'IPV6_RECVTCLASS': 'constant',
+    'IPV6_RTHDR': 'constant',
+    'IPV6_RTHDRDSTOPTS': 'constant',
+    'IPV6_RTHDR_TYPE_0': 'constant',
+    'IPV6_TCLASS': 'constant',
+    'IPV6_UNICAST_HOPS': 'constant',
+    'IPV6_V6ONLY': 'constant',
+    'IP_ADD_MEMBERSHIP': 'constant',
+    'IP_BIND_ADDRESS_NO_PORT': 'constant',
+    'IP_DEFAULT_MULTICAST_LOOP': 'constant',
+    'IP_DEFAULT_MULTICAST_TTL': 'constant',
+    'IP_DROP_MEMBERSHIP': 'constant',
+    'IP_HDRINCL': 'constant',
+    'IP_MAX_MEMBERSHIPS': 'constant',
+    'IP_MULTICAST_IF': 'constant',
+    'IP_MULTICAST_LOOP': 'constant',
+    'IP_MULTICAST_TTL': 'constant',
+    'IP_OPTIONS': 'constant',
+    'IP_RECVOPTS': 'constant',
+    'IP_RECVRETOPTS': 'constant',
+    'IP_RECVTOS': 'constant',
+    'IP_RETOPTS': 'constant',
+    'IP_TOS': 'constant',
+    'IP_TRANSPARENT': 'constant',
+    'IP_TTL': 'constant',
+    'IS_CHARACTER_JUNK': 'function',
+    'IS_LINE_JUNK': 'function',
+    'ITIMER_PROF': 'constant',
+    'ITIMER_REAL': 'constant',
+    'ITIMER_VIRTUAL': 'constant',
+    'If': 'class',
+    'IfExp': 'class',
+    'IllegalMonthError': 'exception',
+    'IllegalWeekdayError': 'exception',
+    'Import': 'class',
+    'ImportFrom': 'class',
+    'In': 'class',
+    'Incomplete': 'exception',
+    'IncompleteReadError': 'exception',
+    'IncrementalDecoder': 'class',
+    'IncrementalEncoder': 'class',
+    'IncrementalNewlineDecoder': 'class',
+    'Index': 'class',
+    'Inexact': 'exception',
+    'InitVar': 'class',
+    'IntEnum': 'class',
+    'IntFlag': 'class',
+    'Integral': 'class',
+    'IntegrityError': 'exception',
+    'Interactive': 'class',
+    'InteractiveConsole': 'class',
+    'InteractiveInterpreter': 'class',
+    'InterfaceError': 'exception',
+    'InternalError': 'exception',
+    'Interpolation': 'class',
+    'InterpolationDepthError': 'exception',
+    'InterpolationError': 'exception',
+    'InterpolationMissingOptionError': 'exception',
+    'InterpolationSyntaxError': 'exception',
+    'InvalidContext': 'exception',
+    'InvalidOperation': 'exception',
+    'InvalidStateError': 'exception',
+    'InvalidTZPathWarning': 'exception',
+    'Invert': 'class',
+    'Is': 'class',
+    'IsNot': 'class',
+    'ItemsView': 'class',
+    'Iterable': 'class',
+    'Iterator': 'class',
+    'ItimerError': 'exception',
+    'J1939_EE_INFO_NONE': 'constant',
+    'J1939_EE_INFO_TX_ABORT': 'constant',
+    'J1939_FILTER_MAX': 'constant',
+    'J1939_IDLE_ADDR': 'constant',
+    'J1939_MAX_UNICAST_ADDR': 'constant',
+    'J1939_NLA_BYTES_ACKED': 'constant',
+    'J1939_NLA_PAD': 'constant',
+    'J1939_NO_ADDR': 'constant',
+    'J1939_NO_NAME': 'constant',
+    'J1939_NO_PGN': 'constant',
+    'J1939_PGN_ADDRESS_CLAIMED': 'constant',
+    'J1939_PGN_ADDRESS_COMMANDED': 'constant',
+    'J1939_PGN_MAX': 'constant',
+    'J1939_PGN_PDU1_MAX': 'constant',
+    'J1939_PGN_REQUEST': 'constant',
+    'JSONDecodeError': 'exception',
+    'JSONDecoder': 'class',
+    'JSONEncoder': 'class',
+    'JoinedStr': 'class',
+    'KEEP': 'constant',
+    'KW_ONLY': 'constant',
+    'KeysView': 'class',
+    'L': 'constant',
+    'LC_ALL': 'constant',
+    'LC_COLLATE': 'constant',
+    'LC_CTYPE': 'constant',
+    'LC_MESSAGES': 'constant',
+    'LC_MONETARY': 'constant',
+    'LC_NUMERIC': 'constant',
+    'LC_TIME': 'constant',
+    'LIST': 'constant',
+    'LOCALE': 'constant',
+    'LONG': 'constant',
+    'LONG1': 'constant',
+    'LONG4': 'constant',
+    'LONG_BINGET': 'constant',
+    'LONG_BINPUT': 'constant',
+    'LShift': 'class',
+    'Lambda': 'class',
+    'LambdaType': 'class',
+    'LargeZipFile': 'exception',
+    'LegacyInterpolation': 'class',
+    'LifoQueue': 'class',
+    'LimitOverrunError': 'exception',
+    'List': 'class',
+    'ListComp': 'class',
+    'Literal': 'class',
+    'LiteralString': 'class',
+    'Load': 'class',
+    'LocaleHTMLCalendar': 'class',
+    'LocaleTextCalendar': 'class',
+    'Lock': 'function',
+    'LogRecord': 'class',
+    'Logger': 'class',
+    'LoggerAdapter': 'class',
+    'Lt': 'class',
+    'LtE': 'class',
+    'M': 'constant',
+    'MARK': 'constant',
+    'MAXYEAR': 'constant',
+    'MAX_EMAX': 'constant',
+    'MAX_INTERPOLATION_DEPTH': 'constant',
+    'MAX_PREC': 'constant',
+    'MAX_WBITS': 'constant',
+    'MEMOIZE': 'constant',
+    'MFD_ALLOW_SEALING': 'constant',
+    'MFD_CLOEXEC': 'constant',
+    'MFD_HUGETLB': 'constant',
+    'MFD_HUGE_16GB': 'constant',
+    'MFD_HUGE_16MB': 'constant',
+    'MFD_HUGE_1GB': 'constant',
+    'MFD_HUGE_1MB': 'constant',
+    'MFD_HUGE_256MB': 'constant',
+    'MFD_HUGE_2GB': 'constant',
+    'MFD_HUGE_2MB': 'constant',
+    'MFD_HUGE_32MB': 'constant',
+    'MFD_HUGE_512KB': 'constant',
+    'MFD_HUGE_512MB': 'constant',
+    'MFD_HUGE_64KB': 'constant',
+    'MFD_HUGE_8MB': 'constant',
+    'MFD_HUGE_MASK': 'constant',
+    'MFD_HUGE_SHIFT': 'constant',
+    'MINYEAR': 'constant',
+    'MIN_EMIN': 'constant',
+    'MIN_ETINY': 'constant',
+    'MISSING': 'constant',
+    'MONDAY': 'constant',
+    'MSG_CMSG_CLOEXEC': 'constant',
+    'MSG_CONFIRM': 'constant',
+    'MSG_CTRUNC': 'constant',
+    'MSG_DONTROUTE': 'constant',
+    'MSG_DONTWAIT': 'constant',
+    'MSG_EOR': 'constant',
+    'MSG_ERRQUEUE': 'constant',
+    'MSG_FASTOPEN': 'constant',
+    'MSG_MORE': 'constant',
+    'MSG_NOSIGNAL': 'constant',
+    'MSG_OOB': 'constant',
+    'MSG_PEEK': 'constant',
+    'MSG_TRUNC': 'constant',
+    'MSG_WAITALL': 'constant',
+    'MULTILINE': 'constant',
+    'Mapping': 'class',
+    'MappingProxyType': 'class',
+    'MappingView': 'class',
+    'MatMult': 'class',
+    'Match': 'class',
+    'MatchAs': 'class',
+    'MatchClass': 'class',
+    'MatchMapping': 'class',
+    'MatchOr': 'class',
+    'MatchSequence': 'class',
+    'MatchSingleton': 'class',
+    'MatchStar': 'class',
+    'MatchValue': 'class',
+    'MemberDescriptorType': 'class',
+    'MethodDescriptorType': 'class',
+    'MethodType': 'class',
+    'MethodWrapperType': 'class',
+    'MimeTypes': 'class',
+    'MissingSectionHeaderError': 'exception',
+    'Mod': 'class',
+    'Module': 'class',
+    'ModuleType': 'class',
+    'Mult': 'class',
+    'MultiLoopChildWatcher': 'class',
+    'MutableMapping': 'class',
+    'MutableSequence': 'class',
+    'MutableSet': 'class',
+    'NAMED_FLAGS': 'constant',
+    'NAMESPACE_DNS': 'constant',
+    'NAMESPACE_OID': 'constant',
+    'NAMESPACE_URL': 'constant',
+    'NAMESPACE_X500': 'constant',
+    'NETLINK_CRYPTO': 'constant',
+    'NETLINK_DNRTMSG': 'constant',
+    'NETLINK_FIREWALL': 'constant',
+    'NETLINK_IP6_FW': 'constant',
+    'NETLINK_NFLOG': 'constant',
+    'NETLINK_ROUTE': 'constant',
+    'NETLINK_USERSOCK': 'constant',
+    'NETLINK_XFRM': 'constant',
+    'NEWFALSE': 'constant',
+    'NEWOBJ': 'constant',
+    'NEWOBJ_EX': 'constant',
+    'NEWTRUE': 'constant',
+    'NEXT_BUFFER': 'constant',
+    'NGROUPS_MAX': 'constant',
+    'NI_DGRAM': 'constant',
+    'NI_MAXHOST': 'constant',
+    'NI_MAXSERV': 'constant',
+    'NI_NAMEREQD': 'constant',
+    'NI_NOFQDN': 'constant',
+    'NI_NUMERICHOST': 'constant',
+    'NI_NUMERICSERV': 'constant',
+    'NOFLAG': 'constant',
+    'NONE': 'constant',
+    'NOTSET': 'constant',
+    'NSIG': 'constant',
+    'Name': 'class',
+    'NameConstant': 'class',
+    'NamedExpr': 'class',
+    'NamedTemporaryFile': 'function',
+    'NamedTuple': 'function',
+    'Never': 'class',
+    'NewType': 'class',
+    'NoOptionError': 'exception',
+    'NoReturn': 'class',
+    'NoSectionError': 'exception',
+    'NodeTransformer': 'class',
+    'NodeVisitor': 'class',
+    'NoneType': 'class',
+    'Nonlocal': 'class',
+    'NormalDist': 'class',
+    'Not': 'class',
+    'NotEq': 'class',
+    'NotImplementedType': 'class',
+    'NotIn': 'class',
+    'NotRequired': 'class',
+    'NotSupportedError': 'exception',
+    'NullHandler': 'class',
+    'Num': 'class',
+    'Number': 'class',
+    'OBJ': 'constant',
+    'O_ACCMODE': 'constant',
+    'O_APPEND': 'constant',
+    'O_ASYNC': 'constant',
+    'O_CLOEXEC': 'constant',
+    'O_CREAT': 'constant',
+    'O_DIRECT': 'constant',
+    'O_DIRECTORY': 'constant',
+    'O_DSYNC': 'constant',
+    'O_EXCL': 'constant',
+    'O_FSYNC': 'constant',
+    'O_LARGEFILE': 'constant',
+    'O_NDELAY': 'constant',
+    'O_NOATIME': 'constant',
+    'O_NOCTTY': 'constant',
+    'O_NOFOLLOW': 'constant',
+    'O_NONBLOCK': 'constant',
+    'O_PATH': 'constant',
+    'O_RDONLY': 'constant',
+    'O_RDWR': 'constant',
+    'O_RSYNC': 'constant',
+    'O_SYNC': 'constant',
+    'O_TMPFILE': 'constant',
+    'O_TRUNC': 'constant',
+    'O_WRONLY': 'constant',
+    'OperationalError': 'exception',
+    'Optional': 'class',
+    'Or': 'class',
+    'OrderedDict': 'class',
+    'Overflow': 'exception',
+    'PACKET_BROADCAST': 'constant',
+    'PACKET_FASTROUTE': 'constant',
+    'PACKET_HOST': 'constant',
+    'PACKET_LOOPBACK': 'constant',
+    'PACKET_MULTICAST': 'constant',
+    'PACKET_OTHERHOST': 'constant',
+    'PACKET_OUTGOING': 'constant',
+    'PARSE_COLNAMES': 'constant',
+    'PARSE_DECLTYPES': 'constant',
+    'PERSID': 'constant',
+    'PF_CAN': 'constant',
+    'PF_PACKET': 'constant',
+    'PF_RDS': 'constant',
+    'PIPE': 'constant',
+    'POP': 'constant',
+    'POP_MARK': 'constant',
+    'POSIX_FADV_DONTNEED': 'constant',
+    'POSIX_FADV_NOREUSE': 'constant',
+    'POSIX_FADV_NORMAL': 'constant',
+    'POSIX_FADV_RANDOM': 'constant',
+    'POSIX_FADV_SEQUENTIAL': 'constant',
+    'POSIX_FADV_WILLNEED': 'constant',
+    'POSIX_SPAWN_CLOSE': 'constant',
+    'POSIX_SPAWN_DUP2': 'constant',
+    'POSIX_SPAWN_OPEN': 'constant',
+    'PRIO_PGRP': 'constant',
+    'PRIO_PROCESS': 'constant',
+    'PRIO_USER': 'constant',
+    'PROTO': 'constant',
+    'PUT': 'constant',
+    'P_ALL': 'constant',
+    'P_NOWAIT': 'constant',
+    'P_NOWAITO': 'constant',
+    'P_PGID': 'constant',
+    'P_PID': 'constant',
+    'P_PIDFD': 'constant',
+    'P_WAIT': 'constant',
+    'Param': 'class',
+    'ParamSpec': 'class',
+    'ParamSpecArgs': 'class',
+    'ParamSpecKwargs': 'class',
+    'ParseResult': 'class',
+    'ParseResultBytes': 'class',
+    'ParsingError': 'exception',
+    'Pass': 'class',
+    'Path': 'class',
+    'Pattern': 'class',
+    'PickleBuffer': 'class',
+    'PickleError': 'exception',
+    'Pickler': 'class',
+    'PicklingError': 'exception',
+    'PidfdChildWatcher': 'class',
+    'Popen': 'class',
+    'PosixPath': 'class',
+    'Pow': 'class',
+    'PrepareProtocol': 'class',
+    'PrettyPrinter': 'class',
+    'PriorityQueue': 'class',
+    'ProgrammingError': 'exception',
+    'Protocol': 'class',
+    'ProxyType': 'class',
+    'ProxyTypes': 'constant',
+    'PurePath': 'class',
+    'PurePosixPath': 'class',
+    'PureWindowsPath': 'class',
+    'PyCF_ALLOW_TOP_LEVEL_AWAIT': 'constant',
+    'PyCF_ONLY_AST': 'constant',
+    'PyCF_TYPE_COMMENTS': 'constant',
+    'PyZipFile': 'class',
+    'QUOTE_ALL': 'constant',
+    'QUOTE_MINIMAL': 'constant',
+    'QUOTE_NONE': 'constant',
+    'QUOTE_NONNUMERIC': 'constant',
+    'Queue': 'class',
+    'QueueEmpty': 'exception',
+    'QueueFull': 'exception',
+    'READONLY_BUFFER': 'constant',
+    'REDUCE': 'constant',
+    'RESERVED_FUTURE': 'constant',
+    'RESERVED_MICROSOFT': 'constant',
+    'RESERVED_NCS': 'constant',
+    'RFC_4122': 'constant',
+    'RLock': 'function',
+    'ROUND_05UP': 'constant',
+    'ROUND_CEILING': 'constant',
+    'ROUND_DOWN': 'constant',
+    'ROUND_FLOOR': 'constant',
+    'ROUND_HALF_DOWN': 'constant',
+    'ROUND_HALF_EVEN': 'constant',
+    'ROUND_HALF_UP': 'constant',
+    'ROUND_UP': 'constant',
+    'RShift': 'class',
+    'RTLD_DEEPBIND': 'constant',
+    'RTLD_GLOBAL': 'constant',
+    'RTLD_LAZY': 'constant',
+    'RTLD_LOCAL': 'constant',
+    'RTLD_NODELETE': 'constant',
+    'RTLD_NOLOAD': 'constant',
+    'RTLD_NOW': 'constant',
+    'RWF_APPEND': 'constant',
+    'RWF_DSYNC': 'constant',
+    'RWF_HIPRI': 'constant',
+    'RWF_NOWAIT': 'constant',
+    'RWF_SYNC': 'constant',
+    'R_OK': 'constant',
+    'Raise': 'class',
+    'Random': 'class',
+    'Rational': 'class',
+    'RawConfigParser': 'class',
+    'RawIOBase': 'class',
+    'ReadTransport': 'class',
+    'Real': 'class',
+    'ReferenceType': 'class',
+    'RegexFlag': 'class',
+    'Repr': 'class',
+    'ReprEnum': 'class',
+    'Required': 'class',
+    'Return': 'class',
+    'Reversible': 'class',
+    'Rounded': 'exception',
+    'Row': 'class',
+    'Runner': 'class',
+    'S': 'constant',
+    'SATURDAY': 'constant',
+    'SCHED_BATCH': 'constant',
+    'SCHED_FIFO': 'constant',
+    'SCHED_IDLE': 'constant',
+    'SCHED_OTHER': 'constant',
+    'SCHED_RESET_ON_FORK': 'constant',
+    'SCHED_RR': 'constant',
+    'SCM_CREDENTIALS': 'constant',
+    'SCM_J1939_DEST_ADDR': 'constant',
+    'SCM_J1939_DEST_NAME': 'constant',
+    'SCM_J1939_ERRQUEUE': 'constant',
+    'SCM_J1939_PRIO': 'constant',
+    'SCM_RIGHTS': 'constant',
+    'SEEK_CUR': 'constant',
+    'SEEK_DATA': 'constant',
+    'SEEK_END': 'constant',
+    'SEEK_HOLE': 'constant',
+    'SEEK_SET': 'constant',
+    'SETITEM': 'constant',
+    'SETITEMS': 'constant',
+    'SHORT_BINBYTES': 'constant',
+    'SHORT_BINSTRING': 'constant',
+    'SHORT_BINUNICODE': 'constant',
+    'SHUT_RD': 'constant',
+    'SHUT_RDWR': 'constant',
+    'SHUT_WR': 'constant',
+    'SIGABRT': 'constant',
+    'SIGALRM': 'constant',
+    'SIGBUS': 'constant',
+    'SIGCHLD': 'constant',
+    'SIGCLD': 'constant',
+    'SIGCONT': 'constant',
+    'SIGFPE': 'constant',
+    'SIGHUP': 'constant',
+    'SIGILL': 'constant',
+    'SIGINT': 'constant',
+    'SIGIO': 'constant',
+    'SIGIOT': 'constant',
+    'SIGKILL': 'constant',
+    'SIGPIPE': 'constant',
+    'SIGPOLL': 'constant',
+    'SIGPROF': 'constant',
+    'SIGPWR': 'constant',
+    'SIGQUIT': 'constant',
+    'SIGRTMAX': 'constant',
+    'SIGRTMIN': 'constant',
+    'SIGSEGV': 'constant',
+    'SIGSTKFLT': 'constant',
+    'SIGSTOP': 'constant',
+    'SIGSYS': 'constant',
+    'SIGTERM': 'constant',
+    'SIGTRAP': 'constant',
+    'SIGTSTP': 'constant',
+    'SIGTTIN': 'constant',
+    'SIGTTOU': 'constant',
+    'SIGURG': 'constant',
+    'SIGUSR1': 'constant',
+    'SIGUSR2': 'constant',
+    'SIGVTALRM': 'constant',
+    'SIGWINCH': 'constant',
+    'SIGXCPU': 'constant',
+    'SIGXFSZ': 'constant',
+    'SIG_BLOCK': 'constant',
+    'SIG_DFL': 'constant',
+    'SIG_IGN': 'constant',
+    'SIG_SETMASK': 'constant',
+    'SIG_UNBLOCK': 'constant',
+    'SOCK_CLOEXEC': 'constant',
+    'SOCK_DGRAM': 'constant',
+    'SOCK_NONBLOCK': 'constant',
+    'SOCK_RAW': 'constant',
+    'SOCK_RDM': 'constant',
+    'SOCK_SEQPACKET': 'constant',
+    'SOCK_STREAM': 'constant',
+    'SOL_ALG': 'constant',
+    'SOL_CAN_BASE': 'constant',
+    'SOL_CAN_RAW': 'constant',
+    'SOL_IP': 'constant',
+    'SOL_RDS': 'constant',
+    'SOL_SOCKET': 'constant',
+    'SOL_TCP': 'constant',
+    'SOL_TIPC': 'constant',
+    'SOL_UDP': 'constant',
+    'SOMAXCONN': 'constant',
+    'SO_ACCEPTCONN': 'constant',
+    'SO_BINDTODEVICE': 'constant',
+    'SO_BROADCAST': 'constant',
+    'SO_DEBUG': 'constant',
+    'SO_DOMAIN': 'constant',
+    'SO_DONTROUTE': 'constant',
+    'SO_ERROR': 'constant',
+    'SO_INCOMING_CPU': 'constant',
+    'SO_J1939_ERRQUEUE': 'constant',
+    'SO_J1939_FILTER': 'constant',
+    'SO_J1939_PROMISC': 'constant',
+    'SO_J1939_SEND_PRIO': 'constant',
+    'SO_KEEPALIVE': 'constant',
+    'SO_LINGER': 'constant',
+    'SO_MARK': 'constant',
+    'SO_OOBINLINE': 'constant',
+    'SO_PASSCRED': 'constant',
+    'SO_PASSSEC': 'constant',
+    'SO_PEERCRED': 'constant',
+    'SO_PEERSEC': 'constant',
+    'SO_PRIORITY': 'constant',
+    'SO_PROTOCOL': 'constant',
+    'SO_RCVBUF': 'constant',
+    'SO_RCVLOWAT': 'constant',
+    'SO_RCVTIMEO': 'constant',
+    'SO_REUSEADDR': 'constant',
+    'SO_REUSEPORT': 'constant',
+    'SO_SNDBUF': 'constant',
+    'SO_SNDLOWAT': 'constant',
+    'SO_SNDTIMEO': 'constant',
+    'SO_TYPE': 'constant',
+    'SO_VM_SOCKETS_BUFFER_MAX_SIZE': 'constant',
+    'SO_VM_SOCKETS_BUFFER_MIN_SIZE': 'constant',
+    'SO_VM_SOCKETS_BUFFER_SIZE': 'constant',
+    'SPLICE_F_MORE': 'constant',
+    'SPLICE_F_MOVE': 'constant',
+    'SPLICE_F_NONBLOCK': 'constant',
+    'SQLITE_ABORT': 'constant',
+    'SQLITE_ABORT_ROLLBACK': 'constant',
+    'SQLITE_ALTER_TABLE': 'constant',
+    'SQLITE_ANALYZE': 'constant',
+    'SQLITE_ATTACH': 'constant',
+    'SQLITE_AUTH': 'constant',
+    'SQLITE_AUTH_USER': 'constant',
+    'SQLITE_BUSY': 'constant',
+    'SQLITE_BUSY_RECOVERY': 'constant',
+    'SQLITE_BUSY_SNAPSHOT': 'constant',
+    'SQLITE_BUSY_TIMEOUT': 'constant',
+    'SQLITE_CANTOPEN': 'constant',
+    'SQLITE_CANTOPEN_CONVPATH': 'constant',
+    'SQLITE_CANTOPEN_DIRTYWAL': 'constant',
+    'SQLITE_CANTOPEN_FULLPATH': 'constant',
+    'SQLITE_CANTOPEN_ISDIR': 'constant',
+    'SQLITE_CANTOPEN_NOTEMPDIR': 'constant',
+    'SQLITE_CANTOPEN_SYMLINK': 'constant',
+    'SQLITE_CONSTRAINT': 'constant',
+    'SQLITE_CONSTRAINT_CHECK': 'constant',
+    'SQLITE_CONSTRAINT_COMMITHOOK': 'constant',
+    'SQLITE_CONSTRAINT_FOREIGNKEY': 'constant',
+    'SQLITE_CONSTRAINT_FUNCTION': 'constant',
+    'SQLITE_CONSTRAINT_NOTNULL': 'constant',
+    'SQLITE_CONSTRAINT_PINNED': 'constant',
+    'SQLITE_CONSTRAINT_PRIMARYKEY': 'constant',
+    'SQLITE_CONSTRAINT_ROWID': 'constant',
+    'SQLITE_CONSTRAINT_TRIGGER': 'constant',
+    'SQLITE_CONSTRAINT_UNIQUE': 'constant',
+    'SQLITE_CONSTRAINT_VTAB': 'constant',
+    'SQLITE_CORRUPT': 'constant',
+    'SQLITE_CORRUPT_INDEX': 'constant',
+    'SQLITE_CORRUPT_SEQUENCE': 'constant',
+    'SQLITE_CORRUPT_VTAB': 'constant',
+    'SQLITE_CREATE_INDEX': 'constant',
+    'SQLITE_CREATE_TABLE': 'constant',
+    'SQLITE_CREATE_TEMP_INDEX': 'constant',
+    'SQLITE_CREATE_TEMP_TABLE': 'constant',
+    'SQLITE_CREATE_TEMP_TRIGGER': 'constant',
+    'SQLITE_CREATE_TEMP_VIEW': 'constant',
+    'SQLITE_CREATE_TRIGGER': 'constant',
+    'SQLITE_CREATE_VIEW': 'constant',
+    'SQLITE_CREATE_VTABLE': 'constant',
+    'SQLITE_DELETE': 'constant',
+    'SQLITE_DENY': 'constant',
+    'SQLITE_DETACH': 'constant',
+    'SQLITE_DONE': 'constant',
+    'SQLITE_DROP_INDEX': 'constant',
+    'SQLITE_DROP_TABLE': 'constant',
+    'SQLITE_DROP_TEMP_INDEX': 'constant',
+    'SQLITE_DROP_TEMP_TABLE': 'constant',
+    'SQLITE_DROP_TEMP_TRIGGER': 'constant',
+    'SQLITE_DROP_TEMP_VIEW': 'constant',
+    'SQLITE_DROP_TRIGGER': 'constant',
+    'SQLITE_DROP_VIEW': 'constant',
+    'SQLITE_DROP_VTABLE': 'constant',
+    'SQLITE_EMPTY': 'constant',
+    'SQLITE_ERROR': 'constant',
+    'SQLITE_ERROR_MISSING_COLLSEQ': 'constant',
+    'SQLITE_ERROR_RETRY': 'constant',
+    'SQLITE_ERROR_SNAPSHOT': 'constant',
+    'SQLITE_FORMAT': 'constant',
+    'SQLITE_FULL': 'constant',
+    'SQLITE_FUNCTION': 'constant',
+    'SQLITE_IGNORE': 'constant',
+    'SQLITE_INSERT': 'constant',
+    'SQLITE_INTERNAL': 'constant',
+    'SQLITE_INTERRUPT': 'constant',
+    'SQLITE_IOERR': 'constant',
+    'SQLITE_IOERR_ACCESS': 'constant',
+    'SQLITE_IOERR_AUTH': 'constant',
+    'SQLITE_IOERR_BEGIN_ATOMIC': 'constant',
+    'SQLITE_IOERR_BLOCKED': 'constant',
+    'SQLITE_IOERR_CHECKRESERVEDLOCK': 'constant',
+    'SQLITE_IOERR_CLOSE': 'constant',
+    'SQLITE_IOERR_COMMIT_ATOMIC': 'constant',
+    'SQLITE_IOERR_CONVPATH': 'constant',
+    'SQLITE_IOERR_CORRUPTFS': 'constant',
+    'SQLITE_IOERR_DATA': 'constant',
+    'SQLITE_IOERR_DELETE': 'constant',
+    'SQLITE_IOERR_DELETE_NOENT': 'constant',
+    'SQLITE_IOERR_DIR_CLOSE': 'constant',
+    'SQLITE_IOERR_DIR_FSYNC': 'constant',
+    'SQLITE_IOERR_FSTAT': 'constant',
+    'SQLITE_IOERR_FSYNC': 'constant',
+    'SQLITE_IOERR_GETTEMPPATH': 'constant',
+    'SQLITE_IOERR_LOCK': 'constant',
+    'SQLITE_IOERR_MMAP': 'constant',
+    'SQLITE_IOERR_NOMEM': 'constant',
+    'SQLITE_IOERR_RDLOCK': 'constant',
+    'SQLITE_IOERR_READ': 'constant',
+    'SQLITE_IOERR_ROLLBACK_ATOMIC': 'constant',
+    'SQLITE_IOERR_SEEK': 'constant',
+    'SQLITE_IOERR_SHMLOCK': 'constant',
+    'SQLITE_IOERR_SHMMAP': 'constant',
+    'SQLITE_IOERR_SHMOPEN': 'constant',
+    'SQLITE_IOERR_SHMSIZE': 'constant',
+    'SQLITE_IOERR_SHORT_READ': 'constant',
+    'SQLITE_IOERR_TRUNCATE': 'constant',
+    'SQLITE_IOERR_UNLOCK': 'constant',
+    'SQLITE_IOERR_VNODE': 'constant',
+    'SQLITE_IOERR_WRITE': 'constant',
+    'SQLITE_LIMIT_ATTACHED': 'constant',
+    'SQLITE_LIMIT_COLUMN': 'constant',
+    'SQLITE_LIMIT_COMPOUND_SELECT': 'constant',
+    'SQLITE_LIMIT_EXPR_DEPTH': 'constant',
+    'SQLITE_LIMIT_FUNCTION_ARG': 'constant',
+    'SQLITE_LIMIT_LENGTH': 'constant',
+    'SQLITE_LIMIT_LIKE_PATTERN_LENGTH': 'constant',
+    'SQLITE_LIMIT_SQL_LENGTH': 'constant',
+    'SQLITE_LIMIT_TRIGGER_DEPTH': 'constant',
+    'SQLITE_LIMIT_VARIABLE_NUMBER': 'constant',
+    'SQLITE_LIMIT_VDBE_OP': 'constant',
+    'SQLITE_LIMIT_WORKER_THREADS': 'constant',
+    'SQLITE_LOCKED': 'constant',
+    'SQLITE_LOCKED_SHAREDCACHE': 'constant',
+    'SQLITE_LOCKED_VTAB': 'constant',
+    'SQLITE_MISMATCH': 'constant',
+    'SQLITE_MISUSE': 'constant',
+    'SQLITE_NOLFS': 'constant',
+    'SQLITE_NOMEM': 'constant',
+    'SQLITE_NOTADB': 'constant',
+    'SQLITE_NOTFOUND': 'constant',
+    'SQLITE_NOTICE': 'constant',
+    'SQLITE_NOTICE_RECOVER_ROLLBACK': 'constant',
+    'SQLITE_NOTICE_RECOVER_WAL': 'constant',
+    'SQLITE_OK': 'constant',
+    'SQLITE_OK_LOAD_PERMANENTLY': 'constant',
+    'SQLITE_OK_SYMLINK': 'constant',
+    'SQLITE_PERM': 'constant',
+    'SQLITE_PRAGMA': 'constant',
+    'SQLITE_PROTOCOL': 'constant',
+    'SQLITE_RANGE': 'constant',
+    'SQLITE_READ': 'constant',
+    'SQLITE_READONLY': 'constant',
+    'SQLITE_READONLY_CANTINIT': 'constant',
+    'SQLITE_READONLY_CANTLOCK': 'constant',
+    'SQLITE_READONLY_DBMOVED': 'constant',
+    'SQLITE_READONLY_DIRECTORY': 'constant',
+    'SQLITE_READONLY_RECOVERY': 'constant',
+    'SQLITE_READONLY_ROLLBACK': 'constant',
+    'SQLITE_RECURSIVE': 'constant',
+    'SQLITE_REINDEX': 'constant',
+    'SQLITE_ROW': 'constant',
+    'SQLITE_SAVEPOINT': 'constant',
+    'SQLITE_SCHEMA': 'constant',
+    'SQLITE_SELECT': 'constant',
+    'SQLITE_TOOBIG': 'constant',
+    'SQLITE_TRANSACTION': 'constant',
+    'SQLITE_UPDATE': 'constant',
+    'SQLITE_WARNING': 'constant',
+    'SQLITE_WARNING_AUTOINDEX': 'constant',
+    'STACK_GLOBAL': 'constant',
+    'STDOUT': 'constant',
+    'STOP': 'constant',
+    'STRICT': 'constant',
+    'STRING': 'constant',
+    'ST_APPEND': 'constant',
+    'ST_MANDLOCK': 'constant',
+    'ST_NOATIME': 'constant',
+    'ST_NODEV': 'constant',
+    'ST_NODIRATIME': 'constant',
+    'ST_NOEXEC': 'constant',
+    'ST_NOSUID': 'constant',
+    'ST_RDONLY': 'constant',
+    'ST_RELATIME': 'constant',
+    'ST_SYNCHRONOUS': 'constant',
+    'ST_WRITE': 'constant',
+    'SUNDAY': 'constant',
+    'SafeChildWatcher': 'class',
+    'SafeConfigParser': 'class',
+    'SafeUUID': 'class',
+    'SameFileError': 'exception',
+    'SectionProxy': 'class',
+    'SelectorEventLoop': 'class',
+    'Self': 'class',
+    'Semaphore': 'class',
+    'SendfileNotAvailableError': 'exception',
+    'Sequence': 'class',
+    'SequenceMatcher': 'class',
+    'Server': 'class',
+    'Set': 'class',
+    'SetComp': 'class',
+    'Shelf': 'class',
+    'Sigmasks': 'class',
+    'Signals': 'class',
+    'SimpleNamespace': 'class',
+    'SimpleQueue': 'class',
+    'Sized': 'class',
+    'Slice': 'class',
+    'Sniffer': 'class',
+    'SocketKind': 'class',
+    'SocketType': 'class',
+    'SpecialFileError': 'exception',
+    'SplitResult': 'class',
+    'SplitResultBytes': 'class',
+    'SpooledTemporaryFile': 'class',
+    'StackSummary': 'class',
+    'Starred': 'class',
+    'StatisticsError': 'exception',
+    'Store': 'class',
+    'Str': 'class',
+    'StrEnum': 'class',
+    'StreamHandler': 'class',
+    'StreamReader': 'class',
+    'StreamReaderProtocol': 'class',
+    'StreamReaderWriter': 'class',
+    'StreamRecoder': 'class',
+    'StreamWriter': 'class',
+    'StringIO': 'class',
+    'Struct': 'class',
+    'Sub': 'class',
+    'Subnormal': 'exception',
+    'SubprocessError': 'exception',
+    'SubprocessProtocol': 'class',
+    'SubprocessTransport': 'class',
+    'Subscript': 'class',
+    'Suite': 'class',
+    'SupportsAbs': 'class',
+    'SupportsBytes': 'class',
+    'SupportsComplex': 'class',
+    'SupportsFloat': 'class',
+    'SupportsIndex': 'class',
+    'SupportsInt': 'class',
+    'SupportsRound': 'class',
+    'SystemRandom': 'class',
+    'TCP_CONGESTION': 'constant',
+    'TCP_CORK': 'constant',
+    'TCP_DEFER_ACCEPT': 'constant',
+    'TCP_FASTOPEN': 'constant',
+    'TCP_INFO': 'constant',
+    'TCP_KEEPCNT': 'constant',
+    'TCP_KEEPIDLE': 'constant',
+    'TCP_KEEPINTVL': 'constant',
+    'TCP_LINGER2': 'constant',
+    'TCP_MAXSEG': 'constant',
+    'TCP_NODELAY': 'constant',
+    'TCP_NOTSENT_LOWAT': 'constant',
+    'TCP_QUICKACK': 'constant',
+    'TCP_SYNCNT': 'constant',
+    'TCP_USER_TIMEOUT': 'constant',
+    'TCP_WINDOW_CLAMP': 'constant',
+    'THURSDAY': 'constant',
+    'TIMEOUT_MAX': 'constant',
+    'TIPC_ADDR_ID': 'constant',
+    'TIPC_ADDR_NAME': 'constant',
+    'TIPC_ADDR_NAMESEQ': 'constant',
+    'TIPC_CFG_SRV': 'constant',
+    'TIPC_CLUSTER_SCOPE': 'constant',
+    'TIPC_CONN_TIMEOUT': 'constant',
+    'TIPC_CRITICAL_IMPORTANCE': 'constant',
+    'TIPC_DEST_DROPPABLE': 'constant',
+    'TIPC_HIGH_IMPORTANCE': 'constant',
+    'TIPC_IMPORTANCE': 'constant',
+    'TIPC_LOW_IMPORTANCE': 'constant',
+    'TIPC_MEDIUM_IMPORTANCE': 'constant',
+    'TIPC_NODE_SCOPE': 'constant',
+    'TIPC_PUBLISHED': 'constant',
+    'TIPC_SRC_DROPPABLE': 'constant',
+    'TIPC_SUBSCR_TIMEOUT': 'constant',
+    'TIPC_SUB_CANCEL': 'constant',
+    'TIPC_SUB_PORTS': 'constant',
+    'TIPC_SUB_SERVICE': 'constant',
+    'TIPC_TOP_SRV': 'constant',
+    'TIPC_WAIT_FOREVER': 'constant',
+    'TIPC_WITHDRAWN': 'constant',
+    'TIPC_ZONE_SCOPE': 'constant',
+    'TMP_MAX': 'constant',
+    'TOMLDecodeError': 'exception',
+    'TRUE': 'constant',
+    'TUESDAY': 'constant',
+    'TUPLE': 'constant',
+    'TUPLE1': 'constant',
+    'TUPLE2': 'constant',
+    'TUPLE3': 'constant',
+    'TYPE_CHECKING': 'constant',
+    'TZPATH': 'constant',
+    'Task': 'class',
+    'Template': 'class',
+    'TemporaryDirectory': 'class',
+    'TemporaryFile': 'function',
+    'Text': 'class',
+    'TextCalendar': 'class',
+    'TextIO': 'class',
+    'TextIOBase': 'class',
+    'TextIOWrapper': 'class',
+    'TextWrapper': 'class',
+    'Thread': 'class',
+    'ThreadError': 'exception',
+    'ThreadedChildWatcher': 'class',
+    'Time': 'class',
+    'TimeFromTicks': 'function',
+    'Timeout': 'class',
+    'TimeoutError': 'exception',
+    'TimeoutExpired': 'exception',
+    'Timer': 'class',
+    'TimerHandle': 'class',
+    'Timestamp': 'class',
+    'TimestampFromTicks': 'function',
+    'TopologicalSorter': 'class',
+    'TracebackException': 'class',
+    'TracebackType': 'class',
+    'Transport': 'class',
+    'Try': 'class',
+    'TryStar': 'class',
+    'Tuple': 'class',
+    'Type': 'class',
+    'TypeAlias': 'class',
+    'TypeGuard': 'class',
+    'TypeIgnore': 'class',
+    'TypeVar': 'class',
+    'TypeVarTuple': 'class',
+    'TypedDict': 'function',
+    'U': 'constant',
+    'UAdd': 'class',
+    'UCD': 'class',
+    'UDPLITE_RECV_CSCOV': 'constant',
+    'UDPLITE_SEND_CSCOV': 'constant',
+    'UNICODE': 'constant',
+    'UNIQUE': 'constant',
+    'USub': 'class',
+    'UTC': 'constant',
+    'UUID': 'class',
+    'UnaryOp': 'class',
+    'Underflow': 'exception',
+    'Union': 'class',
+    'UnionType': 'class',
+    'Unpack': 'class',
+    'Unpickler': 'class',
+    'UnpicklingError': 'exception',
+    'UnsupportedOperation': 'exception',
+    'UserDict': 'class',
+    'UserList': 'class',
+    'UserString': 'class',
+    'VERBOSE': 'constant',
+    'VMADDR_CID_ANY': 'constant',
+    'VMADDR_CID_HOST': 'constant',
+    'VMADDR_PORT_ANY': 'constant',
+    'VM_SOCKETS_INVALID_VERSION': 'constant',
+    'ValuesView': 'class',
+    'WARN': 'constant',
+    'WARNING': 'constant',
+    'WCONTINUED': 'constant',
+    'WCOREDUMP': 'function',
+    'WEDNESDAY': 'constant',
+    'WEXITED': 'constant',
+    'WEXITSTATUS': 'function',
+    'WIFCONTINUED': 'function',
+    'WIFEXITED': 'function',
+    'WIFSIGNALED': 'function',
+    'WIFSTOPPED': 'function',
+    'WNOHANG': 'constant',
+    'WNOWAIT': 'constant',
+    'WRAPPER_ASSIGNMENTS': 'constant',
+    'WRAPPER_UPDATES': 'constant',
+    'WSTOPPED': 'constant',
+    'WSTOPSIG': 'function',
+    'WTERMSIG': 'function',
+    'WUNTRACED': 'constant',
+    'W_OK': 'constant',
+    'Warning': 'exception',
+    'WeakKeyDictionary': 'class',
+    'WeakMethod': 'class',
+    'WeakSet': 'class',
+    'WeakValueDictionary': 'class',
+    'While': 'class',
+    'WindowsPath': 'class',
+    'With': 'class',
+    'WrapperDescriptorType': 'class',
+    'WriteTransport': 'class',
+    'X': 'constant',
+    'XATTR_CREATE': 'constant',
+    'XATTR_REPLACE': 'constant',
+    'XATTR_SIZE_MAX': 'constant',
+    'X_OK': 'constant',
+    'Yield': 'class',
+    'YieldFrom': 'class',
+    'ZIP_BZIP2': 'constant',
+    'ZIP_DEFLATED': 'constant',
+    'ZIP_LZMA': 'constant',
+    'ZIP_STORED': 'constant',
+    'ZLIB_RUNTIME_VERSION': 'constant',
+    'ZLIB_VERSION': 'constant',
+    'Z_BEST_COMPRESSION': 'constant',
+    'Z_BEST_SPEED': 'constant',
+    'Z_BLOCK': 'constant',
+    'Z_DEFAULT_COMPRESSION': 'constant',
+    'Z_DEFAULT_STRATEGY': 'constant',
+    'Z_FILTERED': 'constant',
+    'Z_FINISH': 'constant',
+    'Z_FIXED': 'constant',
+    'Z_FULL_FLUSH': 'constant',
+    'Z_HUFFMAN_ONLY': 'constant',
+    'Z_NO_COMPRESSION': 'constant',
+    'Z_NO_FLUSH': 'constant',
+    'Z_PARTIAL_FLUSH': 'constant',
+    'Z_RLE': 'constant',
+    'Z_SYNC_FLUSH': 'constant',
+    'Z_TREES': 'constant',
+    'ZipFile': 'class',
+    'ZipInfo': 'class',
+    'ZoneInfo': 'class',
+    'ZoneInfoNotFoundError': 'exception',
+    'a2b_base64': 'function',
+    'a2b_hex': 'function',
+    'a2b_qp': 'function',
+    'a2b_uu': 'function',
+    'a85decode': 'function',
+    'a85encode': 'function',
+    'abc': 'module',
+    'abiflags': 'constant',
+    'abort': 'function',
+    'abs': 'function',
+    'abspath': 'function',
+    'abstractclassmethod': 'class',
+    'abstractmethod': 'function',
+    'abstractproperty': 'class',
+    'abstractstaticmethod': 'class',
+    'access': 'function',
+    'accumulate': 'class',
+    'aclosing': 'class',
+    'acos': 'function',
+    'acosh': 'function',
+    'active_count': 'function',
+    'adapt': 'function',
+    'adapters': 'constant',
+    'add': 'function',
+    'addLevelName': 'function',
+    'add_type': 'function',
+    'addaudithook': 'function',
+    'adler32': 'function',
+    'alarm': 'function',
+    'algorithms_available': 'constant',
+    'algorithms_guaranteed': 'constant',
+    'alias': 'class',
+    'all_tasks': 'function',
+    'altsep': 'constant',
+    'altzone': 'constant',
+    'and_': 'function',
+    'api_version': 'constant',
+    'apilevel': 'constant',
+    'architecture': 'function',
+    'arg': 'class',
+    'arguments': 'class',
+    'argv': 'constant',
+    'array': 'class',
+    'as_completed': 'function',
+    'ascii_letters': 'constant',
+    'ascii_lowercase': 'constant',
+    'ascii_uppercase': 'constant',
+    'asctime': 'function',
+    'asdict': 'function',
+    'asin': 'function',
+    'asinh': 'function',
+    'assert_never': 'function',
+    'assert_type': 'function',
+    'ast': 'module',
+    'astuple': 'function',
+    'async_cached_property': 'class',
+    'asynccontextmanager': 'function',
+    'asyncio': 'module',
+    'atan': 'function',
+    'atan2': 'function',
+    'atanh': 'function',
+    'atof': 'function',
+    'atoi': 'function',
+    'attrgetter': 'class',
+    'audit': 'function',
+    'auto': 'class',
+    'available_timezones': 'function',
+    'b16decode': 'function',
+    'b16encode': 'function',
+    'b2a_base64': 'function',
+    'b2a_hex': 'function',
+    'b2a_qp': 'function',
+    'b2a_uu': 'function',
+    'b32decode': 'function',
+    'b32encode': 'function',
+    'b32hexdecode': 'function',
+    'b32hexencode': 'function',
+    'b64decode': 'function',
+    'b64encode': 'function',
+    'b85decode': 'function',
+    'b85encode': 'function',
+    'backslashreplace_errors': 'function',
+    'base64': 'module',
+    'base_exec_prefix': 'constant',
+    'base_prefix': 'constant',
+    'basename': 'function',
+    'basicConfig': 'function',
+    'betavariate': 'function',
+    'bidirectional': 'function',
+    'binascii': 'module',
+    'bisect': 'function',
+    'bisect_left': 'function',
+    'bisect_right': 'function',
+    'blake2b': 'class',
+    'blake2s': 'class',
+    'boolop': 'class',
+    'breakpointhook': 'function',
+    'builtin_module_names': 'constant',
+    'byteorder': 'constant',
+    'bytes_': 'class',
+    'cache': 'function',
+    'cached_property': 'class',
+    'calcsize': 'function',
+    'calendar': 'function',
+    'call': 'function',
+    'call_tracing': 'function',
+    'captureWarnings': 'function',
+    'capwords': 'function',
+    'cast': 'function',
+    'catch_warnings': 'class',
+    'category': 'function',
+    'cbrt': 'function',
+    'ceil': 'function',
+    'chain': 'class',
+    'chdir': 'function',
+    'check_call': 'function',
+    'check_output': 'function',
+    'chmod': 'function',
+    'choice': 'function',
+    'choices': 'function',
+    'chown': 'function',
+    'chroot': 'function',
+    'clear_frames': 'function',
+    'clear_overloads': 'function',
+    'clock_getres': 'function',
+    'clock_gettime': 'function',
+    'clock_gettime_ns': 'function',
+    'clock_settime': 'function',
+    'clock_settime_ns': 'function',
+    'close': 'function',
+    'closerange': 'function',
+    'closing': 'class',
+    'cmath': 'module',
+    'cmp_to_key': 'function',
+    'cmpop': 'class',
+    'code': 'module',
+    'codecs': 'module',
+    'collections': 'module',
+    'comb': 'function',
+    'combinations': 'class',
+    'combinations_with_replacement': 'class',
+    'combining': 'function',
+    'common_types': 'constant',
+    'commonpath': 'function',
+    'commonprefix': 'function',
+    'compare_digest': 'function',
+    'compile': 'function',
+    'compile_command': 'function',
+    'complete_statement': 'function',
+    'comprehension': 'class',
+    'compress': 'class',
+    'compressobj': 'function',
+    'concat': 'function',
+    'configparser': 'module',
+    'confstr': 'function',
+    'confstr_names': 'constant',
+    'connect': 'function',
+    'contains': 'function',
+    'context_diff': 'function',
+    'contextlib': 'module',
+    'contextmanager': 'function',
+    'converters': 'constant',
+    'copy': 'function',
+    'copy2': 'function',
+    'copy_file_range': 'function',
+    'copy_location': 'function',
+    'copyfile': 'function',
+    'copyfileobj': 'function',
+    'copymode': 'function',
+    'copyright': 'function',
+    'copysign': 'function',
+    'copystat': 'function',
+    'copytree': 'function',
+    'coroutine': 'function',
+    'correlation': 'function',
+    'cos': 'function',
+    'cosh': 'function',
+    'count': 'class',
+    'countOf': 'function',
+    'covariance': 'function',
+    'cpu_count': 'function',
+    'crc32': 'function',
+    'crc_hqx': 'function',
+    'create_connection': 'function',
+    'create_server': 'function',
+    'create_subprocess_exec': 'function',
+    'create_subprocess_shell': 'function',
+    'create_task': 'function',
+    'critical': 'function',
+    'csv': 'module',
+    'ctermid': 'function',
+    'ctime': 'function',
+    'curdir': 'constant',
+    'currency': 'function',
+    'current_task': 'function',
+    'current_thread': 'function',
+    'cycle': 'class',
+    'dataclass': 'function',
+    'dataclass_transform': 'function',
+    'dataclasses': 'module',
+    'date': 'class',
+    'datetime': 'module',
+    'day_abbr': 'constant',
+    'day_name': 'constant',
+    'daylight': 'constant',
+    'dbapi2': 'module',
+    'debug': 'function',
+    'decimal': 'function',
+    'decode': 'function',
+    'decodebytes': 'function',
+    'decomposition': 'function',
+    'decompress': 'function',
+    'decompressobj': 'function',
+    'dedent': 'function',
+    'deepcopy': 'function',
+    'default_int_handler': 'function',
+    'default_timer': 'function',
+    'defaultdict': 'class',
+    'defpath': 'constant',
+    'degrees': 'function',
+    'delitem': 'function',
+    'deque': 'class',
+    'device_encoding': 'function',
+    'devnull': 'constant',
+    'diff_bytes': 'function',
+    'difflib': 'module',
+    'digest': 'function',
+    'digest_size': 'constant',
+    'digit': 'function',
+    'digits': 'constant',
+    'dirname': 'function',
+    'disable': 'function',
+    'disk_usage': 'function',
+    'displayhook': 'function',
+    'dist': 'function',
+    'dom': 'module',
+    'dont_write_bytecode': 'constant',
+    'dropwhile': 'class',
+    'dt': 'class',
+    'dump': 'function',
+    'dumps': 'function',
+    'dup': 'function',
+    'dup2': 'function',
+    'e': 'constant',
+    'east_asian_width': 'function',
+    'enable_callback_tracebacks': 'function',
+    'enable_shared_cache': 'function',
+    'encode': 'function',
+    'encodebytes': 'function',
+    'encodings_map': 'constant',
+    'ensure_future': 'function',
+    'enum': 'module',
+    'enumerate': 'class',
+    'environ': 'constant',
+    'environb': 'constant',
+    'eq': 'function',
+    'erf': 'function',
+    'erfc': 'function',
+    'error': 'exception',
+    'escape': 'function',
+    'etree': 'module',
+    'eventfd': 'function',
+    'eventfd_read': 'function',
+    'eventfd_write': 'function',
+    'exc_info': 'function',
+    'excel': 'class',
+    'excel_tab': 'class',
+    'excepthandler': 'class',
+    'excepthook': 'function',
+    'exception': 'function',
+    'exec_prefix': 'constant',
+    'execl': 'function',
+    'execle': 'function',
+    'execlp': 'function',
+    'execlpe': 'function',
+    'executable': 'constant',
+    'execv': 'function',
+    'execve': 'function',
+    'execvp': 'function',
+    'execvpe': 'function',
+    'exists': 'function',
+    'exit': 'function',
+    'exp': 'function',
+    'exp2': 'function',
+    'expanduser': 'function',
+    'expandvars': 'function',
+    'expm1': 'function',
+    'expovariate': 'function',
+    'expr': 'class',
+    'expr_context': 'class',
+    'extract_stack': 'function',
+    'extract_tb': 'function',
+    'extsep': 'constant',
+    'fabs': 'function',
+    'factorial': 'function',
+    'fatal': 'function',
+    'fchdir': 'function',
+    'fchmod': 'function',
+    'fchown': 'function',
+    'fdatasync': 'function',
+    'fdopen': 'function',
+    'field': 'function',
+    'field_size_limit': 'function',
+    'fields': 'function',
+    'file_digest': 'function',
+    'fill': 'function',
+    'filter': 'class',
+    'filterfalse': 'class',
+    'filterwarnings': 'function',
+    'final': 'function',
+    'finalize': 'class',
+    'findall': 'function',
+    'finditer': 'function',
+    'firstweekday': 'function',
+    'fix_missing_locations': 'function',
+    'flags': 'constant',
+    'float_info': 'constant',
+    'float_repr_style': 'constant',
+    'floor': 'function',
+    'floordiv': 'function',
+    'fmean': 'function',
+    'fmod': 'function',
+    'fnmatch': 'function',
+    'fnmatchcase': 'function',
+    'fork': 'function',
+    'forkpty': 'function',
+    'format': 'function',
+    'format_exc': 'function',
+    'format_exception': 'function',
+    'format_exception_only': 'function',
+    'format_list': 'function',
+    'format_stack': 'function',
+    'format_string': 'function',
+    'format_tb': 'function',
+    'formatwarning': 'function',
+    'fpathconf': 'function',
+    'fractions': 'module',
+    'freedesktop_os_release': 'function',
+    'frexp': 'function',
+    'fromfd': 'function',
+    'fromisoformat': 'function',
+    'fromtimestamp': 'function',
+    'fsdecode': 'function',
+    'fsencode': 'function',
+    'fspath': 'function',
+    'fstat': 'function',
+    'fstatvfs': 'function',
+    'fsum': 'function',
+    'fsync': 'function',
+    'ftruncate': 'function',
+    'fullmatch': 'function',
+    'functools': 'module',
+    'fwalk': 'function',
+    'gaierror': 'exception',
+    'gamma': 'function',
+    'gammavariate': 'function',
+    'gather': 'function',
+    'gauss': 'function',
+    'gcd': 'function',
+    'ge': 'function',
+    'geometric_mean': 'function',
+    'getLevelName': 'function',
+    'getLevelNamesMapping': 'function',
+    'getLogRecordFactory': 'function',
+    'getLogger': 'function',
+    'getLoggerClass': 'function',
+    'get_archive_formats': 'function',
+    'get_args': 'function',
+    'get_asyncgen_hooks': 'function',
+    'get_blocking': 'function',
+    'get_cache_token': 'function',
+    'get_child_watcher': 'function',
+    'get_clock_info': 'function',
+    'get_close_matches': 'function',
+    'get_coroutine_origin_tracking_depth': 'function',
+    'get_dialect': 'function',
+    'get_docstring': 'function',
+    'get_event_loop': 'function',
+    'get_event_loop_policy': 'function',
+    'get_exec_path': 'function',
+    'get_ident': 'function',
+    'get_inheritable': 'function',
+    'get_int_max_str_digits': 'function',
+    'get_native_id': 'function',
+    'get_origin': 'function',
+    'get_overloads': 'function',
+    'get_running_loop': 'function',
+    'get_source_segment': 'function',
+    'get_terminal_size': 'function',
+    'get_type_hints': 'function',
+    'get_unpack_formats': 'function',
+    'getaddrinfo': 'function',
+    'getallocatedblocks': 'function',
+    'getatime': 'function',
+    'getcontext': 'function',
+    'getctime': 'function',
+    'getcwd': 'function',
+    'getcwdb': 'function',
+    'getdecoder': 'function',
+    'getdefaultencoding': 'function',
+    'getdefaultlocale': 'function',
+    'getdefaulttimeout': 'function',
+    'getdlopenflags': 'function',
+    'getegid': 'function',
+    'getencoder': 'function',
+    'getencoding': 'function',
+    'getenv': 'function',
+    'getenvb': 'function',
+    'geteuid': 'function',
+    'getfilesystemencodeerrors': 'function',
+    'getfilesystemencoding': 'function',
+    'getfqdn': 'function',
+    'getgid': 'function',
+    'getgrouplist': 'function',
+    'getgroups': 'function',
+    'gethostbyaddr': 'function',
+    'gethostbyname': 'function',
+    'gethostbyname_ex': 'function',
+    'gethostname': 'function',
+    'getincrementaldecoder': 'function',
+    'getincrementalencoder': 'function',
+    'getitem': 'function',
+    'getitimer': 'function',
+    'getloadavg': 'function',
+    'getlocale': 'function',
+    'getlogin': 'function',
+    'getmtime': 'function',
+    'getnameinfo': 'function',
+    'getnode': 'function',
+    'getoutput': 'function',
+    'getpgid': 'function',
+    'getpgrp': 'function',
+    'getpid': 'function',
+    'getppid': 'function',
+    'getpreferredencoding': 'function',
+    'getpriority': 'function',
+    'getprofile': 'function',
+    'getprotobyname': 'function',
+    'getrandbits': 'function',
+    'getrandom': 'function',
+    'getreader': 'function',
+    'getrecursionlimit': 'function',
+    'getrefcount': 'function',
+    'getresgid': 'function',
+    'getresuid': 'function',
+    'getservbyname': 'function',
+    'getservbyport': 'function',
+    'getsid': 'function',
+    'getsignal': 'function',
+    'getsize': 'function',
+    'getsizeof': 'function',
+    'getstate': 'function',
+    'getstatusoutput': 'function',
+    'getswitchinterval': 'function',
+    'gettempdir': 'function',
+    'gettempdirb': 'function',
+    'gettempprefix': 'function',
+    'gettempprefixb': 'function',
+    'gettrace': 'function',
+    'getuid': 'function',
+    'getweakrefcount': 'function',
+    'getweakrefs': 'function',
+    'getwriter': 'function',
+    'getxattr': 'function',
+    'glob': 'module',
+    'global_enum': 'function',
+    'global_enum_repr': 'function',
+    'global_flag_repr': 'function',
+    'global_str': 'function',
+    'gmtime': 'function',
+    'graphlib': 'module',
+    'groupby': 'class',
+    'gt': 'function',
+    'guess_all_extensions': 'function',
+    'guess_extension': 'function',
+    'guess_type': 'function',
+    'harmonic_mean': 'function',
+    'has_dualstack_ipv6': 'function',
+    'has_ipv6': 'constant',
+    'hash_info': 'constant',
+    'hashlib': 'module',
+    'heapify': 'function',
+    'heappop': 'function',
+    'heappush': 'function',
+    'heappushpop': 'function',
+    'heapq': 'module',
+    'heapreplace': 'function',
+    'herror': 'exception',
+    'hexdigits': 'constant',
+    'hexlify': 'function',
+    'hexversion': 'constant',
+    'hmac': 'module',
+    'html': 'module',
+    'htonl': 'function',
+    'htons': 'function',
+    'http': 'module',
+    'hypot': 'function',
+    'iadd': 'function',
+    'iand': 'function',
+    'iconcat': 'function',
+    'if_indextoname': 'function',
+    'if_nameindex': 'function',
+    'if_nametoindex': 'function',
+    'ifloordiv': 'function',
+    'iglob': 'function',
+    'ignore_errors': 'function',
+    'ignore_patterns': 'function',
+    'ilshift': 'function',
+    'imatmul': 'function',
+    'imod': 'function',
+    'implementation': 'constant',
+    'imul': 'function',
+    'increment_lineno': 'function',
+    'indent': 'function',
+    'index': 'function',
+    'indexOf': 'function',
+    'inet_aton': 'function',
+    'inet_ntoa': 'function',
+    'inet_ntop': 'function',
+    'inet_pton': 'function',
+    'inf': 'constant',
+    'infj': 'constant',
+    'info': 'function',
+    'init': 'function',
+    'inited': 'constant',
+    'initgroups': 'function',
+    'insort': 'function',
+    'insort_left': 'function',
+    'insort_right': 'function',
+    'int_': 'class',
+    'int_info': 'constant',
+    'interact': 'function',
+    'intern': 'function',
+    'inv': 'function',
+    'invert': 'function',
+    'io': 'module',
+    'ior': 'function',
+    'ipow': 'function',
+    'irshift': 'function',
+    'is_': 'function',
+    'is_dataclass': 'function',
+    'is_finalizing': 'function',
+    'is_normalized': 'function',
+    'is_not': 'function',
+    'is_typeddict': 'function',
+    'is_zipfile': 'function',
+    'isabs': 'function',
+    'isatty': 'function',
+    'isclose': 'function',
+    'iscoroutine': 'function',
+    'iscoroutinefunction': 'function',
+    'isdir': 'function',
+    'isfile': 'function',
+    'isfinite': 'function',
+    'isfuture': 'function',
+    'isinf': 'function',
+    'isleap': 'function',
+    'islice': 'class',
+    'islink': 'function',
+    'ismount': 'function',
+    'isnan': 'function',
+    'isqrt': 'function',
+    'isreadable': 'function',
+    'isrecursive': 'function',
+    'isub': 'function',
+    'itemgetter': 'class',
+    'iter_child_nodes': 'function',
+    'iter_fields': 'function',
+    'iter_unpack': 'function',
+    'iterdecode': 'function',
+    'iterencode': 'function',
+    'itertools': 'module',
+    'itruediv': 'function',
+    'ixor': 'function',
+    'java_ver': 'function',
+    'join': 'function',
+    'json': 'module',
+    'keyword': 'class',
+    'kill': 'function',
+    'killpg': 'function',
+    'knownfiles': 'constant',
+    'lastResort': 'constant',
+    'lchown': 'function',
+    'lcm': 'function',
+    'ldexp': 'function',
+    'le': 'function',
+    'leapdays': 'function',
+    'length_hint': 'function',
+    'lexists': 'function',
+    'lgamma': 'function',
+    'libc_ver': 'function',
+    'linear_regression': 'function',
+    'linesep': 'constant',
+    'link': 'function',
+    'list_dialects': 'function',
+    'listdir': 'function',
+    'listxattr': 'function',
+    'literal_eval': 'function',
+    'load': 'function',
+    'loads': 'function',
+    'local': 'class',
+    'localcontext': 'function',
+    'locale': 'module',
+    'localeconv': 'function',
+    'localtime': 'function',
+    'lockf': 'function',
+    'log': 'function',
+    'log10': 'function',
+    'log1p': 'function',
+    'log2': 'function',
+    'logging': 'module',
+    'login_tty': 'function',
+    'lognormvariate': 'function',
+    'lookup': 'function',
+    'lookup_error': 'function',
+    'lru_cache': 'function',
+    'lseek': 'function',
+    'lshift': 'function',
+    'lstat': 'function',
+    'lt': 'function',
+    'mac_ver': 'function',
+    'machine': 'function',
+    'main': 'function',
+    'main_thread': 'function',
+    'major': 'function',
+    'makeLogRecord': 'function',
+    'make_archive': 'function',
+    'make_dataclass': 'function',
+    'makedev': 'function',
+    'makedirs': 'function',
+    'match': 'function',
+    'match_case': 'class',
+    'math': 'module',
+    'matmul': 'function',
+    'maxsize': 'constant',
+    'maxunicode': 'constant',
+    'md5': 'function',
+    'mean': 'function',
+    'median': 'function',
+    'median_grouped': 'function',
+    'median_high': 'function',
+    'median_low': 'function',
+    'member': 'class',
+    'memfd_create': 'function',
+    'merge': 'function',
+    'meta_path': 'constant',
+    'methodcaller': 'class',
+    'mimetypes': 'module',
+    'minor': 'function',
+    'mirrored': 'function',
+    'mkdir': 'function',
+    'mkdtemp': 'function',
+    'mkfifo': 'function',
+    'mknod': 'function',
+    'mkstemp': 'function',
+    'mktemp': 'function',
+    'mktime': 'function',
+    'mod': 'function',
+    'mode': 'function',
+    'modf': 'function',
+    'modules': 'constant',
+    'monotonic': 'function',
+    'monotonic_ns': 'function',
+    'month': 'function',
+    'month_abbr': 'constant',
+    'month_name': 'constant',
+    'monthcalendar': 'function',
+    'monthrange': 'function',
+    'move': 'function',
+    'mul': 'function',
+    'multimode': 'function',
+    'name': 'function',
+    'namedtuple': 'function',
+    'namereplace_errors': 'function',
+    'nan': 'constant',
+    'nanj': 'constant',
+    'ndiff': 'function',
+    'ne': 'function',
+    'neg': 'function',
+    'new': 'function',
+    'new_class': 'function',
+    'new_event_loop': 'function',
+    'nextafter': 'function',
+    'nice': 'function',
+    'nlargest': 'function',
+    'no_type_check': 'function',
+    'no_type_check_decorator': 'function',
+    'node': 'function',
+    'nonmember': 'class',
+    'normalize': 'function',
+    'normalvariate': 'function',
+    'normcase': 'function',
+    'normpath': 'function',
+    'not_': 'function',
+    'nsmallest': 'function',
+    'ntohl': 'function',
+    'ntohs': 'function',
+    'nullcontext': 'class',
+    'numbers': 'module',
+    'numeric': 'function',
+    'octdigits': 'constant',
+    'open': 'function',
+    'open_code': 'function',
+    'open_connection': 'function',
+    'open_unix_connection': 'function',
+    'openpty': 'function',
+    'operator': 'module',
+    'or_': 'function',
+    'orig_argv': 'constant',
+    'os': 'module',
+    'overload': 'function',
+    'pack': 'function',
+    'pack_into': 'function',
+    'pairwise': 'class',
+    'paramstyle': 'constant',
+    'pardir': 'constant',
+    'paretovariate': 'function',
+    'parse': 'module',
+    'parse_qs': 'function',
+    'parse_qsl': 'function',
+    'parsers': 'module',
+    'partial': 'class',
+    'partialmethod': 'class',
+    'path': 'module',
+    'path_hooks': 'constant',
+    'path_importer_cache': 'constant',
+    'pathconf': 'function',
+    'pathconf_names': 'constant',
+    'pathlib': 'module',
+    'pathsep': 'constant',
+    'pattern': 'class',
+    'pause': 'function',
+    'pbkdf2_hmac': 'function',
+    'perf_counter': 'function',
+    'perf_counter_ns': 'function',
+    'perm': 'function',
+    'permutations': 'class',
+    'pformat': 'function',
+    'phase': 'function',
+    'pi': 'constant',
+    'pickle': 'module',
+    'pickle_by_enum_name': 'function',
+    'pickle_by_global_name': 'function',
+    'pidfd_open': 'function',
+    'pidfd_send_signal': 'function',
+    'pipe': 'function',
+    'pipe2': 'function',
+    'platform': 'module',
+    'platlibdir': 'constant',
+    'polar': 'function',
+    'popen': 'function',
+    'pos': 'function',
+    'posix_fadvise': 'function',
+    'posix_fallocate': 'function',
+    'posix_spawn': 'function',
+    'posix_spawnp': 'function',
+    'pow': 'function',
+    'pp': 'function',
+    'pprint': 'function',
+    'prcal': 'function',
+    'pread': 'function',
+    'preadv': 'function',
+    'prefix': 'constant',
+    'prepare_class': 'function',
+    'print_exc': 'function',
+    'print_exception': 'function',
+    'print_last': 'function',
+    'print_stack': 'function',
+    'print_tb': 'function',
+    'printable': 'constant',
+    'prmonth': 'function',
+    'process_time': 'function',
+    'process_time_ns': 'function',
+    'processor': 'function',
+    'prod': 'function',
+    'product': 'class',
+    'property': 'class',
+    'proxy': 'function',
+    'pstdev': 'function',
+    'pthread_getcpuclockid': 'function',
+    'pthread_kill': 'function',
+    'pthread_sigmask': 'function',
+    'punctuation': 'constant',
+    'purge': 'function',
+    'putenv': 'function',
+    'pvariance': 'function',
+    'pwrite': 'function',
+    'pwritev': 'function',
+    'pycache_prefix': 'constant',
+    'python_branch': 'function',
+    'python_build': 'function',
+    'python_compiler': 'function',
+    'python_implementation': 'function',
+    'python_revision': 'function',
+    'python_version': 'function',
+    'python_version_tuple': 'function',
+    'quantiles': 'function',
+    'queue': 'module',
+    'quote': 'function',
+    'quote_from_bytes': 'function',
+    'quote_plus': 'function',
+    'radians': 'function',
+    'raiseExceptions': 'constant',
+    'raise_signal': 'function',
+    'randbelow': 'function',
+    'randbits': 'function',
+    'randbytes': 'function',
+    'randint': 'function',
+    'random': 'function',
+    'randrange': 'function',
+    're': 'module',
+    'read': 'function',
+    'read_mime_types': 'function',
+    'reader': 'function',
+    'readlink': 'function',
+    'readv': 'function',
+    'realpath': 'function',
+    'rect': 'function',
+    'recursive_repr': 'function',
+    'recv_fds': 'function',
+    'redirect_stderr': 'class',
+    'redirect_stdout': 'class',
+    'reduce': 'function',
+    'ref': 'class',
+    'register': 'function',
+    'register_adapter': 'function',
+    'register_archive_format': 'function',
+    'register_at_fork': 'function',
+    'register_converter': 'function',
+    'register_dialect': 'function',
+    'register_error': 'function',
+    'register_unpack_format': 'function',
+    'release': 'function',
+    'relpath': 'function',
+    'remainder': 'function',
+    'remove': 'function',
+    'removedirs': 'function',
+    'removexattr': 'function',
+    'rename': 'function',
+    'renames': 'function',
+    'repeat': 'class',
+    'replace': 'function',
+    'replace_errors': 'function',
+    'repr': 'function',
+    'reprlib': 'module',
+    'reset_tzpath': 'function',
+    'resetlocale': 'function',
+    'resetwarnings': 'function',
+    'resolve_bases': 'function',
+    'restore': 'function',
+    'reveal_type': 'function',
+    'rmdir': 'function',
+    'rmtree': 'function',
+    'rshift': 'function',
+    'run': 'function',
+    'run_coroutine_threadsafe': 'function',
+    'runtime_checkable': 'function',
+    'saferepr': 'function',
+    'samefile': 'function',
+    'sameopenfile': 'function',
+    'samestat': 'function',
+    'sample': 'function',
+    'sax': 'module',
+    'scandir': 'function',
+    'sched_get_priority_max': 'function',
+    'sched_get_priority_min': 'function',
+    'sched_getaffinity': 'function',
+    'sched_getparam': 'function',
+    'sched_getscheduler': 'function',
+    'sched_param': 'class',
+    'sched_rr_get_interval': 'function',
+    'sched_setaffinity': 'function',
+    'sched_setparam': 'function',
+    'sched_setscheduler': 'function',
+    'sched_yield': 'function',
+    'search': 'function',
+    'secrets': 'module',
+    'seed': 'function',
+    'send_fds': 'function',
+    'sendfile': 'function',
+    'sep': 'constant',
+    'setLogRecordFactory': 'function',
+    'setLoggerClass': 'function',
+    'set_asyncgen_hooks': 'function',
+    'set_blocking': 'function',
+    'set_child_watcher': 'function',
+    'set_coroutine_origin_tracking_depth': 'function',
+    'set_event_loop': 'function',
+    'set_event_loop_policy': 'function',
+    'set_inheritable': 'function',
+    'set_int_max_str_digits': 'function',
+    'set_wakeup_fd': 'function',
+    'setcontext': 'function',
+    'setdefaulttimeout': 'function',
+    'setdlopenflags': 'function',
+    'setegid': 'function',
+    'seteuid': 'function',
+    'setfirstweekday': 'function',
+    'setgid': 'function',
+    'setgroups': 'function',
+    'sethostname': 'function',
+    'setitem': 'function',
+    'setitimer': 'function',
+    'setlocale': 'function',
+    'setpgid': 'function',
+    'setpgrp': 'function',
+    'setpriority': 'function',
+    'setprofile': 'function',
+    'setrecursionlimit': 'function',
+    'setregid': 'function',
+    'setresgid': 'function',
+    'setresuid': 'function',
+    'setreuid': 'function',
+    'setsid': 'function',
+    'setstate': 'function',
+    'setswitchinterval': 'function',
+    'settrace': 'function',
+    'setuid': 'function',
+    'setxattr': 'function',
+    'sha1': 'function',
+    'sha224': 'function',
+    'sha256': 'function',
+    'sha384': 'function',
+    'sha3_224': 'function',
+    'sha3_256': 'function',
+    'sha3_384': 'function',
+    'sha3_512': 'function',
+    'sha512': 'function',
+    'shake_128': 'function',
+    'shake_256': 'function',
+    'shelve': 'module',
+    'shield': 'function',
+    'shlex': 'module',
+    'shorten': 'function',
+    'showwarning': 'function',
+    'shuffle': 'function',
+    'shutdown': 'function',
+    'shutil': 'module',
+    'siginterrupt': 'function',
+    'signal': 'function',
+    'sigpending': 'function',
+    'sigtimedwait': 'function',
+    'sigwait': 'function',
+    'sigwaitinfo': 'function',
+    'simplefilter': 'function',
+    'sin': 'function',
+    'singledispatch': 'function',
+    'singledispatchmethod': 'class',
+    'sinh': 'function',
+    'sleep': 'function',
+    'slice': 'class',
+    'socket': 'class',
+    'socketpair': 'function',
+    'spawnl': 'function',
+    'spawnle': 'function',
+    'spawnlp': 'function',
+    'spawnlpe': 'function',
+    'spawnv': 'function',
+    'spawnve': 'function',
+    'spawnvp': 'function',
+    'spawnvpe': 'function',
+    'splice': 'function',
+    'split': 'function',
+    'splitdrive': 'function',
+    'splitext': 'function',
+    'sqlite3': 'module',
+    'sqlite_version': 'constant',
+    'sqlite_version_info': 'constant',
+    'sqrt': 'function',
+    'stack_size': 'function',
+    'standard_b64decode': 'function',
+    'standard_b64encode': 'function',
+    'starmap': 'class',
+    'start_server': 'function',
+    'start_unix_server': 'function',
+    'stat': 'function',
+    'stat_result': 'class',
+    'statistics': 'module',
+    'statvfs': 'function',
+    'statvfs_result': 'class',
+    'stderr': 'constant',
+    'stdev': 'function',
+    'stdin': 'constant',
+    'stdlib_module_names': 'constant',
+    'stdout': 'constant',
+    'stmt': 'class',
+    'str': 'class',
+    'strcoll': 'function',
+    'strerror': 'function',
+    'strftime': 'function',
+    'strict_errors': 'function',
+    'string': 'module',
+    'strptime': 'function',
+    'strsignal': 'function',
+    'struct': 'module',
+    'struct_siginfo': 'class',
+    'struct_time': 'class',
+    'strxfrm': 'function',
+    'sub': 'function',
+    'subn': 'function',
+    'subprocess': 'module',
+    'suffix_map': 'constant',
+    'supports_bytes_environ': 'constant',
+    'supports_unicode_filenames': 'constant',
+    'suppress': 'class',
+    'symlink': 'function',
+    'sync': 'function',
+    'sys': 'module',
+    'sysconf': 'function',
+    'sysconf_names': 'constant',
+    'system': 'function',
+    'system_alias': 'function',
+    'takewhile': 'class',
+    'tan': 'function',
+    'tanh': 'function',
+    'tau': 'constant',
+    'tcgetpgrp': 'function',
+    'tcsetpgrp': 'function',
+    'tee': 'function',
+    'tempdir': 'constant',
+    'tempfile': 'module',
+    'template': 'function',
+    'terminal_size': 'class',
+    'text_encoding': 'function',
+    'textwrap': 'module',
+    'thread_info': 'constant',
+    'thread_time': 'function',
+    'thread_time_ns': 'function',
+    'threading': 'module',
+    'threadsafety': 'constant',
+    'time': 'module',
+    'time_ns': 'function',
+    'timedelta': 'class',
+    'timegm': 'function',
+    'timeit': 'function',
+    'timeout': 'exception',
+    'timeout_at': 'function',
+    'times': 'function',
+    'times_result': 'class',
+    'timezone': 'constant',
+    'to_thread': 'function',
+    'token_bytes': 'function',
+    'token_hex': 'function',
+    'token_urlsafe': 'function',
+    'tomllib': 'module',
+    'total_ordering': 'function',
+    'traceback': 'module',
+    'trans_36': 'constant',
+    'trans_5C': 'constant',
+    'translate': 'function',
+    'triangular': 'function',
+    'truediv': 'function',
+    'trunc': 'function',
+    'truncate': 'function',
+    'truth': 'function',
+    'ttyname': 'function',
+    'type_ignore': 'class',
+    'typecodes': 'constant',
+    'types': 'module',
+    'types_map': 'constant',
+    'typing': 'module',
+    'tzinfo': 'class',
+    'tzname': 'constant',
+    'tzset': 'function',
+    'ucd_3_2_0': 'constant',
+    'ulp': 'function',
+    'umask': 'function',
+    'uname': 'function',
+    'uname_result': 'class',
+    'unaryop': 'class',
+    'unescape': 'function',
+    'unhexlify': 'function',
+    'unicodedata': 'module',
+    'unidata_version': 'constant',
+    'unified_diff': 'function',
+    'uniform': 'function',
+    'unique': 'function',
+    'unix_dialect': 'class',
+    'unlink': 'function',
+    'unpack': 'function',
+    'unpack_archive': 'function',
+    'unpack_from': 'function',
+    'unparse': 'function',
+    'unquote': 'function',
+    'unquote_plus': 'function',
+    'unquote_to_bytes': 'function',
+    'unraisablehook': 'function',
+    'unregister_archive_format': 'function',
+    'unregister_dialect': 'function',
+    'unregister_unpack_format': 'function',
+    'unsetenv': 'function',
+    'update_abstractmethods': 'function',
+    'update_wrapper': 'function',
+    'urandom': 'function',
+    'urldefrag': 'function',
+    'urlencode': 'function',
+    'urljoin': 'function',
+    'urllib': 'module',
+    'urlparse': 'function',
+    'urlsafe_b64decode': 'function',
+    'urlsafe_b64encode': 'function',
+    'urlsplit': 'function',
+    'urlunparse': 'function',
+    'urlunsplit': 'function',
+    'utime': 'function',
+    'uuid': 'module',
+    'uuid1': 'function',
+    'uuid3': 'function',
+    'uuid4': 'function',
+    'uuid5': 'function',
+    'valid_signals': 'function',
+    'variance': 'function',
+    'verify': 'class',
+    'version': 'constant',
+    'version_info': 'constant',
+    'vonmisesvariate': 'function',
+    'wait': 'function',
+    'wait3': 'function',
+    'wait4': 'function',
+    'wait_for': 'function',
+    'waitid': 'function',
+    'waitid_result': 'class',
+    'waitpid': 'function',
+    'waitstatus_to_exitcode': 'function',
+    'walk': 'function',
+    'walk_stack': 'function',
+    'walk_tb': 'function',
+    'warn': 'function',
+    'warn_explicit': 'function',
+    'warning': 'function',
+    'warnings': 'module',
+    'warnoptions': 'constant',
+    'weakref': 'module',
+    'weekday': 'function',
+    'weekheader': 'function',
+    'weibullvariate': 'function',
+    'which': 'function',
+    'whitespace': 'constant',
+    'win32_edition': 'function',
+    'win32_is_iot': 'function',
+    'win32_ver': 'function',
+    'withitem': 'class',
+    'wrap': 'function',
+    'wrap_future': 'function',
+    'wraps': 'function',
+    'write': 'function',
+    'writer': 'function',
+    'writev': 'function',
+    'xml': 'module',
+    'xmlcharrefreplace_errors': 'function',
+    'xor': 'function',
+    'zip_longest': 'class',
+    'zipfile': 'module',
+    'zlib': 'module',
+    'zoneinfo': 'module',
+}
+
+SIGNATURES = {
+    'ABC': '()',
+    'ABCMeta': '(name, bases, namespace, /, **kwargs)',
+    'AbstractAsyncContextManager': '()',
+    'AbstractChildWatcher': '()',
+    'AbstractContextManager': '()',
+    'AbstractEventLoop': '()',
+    'AbstractEventLoopPolicy': '()',
+    'AbstractServer': '()',
+    'AbstractSet': '(*args, **kwargs)',
+    'AddressFamily': '(value, names=None, *, module=None, qualname=None, type=None, start=1, boundary=None)',
+    'Annotated': '(*args, **kwargs)',
+    'Any': '(*args, **kwargs)',
+    'AsyncContextManager': '(*args, **kwargs)',
+    'AsyncExitStack': '()',
+    'AsyncGenerator': '(*args, **kwargs)',
+    'AsyncGeneratorType': '()',
+    'AsyncIterable': '(*args, **kwargs)',
+    'AsyncIterator': '(*args, **kwargs)',
+    'Awaitable': '(*args, **kwargs)',
+    'Barrier': '(parties, action=None, timeout=None)',
+    'BaseEventLoop': '()',
+    'BaseProtocol': '()',
+    'BaseTransport': '(extra=None)',
+    'BasicInterpolation': '()',
+    'Binary': '(object)',
+    'BinaryIO': '()',
+    'Blob': '()',
+    'BoundedSemaphore': '(value=1)',
+    'BsdDbShelf': "(dict, protocol=None, writeback=False, keyencoding='utf-8')",
+    'BufferedProtocol': '()',
+    'BufferedRWPair': '(reader, writer, buffer_size=8192, /)',
+    'BufferedRandom': '(raw, buffer_size=8192)',
+    'BufferedReader': '(raw, buffer_size=8192)',
+    'BufferedWriter': '(raw, buffer_size=8192)',
+    'BufferingFormatter': '(linefmt=None)',
+    'BuiltinFunctionType': '()',
+    'BuiltinMethodType': '()',
+    'ByteString': '(*args, **kwargs)',
+    'Bytes': '(*args, **kwargs)',
+    'BytesIO': "(initial_bytes=b'')",
+    'Calendar': '(firstweekday=0)',
+    'Callable': '(*args, **kwargs)',
+    'CallableProxyType': '()',
+    'CalledProcessError': '(returncode, cmd, output=None, stderr=None)',
+    'ChainMap': '(*args, **kwargs)',
+    'ClassMethodDescriptorType': '()',
+    'ClassVar': '(*args, **kwds)',
+    'CodeType': '(argcount, posonlyargcount, kwonlyargcount, nlocals, stacksize, flags, codestring, constants, names, varnames, filename, name, qualname, firstlineno, linetable, exceptiontable, freevars=(), cellvars=(), /)',
+    'Codec': '()',
+    'CodecInfo': '(encode, decode, streamreader=None, streamwriter=None, incrementalencoder=None, incrementaldecoder=None, name=None, *, _is_text_encoding=None)',
+    'Collection': '(*args, **kwargs)',
+    'CompletedProcess': '(args, returncode, stdout=None, stderr=None)',
+    'Complex': '()',
+    'Concatenate': '(*args, **kwds)',
+    'Condition': '(lock=None)',
+    'ConfigParser': "(defaults=None, dict_type=<class 'dict'>, allow_no_value=False, *, delimiters=('=', ':'), comment_prefixes=('#', ';'), inline_comment_prefixes=None, strict=True, empty_lines_in_values=True, default_section='DEFAULT', interpolation=<object object>, converters=<object object>)",
+    'Container': '(*args, **kwargs)',
+    'Context': '(prec=None, rounding=None, Emin=None, Emax=None, capitals=None, clamp=None, flags=None, traps=None)',
+    'ContextDecorator': '()',
+    'ContextManager': '(*args, **kwargs)',
+    'ConverterMapping': '(parser)',
+    'Coroutine': '(*args, **kwargs)',
+    'CoroutineType': '()',
+    'Counter': '(*args, **kwargs)',
+    'DatagramProtocol': '()',
+    'DatagramTransport': '(extra=None)',
+    'DateFromTicks': '(ticks)',
+    'DbfilenameShelf': "(filename, flag='c', protocol=None, writeback=False)",
+    'Decimal': "(value='0', context=None)",
+    'DecimalTuple': '(sign, digits, exponent)',
+    'DefaultDict': '(*args, **kwargs)',
+    'DefaultEventLoopPolicy': '()',
+    'DefragResult': '(url, fragment)',
+    'DefragResultBytes': '(url, fragment)',
+    'Deque': '(*args, **kwargs)',
+    'Dialect': '()',
+    'Dict': '(*args, **kwargs)',
+    'DictReader': "(f, fieldnames=None, restkey=None, restval=None, dialect='excel', *args, **kwds)",
+    'DictWriter': "(f, fieldnames, restval='', extrasaction='raise', dialect='excel', *args, **kwds)",
+    'Differ': '(linejunk=None, charjunk=None)',
+    'DirEntry': '()',
+    'DuplicateOptionError': '(section, option, source=None, lineno=None)',
+    'DuplicateSectionError': '(section, source=None, lineno=None)',
+    'DynamicClassAttribute': '(fget=None, fset=None, fdel=None, doc=None)',
+    'Ellipsis': '(*args, **kwargs)',
+    'EncodedFile': "(file, data_encoding, file_encoding=None, errors='strict')",
+    'Enum': '(value, names=None, *, module=None, qualname=None, type=None, start=1, boundary=None)',
+    'EnumCheck': '(value, names=None, *, module=None, qualname=None, type=None, start=1, boundary=None)',
+    'EnumMeta': '(cls, bases, classdict, *, boundary=None, _simple=False, **kwds)',
+    'EnumType': '(cls, bases, classdict, *, boundary=None, _simple=False, **kwds)',
+    'Event': '()',
+    'ExceptHookArgs': '(iterable=(), /)',
+    'ExitStack': '()',
+    'ExtSlice': '(dims=(), **kwargs)',
+    'ExtendedInterpolation': '()',
+    'FastChildWatcher': '()',
+    'Field': '(default, default_factory, init, repr, hash, compare, metadata, kw_only)',
+    'FileHandler': "(filename, mode='a', encoding=None, delay=False, errors=None)",
+    'FileIO': "(file, mode='r', closefd=True, opener=None)",
+    'Filter': "(name='')",
+    'Final': '(*args, **kwds)',
+    'Flag': '(value, names=None, *, module=None, qualname=None, type=None, start=1, boundary=None)',
+    'FlagBoundary': '(value, names=None, *, module=None, qualname=None, type=None, start=1, boundary=None)',
+    'Formatter': '()',
+    'ForwardRef': '(arg, is_argument=True, module=None, *, is_class=False)',
+    'Fraction': '(numerator=0, denominator=None, *, _normalize=True)',
+    'FrameSummary': '(filename, lineno, name, *, lookup_line=True, locals=None, line=None, end_lineno=None, colno=None, end_colno=None)',
+    'FrameType': '()',
+    'FrozenSet': '(*args, **kwargs)',
+    'FunctionType': '(code, globals, name=None, argdefs=None, closure=None)',
+    'Future': '(*, loop=None)',
+    'Generator': '(*args, **kwargs)',
+    'GeneratorType': '()',
+    'Generic': '()',
+    'GetSetDescriptorType': '()',
+    'HMAC': "(key, msg=None, digestmod='')",
+    'HTMLCalendar': '(firstweekday=0)',
+    'HTTPMethod': '(value, names=None, *, module=None, qualname=None, type=None, start=1, boundary=None)',
+    'HTTPStatus': '(value, names=None, *, module=None, qualname=None, type=None, start=1, boundary=None)',
+    'Handle': '(callback, args, loop, context=None)',
+    'Handler': '(level=0)',
+    'Handlers': '(value, names=None, *, module=None, qualname=None, type=None, start=1, boundary=None)',
+    'Hashable': '(*args, **kwargs)',
+    'HtmlDiff': '(tabsize=8, wrapcolumn=None, linejunk=None, charjunk=<function IS_CHARACTER_JUNK>)',
+    'IO': '()',
+    'IS_CHARACTER_JUNK': "(ch, ws=' \\t')",
+    'IS_LINE_JUNK': '(line, pat=<built-in method match of re.Pattern object>)',
+    'IllegalMonthError': '(month)',
+    'IllegalWeekdayError': '(weekday)',
+    'IncompleteReadError': '(partial, expected)',
+    'IncrementalDecoder': "(errors='strict')",
+    'IncrementalEncoder': "(errors='strict')",
+    'IncrementalNewlineDecoder': "(decoder, translate, errors='strict')",
+    'Index': '(value, **kwargs)',
+    'InitVar': '(type)',
+    'IntEnum': '(value, names=None, *, module=None, qualname=None, type=None, start=1, boundary=None)',
+    'IntFlag': '(value, names=None, *, module=None, qualname=None, type=None, start=1, boundary=None)',
+    'Integral': '()',
+    'InteractiveConsole': "(locals=None, filename='<console>')",
+    'InteractiveInterpreter': '(locals=None)',
+    'Interpolation': '()',
+    'InterpolationDepthError': '(option, section, rawval)',
+    'InterpolationError': '(option, section, msg)',
+    'InterpolationMissingOptionError': '(option, section, rawval, reference)',
+    'InterpolationSyntaxError': '(option, section, msg)',
+    'ItemsView': '(*args, **kwargs)',
+    'Iterable': '(*args, **kwargs)',
+    'Iterator': '(*args, **kwargs)',
+    'JSONDecodeError': '(msg, doc, pos)',
+    'JSONDecoder': '(*, object_hook=None, parse_float=None, parse_int=None, parse_constant=None, strict=True, object_pairs_hook=None)',
+    'JSONEncoder': '(*, skipkeys=False, ensure_ascii=True, check_circular=True, allow_nan=True, sort_keys=False, indent=None, separators=None, default=None)',
+    'KeysView': '(*args, **kwargs)',
+    'LambdaType': '(code, globals, name=None, argdefs=None, closure=None)',
+    'LegacyInterpolation': '(*args, **kwargs)',
+    'LifoQueue': '(maxsize=0)',
+    'LimitOverrunError': '(message, consumed)',
+    'List': '(*args, **kwargs)',
+    'Literal': '(*args, **kwds)',
+    'LiteralString': '(*args, **kwds)',
+    'LocaleHTMLCalendar': '(firstweekday=0, locale=None)',
+    'LocaleTextCalendar': '(firstweekday=0, locale=None)',
+    'LogRecord': '(name, level, pathname, lineno, msg, args, exc_info, func=None, sinfo=None, **kwargs)',
+    'Logger': '(name, level=0)',
+    'LoggerAdapter': '(logger, extra=None)',
+    'Mapping': '(*args, **kwargs)',
+    'MappingView': '(*args, **kwargs)',
+    'Match': '(*args, **kwargs)',
+    'MemberDescriptorType': '()',
+    'MethodDescriptorType': '()',
+    'MethodType': '(function, instance, /)',
+    'MethodWrapperType': '()',
+    'MimeTypes': '(filenames=(), strict=True)',
+    'MissingSectionHeaderError': '(filename, lineno, line)',
+    'ModuleType': '(name, doc=None)',
+    'MultiLoopChildWatcher': '()',
+    'MutableMapping': '(*args, **kwargs)',
+    'MutableSequence': '(*args, **kwargs)',
+    'MutableSet': '(*args, **kwargs)',
+    'NameConstant': '(*args, **kwargs)',
+    'NamedTemporaryFile': "(mode='w+b', buffering=-1, encoding=None, newline=None, suffix=None, prefix=None, dir=None, delete=True, *, errors=None)",
+    'NamedTuple': '(typename, fields=None, /, **kwargs)',
+    'Never': '(*args, **kwds)',
+    'NewType': '(name, tp)',
+    'NoOptionError': '(option, section)',
+    'NoReturn': '(*args, **kwds)',
+    'NoSectionError': '(section)',
+    'NodeTransformer': '()',
+    'NodeVisitor': '()',
+    'NormalDist': '(mu=0.0, sigma=1.0)',
+    'NotRequired': '(*args, **kwds)',
+    'NullHandler': '(level=0)',
+    'Num': '(*args, **kwargs)',
+    'Number': '()',
+    'Optional': '(*args, **kwds)',
+    'OrderedDict': '(*args, **kwargs)',
+    'ParamSpec': '(name, *, bound=None, covariant=False, contravariant=False)',
+    'ParamSpecArgs': '(origin)',
+    'ParamSpecKwargs': '(origin)',
+    'ParseResult': '(scheme, netloc, path, params, query, fragment)',
+    'ParseResultBytes': '(scheme, netloc, path, params, query, fragment)',
+    'ParsingError': '(source=None, filename=None)',
+    'Path': '(*args, **kwargs)',
+    'Pattern': '(*args, **kwargs)',
+    'Pickler': '(file, protocol=None, fix_imports=True, buffer_callback=None)',
+    'PidfdChildWatcher': '()',
+    'Popen': '(args, bufsize=-1, executable=None, stdin=None, stdout=None, stderr=None, preexec_fn=None, close_fds=True, shell=False, cwd=None, env=None, universal_newlines=None, startupinfo=None, creationflags=0, restore_signals=True, start_new_session=False, pass_fds=(), *, user=None, group=None, extra_groups=None, encoding=None, errors=None, text=None, umask=-1, pipesize=-1, process_group=None)',
+    'PosixPath': '(*args, **kwargs)',
+    'PrettyPrinter': '(indent=1, width=80, depth=None, stream=None, *, compact=False, sort_dicts=True, underscore_numbers=False)',
+    'PriorityQueue': '(maxsize=0)',
+    'Protocol': '()',
+    'ProxyType': '()',
+    'PurePath': '(*args)',
+    'PurePosixPath': '(*args)',
+    'PureWindowsPath': '(*args)',
+    'PyZipFile': "(file, mode='r', compression=0, allowZip64=True, optimize=-1)",
+    'Queue': '(maxsize=0)',
+    'RLock': '(*args, **kwargs)',
+    'Random': '(x=None)',
+    'Rational': '()',
+    'RawConfigParser': "(defaults=None, dict_type=<class 'dict'>, allow_no_value=False, *, delimiters=('=', ':'), comment_prefixes=('#', ';'), inline_comment_prefixes=None, strict=True, empty_lines_in_values=True, default_section='DEFAULT', interpolation=<object object>, converters=<object object>)",
+    'ReadTransport': '(extra=None)',
+    'Real': '()',
+    'RegexFlag': '(value, names=None, *, module=None, qualname=None, type=None, start=1, boundary=None)',
+    'Repr': '()',
+    'ReprEnum': '(value, names=None, *, module=None, qualname=None, type=None, start=1, boundary=None)',
+    'Required': '(*args, **kwds)',
+    'Reversible': '(*args, **kwargs)',
+    'Runner': '(*, debug=None, loop_factory=None)',
+    'SafeChildWatcher': '()',
+    'SafeConfigParser': '(*args, **kwargs)',
+    'SafeUUID': '(value, names=None, *, module=None, qualname=None, type=None, start=1, boundary=None)',
+    'SectionProxy': '(parser, name)',
+    'SelectorEventLoop': '(selector=None)',
+    'Self': '(*args, **kwds)',
+    'Semaphore': '(value=1)',
+    'Sequence': '(*args, **kwargs)',
+    'SequenceMatcher': "(isjunk=None, a='', b='', autojunk=True)",
+    'Server': '(loop, sockets, protocol_factory, ssl_context, backlog, ssl_handshake_timeout, ssl_shutdown_timeout=None)',
+    'Set': '(*args, **kwargs)',
+    'Shelf': "(dict, protocol=None, writeback=False, keyencoding='utf-8')",
+    'Sigmasks': '(value, names=None, *, module=None, qualname=None, type=None, start=1, boundary=None)',
+    'Signals': '(value, names=None, *, module=None, qualname=None, type=None, start=1, boundary=None)',
+    'SimpleQueue': '()',
+    'Sized': '(*args, **kwargs)',
+    'Sniffer': '()',
+    'SocketKind': '(value, names=None, *, module=None, qualname=None, type=None, start=1, boundary=None)',
+    'SplitResult': '(scheme, netloc, path, query, fragment)',
+    'SplitResultBytes': '(scheme, netloc, path, query, fragment)',
+    'SpooledTemporaryFile': "(max_size=0, mode='w+b', buffering=-1, encoding=None, newline=None, suffix=None, prefix=None, dir=None, *, errors=None)",
+    'StackSummary': '(iterable=(), /)',
+    'Str': '(*args, **kwargs)',
+    'StrEnum': '(value, names=None, *, module=None, qualname=None, type=None, start=1, boundary=None)',
+    'StreamHandler': '(stream=None)',
+    'StreamReader': "(stream, errors='strict')",
+    'StreamReaderProtocol': '(stream_reader, client_connected_cb=None, loop=None)',
+    'StreamReaderWriter': "(stream, Reader, Writer, errors='strict')",
+    'StreamRecoder': "(stream, encode, decode, Reader, Writer, errors='strict')",
+    'StreamWriter': "(stream, errors='strict')",
+    'StringIO': "(initial_value='', newline='\\n')",
+    'SubprocessProtocol': '()',
+    'SubprocessTransport': '(extra=None)',
+    'SupportsAbs': '(*args, **kwargs)',
+    'SupportsBytes': '(*args, **kwargs)',
+    'SupportsComplex': '(*args, **kwargs)',
+    'SupportsFloat': '(*args, **kwargs)',
+    'SupportsIndex': '(*args, **kwargs)',
+    'SupportsInt': '(*args, **kwargs)',
+    'SupportsRound': '(*args, **kwargs)',
+    'SystemRandom': '(x=None)',
+    'Task': '(coro, *, loop=None, name=None, context=None)',
+    'Template': '(template)',
+    'TemporaryDirectory': '(suffix=None, prefix=None, dir=None, ignore_cleanup_errors=False)',
+    'TemporaryFile': "(mode='w+b', buffering=-1, encoding=None, newline=None, suffix=None, prefix=None, dir=None, *, errors=None)",
+    'TextCalendar': '(firstweekday=0)',
+    'TextIO': '()',
+    'TextIOWrapper': '(buffer, encoding=None, errors=None, newline=None, line_buffering=False, write_through=False)',
+    'TextWrapper': "(width=70, initial_indent='', subsequent_indent='', expand_tabs=True, replace_whitespace=True, fix_sentence_endings=False, break_long_words=True, drop_whitespace=True, break_on_hyphens=True, tabsize=8, *, max_lines=None, placeholder=' [...]')",
+    'Thread': '(group=None, target=None, name=None, args=(), kwargs=None, *, daemon=None)',
+    'ThreadedChildWatcher': '()',
+    'TimeFromTicks': '(ticks)',
+    'Timeout': '(when: Optional[float]) -> None',
+    'TimeoutExpired': '(cmd, timeout, output=None, stderr=None)',
+    'Timer': "(stmt='pass', setup='pass', timer=<built-in function perf_counter>, globals=None)",
+    'TimerHandle': '(when, callback, args, loop, context=None)',
+    'TimestampFromTicks': '(ticks)',
+    'TopologicalSorter': '(graph=None)',
+    'TracebackException': '(exc_type, exc_value, exc_traceback, *, limit=None, lookup_lines=True, capture_locals=False, compact=False, max_group_width=15, max_group_depth=10, _seen=None)',
+    'Transport': '(extra=None)',
+    'Tuple': '(*args, **kwargs)',
+    'Type': '(*args, **kwargs)',
+    'TypeAlias': '(*args, **kwds)',
+    'TypeGuard': '(*args, **kwds)',
+    'TypeVar': '(name, *constraints, bound=None, covariant=False, contravariant=False)',
+    'TypeVarTuple': '(name)',
+    'TypedDict': '(typename, fields=None, /, *, total=True, **kwargs)',
+    'UCD': '()',
+    'UUID': '(hex=None, bytes=None, bytes_le=None, fields=None, int=None, version=None, *, is_safe=<SafeUUID.unknown: None>)',
+    'Union': '(*args, **kwds)',
+    'UnionType': '()',
+    'Unpack': '(*args, **kwds)',
+    'Unpickler': "(file, *, fix_imports=True, encoding='ASCII', errors='strict', buffers=())",
+    'UserDict': '(dict=None, /, **kwargs)',
+    'UserList': '(initlist=None)',
+    'UserString': '(seq)',
+    'ValuesView': '(*args, **kwargs)',
+    'WCOREDUMP': '(status, /)',
+    'WEXITSTATUS': '(status)',
+    'WIFCONTINUED': '(status)',
+    'WIFEXITED': '(status)',
+    'WIFSIGNALED': '(status)',
+    'WIFSTOPPED': '(status)',
+    'WSTOPSIG': '(status)',
+    'WTERMSIG': '(status)',
+    'WeakKeyDictionary': '(dict=None)',
+    'WeakMethod': '(meth, callback=None)',
+    'WeakSet': '(data=None)',
+    'WeakValueDictionary': '(other=(), /, **kw)',
+    'WindowsPath': '(*args, **kwargs)',
+    'WrapperDescriptorType': '()',
+    'WriteTransport': '(extra=None)',
+    'ZipFile': "(file, mode='r', compression=0, allowZip64=True, compresslevel=None, *, strict_timestamps=True, metadata_encoding=None)",
+    'ZipInfo': "(filename='NoName', date_time=(1980, 1, 1, 0, 0, 0))",
+    'a2b_base64': '(data, /, *, strict_mode=False)',
+    'a2b_hex': '(hexstr, /)',
+    'a2b_qp': '(data, header=False)',
+    'a2b_uu': '(data, /)',
+    'a85decode': "(b, *, foldspaces=False, adobe=False, ignorechars=b' \\t\\n\\r\\x0b')",
+    'a85encode': '(b, *, foldspaces=False, wrapcol=0, pad=False, adobe=False)',
+    'abort': '()',
+    'abs': '(x, /)',
+    'abspath': '(path)',
+    'abstractmethod': '(funcobj)',
+    'abstractproperty': '(fget=None, fset=None, fdel=None, doc=None)',
+    'access': '(path, mode, *, dir_fd=None, effective_ids=False, follow_symlinks=True)',
+    'accumulate': '(iterable, func=None, *, initial=None)',
+    'aclosing': '(thing)',
+    'acos': '(x, /)',
+    'acosh': '(x, /)',
+    'active_count': '()',
+    'add': '(a, b, /)',
+    'addLevelName': '(level, levelName)',
+    'add_type': '(type, ext, strict=True)',
+    'addaudithook': '(hook)',
+    'adler32': '(data, value=1, /)',
+    'alarm': '(seconds, /)',
+    'all_tasks': '(loop=None)',
+    'and_': '(a, b, /)',
+    'architecture': "(executable=sys.executable, bits='', linkage='')",
+    'as_completed': '(fs, *, timeout=None)',
+    'asdict': "(obj, *, dict_factory=<class 'dict'>)",
+    'asin': '(x, /)',
+    'asinh': '(x, /)',
+    'assert_never': '(arg: Never, /) -> Never',
+    'assert_type': '(val, typ, /)',
+    'astuple': "(obj, *, tuple_factory=<class 'tuple'>)",
+    'async_cached_property': '(func)',
+    'asynccontextmanager': '(func)',
+    'atan': '(x, /)',
+    'atan2': '(y, x, /)',
+    'atanh': '(x, /)',
+    'atof': "(string, func=<class 'float'>)",
+    'atoi': '(string)',
+    'auto': '(value=_auto_null)',
+    'available_timezones': '()',
+    'b16decode': '(s, casefold=False)',
+    'b16encode': '(s)',
+    'b2a_base64': '(data, /, *, newline=True)',
+    'b2a_qp': '(data, quotetabs=False, istext=True, header=False)',
+    'b2a_uu': '(data, /, *, backtick=False)',
+    'b32decode': '(s, casefold=False, map01=None)',
+    'b32encode': '(s)',
+    'b32hexdecode': '(s, casefold=False)',
+    'b32hexencode': '(s)',
+    'b64decode': '(s, altchars=None, validate=False)',
+    'b64encode': '(s, altchars=None)',
+    'b85decode': '(b)',
+    'b85encode': '(b, pad=False)',
+    'basename': '(p)',
+    'basicConfig': '(**kwargs)',
+    'betavariate': '(alpha, beta)',
+    'bidirectional': '(chr, /)',
+    'bisect': '(a, x, lo=0, hi=None, *, key=None)',
+    'bisect_left': '(a, x, lo=0, hi=None, *, key=None)',
+    'bisect_right': '(a, x, lo=0, hi=None, *, key=None)',
+    'blake2b': "(data=b'', /, *, digest_size=64, key=b'', salt=b'', person=b'', fanout=1, depth=1, leaf_size=0, node_offset=0, node_depth=0, inner_size=0, last_node=False, usedforsecurity=True)",
+    'blake2s': "(data=b'', /, *, digest_size=32, key=b'', salt=b'', person=b'', fanout=1, depth=1, leaf_size=0, node_offset=0, node_depth=0, inner_size=0, last_node=False, usedforsecurity=True)",
+    'cache': '(user_function, /)',
+    'cached_property': '(func=None, *, slot=None, reserve=False, lock=False, ttl=None, depends_on=(), table=False)',
+    'calcsize': '(format, /)',
+    'calendar': '(theyear, w=2, l=1, c=6, m=3)',
+    'call': '(*popenargs, timeout=None, **kwargs)',
+    'call_tracing': '(func, args, /)',
+    'captureWarnings': '(capture)',
+    'capwords': '(s, sep=None)',
+    'cast': '(typ, val)',
+    'catch_warnings': "(*, record=False, module=None, action=None, category=<class 'Warning'>, lineno=0, append=False)",
+    'category': '(chr, /)',
+    'cbrt': '(x, /)',
+    'ceil': '(x, /)',
+    'chdir': '(path)',
+    'check_call': '(*popenargs, **kwargs)',
+    'check_output': '(*popenargs, timeout=None, **kwargs)',
+    'chmod': '(path, mode, *, dir_fd=None, follow_symlinks=True)',
+    'choice': '(seq)',
+    'choices': '(population, weights=None, *, cum_weights=None, k=1)',
+    'chown': '(path, user=None, group=None)',
+    'chroot': '(path)',
+    'clear_frames': '(tb)',
+    'clear_overloads': '()',
+    'closerange': '(fd_low, fd_high, /)',
+    'closing': '(thing)',
+    'comb': '(n, k, /)',
+    'combinations': '(iterable, r)',
+    'combinations_with_replacement': '(iterable, r)',
+    'combining': '(chr, /)',
+    'commonpath': '(paths)',
+    'commonprefix': '(m)',
+    'compare_digest': '(a, b, /)',
+    'compile': '(source, filename, mode, flags=0, dont_inherit=False, optimize=-1, *, _feature_version=-1)',
+    'compile_command': "(source, filename='<input>', symbol='single')",
+    'complete_statement': '(statement)',
+    'compress': '(data, selectors)',
+    'compressobj': '(level=-1, method=8, wbits=15, memLevel=8, strategy=0, zdict=None)',
+    'concat': '(a, b, /)',
+    'confstr': '(name, /)',
+    'contains': '(a, b, /)',
+    'context_diff': "(a, b, fromfile='', tofile='', fromfiledate='', tofiledate='', n=3, lineterm='\\n')",
+    'contextmanager': '(func)',
+    'copy': '(src, dst, *, follow_symlinks=True)',
+    'copy2': '(src, dst, *, follow_symlinks=True)',
+    'copy_file_range': '(src, dst, count, offset_src=None, offset_dst=None)',
+    'copy_location': '(new_node, old_node)',
+    'copyfile': '(src, dst, *, follow_symlinks=True)',
+    'copyfileobj': '(fsrc, fdst, length=0)',
+    'copymode': '(src, dst, *, follow_symlinks=True)',
+    'copyright': '()',
+    'copysign': '(x, y, /)',
+    'copystat': '(src, dst, *, follow_symlinks=True)',
+    'copytree': '(src, dst, symlinks=False, ignore=None, copy_function=<function copy2>, ignore_dangling_symlinks=False, dirs_exist_ok=False)',
+    'coroutine': '(func)',
+    'correlation': '(x, y, /)',
+    'cos': '(x, /)',
+    'cosh': '(x, /)',
+    'count': '(start=0, step=1)',
+    'countOf': '(a, b, /)',
+    'covariance': '(x, y, /)',
+    'cpu_count': '()',
+    'crc32': '(data, value=0, /)',
+    'crc_hqx': '(data, crc, /)',
+    'create_connection': '(address, timeout=<object object>, source_address=None, *, all_errors=False)',
+    'create_server': '(address, *, family=<AddressFamily.AF_INET: 2>, backlog=None, reuse_port=False, dualstack_ipv6=False)',
+    'create_subprocess_exec': '(program, *args, stdin=None, stdout=None, stderr=None, limit=65536, **kwds)',
+    'create_subprocess_shell': '(cmd, stdin=None, stdout=None, stderr=None, limit=65536, **kwds)',
+    'create_task': '(coro, *, name=None, context=None)',
+    'critical': '(msg, *args, **kwargs)',
+    'ctermid': '()',
+    'currency': '(val, symbol=True, grouping=False, international=False)',
+    'current_task': '(loop=None)',
+    'current_thread': '()',
+    'cycle': '(iterable, /)',
+    'dataclass': '(cls=None, /, *, init=True, repr=True, eq=True, order=False, unsafe_hash=False, frozen=False, match_args=True, kw_only=False, slots=False, weakref_slot=False)',
+    'dataclass_transform': '(*, eq_default: bool = True, order_default: bool = False, kw_only_default: bool = False, field_specifiers: tuple[typing.Union[type[typing.Any], typing.Callable[..., typing.Any]], ...] = (), **kwargs: Any) -> Callable[[~T], ~T]',
+    'debug': '(msg, *args, **kwargs)',
+    'decode': "(obj, encoding='utf-8', errors='strict')",
+    'decodebytes': '(s)',
+    'decomposition': '(chr, /)',
+    'decompress': '(data, /, wbits=15, bufsize=16384)',
+    'decompressobj': "(wbits=15, zdict=b'')",
+    'dedent': '(text)',
+    'deepcopy': '(x, memo=None, _nil=[])',
+    'default_int_handler': '(signalnum, frame, /)',
+    'degrees': '(x, /)',
+    'delitem': '(a, b, /)',
+    'device_encoding': '(fd)',
+    'diff_bytes': "(dfunc, a, b, fromfile=b'', tofile=b'', fromfiledate=b'', tofiledate=b'', n=3, lineterm=b'\\n')",
+    'digest': '(key, msg, digest)',
+    'dirname': '(p)',
+    'disable': '(level=50)',
+    'disk_usage': '(path)',
+    'displayhook': '(object, /)',
+    'dist': '(p, q, /)',
+    'dropwhile': '(predicate, iterable, /)',
+    'dump': '(obj, file, protocol=None, *, fix_imports=True, buffer_callback=None)',
+    'dumps': '(obj, protocol=None, *, fix_imports=True, buffer_callback=None)',
+    'dup2': '(fd, fd2, inheritable=True)',
+    'east_asian_width': '(chr, /)',
+    'enable_callback_tracebacks': '(enable, /)',
+    'enable_shared_cache': '(enable)',
+    'encode': "(obj, encoding='utf-8', errors='strict')",
+    'encodebytes': '(s)',
+    'ensure_future': '(coro_or_future, *, loop=None)',
+    'enumerate': '(iterable, start=0)',
+    'eq': '(a, b, /)',
+    'erf': '(x, /)',
+    'erfc': '(x, /)',
+    'error': '(msg, pattern=None, pos=None)',
+    'escape': '(pattern)',
+    'eventfd': '(initval, flags=524288)',
+    'eventfd_read': '(fd)',
+    'eventfd_write': '(fd, value)',
+    'exc_info': '()',
+    'excel': '()',
+    'excel_tab': '()',
+    'exception': '()',
+    'execl': '(file, *args)',
+    'execle': '(file, *args)',
+    'execlp': '(file, *args)',
+    'execlpe': '(file, *args)',
+    'execv': '(path, argv, /)',
+    'execve': '(path, argv, env)',
+    'execvp': '(file, args)',
+    'execvpe': '(file, args, env)',
+    'exists': '(path)',
+    'exit': '(code=None)',
+    'exp': '(x, /)',
+    'exp2': '(x, /)',
+    'expanduser': '(path)',
+    'expandvars': '(path)',
+    'expm1': '(x, /)',
+    'expovariate': '(lambd)',
+    'extract_stack': '(f=None, limit=None)',
+    'extract_tb': '(tb, limit=None)',
+    'fabs': '(x, /)',
+    'factorial': '(n, /)',
+    'fatal': '(msg, *args, **kwargs)',
+    'fchdir': '(fd)',
+    'fchmod': '(fd, mode)',
+    'fchown': '(fd, uid, gid)',
+    'fdatasync': '(fd)',
+    'fdopen': "(fd, mode='r', buffering=-1, encoding=None, *args, **kwargs)",
+    'field': '(*, default=<dataclasses._MISSING_TYPE object>, default_factory=<dataclasses._MISSING_TYPE object>, init=True, repr=True, hash=None, compare=True, metadata=None, kw_only=<dataclasses._MISSING_TYPE object>)',
+    'fields': '(class_or_instance)',
+    'file_digest': '(fileobj, digest, /, *, _bufsize=262144)',
+    'fill': '(text, width=70, **kwargs)',
+    'filterfalse': '(function, iterable, /)',
+    'filterwarnings': "(action, message='', category=<class 'Warning'>, module='', lineno=0, append=False)",
+    'final': '(f)',
+    'finalize': '(obj, func, /, *args, **kwargs)',
+    'findall': '(pattern, string, flags=0)',
+    'finditer': '(pattern, string, flags=0)',
+    'firstweekday': '()',
+    'fix_missing_locations': '(node)',
+    'floor': '(x, /)',
+    'floordiv': '(a, b, /)',
+    'fmean': '(data, weights=None)',
+    'fmod': '(x, y, /)',
+    'fnmatch': '(name, pat)',
+    'fnmatchcase': '(name, pat)',
+    'fork': '()',
+    'forkpty': '()',
+    'format': '(percent, value, grouping=False, monetary=False, *additional)',
+    'format_exc': '(limit=None, chain=True)',
+    'format_exception': '(exc, /, value=<implicit>, tb=<implicit>, limit=None, chain=True)',
+    'format_exception_only': '(exc, /, value=<implicit>)',
+    'format_list': '(extracted_list)',
+    'format_stack': '(f=None, limit=None)',
+    'format_string': '(f, val, grouping=False, monetary=False)',
+    'format_tb': '(tb, limit=None)',
+    'formatwarning': '(message, category, filename, lineno, line=None)',
+    'fpathconf': '(fd, name, /)',
+    'freedesktop_os_release': '()',
+    'frexp': '(x, /)',
+    'fromfd': '(fd, family, type, proto=0)',
+    'fsdecode': '(filename)',
+    'fsencode': '(filename)',
+    'fspath': '(path)',
+    'fstat': '(fd)',
+    'fstatvfs': '(fd, /)',
+    'fsum': '(seq, /)',
+    'fsync': '(fd)',
+    'ftruncate': '(fd, length, /)',
+    'fullmatch': '(pattern, string, flags=0)',
+    'fwalk': "(top='.', topdown=True, onerror=None, *, follow_symlinks=False, dir_fd=None)",
+    'gamma': '(x, /)',
+    'gammavariate': '(alpha, beta)',
+    'gather': '(*coros_or_futures, return_exceptions=False)',
+    'gauss': '(mu=0.0, sigma=1.0)',
+    'gcd': '(*integers)',
+    'ge': '(a, b, /)',
+    'geometric_mean': '(data)',
+    'getLevelName': '(level)',
+    'getLevelNamesMapping': '()',
+    'getLogRecordFactory': '()',
+    'getLogger': '(name=None)',
+    'getLoggerClass': '()',
+    'get_archive_formats': '()',
+    'get_args': '(tp)',
+    'get_asyncgen_hooks': '()',
+    'get_blocking': '(fd, /)',
+    'get_cache_token': '()',
+    'get_child_watcher': '()',
+    'get_close_matches': '(word, possibilities, n=3, cutoff=0.6)',
+    'get_coroutine_origin_tracking_depth': '()',
+    'get_dialect': '(name)',
+    'get_docstring': '(node, clean=True)',
+    'get_event_loop': '()',
+    'get_event_loop_policy': '()',
+    'get_exec_path': '(env=None)',
+    'get_inheritable': '(fd, /)',
+    'get_int_max_str_digits': '()',
+    'get_origin': '(tp)',
+    'get_overloads': '(func)',
+    'get_running_loop': '()',
+    'get_source_segment': '(source, node, *, padded=False)',
+    'get_terminal_size': '(fallback=(80, 24))',
+    'get_type_hints': '(obj, globalns=None, localns=None, include_extras=False)',
+    'get_unpack_formats': '()',
+    'getaddrinfo': '(host, port, family=0, type=0, proto=0, flags=0)',
+    'getallocatedblocks': '()',
+    'getatime': '(filename)',
+    'getcontext': '()',
+    'getctime': '(filename)',
+    'getcwd': '()',
+    'getcwdb': '()',
+    'getdecoder': '(encoding)',
+    'getdefaultencoding': '()',
+    'getdefaultlocale': "(envvars=('LC_ALL', 'LC_CTYPE', 'LANG', 'LANGUAGE'))",
+    'getdlopenflags': '()',
+    'getegid': '()',
+    'getencoder': '(encoding)',
+    'getencoding': '()',
+    'getenv': '(key, default=None)',
+    'getenvb': '(key, default=None)',
+    'geteuid': '()',
+    'getfilesystemencodeerrors': '()',
+    'getfilesystemencoding': '()',
+    'getfqdn': "(name='')",
+    'getgid': '()',
+    'getgrouplist': '(user, group, /)',
+    'getgroups': '()',
+    'getincrementaldecoder': '(encoding)',
+    'getincrementalencoder': '(encoding)',
+    'getitem': '(a, b, /)',
+    'getitimer': '(which, /)',
+    'getloadavg': '()',
+    'getlocale': '(category=0)',
+    'getlogin': '()',
+    'getmtime': '(filename)',
+    'getnode': '()',
+    'getoutput': '(cmd, *, encoding=None, errors=None)',
+    'getpgid': '(pid)',
+    'getpgrp': '()',
+    'getpid': '()',
+    'getppid': '()',
+    'getpreferredencoding': '(do_setlocale=True)',
+    'getpriority': '(which, who)',
+    'getprofile': '()',
+    'getrandbits': '(k, /)',
+    'getrandom': '(size, flags=0)',
+    'getreader': '(encoding)',
+    'getrecursionlimit': '()',
+    'getrefcount': '(object, /)',
+    'getresgid': '()',
+    'getresuid': '()',
+    'getsid': '(pid, /)',
+    'getsignal': '(signalnum)',
+    'getsize': '(filename)',
+    'getstate': '()',
+    'getstatusoutput': '(cmd, *, encoding=None, errors=None)',
+    'getswitchinterval': '()',
+    'gettempdir': '()',
+    'gettempdirb': '()',
+    'gettempprefix': '()',
+    'gettempprefixb': '()',
+    'gettrace': '()',
+    'getuid': '()',
+    'getweakrefcount': '(object, /)',
+    'getweakrefs': '(object, /)',
+    'getwriter': '(encoding)',
+    'getxattr': '(path, attribute, *, follow_symlinks=True)',
+    'global_enum': '(cls, update_str=False)',
+    'global_enum_repr': '(self)',
+    'global_flag_repr': '(self)',
+    'global_str': '(self)',
+    'groupby': '(iterable, key=None)',
+    'gt': '(a, b, /)',
+    'guess_all_extensions': '(type, strict=True)',
+    'guess_extension': '(type, strict=True)',
+    'guess_type': '(url, strict=True)',
+    'harmonic_mean': '(data, weights=None)',
+    'has_dualstack_ipv6': '()',
+    'heapify': '(heap, /)',
+    'heappop': '(heap, /)',
+    'heappush': '(heap, item, /)',
+    'heappushpop': '(heap, item, /)',
+    'heapreplace': '(heap, item, /)',
+    'iadd': '(a, b, /)',
+    'iand': '(a, b, /)',
+    'iconcat': '(a, b, /)',
+    'ifloordiv': '(a, b, /)',
+    'iglob': '(pathname, *, root_dir=None, dir_fd=None, recursive=False, include_hidden=False)',
+    'ignore_patterns': '(*patterns)',
+    'ilshift': '(a, b, /)',
+    'imatmul': '(a, b, /)',
+    'imod': '(a, b, /)',
+    'imul': '(a, b, /)',
+    'increment_lineno': '(node, n=1)',
+    'indent': '(text, prefix, predicate=None)',
+    'index': '(a, /)',
+    'indexOf': '(a, b, /)',
+    'info': '(msg, *args, **kwargs)',
+    'init': '(files=None)',
+    'initgroups': '(username, gid, /)',
+    'insort': '(a, x, lo=0, hi=None, *, key=None)',
+    'insort_left': '(a, x, lo=0, hi=None, *, key=None)',
+    'insort_right': '(a, x, lo=0, hi=None, *, key=None)',
+    'interact': '(banner=None, readfunc=None, local=None, exitmsg=None)',
+    'intern': '(string, /)',
+    'inv': '(a, /)',
+    'invert': '(a, /)',
+    'ior': '(a, b, /)',
+    'ipow': '(a, b, /)',
+    'irshift': '(a, b, /)',
+    'is_': '(a, b, /)',
+    'is_dataclass': '(obj)',
+    'is_finalizing': '()',
+    'is_normalized': '(form, unistr, /)',
+    'is_not': '(a, b, /)',
+    'is_typeddict': '(tp)',
+    'is_zipfile': '(filename)',
+    'isabs': '(s)',
+    'isatty': '(fd, /)',
+    'isclose': '(a, b, *, rel_tol=1e-09, abs_tol=0.0)',
+    'iscoroutine': '(obj)',
+    'iscoroutinefunction': '(func)',
+    'isdir': '(s)',
+    'isfile': '(path)',
+    'isfinite': '(x, /)',
+    'isfuture': '(obj)',
+    'isinf': '(x, /)',
+    'isleap': '(year)',
+    'islink': '(path)',
+    'ismount': '(path)',
+    'isnan': '(x, /)',
+    'isqrt': '(n, /)',
+    'isreadable': '(object)',
+    'isrecursive': '(object)',
+    'isub': '(a, b, /)',
+    'iter_child_nodes': '(node)',
+    'iter_fields': '(node)',
+    'iter_unpack': '(format, buffer, /)',
+    'iterdecode': "(iterator, encoding, errors='strict', **kwargs)",
+    'iterencode': "(iterator, encoding, errors='strict', **kwargs)",
+    'itruediv': '(a, b, /)',
+    'ixor': '(a, b, /)',
+    'java_ver': "(release='', vendor='', vminfo=('', '', ''), osinfo=('', '', ''))",
+    'join': '(a, *p)',
+    'kill': '(pid, signal, /)',
+    'killpg': '(pgid, signal, /)',
+    'lchown': '(path, uid, gid)',
+    'lcm': '(*integers)',
+    'ldexp': '(x, i, /)',
+    'le': '(a, b, /)',
+    'leapdays': '(y1, y2)',
+    'length_hint': '(obj, default=0, /)',
+    'lexists': '(path)',
+    'lgamma': '(x, /)',
+    'libc_ver': "(executable=None, lib='', version='', chunksize=16384)",
+    'linear_regression': '(x, y, /, *, proportional=False)',
+    'link': '(src, dst, *, src_dir_fd=None, dst_dir_fd=None, follow_symlinks=True)',
+    'list_dialects': '()',
+    'listdir': '(path=None)',
+    'listxattr': '(path=None, *, follow_symlinks=True)',
+    'literal_eval': '(node_or_string)',
+    'load': "(fp: 'BinaryIO', /, *, parse_float: 'ParseFloat' = <class 'float'>) -> 'dict[str, Any]'",
+    'loads': "(s: 'str', /, *, parse_float: 'ParseFloat' = <class 'float'>) -> 'dict[str, Any]'",
+    'localcontext': '(ctx=None, **kwargs)',
+    'localeconv': '()',
+    'lockf': '(fd, command, length, /)',
+    'log10': '(x, /)',
+    'log1p': '(x, /)',
+    'log2': '(x, /)',
+    'login_tty': '(fd, /)',
+    'lognormvariate': '(mu, sigma)',
+    'lookup': '(name, /)',
+    'lookup_error': '(name, /)',
+    'lru_cache': '(maxsize=128, typed=False)',
+    'lseek': '(fd, position, whence, /)',
+    'lshift': '(a, b, /)',
+    'lstat': '(path, *, dir_fd=None)',
+    'lt': '(a, b, /)',
+    'mac_ver': "(release='', versioninfo=('', '', ''), machine='')",
+    'machine': '()',
+    'main': '()',
+    'main_thread': '()',
+    'major': '(device, /)',
+    'makeLogRecord': '(dict)',
+    'make_archive': '(base_name, format, root_dir=None, base_dir=None, verbose=0, dry_run=0, owner=None, group=None, logger=None)',
+    'make_dataclass': '(cls_name, fields, *, bases=(), namespace=None, init=True, repr=True, eq=True, order=False, unsafe_hash=False, frozen=False, match_args=True, kw_only=False, slots=False, weakref_slot=False)',
+    'makedev': '(major, minor, /)',
+    'makedirs': '(name, mode=511, exist_ok=False)',
+    'match': '(pattern, string, flags=0)',
+    'matmul': '(a, b, /)',
+    'md5': "(string=b'', *, usedforsecurity=True)",
+    'mean': '(data)',
+    'median': '(data)',
+    'median_grouped': '(data, interval=1.0)',
+    'median_high': '(data)',
+    'median_low': '(data)',
+    'member': '(value)',
+    'memfd_create': '(name, flags=1)',
+    'merge': '(*iterables, key=None, reverse=False)',
+    'minor': '(device, /)',
+    'mirrored': '(chr, /)',
+    'mkdir': '(path, mode=511, *, dir_fd=None)',
+    'mkdtemp': '(suffix=None, prefix=None, dir=None)',
+    'mkfifo': '(path, mode=438, *, dir_fd=None)',
+    'mknod': '(path, mode=384, device=0, *, dir_fd=None)',
+    'mkstemp': '(suffix=None, prefix=None, dir=None, text=False)',
+    'mktemp': "(suffix='', prefix='tmp', dir=None)",
+    'mod': '(a, b, /)',
+    'mode': '(data)',
+    'modf': '(x, /)',
+    'month': '(theyear, themonth, w=0, l=0)',
+    'monthcalendar': '(year, month)',
+    'monthrange': '(year, month)',
+    'move': '(src, dst, copy_function=<function copy2>)',
+    'mul': '(a, b, /)',
+    'multimode': '(data)',
+    'namedtuple': '(typename, field_names, *, rename=False, defaults=None, module=None)',
+    'ndiff': '(a, b, linejunk=None, charjunk=<function IS_CHARACTER_JUNK>)',
+    'ne': '(a, b, /)',
+    'neg': '(a, /)',
+    'new': "(key, msg=None, digestmod='')",
+    'new_class': '(name, bases=(), kwds=None, exec_body=None)',
+    'new_event_loop': '()',
+    'nextafter': '(x, y, /)',
+    'nice': '(increment, /)',
+    'nlargest': '(n, iterable, key=None)',
+    'no_type_check': '(arg)',
+    'no_type_check_decorator': '(decorator)',
+    'node': '()',
+    'nonmember': '(value)',
+    'normalize': '(form, unistr, /)',
+    'normalvariate': '(mu=0.0, sigma=1.0)',
+    'normcase': '(s)',
+    'normpath': '(path)',
+    'not_': '(a, /)',
+    'nsmallest': '(n, iterable, key=None)',
+    'nullcontext': '(enter_result=None)',
+    'open': "(file, mode='r', buffering=-1, encoding=None, errors=None, newline=None, closefd=True, opener=None)",
+    'open_code': '(path)',
+    'open_connection': '(host=None, port=None, *, limit=65536, **kwds)',
+    'open_unix_connection': '(path=None, *, limit=65536, **kwds)',
+    'openpty': '()',
+    'or_': '(a, b, /)',
+    'overload': '(func)',
+    'pairwise': '(iterable, /)',
+    'paretovariate': '(alpha)',
+    'parse_qs': "(qs, keep_blank_values=False, strict_parsing=False, encoding='utf-8', errors='replace', max_num_fields=None, separator='&')",
+    'parse_qsl': "(qs, keep_blank_values=False, strict_parsing=False, encoding='utf-8', errors='replace', max_num_fields=None, separator='&')",
+    'partialmethod': '(func, /, *args, **keywords)',
+    'pathconf': '(path, name)',
+    'pause': '()',
+    'pbkdf2_hmac': '(hash_name, password, salt, iterations, dklen=None)',
+    'perm': '(n, k=None, /)',
+    'permutations': '(iterable, r=None)',
+    'pformat': '(object, indent=1, width=80, depth=None, *, compact=False, sort_dicts=True, underscore_numbers=False)',
+    'phase': '(z, /)',
+    'pickle_by_enum_name': '(self, proto)',
+    'pickle_by_global_name': '(self, proto)',
+    'pidfd_open': '(pid, flags=0)',
+    'pidfd_send_signal': '(pidfd, signalnum, siginfo=None, flags=0, /)',
+    'pipe': '()',
+    'pipe2': '(flags, /)',
+    'polar': '(z, /)',
+    'popen': "(cmd, mode='r', buffering=-1)",
+    'pos': '(a, /)',
+    'posix_fadvise': '(fd, offset, length, advice, /)',
+    'posix_fallocate': '(fd, offset, length, /)',
+    'pow': '(base, exp, mod=None)',
+    'pp': '(object, *args, sort_dicts=False, **kwargs)',
+    'pprint': '(object, stream=None, indent=1, width=80, depth=None, *, compact=False, sort_dicts=True, underscore_numbers=False)',
+    'prcal': '(theyear, w=0, l=0, c=6, m=3)',
+    'pread': '(fd, length, offset, /)',
+    'preadv': '(fd, buffers, offset, flags=0, /)',
+    'prepare_class': '(name, bases=(), kwds=None)',
+    'print_exc': '(limit=None, file=None, chain=True)',
+    'print_exception': '(exc, /, value=<implicit>, tb=<implicit>, limit=None, file=None, chain=True)',
+    'print_last': '(limit=None, file=None, chain=True)',
+    'print_stack': '(f=None, limit=None, file=None)',
+    'print_tb': '(tb, limit=None, file=None)',
+    'prmonth': '(theyear, themonth, w=0, l=0)',
+    'processor': '()',
+    'prod': '(iterable, /, *, start=1)',
+    'property': '(fget=None, fset=None, fdel=None, doc=None)',
+    'proxy': '(object, callback=None, /)',
+    'pstdev': '(data, mu=None)',
+    'pthread_kill': '(thread_id, signalnum, /)',
+    'pthread_sigmask': '(how, mask)',
+    'purge': '()',
+    'putenv': '(name, value, /)',
+    'pvariance': '(data, mu=None)',
+    'pwrite': '(fd, buffer, offset, /)',
+    'pwritev': '(fd, buffers, offset, flags=0, /)',
+    'python_branch': '()',
+    'python_build': '()',
+    'python_compiler': '()',
+    'python_implementation': '()',
+    'python_revision': '()',
+    'python_version': '()',
+    'python_version_tuple': '()',
+    'quantiles': "(data, *, n=4, method='exclusive')",
+    'quote': "(string, safe='/', encoding=None, errors=None)",
+    'quote_from_bytes': "(bs, safe='/')",
+    'quote_plus': "(string, safe='', encoding=None, errors=None)",
+    'radians': '(x, /)',
+    'raise_signal': '(signalnum, /)',
+    'randbelow': '(exclusive_upper_bound)',
+    'randbits': '(k)',
+    'randbytes': '(n)',
+    'randint': '(a, b)',
+    'random': '()',
+    'randrange': '(start, stop=None, step=1)',
+    'read': '(fd, length, /)',
+    'read_mime_types': '(file)',
+    'readlink': '(path, *, dir_fd=None)',
+    'readv': '(fd, buffers, /)',
+    'realpath': '(filename, *, strict=False)',
+    'rect': '(r, phi, /)',
+    'recursive_repr': "(fillvalue='...')",
+    'recv_fds': '(sock, bufsize, maxfds, flags=0)',
+    'redirect_stderr': '(new_target)',
+    'redirect_stdout': '(new_target)',
+    'register': '(search_function, /)',
+    'register_adapter': '(type, adapter, /)',
+    'register_archive_format': "(name, function, extra_args=None, description='')",
+    'register_converter': '(typename, converter, /)',
+    'register_error': '(errors, handler, /)',
+    'register_unpack_format': "(name, extensions, function, extra_args=None, description='')",
+    'release': '()',
+    'relpath': '(path, start=None)',
+    'remainder': '(x, y, /)',
+    'remove': '(path, *, dir_fd=None)',
+    'removedirs': '(name)',
+    'removexattr': '(path, attribute, *, follow_symlinks=True)',
+    'rename': '(src, dst, *, src_dir_fd=None, dst_dir_fd=None)',
+    'renames': '(old, new)',
+    'replace': '(src, dst, *, src_dir_fd=None, dst_dir_fd=None)',
+    'repr': '(obj, /)',
+    'reset_tzpath': '(to=None)',
+    'resetlocale': '(category=6)',
+    'resetwarnings': '()',
+    'resolve_bases': '(bases)',
+    'restore': '(delta, which)',
+    'reveal_type': '(obj: ~T, /) -> ~T',
+    'rmdir': '(path, *, dir_fd=None)',
+    'rmtree': '(path, ignore_errors=False, onerror=None, *, dir_fd=None)',
+    'rshift': '(a, b, /)',
+    'run': '(*popenargs, input=None, capture_output=False, timeout=None, check=False, **kwargs)',
+    'run_coroutine_threadsafe': '(coro, loop)',
+    'runtime_checkable': '(cls)',
+    'saferepr': '(object)',
+    'samefile': '(f1, f2)',
+    'sameopenfile': '(fp1, fp2)',
+    'samestat': '(s1, s2)',
+    'sample': '(population, k, *, counts=None)',
+    'scandir': '(path=None)',
+    'sched_get_priority_max': '(policy)',
+    'sched_get_priority_min': '(policy)',
+    'sched_getaffinity': '(pid, /)',
+    'sched_getparam': '(pid, /)',
+    'sched_getscheduler': '(pid, /)',
+    'sched_param': '(sched_priority)',
+    'sched_rr_get_interval': '(pid, /)',
+    'sched_setaffinity': '(pid, mask, /)',
+    'sched_setparam': '(pid, param, /)',
+    'sched_setscheduler': '(pid, policy, param, /)',
+    'sched_yield': '()',
+    'search': '(pattern, string, flags=0)',
+    'seed': '(a=None, version=2)',
+    'send_fds': '(sock, buffers, fds, flags=0, address=None)',
+    'sendfile': '(out_fd, in_fd, offset, count)',
+    'setLogRecordFactory': '(factory)',
+    'setLoggerClass': '(klass)',
+    'set_blocking': '(fd, blocking, /)',
+    'set_child_watcher': '(watcher)',
+    'set_coroutine_origin_tracking_depth': '(depth)',
+    'set_event_loop': '(loop)',
+    'set_event_loop_policy': '(policy)',
+    'set_inheritable': '(fd, inheritable, /)',
+    'set_int_max_str_digits': '(maxdigits)',
+    'setcontext': '(context, /)',
+    'setdlopenflags': '(flags, /)',
+    'setegid': '(egid, /)',
+    'seteuid': '(euid, /)',
+    'setfirstweekday': '(firstweekday)',
+    'setgid': '(gid, /)',
+    'setgroups': '(groups, /)',
+    'setitem': '(a, b, c, /)',
+    'setitimer': '(which, seconds, interval=0.0, /)',
+    'setlocale': '(category, locale=None)',
+    'setpgid': '(pid, pgrp, /)',
+    'setpgrp': '()',
+    'setpriority': '(which, who, priority)',
+    'setprofile': '(func)',
+    'setrecursionlimit': '(limit, /)',
+    'setregid': '(rgid, egid, /)',
+    'setresgid': '(rgid, egid, sgid, /)',
+    'setresuid': '(ruid, euid, suid, /)',
+    'setreuid': '(ruid, euid, /)',
+    'setsid': '()',
+    'setstate': '(state)',
+    'setswitchinterval': '(interval, /)',
+    'settrace': '(func)',
+    'setuid': '(uid, /)',
+    'setxattr': '(path, attribute, value, flags=0, *, follow_symlinks=True)',
+    'sha1': "(string=b'', *, usedforsecurity=True)",
+    'sha224': "(string=b'', *, usedforsecurity=True)",
+    'sha256': "(string=b'', *, usedforsecurity=True)",
+    'sha384': "(string=b'', *, usedforsecurity=True)",
+    'sha3_224': "(string=b'', *, usedforsecurity=True)",
+    'sha3_256': "(string=b'', *, usedforsecurity=True)",
+    'sha3_384': "(string=b'', *, usedforsecurity=True)",
+    'sha3_512': "(string=b'', *, usedforsecurity=True)",
+    'sha512': "(string=b'', *, usedforsecurity=True)",
+    'shake_128': "(string=b'', *, usedforsecurity=True)",
+    'shake_256': "(string=b'', *, usedforsecurity=True)",
+    'shield': '(arg)',
+    'shorten': '(text, width, **kwargs)',
+    'showwarning': '(message, category, filename, lineno, file=None, line=None)',
+    'shuffle': '(x)',
+    'shutdown': "(handlerList=[<weakref; to '_StderrHandler'>])",
+    'siginterrupt': '(signalnum, flag, /)',
+    'signal': '(signalnum, handler)',
+    'sigpending': '()',
+    'sigtimedwait': '(sigset, timeout, /)',
+    'sigwait': '(sigset)',
+    'sigwaitinfo': '(sigset, /)',
+    'simplefilter': "(action, category=<class 'Warning'>, lineno=0, append=False)",
+    'sin': '(x, /)',
+    'singledispatch': '(func)',
+    'singledispatchmethod': '(func)',
+    'sinh': '(x, /)',
+    'socket': '(family=-1, type=-1, proto=-1, fileno=None)',
+    'socketpair': '(family=None, type=<SocketKind.SOCK_STREAM: 1>, proto=0)',
+    'spawnl': '(mode, file, *args)',
+    'spawnle': '(mode, file, *args)',
+    'spawnlp': '(mode, file, *args)',
+    'spawnlpe': '(mode, file, *args)',
+    'spawnv': '(mode, file, args)',
+    'spawnve': '(mode, file, args, env)',
+    'spawnvp': '(mode, file, args)',
+    'spawnvpe': '(mode, file, args, env)',
+    'splice': '(src, dst, count, offset_src=None, offset_dst=None, flags=0)',
+    'split': '(s, comments=False, posix=True)',
+    'splitdrive': '(p)',
+    'splitext': '(p)',
+    'sqrt': '(x, /)',
+    'standard_b64decode': '(s)',
+    'standard_b64encode': '(s)',
+    'starmap': '(function, iterable, /)',
+    'start_server': '(client_connected_cb, host=None, port=None, *, limit=65536, **kwds)',
+    'start_unix_server': '(client_connected_cb, path=None, *, limit=65536, **kwds)',
+    'stat': '(path, *, dir_fd=None, follow_symlinks=True)',
+    'stat_result': '(iterable=(), /)',
+    'statvfs': '(path)',
+    'statvfs_result': '(iterable=(), /)',
+    'stdev': '(data, xbar=None)',
+    'strcoll': '(os1, os2, /)',
+    'strerror': '(code, /)',
+    'strsignal': '(signalnum, /)',
+    'struct_siginfo': '(iterable=(), /)',
+    'struct_time': '(iterable=(), /)',
+    'strxfrm': '(string, /)',
+    'sub': '(pattern, repl, string, count=0, flags=0)',
+    'subn': '(pattern, repl, string, count=0, flags=0)',
+    'suppress': '(*exceptions)',
+    'symlink': '(src, dst, target_is_directory=False, *, dir_fd=None)',
+    'sync': '()',
+    'sysconf': '(name, /)',
+    'system': '()',
+    'system_alias': '(system, release, version)',
+    'takewhile': '(predicate, iterable, /)',
+    'tan': '(x, /)',
+    'tanh': '(x, /)',
+    'tcgetpgrp': '(fd, /)',
+    'tcsetpgrp': '(fd, pgid, /)',
+    'tee': '(iterable, n=2, /)',
+    'template': '(pattern, flags=0)',
+    'terminal_size': '(iterable=(), /)',
+    'text_encoding': '(encoding, stacklevel=2, /)',
+    'timegm': '(tuple)',
+    'timeit': "(stmt='pass', setup='pass', timer=<built-in function perf_counter>, number=1000000, globals=None)",
+    'timeout_at': '(when: Optional[float]) -> asyncio.timeouts.Timeout',
+    'times': '()',
+    'times_result': '(iterable=(), /)',
+    'to_thread': '(func, /, *args, **kwargs)',
+    'token_bytes': '(nbytes=None)',
+    'token_hex': '(nbytes=None)',
+    'token_urlsafe': '(nbytes=None)',
+    'total_ordering': '(cls)',
+    'translate': '(pat)',
+    'triangular': '(low=0.0, high=1.0, mode=None)',
+    'truediv': '(a, b, /)',
+    'trunc': '(x, /)',
+    'truncate': '(path, length)',
+    'truth': '(a, /)',
+    'ttyname': '(fd, /)',
+    'ulp': '(x, /)',
+    'umask': '(mask, /)',
+    'uname': '()',
+    'uname_result': '(system, node, release, version, machine)',
+    'unescape': '(s)',
+    'unhexlify': '(hexstr, /)',
+    'unified_diff': "(a, b, fromfile='', tofile='', fromfiledate='', tofiledate='', n=3, lineterm='\\n')",
+    'uniform': '(a, b)',
+    'unique': '(enumeration)',
+    'unix_dialect': '()',
+    'unlink': '(path, *, dir_fd=None)',
+    'unpack': '(format, buffer, /)',
+    'unpack_archive': '(filename, extract_dir=None, format=None, *, filter=None)',
+    'unpack_from': '(format, /, buffer, offset=0)',
+    'unparse': '(ast_obj)',
+    'unquote': "(string, encoding='utf-8', errors='replace')",
+    'unquote_plus': "(string, encoding='utf-8', errors='replace')",
+    'unquote_to_bytes': '(string)',
+    'unraisablehook': '(unraisable, /)',
+    'unregister_archive_format': '(name)',
+    'unregister_dialect': '(name)',
+    'unregister_unpack_format': '(name)',
+    'unsetenv': '(name, /)',
+    'update_abstractmethods': '(cls)',
+    'update_wrapper': "(wrapper, wrapped, assigned=('__module__', '__name__', '__qualname__', '__doc__', '__annotations__'), updated=('__dict__',))",
+    'urandom': '(size, /)',
+    'urldefrag': '(url)',
+    'urlencode': "(query, doseq=False, safe='', encoding=None, errors=None, quote_via=<function quote_plus>)",
+    'urljoin': '(base, url, allow_fragments=True)',
+    'urlparse': "(url, scheme='', allow_fragments=True)",
+    'urlsafe_b64decode': '(s)',
+    'urlsafe_b64encode': '(s)',
+    'urlsplit': "(url, scheme='', allow_fragments=True)",
+    'urlunparse': '(components)',
+    'urlunsplit': '(components)',
+    'uuid1': '(node=None, clock_seq=None)',
+    'uuid3': '(namespace, name)',
+    'uuid4': '()',
+    'uuid5': '(namespace, name)',
+    'valid_signals': '()',
+    'variance': '(data, xbar=None)',
+    'verify': '(*checks)',
+    'vonmisesvariate': '(mu, kappa)',
+    'wait': '()',
+    'wait3': '(options)',
+    'wait4': '(pid, options)',
+    'wait_for': '(fut, timeout)',
+    'waitid': '(idtype, id, options, /)',
+    'waitid_result': '(iterable=(), /)',
+    'waitpid': '(pid, options, /)',
+    'waitstatus_to_exitcode': '(status)',
+    'walk': '(top, topdown=True, onerror=None, followlinks=False)',
+    'walk_stack': '(f)',
+    'walk_tb': '(tb)',
+    'warn': '(message, category=None, stacklevel=1, source=None)',
+    'warning': '(msg, *args, **kwargs)',
+    'weekday': '(year, month, day)',
+    'weekheader': '(width)',
+    'weibullvariate': '(alpha, beta)',
+    'which': '(cmd, mode=1, path=None)',
+    'win32_edition': '()',
+    'win32_is_iot': '()',
+    'win32_ver': "(release='', version='', csd='', ptype='')",
+    'wrap': '(text, width=70, **kwargs)',
+    'wrap_future': '(future, *, loop=None)',
+    'wraps': "(wrapped, assigned=('__module__', '__name__', '__qualname__', '__doc__', '__annotations__'), updated=('__dict__',))",
+    'write': '(fd, data, /)',
+    'writev': '(fd, buffers, /)',
+    'xor': '(a, b, /)',
+}
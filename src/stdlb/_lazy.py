@@ -0,0 +1,203 @@
+"""Lazy (PEP 562) resolution of stdlb exports.
+
+Instead of star-importing every module up front, `install` gives a namespace a
+module-level `__getattr__` that imports only the module owning the requested
+name, using the per-interpreter export index (see `_index.py`). `preload` imports
+the remaining modules on a background thread.
+"""
+import sys
+from _thread import RLock
+
+from . import _trace
+
+# Held while stdlb imports a module (on any thread), so that a lookup on one thread
+# never races `preload`'s thread into a cross-thread circular import, which importlib
+# would resolve by handing one of them a partially initialized module
+_import_lock = RLock()
+
+
+def resolve(spec, name=None):
+    """Resolve a `module[:attr.path]` export spec to the object it names.
+
+    `name` is the stdlb name being resolved, recorded when tracing (see `_trace.py`).
+    """
+    if name is not None and _trace.names is not None:
+        _trace.record(name, spec)
+    module_name, _, attrs = spec.partition(':')
+    value = sys.modules.get(module_name)
+    # A module still initializing (on `preload`'s thread) is in `sys.modules`, too
+    if value is None or getattr(getattr(value, '__spec__', None), '_initializing', False):
+        with _import_lock:
+            __import__(module_name)
+        value = sys.modules[module_name]
+    if attrs:
+        for attr in attrs.split('.'):
+            value = getattr(value, attr)
+    return value
+
+
+def import_eager():
+    """Import and return the module binding the full eager namespace.
+
+    That's this interpreter's generated variant (see `_index.variant_module`), unless
+    there's none, or this build lacks a name it imports (e.g. `os.memfd_create`, which
+    depends on the platform's headers); then `_eager.py`, whose star-imports bind
+    whatever the build has.
+    """
+    from importlib import import_module
+
+    from ._index import index_key
+
+    with _import_lock:
+        try:
+            return import_module(f"{__package__}._variants.{index_key()}")
+        except ImportError:
+            return import_module(f"{__package__}._eager")
+
+
+def importing_submodule(package):
+    """Whether `package` is being imported only on the way to one of its submodules.
+
+    That's `import package.sub` (importlib holds the submodule's import lock while it
+    imports the package), or `python -m package[.sub]` (`sys.argv[0]` is `'-m'` while
+    the module is located). `import package` and `from package import name` aren't.
+    """
+    locks = getattr(sys.modules.get('_frozen_importlib'), '_module_locks', {})
+    if any(name.startswith(f"{package}.") for name in list(locks)):
+        return True
+    argv = getattr(sys, 'orig_argv', [])
+    if getattr(sys, 'argv', [None])[:1] == ['-m'] and '-m' in argv[:-1]:
+        target = argv[argv.index('-m') + 1]
+        return target == package or target.startswith(f"{package}.")
+    return False
+
+
+def install(namespace, eager=False, trace=None):
+    """Give a module namespace PEP 562 `__getattr__`/`__dir__` hooks over the stdlb exports.
+
+    Lazy (default): each name is resolved on first lookup, importing only its module,
+    and cached in `namespace`; the index itself is only loaded on first lookup
+    (including `__all__`/`dir()`).
+
+    Tracing (`trace` is a ``STDLB_TRACE`` value that enables it): lazy, but lookups
+    return `stdlb.lazy.LazyProxy`s, so that `from stdlb import *` only resolves (and
+    records) the names that are then used. Exception classes, which `except` clauses
+    need as themselves, are resolved (and recorded) right away.
+
+    Eager: runs the full eager import into `namespace` right away, from this
+    interpreter's generated variant module if there is one (see `_index.variant_module`),
+    else from `_eager.py` (see `import_eager`). When the package is only being imported on the way to one of
+    its submodules (see `importing_submodule`), that's deferred to the first lookup of a
+    public name (including `__all__`, i.e. `from stdlb import *`, or `dir()`), so that
+    e.g. `stdlb.lazy` and `python -m stdlb` stay cheap.
+    """
+    from ._index import is_exception, load_exports
+
+    module_name = namespace['__name__']
+    trace_path = _trace.trace_path(trace)
+    if trace_path:
+        _trace.start(trace_path)
+        eager = False
+        # Route every export (including `sys`, `cached_property`) through __getattr__
+        for name in namespace.keys() & load_exports().keys():
+            del namespace[name]
+
+    if eager:
+        def load():
+            module = import_eager()
+            exports = [k for k in vars(module) if not k.startswith('_')]
+            namespace.update((k, getattr(module, k)) for k in exports)
+            namespace['__all__'] = exports
+            namespace.pop('__getattr__', None)
+            namespace.pop('__dir__', None)
+
+        def __getattr__(name):
+            if name.startswith('_') and name != '__all__':
+                raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+            load()
+            try:
+                return namespace[name]
+            except KeyError:
+                raise AttributeError(f"module {module_name!r} has no attribute {name!r}") from None
+
+        def __dir__():
+            load()
+            return sorted(namespace)
+
+        namespace['__getattr__'] = __getattr__
+        namespace['__dir__'] = __dir__
+        if not importing_submodule(module_name):
+            load()
+        return
+
+    def __getattr__(name):
+        if name == '__all__':
+            value = namespace['__all__'] = list(load_exports())
+            return value
+        try:
+            spec = load_exports()[name]
+        except KeyError:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}") from None
+        if trace_path and not is_exception(name):
+            from .lazy import LazyProxy
+            # Bound in the caller's namespace by `from stdlb import *`
+            return LazyProxy(name, spec, sys._getframe(1).f_globals)
+        value = namespace[name] = resolve(spec, name)
+        return value
+
+    def __dir__():
+        return sorted(namespace.keys() | load_exports().keys())
+
+    namespace['__getattr__'] = __getattr__
+    namespace['__dir__'] = __dir__
+
+
+def preload_order(modules=None, priority=None):
+    """Modules `preload` would import, in order: `priority` first, then the rest by name.
+
+    `modules` defaults to every module providing a stdlb export (per the export index),
+    `priority` to `PRELOAD_PRIORITY` (roughly most-used first); a submodule is ordered
+    with its top-level package. Modules already imported are omitted.
+    """
+    from ._config import PRELOAD_PRIORITY
+    from ._index import load_exports
+
+    if modules is None:
+        modules = {
+            spec.partition(':')[0] for spec in load_exports().values()
+        } - {'builtins'}
+        modules = {m for m in modules if not m.startswith(f"{__package__}.")}
+    ranks = {name: i for i, name in enumerate(PRELOAD_PRIORITY if priority is None else priority)}
+
+    def rank(module):
+        top = module.split('.')[0]
+        return ranks.get(module, ranks.get(top, len(ranks))), module
+
+    return [m for m in sorted(set(modules), key=rank) if m not in sys.modules]
+
+
+def preload(modules=None, priority=None):
+    """Import stdlb's modules on a daemon thread, so later lookups find them loaded.
+
+    Returns the (started) thread. Modules are imported one at a time, in
+    `preload_order(modules, priority)`, each under the lock `resolve` and the eager
+    import take, so a main-thread lookup waits for at most the module in flight (and
+    never sees it half-initialized). Modules that fail to import are skipped.
+    """
+    import threading
+
+    order = preload_order(modules, priority)
+
+    def run():
+        for module in order:
+            if module in sys.modules:
+                continue
+            with _import_lock:
+                try:
+                    __import__(module)
+                except Exception:
+                    pass
+
+    thread = threading.Thread(target=run, name='stdlb-preload', daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,100 @@
+"""Interactive namespaces that bind stdlb names on first use (`python -m stdlb`, `stdlb.startup`).
+
+`install` gives a namespace a `__builtins__` mapping holding the builtins, which
+falls back to stdlb's exports: code run in the namespace finds a stdlb name the
+first time it looks it up without a global of that name, importing only its
+module. The namespace stays a plain dict (e.g. a real `__main__` module's, so
+pickling classes defined at the prompt works), holding only what the user binds,
+and nothing is imported up front: only the export index is read, to find the
+builtins stdlb rebinds.
+"""
+import builtins
+import sys
+
+from ._index import load_exports
+from ._lazy import resolve
+
+
+class StdlbBuiltins(dict):
+    """`__builtins__` mapping: the builtins stdlb keeps, then stdlb's exports, then the live builtins."""
+    __slots__ = ()
+
+    def __missing__(self, name):
+        spec = load_exports().get(name)
+        if spec is None:
+            # Builtins set later, e.g. `_` (by `sys.displayhook`)
+            return vars(builtins)[name]
+        value = self[name] = resolve(spec, name)
+        return value
+
+
+def stdlb_builtins():
+    """A new `StdlbBuiltins`: the current builtins, minus `_` and those stdlb binds to another object."""
+    exports = load_exports()
+    return StdlbBuiltins(
+        (name, value) for name, value in vars(builtins).items()
+        if name != '_' and exports.get(name, f"builtins:{name}") == f"builtins:{name}"
+    )
+
+
+class PreloadingPrompt:
+    """`sys.ps1` stand-in that starts `stdlb.preload()` as the first prompt is shown, then restores `prompt`."""
+    def __init__(self, prompt):
+        self.prompt = prompt
+
+    def __str__(self):
+        from ._lazy import preload
+
+        sys.ps1 = self.prompt
+        preload()
+        return str(self.prompt)
+
+
+def completer(namespace):
+    """`rlcompleter.Completer` for `namespace` that also completes (not yet bound) stdlb names."""
+    import rlcompleter
+
+    from .ipython import prefixed
+
+    names = sorted(load_exports())
+
+    class Completer(rlcompleter.Completer):
+        def global_matches(self, text):
+            matches = super().global_matches(text)
+            seen = {match.rstrip('(') for match in matches}
+            return matches + [name for name in prefixed(names, text) if name not in seen]
+
+    return Completer(namespace)
+
+
+def install_completer(namespace):
+    """Complete stdlb names at the prompt, once the interpreter sets up readline.
+
+    Wraps `sys.__interactivehook__` (which `site` sets to enable readline, history
+    and `rlcompleter`), so it works from `PYTHONSTARTUP`, which runs before the hook.
+    """
+    hook = getattr(sys, '__interactivehook__', None)
+
+    def __interactivehook__():
+        if hook is not None:
+            hook()
+        try:
+            import readline
+        except ImportError:
+            return
+        readline.set_completer(completer(namespace).complete)
+        readline.parse_and_bind('tab: complete')
+
+    sys.__interactivehook__ = __interactivehook__
+
+
+def install(namespace, preload=True):
+    """Make stdlb's names available to code run in `namespace` (see module docstring).
+
+    With `preload`, `stdlb.preload()` starts as the first interactive prompt is shown.
+    """
+    namespace['__builtins__'] = stdlb_builtins()
+    install_completer(namespace)
+    if preload:
+        sys.ps1 = PreloadingPrompt(getattr(sys, 'ps1', '>>> '))
+    return namespace
@@ -0,0 +1,96 @@
+"""Usage tracing (``STDLB_TRACE``): record which stdlb names a session actually resolves.
+
+With ``STDLB_TRACE=1`` (or ``STDLB_TRACE=<path>``), `import stdlb` runs in lazy mode,
+and `from stdlb import *` binds proxies (see `stdlb.lazy`), so only names that are
+used get resolved. Each resolved name, and the `module[:attr]` spec it resolved to,
+is recorded, and at exit merged into a JSON trace file (default
+`~/.cache/stdlb/trace.json`), which accumulates across runs:
+
+```json
+{"runs": 12, "names": {"Path": {"spec": "pathlib:Path", "sessions": 9}, ...}}
+```
+
+`scripts/generate_init.py --from-trace <path>` turns a trace into a profile module
+that imports only the modules those names come from.
+"""
+import os
+
+# {name: spec} resolved this session, or None when not tracing
+names = None
+
+
+def default_path():
+    cache = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache, 'stdlb', 'trace.json')
+
+
+def trace_path(value):
+    """Trace file for a ``STDLB_TRACE`` value, or None if tracing is off."""
+    if value in (None, '', '0'):
+        return None
+    if value.lower() in ('1', 'true', 'yes'):
+        return default_path()
+    return value
+
+
+def start(path):
+    """Start recording resolved names, and merge them into `path` at exit."""
+    import atexit
+
+    global names
+    if names is None:
+        names = {}
+        atexit.register(save, path)
+
+
+def record(name, spec):
+    if names is not None:
+        names[name] = spec
+
+
+def load(path):
+    """Read a trace file (an empty trace if it doesn't exist)."""
+    import json
+
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {'runs': 0, 'names': {}}
+
+
+def merge(trace, session):
+    """Add one session's `{name: spec}` to `trace` (in place), and return it."""
+    trace['runs'] += 1
+    for name, spec in session.items():
+        entry = trace['names'].setdefault(name, {'spec': spec, 'sessions': 0})
+        entry['spec'] = spec
+        entry['sessions'] += 1
+    trace['names'] = dict(sorted(trace['names'].items()))
+    return trace
+
+
+def save(path, session=None):
+    """Merge `session` (default: this session's names) into the trace file at `path`.
+
+    Concurrent runs are serialized with an exclusive lock (where `fcntl` is available),
+    and the file is replaced atomically.
+    """
+    import json
+
+    session = names if session is None else session
+    if not session:
+        return
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(f"{path}.lock", 'w') as lock:
+        try:
+            import fcntl
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        except ImportError:
+            pass
+        trace = merge(load(path), session)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, 'w') as f:
+            json.dump(trace, f, indent=2)
+            f.write('\n')
+        os.replace(tmp, path)
@@ -0,0 +1 @@
+"""Generated eager namespace modules, one per interpreter fingerprint (see `stdlb._index.variant_module`)."""
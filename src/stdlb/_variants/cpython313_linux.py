@@ -0,0 +1,2951 @@
+"""stdlb's eager namespace for cpython 3.13 on linux: 2690 names, imported explicitly.
+
+Equivalent to _eager.py on this interpreter (see `stdlb._index.variant_module`).
+
+This file is auto-generated by scripts/generate_init.py.
+Do not edit manually.
+"""
+
+import abc
+from abc import (
+    ABC,
+    ABCMeta,
+    abstractclassmethod,
+    abstractmethod,
+    abstractproperty,
+    abstractstaticmethod,
+    get_cache_token,
+    update_abstractmethods,
+)
+
+from array import (
+    ArrayType,
+    array,
+    typecodes,
+)
+
+import ast
+from ast import (
+    AST,
+    Add,
+    And,
+    AnnAssign,
+    Assert,
+    Assign,
+    AsyncFor,
+    AsyncFunctionDef,
+    AsyncWith,
+    Attribute,
+    AugAssign,
+    AugLoad,
+    AugStore,
+    Await,
+    BinOp,
+    BitAnd,
+    BitOr,
+    BitXor,
+    BoolOp,
+    Break,
+    Call,
+    ClassDef,
+    Compare,
+    Constant,
+    Continue,
+    Del,
+    Delete,
+    DictComp,
+    Div,
+    Eq,
+    ExceptHandler,
+    Expr,
+    Expression,
+    ExtSlice,
+    FloorDiv,
+    For,
+    FormattedValue,
+    FunctionDef,
+    GeneratorExp,
+    Global,
+    Gt,
+    GtE,
+    If,
+    IfExp,
+    Import,
+    ImportFrom,
+    In,
+    Index,
+    Interactive,
+    Invert,
+    Is,
+    IsNot,
+    JoinedStr,
+    LShift,
+    Lambda,
+    ListComp,
+    Load,
+    Lt,
+    LtE,
+    MatMult,
+    MatchAs,
+    MatchClass,
+    MatchMapping,
+    MatchOr,
+    MatchSequence,
+    MatchSingleton,
+    MatchStar,
+    MatchValue,
+    Mod,
+    Module,
+    Mult,
+    Name,
+    NamedExpr,
+    NodeTransformer,
+    NodeVisitor,
+    Nonlocal,
+    Not,
+    NotEq,
+    NotIn,
+    Or,
+    Param,
+    Pass,
+    Pow,
+    PyCF_ALLOW_TOP_LEVEL_AWAIT,
+    PyCF_ONLY_AST,
+    PyCF_OPTIMIZED_AST,
+    PyCF_TYPE_COMMENTS,
+    RShift,
+    Raise,
+    Return,
+    SetComp,
+    Slice,
+    Starred,
+    Store,
+    Sub,
+    Subscript,
+    Suite,
+    Try,
+    TryStar,
+    TypeIgnore,
+    UAdd,
+    USub,
+    UnaryOp,
+    While,
+    With,
+    Yield,
+    YieldFrom,
+    alias,
+    arg,
+    arguments,
+    boolop,
+    cmpop,
+    comprehension,
+    copy_location,
+    excepthandler,
+    expr,
+    expr_context,
+    fix_missing_locations,
+    get_docstring,
+    get_source_segment,
+    increment_lineno,
+    iter_child_nodes,
+    iter_fields,
+    keyword,
+    literal_eval,
+    match_case,
+    pattern,
+    stmt,
+    type_ignore,
+    type_param,
+    unaryop,
+    unparse,
+    withitem,
+)
+
+import asyncio
+from asyncio import (
+    ALL_COMPLETED,
+    AbstractChildWatcher,
+    AbstractEventLoop,
+    AbstractEventLoopPolicy,
+    AbstractServer,
+    BaseEventLoop,
+    BaseProtocol,
+    BaseTransport,
+    BufferedProtocol,
+    CancelledError,
+    DatagramProtocol,
+    DatagramTransport,
+    DefaultEventLoopPolicy,
+    EventLoop,
+    FIRST_COMPLETED,
+    FIRST_EXCEPTION,
+    FastChildWatcher,
+    Future,
+    Handle,
+    IncompleteReadError,
+    InvalidStateError,
+    LimitOverrunError,
+    MultiLoopChildWatcher,
+    PidfdChildWatcher,
+    QueueEmpty,
+    QueueFull,
+    QueueShutDown,
+    ReadTransport,
+    Runner,
+    SafeChildWatcher,
+    SelectorEventLoop,
+    SendfileNotAvailableError,
+    Server,
+    StreamReaderProtocol,
+    SubprocessProtocol,
+    SubprocessTransport,
+    Task,
+    TaskGroup,
+    ThreadedChildWatcher,
+    Timeout,
+    TimerHandle,
+    Transport,
+    WriteTransport,
+    all_tasks,
+    as_completed,
+    create_eager_task_factory,
+    create_subprocess_exec,
+    create_subprocess_shell,
+    create_task,
+    current_task,
+    eager_task_factory,
+    ensure_future,
+    gather,
+    get_child_watcher,
+    get_event_loop,
+    get_event_loop_policy,
+    get_running_loop,
+    iscoroutine,
+    iscoroutinefunction,
+    isfuture,
+    new_event_loop,
+    open_connection,
+    open_unix_connection,
+    run_coroutine_threadsafe,
+    set_child_watcher,
+    set_event_loop,
+    set_event_loop_policy,
+    shield,
+    start_server,
+    start_unix_server,
+    timeout_at,
+    to_thread,
+    wait_for,
+    wrap_future,
+)
+
+import base64
+from base64 import (
+    a85decode,
+    a85encode,
+    b16decode,
+    b16encode,
+    b32decode,
+    b32encode,
+    b32hexdecode,
+    b32hexencode,
+    b64decode,
+    b64encode,
+    b85decode,
+    b85encode,
+    decodebytes,
+    encodebytes,
+    standard_b64decode,
+    standard_b64encode,
+    urlsafe_b64decode,
+    urlsafe_b64encode,
+    z85decode,
+    z85encode,
+)
+
+import binascii
+from binascii import (
+    Incomplete,
+    a2b_base64,
+    a2b_hex,
+    a2b_qp,
+    a2b_uu,
+    b2a_base64,
+    b2a_hex,
+    b2a_qp,
+    b2a_uu,
+    crc_hqx,
+    hexlify,
+    unhexlify,
+)
+
+from bisect import (
+    bisect,
+    bisect_left,
+    bisect_right,
+    insort,
+    insort_left,
+    insort_right,
+)
+
+from builtins import (
+    BlockingIOError,
+    TimeoutError,
+    Warning,
+    abs,
+    compile,
+    copyright,
+    enumerate,
+    exit,
+    filter,
+    open,
+    pow,
+    property,
+    repr,
+    slice,
+    str,
+)
+
+from calendar import (
+    APRIL,
+    AUGUST,
+    Calendar,
+    DECEMBER,
+    Day,
+    FEBRUARY,
+    FRIDAY,
+    HTMLCalendar,
+    IllegalMonthError,
+    IllegalWeekdayError,
+    JANUARY,
+    JULY,
+    JUNE,
+    LocaleHTMLCalendar,
+    LocaleTextCalendar,
+    MARCH,
+    MAY,
+    MONDAY,
+    Month,
+    NOVEMBER,
+    OCTOBER,
+    SATURDAY,
+    SEPTEMBER,
+    SUNDAY,
+    THURSDAY,
+    TUESDAY,
+    TextCalendar,
+    WEDNESDAY,
+    calendar,
+    day_abbr,
+    day_name,
+    firstweekday,
+    isleap,
+    leapdays,
+    month,
+    month_abbr,
+    month_name,
+    monthcalendar,
+    monthrange,
+    prcal,
+    prmonth,
+    setfirstweekday,
+    timegm,
+    weekday,
+    weekheader,
+)
+
+import cmath
+from cmath import (
+    infj,
+    nanj,
+    phase,
+    polar,
+    rect,
+)
+
+import code
+from code import (
+    InteractiveConsole,
+    InteractiveInterpreter,
+    compile_command,
+    interact,
+)
+
+import codecs
+from codecs import (
+    BOM,
+    BOM32_BE,
+    BOM32_LE,
+    BOM64_BE,
+    BOM64_LE,
+    BOM_BE,
+    BOM_LE,
+    BOM_UTF16,
+    BOM_UTF16_BE,
+    BOM_UTF16_LE,
+    BOM_UTF32,
+    BOM_UTF32_BE,
+    BOM_UTF32_LE,
+    BOM_UTF8,
+    Codec,
+    CodecInfo,
+    EncodedFile,
+    IncrementalDecoder,
+    IncrementalEncoder,
+    StreamReader,
+    StreamReaderWriter,
+    StreamRecoder,
+    StreamWriter,
+    backslashreplace_errors,
+    decode,
+    encode,
+    getdecoder,
+    getencoder,
+    getincrementaldecoder,
+    getincrementalencoder,
+    getreader,
+    getwriter,
+    ignore_errors,
+    iterdecode,
+    iterencode,
+    lookup_error,
+    namereplace_errors,
+    register,
+    register_error,
+    replace_errors,
+    strict_errors,
+    xmlcharrefreplace_errors,
+)
+
+import collections
+from collections import (
+    UserDict,
+    UserList,
+    UserString,
+    defaultdict,
+    deque,
+    namedtuple,
+)
+
+import configparser
+from configparser import (
+    BasicInterpolation,
+    ConfigParser,
+    ConverterMapping,
+    DEFAULTSECT,
+    DuplicateOptionError,
+    DuplicateSectionError,
+    ExtendedInterpolation,
+    Interpolation,
+    InterpolationDepthError,
+    InterpolationError,
+    InterpolationMissingOptionError,
+    InterpolationSyntaxError,
+    MAX_INTERPOLATION_DEPTH,
+    MissingSectionHeaderError,
+    MultilineContinuationError,
+    NoOptionError,
+    NoSectionError,
+    ParsingError,
+    RawConfigParser,
+    SectionProxy,
+    UNNAMED_SECTION,
+)
+
+import contextlib
+from contextlib import (
+    AbstractAsyncContextManager,
+    AbstractContextManager,
+    AsyncExitStack,
+    ContextDecorator,
+    ExitStack,
+    aclosing,
+    asynccontextmanager,
+    closing,
+    contextmanager,
+    nullcontext,
+    redirect_stderr,
+    redirect_stdout,
+    suppress,
+)
+
+from copy import (
+    deepcopy,
+)
+
+import csv
+from csv import (
+    Dialect,
+    DictReader,
+    DictWriter,
+    QUOTE_ALL,
+    QUOTE_MINIMAL,
+    QUOTE_NONE,
+    QUOTE_NONNUMERIC,
+    QUOTE_NOTNULL,
+    QUOTE_STRINGS,
+    Sniffer,
+    excel,
+    excel_tab,
+    field_size_limit,
+    get_dialect,
+    list_dialects,
+    reader,
+    register_dialect,
+    unix_dialect,
+    unregister_dialect,
+    writer,
+)
+
+import dataclasses
+from dataclasses import (
+    Field,
+    FrozenInstanceError,
+    InitVar,
+    KW_ONLY,
+    MISSING,
+    asdict,
+    astuple,
+    dataclass,
+    field,
+    fields,
+    is_dataclass,
+    make_dataclass,
+)
+
+import datetime
+from datetime import (
+    MAXYEAR,
+    MINYEAR,
+    UTC,
+    date,
+    datetime as dt,
+    timedelta,
+    tzinfo,
+)
+
+from decimal import (
+    BasicContext,
+    Clamped,
+    Context,
+    ConversionSyntax,
+    Decimal,
+    DecimalException,
+    DecimalTuple,
+    DefaultContext,
+    DivisionByZero,
+    DivisionImpossible,
+    DivisionUndefined,
+    ExtendedContext,
+    FloatOperation,
+    HAVE_CONTEXTVAR,
+    HAVE_THREADS,
+    Inexact,
+    InvalidContext,
+    InvalidOperation,
+    MAX_EMAX,
+    MAX_PREC,
+    MIN_EMIN,
+    MIN_ETINY,
+    Overflow,
+    ROUND_05UP,
+    ROUND_CEILING,
+    ROUND_DOWN,
+    ROUND_FLOOR,
+    ROUND_HALF_DOWN,
+    ROUND_HALF_EVEN,
+    ROUND_HALF_UP,
+    ROUND_UP,
+    Rounded,
+    Subnormal,
+    Underflow,
+    getcontext,
+    localcontext,
+    setcontext,
+)
+
+import difflib
+from difflib import (
+    Differ,
+    HtmlDiff,
+    IS_CHARACTER_JUNK,
+    IS_LINE_JUNK,
+    SequenceMatcher,
+    context_diff,
+    diff_bytes,
+    get_close_matches,
+    ndiff,
+    restore,
+    unified_diff,
+)
+
+import enum
+from enum import (
+    CONFORM,
+    CONTINUOUS,
+    EJECT,
+    EnumCheck,
+    EnumDict,
+    EnumMeta,
+    EnumType,
+    Flag,
+    FlagBoundary,
+    IntEnum,
+    IntFlag,
+    KEEP,
+    NAMED_FLAGS,
+    ReprEnum,
+    STRICT,
+    StrEnum,
+    UNIQUE,
+    auto,
+    global_enum,
+    global_enum_repr,
+    global_flag_repr,
+    global_str,
+    member,
+    nonmember,
+    pickle_by_enum_name,
+    pickle_by_global_name,
+    unique,
+    verify,
+)
+
+from fnmatch import (
+    fnmatch,
+    fnmatchcase,
+)
+
+import fractions
+from fractions import (
+    Fraction,
+)
+
+import functools
+from functools import (
+    WRAPPER_ASSIGNMENTS,
+    WRAPPER_UPDATES,
+    cache,
+    cmp_to_key,
+    lru_cache,
+    partial,
+    partialmethod,
+    reduce,
+    singledispatch,
+    singledispatchmethod,
+    total_ordering,
+    update_wrapper,
+    wraps,
+)
+
+import glob
+from glob import (
+    iglob,
+    translate,
+)
+
+import graphlib
+from graphlib import (
+    CycleError,
+    TopologicalSorter,
+)
+
+import hashlib
+from hashlib import (
+    algorithms_available,
+    algorithms_guaranteed,
+    blake2b,
+    blake2s,
+    file_digest,
+    md5,
+    pbkdf2_hmac,
+    sha1,
+    sha224,
+    sha256,
+    sha384,
+    sha3_224,
+    sha3_256,
+    sha3_384,
+    sha3_512,
+    sha512,
+    shake_128,
+    shake_256,
+)
+
+import heapq
+from heapq import (
+    heapify,
+    heappop,
+    heappush,
+    heappushpop,
+    heapreplace,
+    merge,
+    nlargest,
+    nsmallest,
+)
+
+import hmac
+from hmac import (
+    HMAC,
+    digest,
+    digest_size,
+    new,
+    trans_36,
+    trans_5C,
+)
+
+import html
+from html import (
+    unescape,
+)
+
+import http
+from http import (
+    HTTPMethod,
+    HTTPStatus,
+)
+
+import io
+from io import (
+    BufferedIOBase,
+    BufferedRWPair,
+    BufferedRandom,
+    BufferedReader,
+    BufferedWriter,
+    BytesIO,
+    DEFAULT_BUFFER_SIZE,
+    FileIO,
+    IOBase,
+    IncrementalNewlineDecoder,
+    RawIOBase,
+    StringIO,
+    TextIOBase,
+    TextIOWrapper,
+    open_code,
+    text_encoding,
+)
+
+import itertools
+from itertools import (
+    accumulate,
+    batched,
+    chain,
+    combinations,
+    combinations_with_replacement,
+    compress,
+    count,
+    cycle,
+    dropwhile,
+    filterfalse,
+    groupby,
+    islice,
+    pairwise,
+    permutations,
+    product,
+    repeat,
+    starmap,
+    takewhile,
+    tee,
+    zip_longest,
+)
+
+import json
+from json import (
+    JSONDecodeError,
+    JSONDecoder,
+    JSONEncoder,
+)
+
+import locale
+from locale import (
+    CHAR_MAX,
+    LC_ALL,
+    LC_COLLATE,
+    LC_CTYPE,
+    LC_MESSAGES,
+    LC_MONETARY,
+    LC_NUMERIC,
+    LC_TIME,
+    atof,
+    atoi,
+    currency,
+    format_string,
+    getdefaultlocale,
+    getencoding,
+    getlocale,
+    getpreferredencoding,
+    localeconv,
+    setlocale,
+    strcoll,
+    strxfrm,
+)
+
+import logging
+from logging import (
+    BASIC_FORMAT,
+    BufferingFormatter,
+    CRITICAL,
+    DEBUG,
+    ERROR,
+    FATAL,
+    FileHandler,
+    Filter,
+    Handler,
+    INFO,
+    LogRecord,
+    Logger,
+    LoggerAdapter,
+    NOTSET,
+    NullHandler,
+    StreamHandler,
+    WARN,
+    WARNING,
+    addLevelName,
+    basicConfig,
+    captureWarnings,
+    critical,
+    debug,
+    disable,
+    fatal,
+    getHandlerByName,
+    getHandlerNames,
+    getLevelName,
+    getLevelNamesMapping,
+    getLogRecordFactory,
+    getLogger,
+    getLoggerClass,
+    info,
+    lastResort,
+    makeLogRecord,
+    raiseExceptions,
+    setLogRecordFactory,
+    setLoggerClass,
+    shutdown,
+    warning,
+)
+
+import math
+from math import (
+    acos,
+    acosh,
+    asin,
+    asinh,
+    atan,
+    atan2,
+    atanh,
+    cbrt,
+    ceil,
+    comb,
+    copysign,
+    cos,
+    cosh,
+    degrees,
+    dist,
+    e,
+    erf,
+    erfc,
+    exp,
+    exp2,
+    expm1,
+    fabs,
+    factorial,
+    floor,
+    fma,
+    fmod,
+    frexp,
+    fsum,
+    gamma,
+    gcd,
+    hypot,
+    inf,
+    isclose,
+    isfinite,
+    isinf,
+    isnan,
+    isqrt,
+    lcm,
+    ldexp,
+    lgamma,
+    log,
+    log10,
+    log1p,
+    log2,
+    modf,
+    nan,
+    nextafter,
+    perm,
+    pi,
+    prod,
+    radians,
+    remainder,
+    sin,
+    sinh,
+    sqrt,
+    sumprod,
+    tan,
+    tanh,
+    tau,
+    trunc,
+    ulp,
+)
+
+import mimetypes
+from mimetypes import (
+    MimeTypes,
+    add_type,
+    common_types,
+    encodings_map,
+    guess_all_extensions,
+    guess_extension,
+    guess_file_type,
+    guess_type,
+    init,
+    inited,
+    knownfiles,
+    read_mime_types,
+    suffix_map,
+    types_map,
+)
+
+import numbers
+from numbers import (
+    Complex,
+    Integral,
+    Number,
+    Rational,
+    Real,
+)
+
+import operator
+from operator import (
+    add,
+    and_,
+    attrgetter,
+    concat,
+    contains,
+    countOf,
+    delitem,
+    eq,
+    floordiv,
+    ge,
+    getitem,
+    gt,
+    iadd,
+    iand,
+    iconcat,
+    ifloordiv,
+    ilshift,
+    imatmul,
+    imod,
+    imul,
+    index,
+    indexOf,
+    inv,
+    invert,
+    ior,
+    ipow,
+    irshift,
+    is_,
+    is_not,
+    isub,
+    itemgetter,
+    itruediv,
+    ixor,
+    le,
+    length_hint,
+    lshift,
+    lt,
+    matmul,
+    methodcaller,
+    mod,
+    mul,
+    ne,
+    neg,
+    not_,
+    or_,
+    pos,
+    rshift,
+    setitem,
+    truediv,
+    truth,
+    xor,
+)
+
+import os
+from os import (
+    CLD_CONTINUED,
+    CLD_DUMPED,
+    CLD_EXITED,
+    CLD_KILLED,
+    CLD_STOPPED,
+    CLD_TRAPPED,
+    CLONE_FILES,
+    CLONE_FS,
+    CLONE_NEWCGROUP,
+    CLONE_NEWIPC,
+    CLONE_NEWNET,
+    CLONE_NEWNS,
+    CLONE_NEWPID,
+    CLONE_NEWTIME,
+    CLONE_NEWUSER,
+    CLONE_NEWUTS,
+    CLONE_SIGHAND,
+    CLONE_SYSVSEM,
+    CLONE_THREAD,
+    CLONE_VM,
+    DirEntry,
+    EFD_CLOEXEC,
+    EFD_NONBLOCK,
+    EFD_SEMAPHORE,
+    EX_CANTCREAT,
+    EX_CONFIG,
+    EX_DATAERR,
+    EX_IOERR,
+    EX_NOHOST,
+    EX_NOINPUT,
+    EX_NOPERM,
+    EX_NOUSER,
+    EX_OK,
+    EX_OSERR,
+    EX_OSFILE,
+    EX_PROTOCOL,
+    EX_SOFTWARE,
+    EX_TEMPFAIL,
+    EX_UNAVAILABLE,
+    EX_USAGE,
+    F_LOCK,
+    F_OK,
+    F_TEST,
+    F_TLOCK,
+    F_ULOCK,
+    GRND_NONBLOCK,
+    GRND_RANDOM,
+    MFD_ALLOW_SEALING,
+    MFD_CLOEXEC,
+    MFD_HUGETLB,
+    MFD_HUGE_16GB,
+    MFD_HUGE_16MB,
+    MFD_HUGE_1GB,
+    MFD_HUGE_1MB,
+    MFD_HUGE_256MB,
+    MFD_HUGE_2GB,
+    MFD_HUGE_2MB,
+    MFD_HUGE_32MB,
+    MFD_HUGE_512KB,
+    MFD_HUGE_512MB,
+    MFD_HUGE_64KB,
+    MFD_HUGE_8MB,
+    MFD_HUGE_MASK,
+    MFD_HUGE_SHIFT,
+    NGROUPS_MAX,
+    O_ACCMODE,
+    O_APPEND,
+    O_ASYNC,
+    O_CLOEXEC,
+    O_CREAT,
+    O_DIRECT,
+    O_DIRECTORY,
+    O_DSYNC,
+    O_EXCL,
+    O_FSYNC,
+    O_LARGEFILE,
+    O_NDELAY,
+    O_NOATIME,
+    O_NOCTTY,
+    O_NOFOLLOW,
+    O_NONBLOCK,
+    O_PATH,
+    O_RDONLY,
+    O_RDWR,
+    O_RSYNC,
+    O_SYNC,
+    O_TMPFILE,
+    O_TRUNC,
+    O_WRONLY,
+    POSIX_FADV_DONTNEED,
+    POSIX_FADV_NOREUSE,
+    POSIX_FADV_NORMAL,
+    POSIX_FADV_RANDOM,
+    POSIX_FADV_SEQUENTIAL,
+    POSIX_FADV_WILLNEED,
+    POSIX_SPAWN_CLOSE,
+    POSIX_SPAWN_CLOSEFROM,
+    POSIX_SPAWN_DUP2,
+    POSIX_SPAWN_OPEN,
+    PRIO_PGRP,
+    PRIO_PROCESS,
+    PRIO_USER,
+    P_ALL,
+    P_NOWAIT,
+    P_NOWAITO,
+    P_PGID,
+    P_PID,
+    P_PIDFD,
+    P_WAIT,
+    RTLD_DEEPBIND,
+    RTLD_GLOBAL,
+    RTLD_LAZY,
+    RTLD_LOCAL,
+    RTLD_NODELETE,
+    RTLD_NOLOAD,
+    RTLD_NOW,
+    RWF_APPEND,
+    RWF_DSYNC,
+    RWF_HIPRI,
+    RWF_NOWAIT,
+    RWF_SYNC,
+    R_OK,
+    SCHED_BATCH,
+    SCHED_FIFO,
+    SCHED_IDLE,
+    SCHED_OTHER,
+    SCHED_RESET_ON_FORK,
+    SCHED_RR,
+    SEEK_CUR,
+    SEEK_DATA,
+    SEEK_END,
+    SEEK_HOLE,
+    SEEK_SET,
+    SPLICE_F_MORE,
+    SPLICE_F_MOVE,
+    SPLICE_F_NONBLOCK,
+    ST_APPEND,
+    ST_MANDLOCK,
+    ST_NOATIME,
+    ST_NODEV,
+    ST_NODIRATIME,
+    ST_NOEXEC,
+    ST_NOSUID,
+    ST_RDONLY,
+    ST_RELATIME,
+    ST_SYNCHRONOUS,
+    ST_WRITE,
+    TFD_CLOEXEC,
+    TFD_NONBLOCK,
+    TFD_TIMER_ABSTIME,
+    TFD_TIMER_CANCEL_ON_SET,
+    WCONTINUED,
+    WCOREDUMP,
+    WEXITED,
+    WEXITSTATUS,
+    WIFCONTINUED,
+    WIFEXITED,
+    WIFSIGNALED,
+    WIFSTOPPED,
+    WNOHANG,
+    WNOWAIT,
+    WSTOPPED,
+    WSTOPSIG,
+    WTERMSIG,
+    WUNTRACED,
+    W_OK,
+    XATTR_CREATE,
+    XATTR_REPLACE,
+    XATTR_SIZE_MAX,
+    X_OK,
+    abort,
+    access,
+    chdir,
+    chmod,
+    chroot,
+    closerange,
+    confstr,
+    confstr_names,
+    copy_file_range,
+    cpu_count,
+    ctermid,
+    device_encoding,
+    dup2,
+    environ,
+    environb,
+    eventfd,
+    eventfd_read,
+    eventfd_write,
+    execl,
+    execle,
+    execlp,
+    execlpe,
+    execv,
+    execve,
+    execvp,
+    execvpe,
+    fchdir,
+    fchmod,
+    fchown,
+    fdatasync,
+    fdopen,
+    fork,
+    forkpty,
+    fpathconf,
+    fsdecode,
+    fsencode,
+    fspath,
+    fstat,
+    fstatvfs,
+    fsync,
+    ftruncate,
+    fwalk,
+    get_blocking,
+    get_exec_path,
+    get_inheritable,
+    getcwd,
+    getcwdb,
+    getegid,
+    getenv,
+    getenvb,
+    geteuid,
+    getgid,
+    getgrouplist,
+    getgroups,
+    getloadavg,
+    getlogin,
+    getpgid,
+    getpgrp,
+    getpid,
+    getppid,
+    getpriority,
+    getrandom,
+    getresgid,
+    getresuid,
+    getsid,
+    getuid,
+    getxattr,
+    grantpt,
+    initgroups,
+    isatty,
+    kill,
+    killpg,
+    lchown,
+    linesep,
+    link,
+    listdir,
+    listxattr,
+    lockf,
+    login_tty,
+    lseek,
+    lstat,
+    major,
+    makedev,
+    makedirs,
+    memfd_create,
+    minor,
+    mkdir,
+    mkfifo,
+    mknod,
+    nice,
+    openpty,
+    pathconf,
+    pathconf_names,
+    pidfd_open,
+    pipe,
+    pipe2,
+    popen,
+    posix_fadvise,
+    posix_fallocate,
+    posix_openpt,
+    posix_spawn,
+    posix_spawnp,
+    pread,
+    preadv,
+    ptsname,
+    putenv,
+    pwrite,
+    pwritev,
+    read,
+    readlink,
+    readv,
+    register_at_fork,
+    remove,
+    removedirs,
+    removexattr,
+    rename,
+    renames,
+    replace,
+    rmdir,
+    scandir,
+    sched_get_priority_max,
+    sched_get_priority_min,
+    sched_getaffinity,
+    sched_getparam,
+    sched_getscheduler,
+    sched_param,
+    sched_rr_get_interval,
+    sched_setaffinity,
+    sched_setparam,
+    sched_setscheduler,
+    sched_yield,
+    sendfile,
+    set_blocking,
+    set_inheritable,
+    setegid,
+    seteuid,
+    setgid,
+    setgroups,
+    setns,
+    setpgid,
+    setpgrp,
+    setpriority,
+    setregid,
+    setresgid,
+    setresuid,
+    setreuid,
+    setsid,
+    setuid,
+    setxattr,
+    spawnl,
+    spawnle,
+    spawnlp,
+    spawnlpe,
+    spawnv,
+    spawnve,
+    spawnvp,
+    spawnvpe,
+    splice,
+    stat,
+    stat_result,
+    statvfs,
+    statvfs_result,
+    strerror,
+    supports_bytes_environ,
+    symlink,
+    sync,
+    sysconf,
+    sysconf_names,
+    tcgetpgrp,
+    tcsetpgrp,
+    terminal_size,
+    timerfd_create,
+    timerfd_gettime,
+    timerfd_gettime_ns,
+    timerfd_settime,
+    timerfd_settime_ns,
+    times,
+    times_result,
+    truncate,
+    ttyname,
+    umask,
+    unlink,
+    unlockpt,
+    unsetenv,
+    unshare,
+    urandom,
+    utime,
+    wait,
+    wait3,
+    wait4,
+    waitid,
+    waitid_result,
+    waitpid,
+    waitstatus_to_exitcode,
+    walk,
+    write,
+    writev,
+)
+
+import os.path as path
+from os.path import (
+    abspath,
+    altsep,
+    basename,
+    commonpath,
+    commonprefix,
+    curdir,
+    defpath,
+    devnull,
+    dirname,
+    exists,
+    expanduser,
+    expandvars,
+    extsep,
+    getatime,
+    getctime,
+    getmtime,
+    getsize,
+    isabs,
+    isdevdrive,
+    isdir,
+    isfile,
+    isjunction,
+    islink,
+    ismount,
+    join,
+    lexists,
+    normcase,
+    normpath,
+    pardir,
+    pathsep,
+    realpath,
+    relpath,
+    samefile,
+    sameopenfile,
+    samestat,
+    sep,
+    splitdrive,
+    splitext,
+    splitroot,
+    supports_unicode_filenames,
+)
+
+import pathlib
+from pathlib import (
+    Path,
+    PosixPath,
+    PurePath,
+    PurePosixPath,
+    PureWindowsPath,
+    UnsupportedOperation,
+    WindowsPath,
+)
+
+import pickle
+from pickle import (
+    ADDITEMS,
+    APPEND,
+    APPENDS,
+    BINBYTES,
+    BINBYTES8,
+    BINFLOAT,
+    BINGET,
+    BININT,
+    BININT1,
+    BININT2,
+    BINPERSID,
+    BINPUT,
+    BINSTRING,
+    BINUNICODE,
+    BINUNICODE8,
+    BUILD,
+    BYTEARRAY8,
+    DEFAULT_PROTOCOL,
+    DICT,
+    DUP,
+    EMPTY_DICT,
+    EMPTY_LIST,
+    EMPTY_SET,
+    EMPTY_TUPLE,
+    EXT1,
+    EXT2,
+    EXT4,
+    FALSE,
+    FLOAT,
+    FRAME,
+    FROZENSET,
+    GET,
+    GLOBAL,
+    HIGHEST_PROTOCOL,
+    INST,
+    INT,
+    LIST,
+    LONG,
+    LONG1,
+    LONG4,
+    LONG_BINGET,
+    LONG_BINPUT,
+    MARK,
+    MEMOIZE,
+    NEWFALSE,
+    NEWOBJ,
+    NEWOBJ_EX,
+    NEWTRUE,
+    NEXT_BUFFER,
+    NONE,
+    OBJ,
+    PERSID,
+    POP,
+    POP_MARK,
+    PROTO,
+    PUT,
+    PickleBuffer,
+    PickleError,
+    Pickler,
+    PicklingError,
+    READONLY_BUFFER,
+    REDUCE,
+    SETITEM,
+    SETITEMS,
+    SHORT_BINBYTES,
+    SHORT_BINSTRING,
+    SHORT_BINUNICODE,
+    STACK_GLOBAL,
+    STOP,
+    STRING,
+    TRUE,
+    TUPLE,
+    TUPLE1,
+    TUPLE2,
+    TUPLE3,
+    Unpickler,
+    UnpicklingError,
+    dump,
+    dumps,
+)
+
+from platform import (
+    AndroidVer,
+    IOSVersionInfo,
+    android_ver,
+    architecture,
+    freedesktop_os_release,
+    ios_ver,
+    java_ver,
+    libc_ver,
+    mac_ver,
+    machine,
+    node,
+    processor,
+    python_branch,
+    python_build,
+    python_compiler,
+    python_implementation,
+    python_revision,
+    python_version,
+    python_version_tuple,
+    release,
+    system,
+    system_alias,
+    uname,
+    uname_result,
+    win32_edition,
+    win32_is_iot,
+    win32_ver,
+)
+
+from pprint import (
+    PrettyPrinter,
+    isreadable,
+    isrecursive,
+    pformat,
+    pp,
+    pprint,
+    saferepr,
+)
+
+import queue
+from queue import (
+    Empty,
+    Full,
+    LifoQueue,
+    PriorityQueue,
+    Queue,
+    ShutDown,
+    SimpleQueue,
+)
+
+from random import (
+    Random,
+    betavariate,
+    binomialvariate,
+    choices,
+    expovariate,
+    gammavariate,
+    gauss,
+    getrandbits,
+    getstate,
+    lognormvariate,
+    normalvariate,
+    paretovariate,
+    randbytes,
+    randint,
+    random,
+    randrange,
+    sample,
+    seed,
+    setstate,
+    shuffle,
+    triangular,
+    uniform,
+    vonmisesvariate,
+    weibullvariate,
+)
+
+import re
+from re import (
+    A,
+    ASCII,
+    DOTALL,
+    I,
+    IGNORECASE,
+    L,
+    LOCALE,
+    M,
+    MULTILINE,
+    NOFLAG,
+    PatternError,
+    RegexFlag,
+    S,
+    U,
+    UNICODE,
+    VERBOSE,
+    X,
+    error,
+    escape,
+    findall,
+    finditer,
+    fullmatch,
+    match,
+    purge,
+    search,
+    sub,
+    subn,
+)
+
+import reprlib
+from reprlib import (
+    Repr,
+    recursive_repr,
+)
+
+import secrets
+from secrets import (
+    SystemRandom,
+    choice,
+    compare_digest,
+    randbelow,
+    randbits,
+    token_bytes,
+    token_hex,
+    token_urlsafe,
+)
+
+import shelve
+from shelve import (
+    BsdDbShelf,
+    DbfilenameShelf,
+    Shelf,
+)
+
+import shlex
+from shlex import (
+    split,
+)
+
+import shutil
+from shutil import (
+    ExecError,
+    SameFileError,
+    SpecialFileError,
+    chown,
+    copy,
+    copy2,
+    copyfile,
+    copyfileobj,
+    copymode,
+    copystat,
+    copytree,
+    disk_usage,
+    get_archive_formats,
+    get_terminal_size,
+    get_unpack_formats,
+    ignore_patterns,
+    make_archive,
+    move,
+    register_archive_format,
+    register_unpack_format,
+    rmtree,
+    unpack_archive,
+    unregister_archive_format,
+    unregister_unpack_format,
+    which,
+)
+
+from signal import (
+    Handlers,
+    ITIMER_PROF,
+    ITIMER_REAL,
+    ITIMER_VIRTUAL,
+    ItimerError,
+    NSIG,
+    SIGABRT,
+    SIGALRM,
+    SIGBUS,
+    SIGCHLD,
+    SIGCLD,
+    SIGCONT,
+    SIGFPE,
+    SIGHUP,
+    SIGILL,
+    SIGINT,
+    SIGIO,
+    SIGIOT,
+    SIGKILL,
+    SIGPIPE,
+    SIGPOLL,
+    SIGPROF,
+    SIGPWR,
+    SIGQUIT,
+    SIGRTMAX,
+    SIGRTMIN,
+    SIGSEGV,
+    SIGSTKFLT,
+    SIGSTOP,
+    SIGSYS,
+    SIGTERM,
+    SIGTRAP,
+    SIGTSTP,
+    SIGTTIN,
+    SIGTTOU,
+    SIGURG,
+    SIGUSR1,
+    SIGUSR2,
+    SIGVTALRM,
+    SIGWINCH,
+    SIGXCPU,
+    SIGXFSZ,
+    SIG_BLOCK,
+    SIG_DFL,
+    SIG_IGN,
+    SIG_SETMASK,
+    SIG_UNBLOCK,
+    Sigmasks,
+    Signals,
+    alarm,
+    default_int_handler,
+    getitimer,
+    getsignal,
+    pause,
+    pidfd_send_signal,
+    pthread_kill,
+    pthread_sigmask,
+    raise_signal,
+    set_wakeup_fd,
+    setitimer,
+    siginterrupt,
+    signal,
+    sigpending,
+    sigtimedwait,
+    sigwait,
+    sigwaitinfo,
+    strsignal,
+    struct_siginfo,
+    valid_signals,
+)
+
+from socket import (
+    AF_ALG,
+    AF_APPLETALK,
+    AF_ASH,
+    AF_ATMPVC,
+    AF_ATMSVC,
+    AF_AX25,
+    AF_BRIDGE,
+    AF_CAN,
+    AF_DECnet,
+    AF_ECONET,
+    AF_INET,
+    AF_INET6,
+    AF_IPX,
+    AF_IRDA,
+    AF_KEY,
+    AF_LLC,
+    AF_NETBEUI,
+    AF_NETLINK,
+    AF_NETROM,
+    AF_PACKET,
+    AF_PPPOX,
+    AF_QIPCRTR,
+    AF_RDS,
+    AF_ROSE,
+    AF_ROUTE,
+    AF_SECURITY,
+    AF_SNA,
+    AF_TIPC,
+    AF_UNIX,
+    AF_UNSPEC,
+    AF_VSOCK,
+    AF_WANPIPE,
+    AF_X25,
+    AI_ADDRCONFIG,
+    AI_ALL,
+    AI_CANONNAME,
+    AI_NUMERICHOST,
+    AI_NUMERICSERV,
+    AI_PASSIVE,
+    AI_V4MAPPED,
+    ALG_OP_DECRYPT,
+    ALG_OP_ENCRYPT,
+    ALG_OP_SIGN,
+    ALG_OP_VERIFY,
+    ALG_SET_AEAD_ASSOCLEN,
+    ALG_SET_AEAD_AUTHSIZE,
+    ALG_SET_IV,
+    ALG_SET_KEY,
+    ALG_SET_OP,
+    ALG_SET_PUBKEY,
+    AddressFamily,
+    CAN_BCM,
+    CAN_BCM_CAN_FD_FRAME,
+    CAN_BCM_RX_ANNOUNCE_RESUME,
+    CAN_BCM_RX_CHANGED,
+    CAN_BCM_RX_CHECK_DLC,
+    CAN_BCM_RX_DELETE,
+    CAN_BCM_RX_FILTER_ID,
+    CAN_BCM_RX_NO_AUTOTIMER,
+    CAN_BCM_RX_READ,
+    CAN_BCM_RX_RTR_FRAME,
+    CAN_BCM_RX_SETUP,
+    CAN_BCM_RX_STATUS,
+    CAN_BCM_RX_TIMEOUT,
+    CAN_BCM_SETTIMER,
+    CAN_BCM_STARTTIMER,
+    CAN_BCM_TX_ANNOUNCE,
+    CAN_BCM_TX_COUNTEVT,
+    CAN_BCM_TX_CP_CAN_ID,
+    CAN_BCM_TX_DELETE,
+    CAN_BCM_TX_EXPIRED,
+    CAN_BCM_TX_READ,
+    CAN_BCM_TX_RESET_MULTI_IDX,
+    CAN_BCM_TX_SEND,
+    CAN_BCM_TX_SETUP,
+    CAN_BCM_TX_STATUS,
+    CAN_EFF_FLAG,
+    CAN_EFF_MASK,
+    CAN_ERR_FLAG,
+    CAN_ERR_MASK,
+    CAN_ISOTP,
+    CAN_J1939,
+    CAN_RAW,
+    CAN_RAW_FD_FRAMES,
+    CAN_RAW_FILTER,
+    CAN_RAW_JOIN_FILTERS,
+    CAN_RAW_LOOPBACK,
+    CAN_RAW_RECV_OWN_MSGS,
+    CAN_RTR_FLAG,
+    CAN_SFF_MASK,
+    CAPI,
+    CMSG_LEN,
+    CMSG_SPACE,
+    EAI_ADDRFAMILY,
+    EAI_AGAIN,
+    EAI_BADFLAGS,
+    EAI_FAIL,
+    EAI_FAMILY,
+    EAI_MEMORY,
+    EAI_NODATA,
+    EAI_NONAME,
+    EAI_OVERFLOW,
+    EAI_SERVICE,
+    EAI_SOCKTYPE,
+    EAI_SYSTEM,
+    ETHERTYPE_ARP,
+    ETHERTYPE_IP,
+    ETHERTYPE_IPV6,
+    ETHERTYPE_VLAN,
+    ETH_P_ALL,
+    INADDR_ALLHOSTS_GROUP,
+    INADDR_ANY,
+    INADDR_BROADCAST,
+    INADDR_LOOPBACK,
+    INADDR_MAX_LOCAL_GROUP,
+    INADDR_NONE,
+    INADDR_UNSPEC_GROUP,
+    IOCTL_VM_SOCKETS_GET_LOCAL_CID,
+    IPPORT_RESERVED,
+    IPPORT_USERRESERVED,
+    IPPROTO_AH,
+    IPPROTO_DSTOPTS,
+    IPPROTO_EGP,
+    IPPROTO_ESP,
+    IPPROTO_FRAGMENT,
+    IPPROTO_GRE,
+    IPPROTO_HOPOPTS,
+    IPPROTO_ICMP,
+    IPPROTO_ICMPV6,
+    IPPROTO_IDP,
+    IPPROTO_IGMP,
+    IPPROTO_IP,
+    IPPROTO_IPIP,
+    IPPROTO_IPV6,
+    IPPROTO_MPTCP,
+    IPPROTO_NONE,
+    IPPROTO_PIM,
+    IPPROTO_PUP,
+    IPPROTO_RAW,
+    IPPROTO_ROUTING,
+    IPPROTO_RSVP,
+    IPPROTO_SCTP,
+    IPPROTO_TCP,
+    IPPROTO_TP,
+    IPPROTO_UDP,
+    IPPROTO_UDPLITE,
+    IPV6_CHECKSUM,
+    IPV6_DONTFRAG,
+    IPV6_DSTOPTS,
+    IPV6_HOPLIMIT,
+    IPV6_HOPOPTS,
+    IPV6_JOIN_GROUP,
+    IPV6_LEAVE_GROUP,
+    IPV6_MULTICAST_HOPS,
+    IPV6_MULTICAST_IF,
+    IPV6_MULTICAST_LOOP,
+    IPV6_NEXTHOP,
+    IPV6_PATHMTU,
+    IPV6_PKTINFO,
+    IPV6_RECVDSTOPTS,
+    IPV6_RECVHOPLIMIT,
+    IPV6_RECVHOPOPTS,
+    IPV6_RECVPATHMTU,
+    IPV6_RECVPKTINFO,
+    IPV6_RECVRTHDR,
+    IPV6_RECVTCLASS,
+    IPV6_RTHDR,
+    IPV6_RTHDRDSTOPTS,
+    IPV6_RTHDR_TYPE_0,
+    IPV6_TCLASS,
+    IPV6_UNICAST_HOPS,
+    IPV6_V6ONLY,
+    IP_ADD_MEMBERSHIP,
+    IP_ADD_SOURCE_MEMBERSHIP,
+    IP_BIND_ADDRESS_NO_PORT,
+    IP_BLOCK_SOURCE,
+    IP_DEFAULT_MULTICAST_LOOP,
+    IP_DEFAULT_MULTICAST_TTL,
+    IP_DROP_MEMBERSHIP,
+    IP_DROP_SOURCE_MEMBERSHIP,
+    IP_HDRINCL,
+    IP_MAX_MEMBERSHIPS,
+    IP_MULTICAST_IF,
+    IP_MULTICAST_LOOP,
+    IP_MULTICAST_TTL,
+    IP_OPTIONS,
+    IP_PKTINFO,
+    IP_RECVOPTS,
+    IP_RECVRETOPTS,
+    IP_RECVTOS,
+    IP_RETOPTS,
+    IP_TOS,
+    IP_TRANSPARENT,
+    IP_TTL,
+    IP_UNBLOCK_SOURCE,
+    J1939_EE_INFO_NONE,
+    J1939_EE_INFO_TX_ABORT,
+    J1939_FILTER_MAX,
+    J1939_IDLE_ADDR,
+    J1939_MAX_UNICAST_ADDR,
+    J1939_NLA_BYTES_ACKED,
+    J1939_NLA_PAD,
+    J1939_NO_ADDR,
+    J1939_NO_NAME,
+    J1939_NO_PGN,
+    J1939_PGN_ADDRESS_CLAIMED,
+    J1939_PGN_ADDRESS_COMMANDED,
+    J1939_PGN_MAX,
+    J1939_PGN_PDU1_MAX,
+    J1939_PGN_REQUEST,
+    MSG_CMSG_CLOEXEC,
+    MSG_CONFIRM,
+    MSG_CTRUNC,
+    MSG_DONTROUTE,
+    MSG_DONTWAIT,
+    MSG_EOR,
+    MSG_ERRQUEUE,
+    MSG_FASTOPEN,
+    MSG_MORE,
+    MSG_NOSIGNAL,
+    MSG_OOB,
+    MSG_PEEK,
+    MSG_TRUNC,
+    MSG_WAITALL,
+    NETLINK_CRYPTO,
+    NETLINK_DNRTMSG,
+    NETLINK_FIREWALL,
+    NETLINK_IP6_FW,
+    NETLINK_NFLOG,
+    NETLINK_ROUTE,
+    NETLINK_USERSOCK,
+    NETLINK_XFRM,
+    NI_DGRAM,
+    NI_IDN,
+    NI_MAXHOST,
+    NI_MAXSERV,
+    NI_NAMEREQD,
+    NI_NOFQDN,
+    NI_NUMERICHOST,
+    NI_NUMERICSERV,
+    PACKET_BROADCAST,
+    PACKET_FASTROUTE,
+    PACKET_HOST,
+    PACKET_LOOPBACK,
+    PACKET_MULTICAST,
+    PACKET_OTHERHOST,
+    PACKET_OUTGOING,
+    PF_CAN,
+    PF_PACKET,
+    PF_RDS,
+    SCM_CREDENTIALS,
+    SCM_J1939_DEST_ADDR,
+    SCM_J1939_DEST_NAME,
+    SCM_J1939_ERRQUEUE,
+    SCM_J1939_PRIO,
+    SCM_RIGHTS,
+    SHUT_RD,
+    SHUT_RDWR,
+    SHUT_WR,
+    SOCK_CLOEXEC,
+    SOCK_DGRAM,
+    SOCK_NONBLOCK,
+    SOCK_RAW,
+    SOCK_RDM,
+    SOCK_SEQPACKET,
+    SOCK_STREAM,
+    SOL_ALG,
+    SOL_CAN_BASE,
+    SOL_CAN_RAW,
+    SOL_IP,
+    SOL_RDS,
+    SOL_SOCKET,
+    SOL_TCP,
+    SOL_TIPC,
+    SOL_UDP,
+    SOMAXCONN,
+    SO_ACCEPTCONN,
+    SO_BINDTODEVICE,
+    SO_BINDTOIFINDEX,
+    SO_BROADCAST,
+    SO_DEBUG,
+    SO_DOMAIN,
+    SO_DONTROUTE,
+    SO_ERROR,
+    SO_INCOMING_CPU,
+    SO_J1939_ERRQUEUE,
+    SO_J1939_FILTER,
+    SO_J1939_PROMISC,
+    SO_J1939_SEND_PRIO,
+    SO_KEEPALIVE,
+    SO_LINGER,
+    SO_MARK,
+    SO_OOBINLINE,
+    SO_PASSCRED,
+    SO_PASSSEC,
+    SO_PEERCRED,
+    SO_PEERSEC,
+    SO_PRIORITY,
+    SO_PROTOCOL,
+    SO_RCVBUF,
+    SO_RCVLOWAT,
+    SO_RCVTIMEO,
+    SO_REUSEADDR,
+    SO_REUSEPORT,
+    SO_SNDBUF,
+    SO_SNDLOWAT,
+    SO_SNDTIMEO,
+    SO_TYPE,
+    SO_VM_SOCKETS_BUFFER_MAX_SIZE,
+    SO_VM_SOCKETS_BUFFER_MIN_SIZE,
+    SO_VM_SOCKETS_BUFFER_SIZE,
+    SocketKind,
+    SocketType,
+    TCP_CC_INFO,
+    TCP_CONGESTION,
+    TCP_CORK,
+    TCP_DEFER_ACCEPT,
+    TCP_FASTOPEN,
+    TCP_FASTOPEN_CONNECT,
+    TCP_FASTOPEN_KEY,
+    TCP_FASTOPEN_NO_COOKIE,
+    TCP_INFO,
+    TCP_INQ,
+    TCP_KEEPCNT,
+    TCP_KEEPIDLE,
+    TCP_KEEPINTVL,
+    TCP_LINGER2,
+    TCP_MAXSEG,
+    TCP_MD5SIG,
+    TCP_MD5SIG_EXT,
+    TCP_NODELAY,
+    TCP_NOTSENT_LOWAT,
+    TCP_QUEUE_SEQ,
+    TCP_QUICKACK,
+    TCP_REPAIR,
+    TCP_REPAIR_OPTIONS,
+    TCP_REPAIR_QUEUE,
+    TCP_REPAIR_WINDOW,
+    TCP_SAVED_SYN,
+    TCP_SAVE_SYN,
+    TCP_SYNCNT,
+    TCP_THIN_DUPACK,
+    TCP_THIN_LINEAR_TIMEOUTS,
+    TCP_TIMESTAMP,
+    TCP_TX_DELAY,
+    TCP_ULP,
+    TCP_USER_TIMEOUT,
+    TCP_WINDOW_CLAMP,
+    TCP_ZEROCOPY_RECEIVE,
+    TIPC_ADDR_ID,
+    TIPC_ADDR_NAME,
+    TIPC_ADDR_NAMESEQ,
+    TIPC_CFG_SRV,
+    TIPC_CLUSTER_SCOPE,
+    TIPC_CONN_TIMEOUT,
+    TIPC_CRITICAL_IMPORTANCE,
+    TIPC_DEST_DROPPABLE,
+    TIPC_HIGH_IMPORTANCE,
+    TIPC_IMPORTANCE,
+    TIPC_LOW_IMPORTANCE,
+    TIPC_MEDIUM_IMPORTANCE,
+    TIPC_NODE_SCOPE,
+    TIPC_PUBLISHED,
+    TIPC_SRC_DROPPABLE,
+    TIPC_SUBSCR_TIMEOUT,
+    TIPC_SUB_CANCEL,
+    TIPC_SUB_PORTS,
+    TIPC_SUB_SERVICE,
+    TIPC_TOP_SRV,
+    TIPC_WAIT_FOREVER,
+    TIPC_WITHDRAWN,
+    TIPC_ZONE_SCOPE,
+    UDPLITE_RECV_CSCOV,
+    UDPLITE_SEND_CSCOV,
+    VMADDR_CID_ANY,
+    VMADDR_CID_HOST,
+    VMADDR_PORT_ANY,
+    VM_SOCKETS_INVALID_VERSION,
+    close,
+    create_connection,
+    create_server,
+    dup,
+    fromfd,
+    gaierror,
+    getaddrinfo,
+    getdefaulttimeout,
+    getfqdn,
+    gethostbyaddr,
+    gethostbyname,
+    gethostbyname_ex,
+    gethostname,
+    getnameinfo,
+    getprotobyname,
+    getservbyname,
+    getservbyport,
+    has_dualstack_ipv6,
+    has_ipv6,
+    herror,
+    htonl,
+    htons,
+    if_indextoname,
+    if_nameindex,
+    if_nametoindex,
+    inet_aton,
+    inet_ntoa,
+    inet_ntop,
+    inet_pton,
+    ntohl,
+    ntohs,
+    recv_fds,
+    send_fds,
+    setdefaulttimeout,
+    sethostname,
+    socket,
+    socketpair,
+    timeout,
+)
+
+import sqlite3
+from sqlite3 import (
+    Binary,
+    Blob,
+    Connection,
+    Cursor,
+    DataError,
+    DatabaseError,
+    Date,
+    DateFromTicks,
+    Error,
+    IntegrityError,
+    InterfaceError,
+    InternalError,
+    LEGACY_TRANSACTION_CONTROL,
+    NotSupportedError,
+    OperationalError,
+    PARSE_COLNAMES,
+    PARSE_DECLTYPES,
+    PrepareProtocol,
+    ProgrammingError,
+    Row,
+    SQLITE_ABORT,
+    SQLITE_ABORT_ROLLBACK,
+    SQLITE_ALTER_TABLE,
+    SQLITE_ANALYZE,
+    SQLITE_ATTACH,
+    SQLITE_AUTH,
+    SQLITE_AUTH_USER,
+    SQLITE_BUSY,
+    SQLITE_BUSY_RECOVERY,
+    SQLITE_BUSY_SNAPSHOT,
+    SQLITE_BUSY_TIMEOUT,
+    SQLITE_CANTOPEN,
+    SQLITE_CANTOPEN_CONVPATH,
+    SQLITE_CANTOPEN_DIRTYWAL,
+    SQLITE_CANTOPEN_FULLPATH,
+    SQLITE_CANTOPEN_ISDIR,
+    SQLITE_CANTOPEN_NOTEMPDIR,
+    SQLITE_CANTOPEN_SYMLINK,
+    SQLITE_CONSTRAINT,
+    SQLITE_CONSTRAINT_CHECK,
+    SQLITE_CONSTRAINT_COMMITHOOK,
+    SQLITE_CONSTRAINT_FOREIGNKEY,
+    SQLITE_CONSTRAINT_FUNCTION,
+    SQLITE_CONSTRAINT_NOTNULL,
+    SQLITE_CONSTRAINT_PINNED,
+    SQLITE_CONSTRAINT_PRIMARYKEY,
+    SQLITE_CONSTRAINT_ROWID,
+    SQLITE_CONSTRAINT_TRIGGER,
+    SQLITE_CONSTRAINT_UNIQUE,
+    SQLITE_CONSTRAINT_VTAB,
+    SQLITE_CORRUPT,
+    SQLITE_CORRUPT_INDEX,
+    SQLITE_CORRUPT_SEQUENCE,
+    SQLITE_CORRUPT_VTAB,
+    SQLITE_CREATE_INDEX,
+    SQLITE_CREATE_TABLE,
+    SQLITE_CREATE_TEMP_INDEX,
+    SQLITE_CREATE_TEMP_TABLE,
+    SQLITE_CREATE_TEMP_TRIGGER,
+    SQLITE_CREATE_TEMP_VIEW,
+    SQLITE_CREATE_TRIGGER,
+    SQLITE_CREATE_VIEW,
+    SQLITE_CREATE_VTABLE,
+    SQLITE_DBCONFIG_DEFENSIVE,
+    SQLITE_DBCONFIG_DQS_DDL,
+    SQLITE_DBCONFIG_DQS_DML,
+    SQLITE_DBCONFIG_ENABLE_FKEY,
+    SQLITE_DBCONFIG_ENABLE_FTS3_TOKENIZER,
+    SQLITE_DBCONFIG_ENABLE_LOAD_EXTENSION,
+    SQLITE_DBCONFIG_ENABLE_QPSG,
+    SQLITE_DBCONFIG_ENABLE_TRIGGER,
+    SQLITE_DBCONFIG_ENABLE_VIEW,
+    SQLITE_DBCONFIG_LEGACY_ALTER_TABLE,
+    SQLITE_DBCONFIG_LEGACY_FILE_FORMAT,
+    SQLITE_DBCONFIG_NO_CKPT_ON_CLOSE,
+    SQLITE_DBCONFIG_RESET_DATABASE,
+    SQLITE_DBCONFIG_TRIGGER_EQP,
+    SQLITE_DBCONFIG_TRUSTED_SCHEMA,
+    SQLITE_DBCONFIG_WRITABLE_SCHEMA,
+    SQLITE_DELETE,
+    SQLITE_DENY,
+    SQLITE_DETACH,
+    SQLITE_DONE,
+    SQLITE_DROP_INDEX,
+    SQLITE_DROP_TABLE,
+    SQLITE_DROP_TEMP_INDEX,
+    SQLITE_DROP_TEMP_TABLE,
+    SQLITE_DROP_TEMP_TRIGGER,
+    SQLITE_DROP_TEMP_VIEW,
+    SQLITE_DROP_TRIGGER,
+    SQLITE_DROP_VIEW,
+    SQLITE_DROP_VTABLE,
+    SQLITE_EMPTY,
+    SQLITE_ERROR,
+    SQLITE_ERROR_MISSING_COLLSEQ,
+    SQLITE_ERROR_RETRY,
+    SQLITE_ERROR_SNAPSHOT,
+    SQLITE_FORMAT,
+    SQLITE_FULL,
+    SQLITE_FUNCTION,
+    SQLITE_IGNORE,
+    SQLITE_INSERT,
+    SQLITE_INTERNAL,
+    SQLITE_INTERRUPT,
+    SQLITE_IOERR,
+    SQLITE_IOERR_ACCESS,
+    SQLITE_IOERR_AUTH,
+    SQLITE_IOERR_BEGIN_ATOMIC,
+    SQLITE_IOERR_BLOCKED,
+    SQLITE_IOERR_CHECKRESERVEDLOCK,
+    SQLITE_IOERR_CLOSE,
+    SQLITE_IOERR_COMMIT_ATOMIC,
+    SQLITE_IOERR_CONVPATH,
+    SQLITE_IOERR_CORRUPTFS,
+    SQLITE_IOERR_DATA,
+    SQLITE_IOERR_DELETE,
+    SQLITE_IOERR_DELETE_NOENT,
+    SQLITE_IOERR_DIR_CLOSE,
+    SQLITE_IOERR_DIR_FSYNC,
+    SQLITE_IOERR_FSTAT,
+    SQLITE_IOERR_FSYNC,
+    SQLITE_IOERR_GETTEMPPATH,
+    SQLITE_IOERR_LOCK,
+    SQLITE_IOERR_MMAP,
+    SQLITE_IOERR_NOMEM,
+    SQLITE_IOERR_RDLOCK,
+    SQLITE_IOERR_READ,
+    SQLITE_IOERR_ROLLBACK_ATOMIC,
+    SQLITE_IOERR_SEEK,
+    SQLITE_IOERR_SHMLOCK,
+    SQLITE_IOERR_SHMMAP,
+    SQLITE_IOERR_SHMOPEN,
+    SQLITE_IOERR_SHMSIZE,
+    SQLITE_IOERR_SHORT_READ,
+    SQLITE_IOERR_TRUNCATE,
+    SQLITE_IOERR_UNLOCK,
+    SQLITE_IOERR_VNODE,
+    SQLITE_IOERR_WRITE,
+    SQLITE_LIMIT_ATTACHED,
+    SQLITE_LIMIT_COLUMN,
+    SQLITE_LIMIT_COMPOUND_SELECT,
+    SQLITE_LIMIT_EXPR_DEPTH,
+    SQLITE_LIMIT_FUNCTION_ARG,
+    SQLITE_LIMIT_LENGTH,
+    SQLITE_LIMIT_LIKE_PATTERN_LENGTH,
+    SQLITE_LIMIT_SQL_LENGTH,
+    SQLITE_LIMIT_TRIGGER_DEPTH,
+    SQLITE_LIMIT_VARIABLE_NUMBER,
+    SQLITE_LIMIT_VDBE_OP,
+    SQLITE_LIMIT_WORKER_THREADS,
+    SQLITE_LOCKED,
+    SQLITE_LOCKED_SHAREDCACHE,
+    SQLITE_LOCKED_VTAB,
+    SQLITE_MISMATCH,
+    SQLITE_MISUSE,
+    SQLITE_NOLFS,
+    SQLITE_NOMEM,
+    SQLITE_NOTADB,
+    SQLITE_NOTFOUND,
+    SQLITE_NOTICE,
+    SQLITE_NOTICE_RECOVER_ROLLBACK,
+    SQLITE_NOTICE_RECOVER_WAL,
+    SQLITE_OK,
+    SQLITE_OK_LOAD_PERMANENTLY,
+    SQLITE_OK_SYMLINK,
+    SQLITE_PERM,
+    SQLITE_PRAGMA,
+    SQLITE_PROTOCOL,
+    SQLITE_RANGE,
+    SQLITE_READ,
+    SQLITE_READONLY,
+    SQLITE_READONLY_CANTINIT,
+    SQLITE_READONLY_CANTLOCK,
+    SQLITE_READONLY_DBMOVED,
+    SQLITE_READONLY_DIRECTORY,
+    SQLITE_READONLY_RECOVERY,
+    SQLITE_READONLY_ROLLBACK,
+    SQLITE_RECURSIVE,
+    SQLITE_REINDEX,
+    SQLITE_ROW,
+    SQLITE_SAVEPOINT,
+    SQLITE_SCHEMA,
+    SQLITE_SELECT,
+    SQLITE_TOOBIG,
+    SQLITE_TRANSACTION,
+    SQLITE_UPDATE,
+    SQLITE_WARNING,
+    SQLITE_WARNING_AUTOINDEX,
+    Time,
+    TimeFromTicks,
+    Timestamp,
+    TimestampFromTicks,
+    adapt,
+    adapters,
+    apilevel,
+    complete_statement,
+    connect,
+    converters,
+    enable_callback_tracebacks,
+    paramstyle,
+    register_adapter,
+    register_converter,
+    sqlite_version,
+    sqlite_version_info,
+    threadsafety,
+)
+
+import sqlite3.dbapi2 as dbapi2
+
+import statistics
+from statistics import (
+    NormalDist,
+    StatisticsError,
+    correlation,
+    covariance,
+    fmean,
+    geometric_mean,
+    harmonic_mean,
+    kde,
+    kde_random,
+    linear_regression,
+    mean,
+    median,
+    median_grouped,
+    median_high,
+    median_low,
+    mode,
+    multimode,
+    pstdev,
+    pvariance,
+    quantiles,
+    stdev,
+    variance,
+)
+
+from ..cached_property import (
+    async_cached_property,
+    cached_property,
+)
+
+import string
+from string import (
+    Formatter,
+    Template,
+    ascii_letters,
+    ascii_lowercase,
+    ascii_uppercase,
+    capwords,
+    digits,
+    hexdigits,
+    octdigits,
+    printable,
+    punctuation,
+    whitespace,
+)
+
+import struct
+from struct import (
+    Struct,
+    calcsize,
+    iter_unpack,
+    pack,
+    pack_into,
+    unpack,
+    unpack_from,
+)
+
+import subprocess
+from subprocess import (
+    CalledProcessError,
+    CompletedProcess,
+    DEVNULL,
+    PIPE,
+    Popen,
+    STDOUT,
+    SubprocessError,
+    TimeoutExpired,
+    call,
+    check_call,
+    check_output,
+    getoutput,
+    getstatusoutput,
+    run,
+)
+
+import sys
+from sys import (
+    abiflags,
+    activate_stack_trampoline,
+    addaudithook,
+    api_version,
+    argv,
+    audit,
+    base_exec_prefix,
+    base_prefix,
+    breakpointhook,
+    builtin_module_names,
+    byteorder,
+    call_tracing,
+    deactivate_stack_trampoline,
+    displayhook,
+    dont_write_bytecode,
+    exc_info,
+    exception,
+    exec_prefix,
+    executable,
+    flags,
+    float_info,
+    float_repr_style,
+    get_asyncgen_hooks,
+    get_coroutine_origin_tracking_depth,
+    get_int_max_str_digits,
+    getallocatedblocks,
+    getdefaultencoding,
+    getdlopenflags,
+    getfilesystemencodeerrors,
+    getfilesystemencoding,
+    getrecursionlimit,
+    getrefcount,
+    getsizeof,
+    getswitchinterval,
+    getunicodeinternedsize,
+    hash_info,
+    hexversion,
+    implementation,
+    int_info,
+    intern,
+    is_finalizing,
+    is_stack_trampoline_active,
+    maxsize,
+    maxunicode,
+    meta_path,
+    modules,
+    monitoring,
+    orig_argv,
+    path_hooks,
+    path_importer_cache,
+    platform,
+    platlibdir,
+    prefix,
+    pycache_prefix,
+    set_asyncgen_hooks,
+    set_coroutine_origin_tracking_depth,
+    set_int_max_str_digits,
+    setdlopenflags,
+    setrecursionlimit,
+    setswitchinterval,
+    stderr,
+    stdin,
+    stdlib_module_names,
+    stdout,
+    thread_info,
+    unraisablehook,
+    version,
+    version_info,
+    warnoptions,
+)
+
+import tempfile
+from tempfile import (
+    NamedTemporaryFile,
+    SpooledTemporaryFile,
+    TMP_MAX,
+    TemporaryDirectory,
+    TemporaryFile,
+    gettempdir,
+    gettempdirb,
+    gettempprefix,
+    gettempprefixb,
+    mkdtemp,
+    mkstemp,
+    mktemp,
+    tempdir,
+)
+
+import textwrap
+from textwrap import (
+    TextWrapper,
+    dedent,
+    fill,
+    indent,
+    shorten,
+    wrap,
+)
+
+import threading
+from threading import (
+    Barrier,
+    BoundedSemaphore,
+    BrokenBarrierError,
+    Condition,
+    Event,
+    ExceptHookArgs,
+    Lock,
+    RLock,
+    Semaphore,
+    TIMEOUT_MAX,
+    Thread,
+    ThreadError,
+    active_count,
+    current_thread,
+    excepthook,
+    get_ident,
+    get_native_id,
+    getprofile,
+    gettrace,
+    local,
+    main_thread,
+    setprofile,
+    setprofile_all_threads,
+    settrace,
+    settrace_all_threads,
+    stack_size,
+)
+
+import time
+from time import (
+    CLOCK_BOOTTIME,
+    CLOCK_MONOTONIC,
+    CLOCK_MONOTONIC_RAW,
+    CLOCK_PROCESS_CPUTIME_ID,
+    CLOCK_REALTIME,
+    CLOCK_TAI,
+    CLOCK_THREAD_CPUTIME_ID,
+    altzone,
+    asctime,
+    clock_getres,
+    clock_gettime,
+    clock_gettime_ns,
+    clock_settime,
+    clock_settime_ns,
+    ctime,
+    daylight,
+    get_clock_info,
+    gmtime,
+    localtime,
+    mktime,
+    monotonic,
+    monotonic_ns,
+    perf_counter,
+    perf_counter_ns,
+    process_time,
+    process_time_ns,
+    pthread_getcpuclockid,
+    sleep,
+    strftime,
+    strptime,
+    struct_time,
+    thread_time,
+    thread_time_ns,
+    time_ns,
+    timezone,
+    tzname,
+    tzset,
+)
+
+from timeit import (
+    Timer,
+    default_timer,
+    timeit,
+)
+
+import tomllib
+from tomllib import (
+    TOMLDecodeError,
+    load,
+    loads,
+)
+
+import traceback
+from traceback import (
+    FrameSummary,
+    StackSummary,
+    TracebackException,
+    clear_frames,
+    extract_stack,
+    extract_tb,
+    format_exc,
+    format_exception,
+    format_exception_only,
+    format_list,
+    format_stack,
+    format_tb,
+    print_exc,
+    print_exception,
+    print_last,
+    print_stack,
+    print_tb,
+    walk_stack,
+    walk_tb,
+)
+
+import types
+from types import (
+    AsyncGeneratorType,
+    BuiltinFunctionType,
+    BuiltinMethodType,
+    CapsuleType,
+    CellType,
+    ClassMethodDescriptorType,
+    CodeType,
+    CoroutineType,
+    DynamicClassAttribute,
+    EllipsisType,
+    FrameType,
+    FunctionType,
+    GeneratorType,
+    GenericAlias,
+    GetSetDescriptorType,
+    LambdaType,
+    MappingProxyType,
+    MemberDescriptorType,
+    MethodDescriptorType,
+    MethodType,
+    MethodWrapperType,
+    ModuleType,
+    NoneType,
+    NotImplementedType,
+    SimpleNamespace,
+    TracebackType,
+    UnionType,
+    WrapperDescriptorType,
+    coroutine,
+    get_original_bases,
+    new_class,
+    prepare_class,
+    resolve_bases,
+)
+
+import typing
+from typing import (
+    AbstractSet,
+    Annotated,
+    Any,
+    AnyStr,
+    AsyncContextManager,
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    BinaryIO,
+    ByteString,
+    Callable,
+    ChainMap,
+    ClassVar,
+    Collection,
+    Concatenate,
+    Container,
+    ContextManager,
+    Coroutine,
+    Counter,
+    DefaultDict,
+    Deque,
+    Dict,
+    Final,
+    ForwardRef,
+    FrozenSet,
+    Generator,
+    Generic,
+    Hashable,
+    IO,
+    ItemsView,
+    Iterable,
+    Iterator,
+    KeysView,
+    List,
+    Literal,
+    LiteralString,
+    Mapping,
+    MappingView,
+    Match,
+    MutableMapping,
+    MutableSequence,
+    MutableSet,
+    NamedTuple,
+    Never,
+    NewType,
+    NoDefault,
+    NoReturn,
+    NotRequired,
+    Optional,
+    OrderedDict,
+    ParamSpec,
+    ParamSpecArgs,
+    ParamSpecKwargs,
+    Pattern,
+    Protocol,
+    ReadOnly,
+    Required,
+    Reversible,
+    Self,
+    Sequence,
+    Set,
+    Sized,
+    SupportsAbs,
+    SupportsBytes,
+    SupportsComplex,
+    SupportsFloat,
+    SupportsIndex,
+    SupportsInt,
+    SupportsRound,
+    TYPE_CHECKING,
+    Text,
+    TextIO,
+    Tuple,
+    Type,
+    TypeAlias,
+    TypeAliasType,
+    TypeGuard,
+    TypeIs,
+    TypeVar,
+    TypeVarTuple,
+    TypedDict,
+    Union,
+    Unpack,
+    ValuesView,
+    assert_never,
+    assert_type,
+    cast,
+    clear_overloads,
+    dataclass_transform,
+    final,
+    get_args,
+    get_origin,
+    get_overloads,
+    get_protocol_members,
+    get_type_hints,
+    is_protocol,
+    is_typeddict,
+    no_type_check,
+    no_type_check_decorator,
+    overload,
+    override,
+    reveal_type,
+    runtime_checkable,
+)
+
+import unicodedata
+from unicodedata import (
+    UCD,
+    bidirectional,
+    category,
+    combining,
+    decimal,
+    decomposition,
+    digit,
+    east_asian_width,
+    is_normalized,
+    lookup,
+    mirrored,
+    name,
+    normalize,
+    numeric,
+    ucd_3_2_0,
+    unidata_version,
+)
+
+import urllib
+
+import urllib.parse as parse
+from urllib.parse import (
+    DefragResult,
+    DefragResultBytes,
+    ParseResult,
+    ParseResultBytes,
+    SplitResult,
+    SplitResultBytes,
+    parse_qs,
+    parse_qsl,
+    quote,
+    quote_from_bytes,
+    quote_plus,
+    unquote,
+    unquote_plus,
+    unquote_to_bytes,
+    urldefrag,
+    urlencode,
+    urljoin,
+    urlparse,
+    urlsplit,
+    urlunparse,
+    urlunsplit,
+)
+
+import uuid
+from uuid import (
+    Enum,
+    NAMESPACE_DNS,
+    NAMESPACE_OID,
+    NAMESPACE_URL,
+    NAMESPACE_X500,
+    RESERVED_FUTURE,
+    RESERVED_MICROSOFT,
+    RESERVED_NCS,
+    RFC_4122,
+    SafeUUID,
+    UUID,
+    bytes_,
+    getnode,
+    int_,
+    main,
+    uuid1,
+    uuid3,
+    uuid4,
+    uuid5,
+)
+
+import warnings
+from warnings import (
+    catch_warnings,
+    deprecated,
+    filterwarnings,
+    formatwarning,
+    resetwarnings,
+    showwarning,
+    simplefilter,
+    warn,
+    warn_explicit,
+)
+
+import weakref
+from weakref import (
+    CallableProxyType,
+    ProxyType,
+    ProxyTypes,
+    ReferenceType,
+    WeakKeyDictionary,
+    WeakMethod,
+    WeakSet,
+    WeakValueDictionary,
+    finalize,
+    getweakrefcount,
+    getweakrefs,
+    proxy,
+    ref,
+)
+
+import xml
+
+import xml.dom as dom
+
+import xml.etree as etree
+
+import xml.parsers as parsers
+
+import xml.sax as sax
+
+import zipfile
+from zipfile import (
+    BadZipFile,
+    BadZipfile,
+    LargeZipFile,
+    PyZipFile,
+    ZIP_BZIP2,
+    ZIP_DEFLATED,
+    ZIP_LZMA,
+    ZIP_STORED,
+    ZipFile,
+    ZipInfo,
+    is_zipfile,
+)
+
+import zlib
+from zlib import (
+    DEFLATED,
+    DEF_BUF_SIZE,
+    DEF_MEM_LEVEL,
+    MAX_WBITS,
+    ZLIB_RUNTIME_VERSION,
+    ZLIB_VERSION,
+    Z_BEST_COMPRESSION,
+    Z_BEST_SPEED,
+    Z_BLOCK,
+    Z_DEFAULT_COMPRESSION,
+    Z_DEFAULT_STRATEGY,
+    Z_FILTERED,
+    Z_FINISH,
+    Z_FIXED,
+    Z_FULL_FLUSH,
+    Z_HUFFMAN_ONLY,
+    Z_NO_COMPRESSION,
+    Z_NO_FLUSH,
+    Z_PARTIAL_FLUSH,
+    Z_RLE,
+    Z_SYNC_FLUSH,
+    Z_TREES,
+    adler32,
+    compressobj,
+    crc32,
+    decompress,
+    decompressobj,
+)
+
+import zoneinfo
+from zoneinfo import (
+    InvalidTZPathWarning,
+    TZPATH,
+    ZoneInfo,
+    ZoneInfoNotFoundError,
+    available_timezones,
+    reset_tzpath,
+)
+
+import datetime as _module_datetime
+fromisoformat = _module_datetime.datetime.fromisoformat
+fromtimestamp = _module_datetime.datetime.fromtimestamp
+
+_FINGERPRINT = ('cpython', (3, 13), 'linux')
@@ -0,0 +1,143 @@
+"""`stdlb run` client: run a script in a child forked from a warm `stdlb serve` interpreter.
+
+Sends the script's argv, the cwd, the environment and stdin/stdout/stderr (as file
+descriptors, over a Unix socket) to the server (see `zygote.py`), forwards
+SIGINT/SIGTERM/SIGHUP/SIGQUIT to the child, and exits with its status. If no
+server is listening, execs `python script.py` instead. So does a server that isn't
+trusted (see `check_server`): nothing is sent unless the socket's directory is
+the user's own, and the process listening on it runs as the user.
+
+It only imports modules built into the interpreter, so it can also run without
+`site` (and without importing `stdlb`), which is the fastest way to start it:
+
+```bash
+python -S -E path/to/stdlb/_zygote_client.py script.py [args]
+```
+"""
+import _signal
+import _socket
+import os
+import sys
+
+FORWARDED_SIGNALS = (_signal.SIGINT, _signal.SIGTERM, _signal.SIGHUP, _signal.SIGQUIT)
+
+
+def socket_path():
+    """`$STDLB_ZYGOTE_SOCKET`, or `stdlb-zygote.sock` in `$XDG_RUNTIME_DIR` (else a per-user dir in /tmp)."""
+    path = os.environ.get('STDLB_ZYGOTE_SOCKET')
+    if path:
+        return path
+    return os.path.join(os.environ.get('XDG_RUNTIME_DIR') or f"/tmp/stdlb-{os.getuid()}", 'stdlb-zygote.sock')
+
+
+def check_socket_dir(path):
+    """Why the directory of socket `path` can't be trusted (another user could have created it), or None.
+
+    It must be a directory (not a symlink) owned by the current user, which no other
+    user can access, so that no one else can have bound (or replaced) the socket.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    st = os.lstat(directory)
+    if st.st_mode & 0o170000 != 0o040000:  # S_IFMT, S_IFDIR: `stat` isn't built in
+        return f"{directory} is not a directory"
+    if st.st_uid != os.getuid():
+        return f"{directory} is owned by uid {st.st_uid}, not {os.getuid()}"
+    if st.st_mode & 0o077:
+        return f"{directory} is accessible to other users (mode {st.st_mode & 0o777:o}, should be 700)"
+    return None
+
+
+def peer_uid(sock):
+    """The uid of the process at the other end of Unix socket `sock` (None if the platform can't tell)."""
+    if sys.platform.startswith('linux'):
+        # struct ucred {pid_t pid; uid_t uid; gid_t gid;}
+        data = sock.getsockopt(_socket.SOL_SOCKET, _socket.SO_PEERCRED, 12)
+    elif sys.platform == 'darwin':
+        # getsockopt(SOL_LOCAL, LOCAL_PEERCRED): struct xucred {u_int cr_version; uid_t cr_uid; ...}
+        data = sock.getsockopt(0, getattr(_socket, 'LOCAL_PEERCRED', 1), 76)
+    else:
+        return None
+    return int.from_bytes(data[4:8], sys.byteorder)
+
+
+def check_server(sock, path):
+    """Why the server connected to at `path` can't be sent the environment and stdio, or None."""
+    try:
+        problem = check_socket_dir(path)
+    except OSError as e:
+        return str(e)
+    if problem:
+        return problem
+    uid = peer_uid(sock)
+    if uid is None:
+        return f"can't check the server's uid on {sys.platform}"
+    if uid != os.getuid():
+        return f"the server runs as uid {uid}, not {os.getuid()}"
+    return None
+
+
+def recv_exactly(sock, size):
+    """`size` bytes from `sock`, or fewer if it closes first."""
+    data = b''
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            break
+        data += chunk
+    return data
+
+
+def run(argv, path=None):
+    """Run `argv` (`[script, *args]`) via the server at `path`; returns the exit status, or None if none is listening (or it isn't trusted)."""
+    path = path or socket_path()
+    sock = _socket.socket(_socket.AF_UNIX, _socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+    except OSError:
+        sock.close()
+        return None
+    problem = check_server(sock, path)
+    if problem:
+        sock.close()
+        print(f"stdlb run: not using the server at {path}: {problem}", file=sys.stderr)
+        return None
+    request = repr({'argv': list(argv), 'cwd': os.getcwd(), 'env': dict(os.environ)})
+    payload = request.encode('utf-8', 'surrogateescape')
+    message = len(payload).to_bytes(4, 'little') + payload
+    fds = b''.join(fd.to_bytes(4, sys.byteorder) for fd in (0, 1, 2))
+    sent = sock.sendmsg([message], [(_socket.SOL_SOCKET, _socket.SCM_RIGHTS, fds)])
+    sock.sendall(message[sent:])
+
+    pid = recv_exactly(sock, 4)
+    if len(pid) < 4:
+        print('stdlb run: the server closed the connection', file=sys.stderr)
+        return 1
+    pid = int.from_bytes(pid, 'little')
+
+    def forward(signum, frame):
+        os.kill(pid, signum)
+
+    for signum in FORWARDED_SIGNALS:
+        _signal.signal(signum, forward)
+    status = recv_exactly(sock, 4)
+    sock.close()
+    if len(status) < 4:
+        print(f"stdlb run: process {pid} exited without a status (killed by a signal?)", file=sys.stderr)
+        return 1
+    return int.from_bytes(status, 'little', signed=True)
+
+
+def main(args=None):
+    args = sys.argv[1:] if args is None else args
+    if not args:
+        print('usage: stdlb run script.py [args]', file=sys.stderr)
+        return 2
+    status = run(args)
+    if status is None:
+        # No server: run the script cold
+        os.execv(sys.executable, [sys.executable, *args])
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,137 @@
+"""Audit the I/O that importing stdlb does: `python -m stdlb.audit_io`.
+
+Imports `from stdlb import *` (or `-t <target>`) in a fresh interpreter with a
+`sys.addaudithook` hook installed first, and records every file open, directory
+listing, process spawn and socket operation, by the module whose top-level code
+triggered it. Events raised by the import system itself (reading `.py`/`.pyc` files,
+listing `sys.path` directories) are "module loading", and are reported separately
+from I/O done by modules' own code (e.g. reading `/etc/mime.types`, or running a
+subprocess to query the platform), which is what shows up as startup jitter on
+network filesystems and in containers.
+
+```
+python -m stdlb.audit_io              # report
+python -m stdlb.audit_io --check      # exit 1 if anything does I/O beyond module loading
+python -m stdlb.audit_io -t stdlb.core --json audit.json
+```
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# Audit events that are recorded (an entry ending in '.' matches every event with that prefix)
+EVENTS = (
+    'open', 'os.listdir', 'os.scandir', 'os.chdir', 'os.mkdir', 'os.remove', 'os.rename',
+    'os.system', 'os.exec', 'os.fork', 'os.forkpty', 'os.posix_spawn', 'os.spawn',
+    'os.startfile', 'subprocess.Popen', 'ctypes.dlopen', 'socket.',
+)
+
+# Runs in the audited interpreter: only `sys` is imported before the hook is installed,
+# so everything else (including `import stdlb` itself) is audited
+CHILD_SCRIPT = '''
+import sys
+EVENTS = {events!r}
+exact = frozenset(e for e in EVENTS if not e.endswith('.'))
+prefixes = tuple(e for e in EVENTS if e.endswith('.'))
+records = []
+recording = True
+
+def describe(args):
+    # Socket objects' reprs query the socket; describe them by type only
+    return ', '.join(type(a).__name__ if type(a).__name__ == 'socket' else repr(a) for a in args)[:300]
+
+def hook(event, args):
+    if not recording or not (event in exact or event.startswith(prefixes)):
+        return
+    frame = sys._getframe(1)
+    code = frame.f_code
+    loading = code.co_filename.startswith(('<frozen importlib', '<frozen zipimport'))
+    caller = f"{{code.co_filename}}:{{frame.f_lineno}} ({{code.co_name}})"
+    while frame is not None and frame.f_code.co_name != '<module>':
+        frame = frame.f_back
+    module = frame.f_globals.get('__name__') if frame is not None else None
+    records.append([event, describe(args), module, loading, caller])
+
+sys.addaudithook(hook)
+exec({statement!r}, {{'__name__': '__main__'}})
+recording = False
+import json
+print(json.dumps(records))
+'''
+
+
+def run_audit(target='stdlb', python=sys.executable):
+    """Audit events raised while star-importing `target` in a fresh interpreter.
+
+    Returns a list of `{'event', 'args', 'module', 'loading', 'caller'}` dicts, in the
+    order they were raised. `module` is the module whose top-level code (transitively)
+    raised the event (`'__main__'` for `import stdlb` itself), and `loading` is whether
+    the import system raised it while finding or loading a module.
+    """
+    src_dir = str(Path(__file__).parent.parent)
+    pythonpath = os.pathsep.join(filter(None, [src_dir, os.environ.get('PYTHONPATH')]))
+    env = dict(os.environ, PYTHONPATH=pythonpath)
+    code = CHILD_SCRIPT.format(events=EVENTS, statement=f"from {target} import *")
+    result = subprocess.run([python, '-c', code], capture_output=True, text=True, env=env, check=True)
+    keys = ('event', 'args', 'module', 'loading', 'caller')
+    return [dict(zip(keys, record)) for record in json.loads(result.stdout)]
+
+
+def summarize(records):
+    """Group audit records by triggering module: loading-event counts, and other I/O."""
+    modules = {}
+    for record in records:
+        module = modules.setdefault(record['module'], {'loading': {}, 'io': []})
+        if record['loading']:
+            module['loading'][record['event']] = module['loading'].get(record['event'], 0) + 1
+        else:
+            module['io'].append({k: record[k] for k in ('event', 'args', 'caller')})
+    return modules
+
+
+def io_beyond_loading(records):
+    """Records of I/O done by modules' own code, i.e. not by the import system."""
+    return [record for record in records if not record['loading']]
+
+
+def format_report(target, modules):
+    loading = sum(sum(m['loading'].values()) for m in modules.values())
+    io = sum(len(m['io']) for m in modules.values())
+    lines = [f"`from {target} import *`: {loading} module-loading events, {io} other I/O events", '']
+    for name, module in sorted(modules.items(), key=lambda item: (-len(item[1]['io']), str(item[0]))):
+        counts = ', '.join(f"{event} ×{n}" for event, n in sorted(module['loading'].items()))
+        lines.append(f"{name}: {len(module['io'])} I/O" + (f"; imports: {counts}" if counts else ''))
+        for event in module['io']:
+            lines.append(f"    {event['event']}({event['args']})  at {event['caller']}")
+    return '\n'.join(lines)
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(prog='python -m stdlb.audit_io', description=__doc__.split('\n\n')[0])
+    parser.add_argument('-t', '--target', default='stdlb', help='Module to star-import (default: %(default)s), e.g. stdlb.core')
+    parser.add_argument('-p', '--python', default=sys.executable, help='Interpreter to audit (default: this one)')
+    parser.add_argument('-c', '--check', action='store_true', help='Exit 1 if any module does I/O beyond module loading')
+    parser.add_argument('-j', '--json', metavar='PATH', help="Also write the report as JSON ('-' for stdout)")
+    args = parser.parse_args(args)
+
+    records = run_audit(args.target, args.python)
+    modules = summarize(records)
+    if args.json == '-':
+        json.dump(modules, sys.stdout, indent=2)
+        print()
+    else:
+        print(format_report(args.target, modules))
+        if args.json:
+            with open(args.json, 'w') as f:
+                json.dump(modules, f, indent=2)
+                f.write('\n')
+    if args.check and io_beyond_loading(records):
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,16 +1,457 @@
+from _thread import RLock as _RLock, allocate_lock as _allocate_lock
+from _weakref import ref as _ref
+from time import monotonic as _monotonic
+
+
+class _Slotted:
+    __slots__ = ('slot',)
+
+
+_MemberDescriptorType = type(_Slotted.slot)
+
+
+class _Entry(_ref):
+    """A `cached_property` table entry: a weak reference to the instance, holding its key and value."""
+    __slots__ = ('key', 'value')
+
+    def __new__(cls, instance, callback, key, value):
+        return super().__new__(cls, instance, callback)
+
+    def __init__(self, instance, callback, key, value):
+        super().__init__(instance, callback)
+        self.key = key
+        self.value = value
+
+
+class _Checked:
+    """A `ttl`/`depends_on` value cached in an instance's `__dict__`, with its deadline and `(name, value)` of its dependencies."""
+    __slots__ = ('value', 'expires', 'depends')
+
+    def __init__(self, value, expires, depends):
+        self.value = value
+        self.expires = expires
+        self.depends = depends
+
+    def __reduce__(self):
+        # Deadlines are `time.monotonic` values, which mean nothing in another process
+        expires = None if self.expires is None else float('-inf')
+        return _Checked, (self.value, expires, self.depends)
+
+
+class _CheckedEntry(_Entry):
+    """A table entry for a `ttl`/`depends_on` property: also holds its deadline, and `(name, value)` of its dependencies."""
+    __slots__ = ('expires', 'depends')
+
+    def __new__(cls, instance, callback, key, value, expires, depends):
+        return super().__new__(cls, instance, callback, key, value)
+
+    def __init__(self, instance, callback, key, value, expires, depends):
+        super().__init__(instance, callback, key, value)
+        self.expires = expires
+        self.depends = depends
+
+
+_MISSING = object()
+
+
+class _InstanceLock:
+    """A reentrant lock for computing one instance's value, flagged while checking for a cached one."""
+    __slots__ = ('rlock', 'checking')
+
+    def __init__(self):
+        self.rlock = _RLock()
+        self.checking = False
+
+    def __enter__(self):
+        self.rlock.acquire()
+
+    def __exit__(self, *exc):
+        self.rlock.release()
+
+
 class cached_property:
     """@cached_property annotation without unnecessary/unserializable lock found in functools.cached_property.
 
     See https://github.com/python/cpython/issues/87634.
     Based on code from David Beazley's "Python Cookbook" / https://stackoverflow.com/q/62160411/544236.
+
+    Where the value is cached:
+    - instances with a `__dict__`: in it, under the property's name, so later reads
+      are plain attribute lookups (`del obj.name` recomputes on the next read);
+    - `@cached_property(slot='_name')`: in that (otherwise unused) slot. The class's
+      `name` attribute becomes the slot itself, so later reads are plain slot reads;
+      the first read falls through to a `__getattr__` installed on the class (which
+      defers to the class's own `__getattr__`, if any, for other names). With
+      `@dataclass(slots=True)`, declare the slot as a field, e.g.
+      `_name: float = field(init=False, repr=False, compare=False)`;
+    - `@cached_property(table=True)`, for instances without a `__dict__` (which must
+      have a `__weakref__` slot, e.g. `@dataclass(slots=True, weakref_slot=True)`): in
+      a table on the property, keyed by `id(instance)`; entries are dropped when the
+      instance is garbage-collected. The table holds values strongly, from the class,
+      so a value that refers back to its instance (e.g. a bound method, or a child
+      object with a parent link) keeps the instance alive for as long as the class,
+      which is why it has to be asked for. Without `slot=` or `table=True`, instances
+      without a `__dict__` raise TypeError.
+
+    `reserve=True` keeps instances' `__dict__`s compact. CPython stores the attributes
+    of a class's instances as arrays of values over keys shared by the class, sized
+    when each instance is created; an attribute added once instances exist (as a
+    cached value is) doesn't fit, and turns the instance's dict into a full one.
+    Instead, the property's name is added to the class's shared keys when the class
+    is created (and for subclasses, on their first read), and values are stored with
+    `object.__setattr__`, so every instance has room for them, with or without them
+    computed. Subclass instances created before their class's first read aren't covered.
+    This only saves memory from Python 3.11, whose instances store their values inline;
+    earlier versions give each instance a dict of its own either way.
+
+    `lock=True` computes each instance's value once, even if several threads read it
+    at once: the first computes it while the others wait, then find it cached. Locks
+    are per instance and property, and only exist while a value is being computed
+    (they're kept on the property, so instances stay picklable); reading a cached
+    value takes no lock. Unlike `functools.cached_property` before Python 3.12, threads
+    computing different instances' values don't wait for each other.
+
+    `ttl=seconds` recomputes a value read more than `ttl` seconds (by `time.monotonic`)
+    after it was computed, and `depends_on=('attr', ...)` one read after any of those
+    attributes was reassigned (to another object) since. Such values are cached with
+    their deadline and dependencies under another key (`'<name>@cached'`) of the
+    instance's `__dict__` (or in the table, with `table=True`), so every read goes through the
+    property to check them. A `ttl` value is stale once unpickled.
+    `stdlb.invalidate(obj, *names)` (also `cached_property.invalidate`) drops cached values in any mode.
     """
-    def __init__(self, func):
+    def __init__(self, func=None, *, slot=None, reserve=False, lock=False, ttl=None, depends_on=(), table=False):
+        if (ttl is not None or depends_on) and (slot is not None or reserve):
+            raise ValueError("cached_property: ttl/depends_on can't be combined with slot/reserve, which cache values where reads bypass the property")
+        if table and slot is not None:
+            raise ValueError("cached_property: table and slot are alternative places to cache values of instances without a __dict__")
+        self.func = None
+        self.slot = slot
+        self.table = table
+        self.reserve = reserve
+        self.lock = lock
+        self.ttl = ttl
+        self.depends_on = tuple(depends_on)
+        self._checked = ttl is not None or bool(self.depends_on)
+        self.name = None
+        self._key = None
+        self._table = None
+        self._reserved = set()
+        # With `lock`: {id(instance): _InstanceLock} for values being computed
+        self._locks = {}
+        self._locks_lock = _allocate_lock()
+        if func is not None:
+            self(func)
+
+    def __call__(self, func):
+        """Wrap `func`, for use with options: `@cached_property(slot='_area')`."""
+        if self.func is not None:
+            raise TypeError(f"cached_property {self.name!r} already wraps {self.func!r}")
         self.__doc__ = getattr(func, '__doc__')
         self.func = func
+        self._set_name(func.__name__)
+        return self
+
+    def _set_name(self, name):
+        self.name = name
+        if self._checked:
+            # Not an identifier, so it can't collide with (or be shadowed by) attributes
+            self._key = f"{name}@cached"
+
+    def __set_name__(self, owner, name):
+        self._set_name(name)
+        if self.slot is not None and isinstance(owner.__dict__.get(self.slot), _MemberDescriptorType):
+            _install_slot(owner, name, self)
+        elif self.reserve:
+            _reserve(owner, name)
+            self._reserved.add(owner)
 
     def __get__(self, instance, cls):
         if instance is None:
             return self
+        if self.slot is not None:
+            # The slot wasn't found on the class when the property was bound to it
+            try:
+                return getattr(instance, self.slot)
+            except AttributeError:
+                pass
+        elif self._checked:
+            try:
+                entry = instance.__dict__[self._key]
+            except (AttributeError, KeyError):
+                entry = self._table.get(id(instance)) if self._table is not None else None
+            if entry is not None:
+                # Inlined (rather than a method), as it runs on every read
+                expires = entry.expires
+                if expires is None or _monotonic() < expires:
+                    for name, value in entry.depends:
+                        if getattr(instance, name) is not value:
+                            break
+                    else:
+                        return entry.value
+        elif self._table is not None:
+            try:
+                return self._table[id(instance)].value
+            except KeyError:
+                pass
+        return self.compute(instance)
+
+    def compute(self, instance):
+        """Compute the value for `instance` (which has none cached), and cache it."""
+        if self.lock:
+            return self._compute_locked(instance)
+        return self._compute(instance)
+
+    def _compute(self, instance):
+        if not self._checked:
+            return self._store(instance, self.func(instance))
+        # The values the computation sees
+        depends = tuple((name, getattr(instance, name)) for name in self.depends_on)
+        value = self.func(instance)
+        expires = None if self.ttl is None else _monotonic() + self.ttl
+        try:
+            namespace = instance.__dict__
+        except AttributeError:
+            return self._set_in_table(instance, value, expires, depends)
+        namespace[self._key] = _Checked(value, expires, depends)
+        return value
+
+    def _invalidate(self, instance):
+        """Drop `instance`'s cached value, if any, so that it's recomputed on the next read."""
+        if self.slot is not None:
+            name = self.slot
         else:
-            value = instance.__dict__[self.func.__name__] = self.func(instance)
+            if self._table is not None:
+                self._table.pop(id(instance), None)
+            name = self._key if self._checked else self.name
+        try:
+            object.__delattr__(instance, name)
+        except AttributeError:
+            pass
+
+    def _compute_locked(self, instance):
+        """`compute`, once per instance: threads that race to compute a value wait for the first.
+
+        The lock is only held (in `_locks`, not on the instance) while computing; a thread
+        that then acquires it finds the value cached (double-checked locking).
+        """
+        key = id(instance)
+        with self._locks_lock:
+            lock = self._locks.get(key)
+            if lock is None:
+                lock = self._locks[key] = _InstanceLock()
+        with lock:
+            if lock.checking:
+                # Called back by the check below: nothing cached
+                return _MISSING
+            lock.checking = True
+            try:
+                value = object.__getattribute__(instance, self.name)
+            except AttributeError:
+                value = _MISSING
+            finally:
+                lock.checking = False
+            try:
+                if value is _MISSING:
+                    value = self._compute(instance)
+                return value
+            finally:
+                # Also when computing raised, so `_locks` doesn't keep the failed id
+                with self._locks_lock:
+                    if self._locks.get(key) is lock:
+                        del self._locks[key]
+
+    def _store(self, instance, value):
+        """Cache `value` for `instance`, and return it."""
+        if self.slot is not None:
+            object.__setattr__(instance, self.slot, value)
             return value
+        if self.reserve:
+            # Reading `instance.__dict__` would create a dict object for it
+            cls = type(instance)
+            if cls not in self._reserved:
+                _reserve(cls, self.name)
+                self._reserved.add(cls)
+            try:
+                object.__setattr__(instance, self.name, value)
+            except AttributeError:
+                # No __dict__
+                return self._set_in_table(instance, value)
+            return value
+        try:
+            namespace = instance.__dict__
+        except AttributeError:
+            return self._set_in_table(instance, value)
+        namespace[self.name] = value
+        return value
+
+    def _set_in_table(self, instance, value, *checks):
+        if not self.table:
+            raise TypeError(
+                f"cached_property {self.name!r}: {type(instance).__name__!r} instances have no __dict__; pass a "
+                "slot to cache the value in (cached_property(slot=...)), or cache it in a table on the property "
+                "(cached_property(table=True), which needs a __weakref__ slot, and keeps alive instances whose "
+                "value refers back to them)"
+            )
+        if self._table is None:
+            # One bound method for every entry's callback
+            self._table, self._evict_entry = {}, self._evict
+        key = id(instance)
+        entry_type = _CheckedEntry if checks else _Entry
+        try:
+            self._table[key] = entry_type(instance, self._evict_entry, key, value, *checks)
+        except TypeError:
+            raise TypeError(
+                f"cached_property {self.name!r}: {type(instance).__name__!r} instances have no __dict__ or "
+                "__weakref__ slot; pass a slot to cache the value in (cached_property(slot=...)), or add "
+                "'__weakref__' to __slots__ (weakref_slot=True for dataclasses)"
+            ) from None
+        return value
+
+    def _evict(self, entry):
+        if self._table.get(entry.key) is entry:
+            del self._table[entry.key]
+
+
+class _Cached:
+    """Awaitable for a cached value."""
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __await__(self):
+        return self.value
+        yield
+
+
+class async_cached_property:
+    """@async_cached_property: an `async def` property, awaited once per instance.
+
+    `await obj.name` runs the coroutine the first time, and caches its result in the
+    instance's `__dict__`; later awaits return it without suspending. Concurrent
+    awaits (before the result is cached) share one task, which each awaits through
+    `asyncio.shield` (so one awaiter's cancellation doesn't cancel the others'). If the
+    coroutine raises, nothing is cached, and the next await runs it again.
+
+    In-flight tasks are kept on the property, keyed by `id(instance)`, so instances
+    only ever hold plain values, and stay picklable. `obj.name = value` sets the
+    cached value, and `del obj.name` clears it.
+    """
+    def __init__(self, func):
+        self.__doc__ = getattr(func, '__doc__')
+        self.func = func
+        self.name = func.__name__
+        self._tasks = {}
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, cls):
+        if instance is None:
+            return self
+        try:
+            return _Cached(instance.__dict__[self.name])
+        except KeyError:
+            return self._await(instance)
+
+    def __set__(self, instance, value):
+        instance.__dict__[self.name] = value
+
+    def __delete__(self, instance):
+        try:
+            del instance.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+
+    def _invalidate(self, instance):
+        """Drop `instance`'s cached value, if any, so that it's recomputed on the next await."""
+        instance.__dict__.pop(self.name, None)
+
+    async def _await(self, instance):
+        import asyncio
+
+        key = id(instance)
+        task = self._tasks.get(key)
+        if task is None:
+            task = self._tasks[key] = asyncio.ensure_future(self._compute(instance))
+
+            def done(_):
+                if self._tasks.get(key) is task:
+                    del self._tasks[key]
+
+            task.add_done_callback(done)
+        return await asyncio.shield(task)
+
+    async def _compute(self, instance):
+        value = await self.func(instance)
+        instance.__dict__[self.name] = value
+        return value
+
+
+def invalidate(obj, *names):
+    """Drop `obj`'s cached values of the cached properties `names` (default: all of them).
+
+    Each is recomputed on its next read. Works with `cached_property` (in any mode) and
+    `async_cached_property`; names that aren't cached properties of `obj`'s class
+    raise AttributeError.
+    """
+    properties = _cached_properties(type(obj))
+    for name in names or properties:
+        try:
+            prop = properties[name]
+        except KeyError:
+            raise AttributeError(f"{type(obj).__name__!r} object has no cached property {name!r}") from None
+        prop._invalidate(obj)
+
+
+cached_property.invalidate = staticmethod(invalidate)
+
+
+def _cached_properties(cls):
+    """`{name: property}` for the cached properties of `cls` (and its bases, unless overridden)."""
+    attrs = {}
+    for klass in cls.__mro__:
+        namespace = vars(klass)
+        # Slot-backed properties' names are bound to their slots (see `_install_slot`)
+        hooked = getattr(namespace.get('__getattr__'), 'cached_properties', {})
+        for name, attr in namespace.items():
+            if name not in attrs:
+                attrs[name] = hooked.get(name, attr)
+    return {
+        name: attr for name, attr in attrs.items()
+        if isinstance(attr, (cached_property, async_cached_property))
+    }
+
+
+def _install_slot(owner, name, prop):
+    """Replace `owner.<name>` with `prop`'s slot, and compute missing values in `owner.__getattr__`."""
+    hook = owner.__dict__.get('__getattr__')
+    if getattr(hook, 'cached_properties', None) is None:
+        fallback = getattr(owner, '__getattr__', None)
+        properties = {}
+
+        def __getattr__(self, attr):
+            prop = properties.get(attr)
+            if prop is not None:
+                return prop.compute(self)
+            if fallback is not None:
+                return fallback(self, attr)
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {attr!r}")
+
+        __getattr__.cached_properties = properties
+        __getattr__.__qualname__ = f"{owner.__qualname__}.__getattr__"
+        owner.__getattr__ = hook = __getattr__
+    hook.cached_properties[name] = prop
+    setattr(owner, name, owner.__dict__[prop.slot])
+
+
+def _reserve(cls, name):
+    """Add `name` to the keys `cls`'s instances' dicts share (by setting it on a throwaway instance)."""
+    if getattr(cls, '__del__', None) is not None:
+        return
+    try:
+        instance = object.__new__(cls)
+        object.__setattr__(instance, name, None)
+    except (TypeError, AttributeError):
+        # Abstract, or a builtin type's subclass that object.__new__ can't create, or no __dict__
+        pass
@@ -0,0 +1,33 @@
+"""stdlb `concurrency` profile: wildcard-import 5 of stdlb's modules.
+
+`from stdlb.concurrency import *` applies the same builtin preservation and collision
+resolution as `from stdlb import *`, restricted to these modules (see PROFILES in
+_config.py).
+
+This file is auto-generated by scripts/generate_init.py.
+Do not edit manually.
+"""
+import sys
+
+import asyncio
+from asyncio import *
+
+import queue
+from queue import *
+
+import signal
+from signal import *
+
+import subprocess
+from subprocess import *
+
+import threading
+from threading import *
+
+# Preserve builtins that may be shadowed by module members
+_builtins_dict = __builtins__ if isinstance(__builtins__, dict) else __builtins__.__dict__
+if 'TimeoutError' in _builtins_dict:
+    TimeoutError = _builtins_dict['TimeoutError']
+if 'enumerate' in _builtins_dict:
+    enumerate = _builtins_dict['enumerate']
+
@@ -0,0 +1,186 @@
+"""stdlb `core` profile: wildcard-import 42 of stdlb's modules.
+
+`from stdlb.core import *` applies the same builtin preservation and collision
+resolution as `from stdlb import *`, restricted to these modules (see PROFILES in
+_config.py).
+
+This file is auto-generated by scripts/generate_init.py.
+Do not edit manually.
+"""
+import sys
+
+import abc
+from abc import *
+
+import ast
+from ast import *
+
+import bisect
+from bisect import *
+
+import code
+from code import *
+
+import collections
+from collections import *
+
+import contextlib
+from contextlib import *
+
+import copy
+from copy import *
+
+import dataclasses
+from dataclasses import *
+
+import datetime as _module_datetime
+from datetime import *
+datetime = _module_datetime
+
+import enum
+from enum import *
+
+import fnmatch
+from fnmatch import *
+
+import functools
+from functools import *
+
+import glob as _module_glob
+from glob import *
+glob = _module_glob
+
+import heapq
+from heapq import *
+
+import io
+from io import *
+
+import itertools
+from itertools import *
+
+import json
+from json import *
+
+import locale
+from locale import *
+
+import logging
+from logging import *
+
+import math
+from math import *
+
+import numbers
+from numbers import *
+
+import operator
+from operator import *
+
+import os as _module_os
+from os import *
+os = _module_os
+from os.path import *
+
+import pathlib
+from pathlib import *
+
+import platform
+from platform import *
+
+import pprint
+from pprint import *
+
+import random
+from random import *
+
+import re
+from re import *
+
+import reprlib
+from reprlib import *
+
+import shlex as _module_shlex
+from shlex import *
+shlex = _module_shlex
+
+import shutil
+from shutil import *
+
+import string
+from string import *
+
+import sys as _module_sys
+from sys import *
+sys = _module_sys
+
+import tempfile
+from tempfile import *
+
+import textwrap
+from textwrap import *
+
+import time as _module_time
+from time import *
+time = _module_time
+
+import timeit
+from timeit import *
+
+import traceback
+from traceback import *
+
+import types
+from types import *
+
+import typing
+from typing import *
+
+import warnings
+from warnings import *
+
+import weakref
+from weakref import *
+
+# Preserve builtins that may be shadowed by module members
+_builtins_dict = __builtins__ if isinstance(__builtins__, dict) else __builtins__.__dict__
+if 'BlockingIOError' in _builtins_dict:
+    BlockingIOError = _builtins_dict['BlockingIOError']
+if 'abs' in _builtins_dict:
+    abs = _builtins_dict['abs']
+if 'compile' in _builtins_dict:
+    compile = _builtins_dict['compile']
+if 'copyright' in _builtins_dict:
+    copyright = _builtins_dict['copyright']
+if 'exit' in _builtins_dict:
+    exit = _builtins_dict['exit']
+if 'filter' in _builtins_dict:
+    filter = _builtins_dict['filter']
+if 'open' in _builtins_dict:
+    open = _builtins_dict['open']
+if 'pow' in _builtins_dict:
+    pow = _builtins_dict['pow']
+if 'property' in _builtins_dict:
+    property = _builtins_dict['property']
+if 'repr' in _builtins_dict:
+    repr = _builtins_dict['repr']
+if 'slice' in _builtins_dict:
+    slice = _builtins_dict['slice']
+if 'str' in _builtins_dict:
+    str = _builtins_dict['str']
+
+# Datetime convenience aliases
+dt = datetime.datetime
+fromtimestamp = dt.fromtimestamp
+fromisoformat = dt.fromisoformat
+
+# Collision resolution preferences
+Path = pathlib.Path
+compress = itertools.compress
+error = re.error
+join = os.path.join
+path = os.path
+repeat = itertools.repeat
+
+# Custom implementations
+from .cached_property import async_cached_property, cached_property
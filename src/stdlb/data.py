@@ -0,0 +1,102 @@
+"""stdlb `data` profile: wildcard-import 27 of stdlb's modules.
+
+`from stdlb.data import *` applies the same builtin preservation and collision
+resolution as `from stdlb import *`, restricted to these modules (see PROFILES in
+_config.py).
+
+This file is auto-generated by scripts/generate_init.py.
+Do not edit manually.
+"""
+import sys
+
+import array
+from array import *
+
+import base64
+from base64 import *
+
+import binascii
+from binascii import *
+
+import calendar
+from calendar import *
+
+import cmath
+from cmath import *
+
+import codecs
+from codecs import *
+
+import configparser
+from configparser import *
+
+import csv
+from csv import *
+
+import decimal
+from decimal import *
+
+import difflib
+from difflib import *
+
+import fractions
+from fractions import *
+
+if sys.version_info >= (3, 9):
+    import graphlib
+    from graphlib import *
+
+import hashlib
+from hashlib import *
+
+import hmac
+from hmac import *
+
+import pickle
+from pickle import *
+
+import secrets
+from secrets import *
+
+import shelve
+from shelve import *
+
+import sqlite3
+from sqlite3 import *
+
+import statistics
+from statistics import *
+
+import struct
+from struct import *
+
+if sys.version_info >= (3, 11):
+    import tomllib
+    from tomllib import *
+
+import unicodedata
+from unicodedata import *
+
+import uuid
+from uuid import *
+
+import xml
+from xml import *
+
+import zipfile
+from zipfile import *
+
+import zlib
+from zlib import *
+
+if sys.version_info >= (3, 9):
+    import zoneinfo
+    from zoneinfo import *
+
+# Preserve builtins that may be shadowed by module members
+_builtins_dict = __builtins__ if isinstance(__builtins__, dict) else __builtins__.__dict__
+if 'Warning' in _builtins_dict:
+    Warning = _builtins_dict['Warning']
+if 'open' in _builtins_dict:
+    open = _builtins_dict['open']
+
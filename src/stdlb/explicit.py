@@ -0,0 +1,268 @@
+"""Rewrite `from stdlb import *` into explicit imports: `python -m stdlb.explicit`.
+
+For each `.py` file or `.ipynb` notebook (directories are searched recursively), finds
+the global names the code reads but never binds, looks them up in stdlb's export
+index, and replaces `from stdlb import *` (or `from stdlb.lazy import *`) with
+explicit imports of just those names, resolved exactly as the star-import would
+(e.g. `join` → `os.path.join`, `repeat` → `itertools.repeat`, `dt` →
+`datetime.datetime`). Names stdlb resolves to builtins need no import.
+
+```
+python -m stdlb.explicit notebook.ipynb src/        # rewrite in place
+python -m stdlb.explicit -n src/                     # show diffs, don't write
+python -m stdlb.explicit --check src/                # exit 1 if anything would change
+```
+
+Files are processed in parallel (`-j`). Unless `--profile-runs 0`, each file's report
+includes an estimate of the import time saved: the star-import's total, minus the
+cumulative time of the stdlb modules the explicit imports need (per `stdlb.profile`;
+approximate, as modules share dependencies).
+"""
+import argparse
+import ast
+import difflib
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from ._index import load_exports, module_owner
+from .ipython import global_names
+
+STAR_MODULES = ('stdlb', 'stdlb.lazy')
+SKIP_DIRS = {'.git', '.hg', '.venv', 'venv', '__pycache__', 'node_modules', '.ipynb_checkpoints', '.tox', '.nox'}
+MAX_LINE = 100
+
+
+def is_star_import(node):
+    return (
+        isinstance(node, ast.ImportFrom)
+        and node.module in STAR_MODULES
+        and node.level == 0
+        and [alias.name for alias in node.names] == ['*']
+    )
+
+
+def star_import_lines(source):
+    """`(start, end)` (1-based, inclusive) line ranges of top-level stdlb star-imports in `source`."""
+    tree = ast.parse(source)
+    return [(node.lineno, node.end_lineno) for node in tree.body if is_star_import(node)]
+
+
+def import_statements(names, exports=None):
+    """Explicit import statements binding `names` as stdlb does (names stdlb doesn't export are ignored)."""
+    exports = load_exports() if exports is None else exports
+    imports = set()     # `import a.b` / `import a.b as c`
+    members = {}        # module → {"attr" or "attr as name"}
+    assignments = []    # nested attributes, e.g. `fromtimestamp = datetime.datetime.fromtimestamp`
+    for name in sorted(names):
+        spec = exports.get(name)
+        if spec is None or spec.startswith('builtins:'):
+            continue
+        module, _, attrs = spec.partition(':')
+        if not attrs:
+            parent, _, leaf = module.rpartition('.')
+            if name == module:
+                imports.add(f"import {module}")
+            elif parent and name == leaf:
+                members.setdefault(parent, set()).add(leaf)
+            else:
+                imports.add(f"import {module} as {name}")
+        elif '.' not in attrs:
+            members.setdefault(module, set()).add(attrs if attrs == name else f"{attrs} as {name}")
+        else:
+            imports.add(f"import {module}")
+            assignments.append(f"{name} = {module}.{attrs}")
+
+    lines = sorted(imports)
+    for module, attrs in sorted(members.items()):
+        line = f"from {module} import {', '.join(sorted(attrs))}"
+        if len(line) > MAX_LINE:
+            line = '\n'.join([f"from {module} import ("] + [f"    {attr}," for attr in sorted(attrs)] + [")"])
+        lines.append(line)
+    return lines + assignments
+
+
+def owner_modules(names, exports=None):
+    """stdlb modules (`MODULES` entries) that the explicit imports of `names` import."""
+    exports = load_exports() if exports is None else exports
+    owners = set()
+    for name in names:
+        spec = exports.get(name)
+        if spec is None or spec.startswith('builtins:'):
+            continue
+        owner = module_owner(spec.partition(':')[0])
+        if owner is not None:
+            owners.add(owner)
+    return owners
+
+
+def _analysis_line(line):
+    """`line` with IPython syntax removed: magics and shell escapes blanked, help requests (`obj?`, `??obj`) reduced to `obj`."""
+    code = line.lstrip()
+    if code.startswith(('%', '!')):
+        return ''
+    # Only analyzed (not written back), so '?'s at the end of comments or strings can go too
+    return line[:len(line) - len(code)] + code.lstrip('?').rstrip().rstrip('?')
+
+
+def _code_for_analysis(source):
+    """Notebook cell source, with IPython magics, shell escapes and help syntax removed."""
+    if source.lstrip().startswith('%%'):
+        return ''
+    return '\n'.join(map(_analysis_line, source.split('\n')))
+
+
+def rewrite_source(sources, exports=None):
+    """Rewrite the stdlb star-imports in `sources` (a module, or a notebook's code cells).
+
+    Names are collected across all `sources`; the first star-import is replaced by the
+    explicit imports, and any others are removed. Returns `(new_sources, names)`, where
+    `names` are the stdlb names the code uses (`new_sources` is `sources` if there's no
+    star-import). Raises `SyntaxError` if there is one, but some source doesn't parse
+    (even with IPython syntax blanked out), as the names it uses would be missed.
+    """
+    exports = load_exports() if exports is None else exports
+    read, bound = set(), set()
+    stars = []
+    unparsed = []
+    for i, source in enumerate(sources):
+        try:
+            code = _code_for_analysis(source)
+            cell_read, cell_bound = global_names(code)
+            lines = star_import_lines(code)
+        except SyntaxError as e:
+            unparsed.append((i, e))
+            continue
+        read |= cell_read
+        bound |= cell_bound
+        stars += [(i, start, end) for start, end in lines]
+    if not stars:
+        return sources, set()
+    if unparsed:
+        i, e = unparsed[0]
+        where = f"code cell {i + 1}, line {e.lineno}" if len(sources) > 1 else f"line {e.lineno}"
+        more = f" and {len(unparsed) - 1} more" if len(unparsed) > 1 else ''
+        raise SyntaxError(f"{e.msg} ({where}{more}), so the names used there are unknown")
+
+    names = {name for name in read - bound if name in exports}
+    statements = '\n'.join(import_statements(names, exports))
+    new_sources = list(sources)
+    # Rewrite from the bottom up, so earlier line numbers stay valid
+    for n, (i, start, end) in reversed(list(enumerate(stars))):
+        lines = new_sources[i].split('\n')
+        replacement = statements.split('\n') if n == 0 and statements else []
+        lines[start - 1:end] = replacement
+        new_sources[i] = '\n'.join(lines)
+    return new_sources, names
+
+
+def rewrite_file(path, exports=None):
+    """`(old_text, new_text, names)` for rewriting `path` (a `.py` file or `.ipynb` notebook)."""
+    path = Path(path)
+    text = path.read_text()
+    if path.suffix != '.ipynb':
+        (new_text,), names = rewrite_source([text], exports)
+        return text, new_text, names
+
+    notebook = json.loads(text)
+    cells = [cell for cell in notebook.get('cells', []) if cell.get('cell_type') == 'code']
+    sources = [''.join(cell['source']) if isinstance(cell['source'], list) else cell['source'] for cell in cells]
+    new_sources, names = rewrite_source(sources, exports)
+    if new_sources == sources:
+        return text, text, names
+    for cell, old, new in zip(cells, sources, new_sources):
+        if new != old:
+            cell['source'] = new.splitlines(keepends=True) if isinstance(cell['source'], list) else new
+    new_text = json.dumps(notebook, indent=1, ensure_ascii=False) + '\n'
+    return text, new_text, names
+
+
+def find_files(paths):
+    for path in map(Path, paths):
+        if path.is_dir():
+            for root, dirs, files in os.walk(path):
+                dirs[:] = sorted(d for d in dirs if d not in SKIP_DIRS)
+                for file in sorted(files):
+                    if file.endswith(('.py', '.ipynb')):
+                        yield Path(root) / file
+        else:
+            yield path
+
+
+def process_file(path, write=True):
+    """Rewrite one file (if `write`), and return a JSON-able result for the report."""
+    try:
+        old, new, names = rewrite_file(path)
+    except (OSError, UnicodeDecodeError, ValueError, SyntaxError) as e:
+        return {'path': str(path), 'error': f"{type(e).__name__}: {e}"}
+    changed = new != old
+    if changed and write:
+        Path(path).write_text(new)
+    diff = ''.join(difflib.unified_diff(
+        old.splitlines(keepends=True), new.splitlines(keepends=True), f"a/{path}", f"b/{path}",
+    )) if changed else ''
+    return {
+        'path': str(path),
+        'changed': changed,
+        'names': sorted(names),
+        'modules': sorted(owner_modules(names)),
+        'diff': diff,
+    }
+
+
+def import_costs(runs):
+    """`(total_ms, {module: cumulative_ms})` of `from stdlb import *`, per `stdlb.profile`."""
+    from .profile import profile
+
+    report = profile('stdlb', runs=runs)
+    return report['total_ms']['median'], {
+        module: cost['cumulative_ms']['median'] for module, cost in report['modules'].items()
+    }
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(prog='python -m stdlb.explicit', description=__doc__.split('\n\n')[0])
+    parser.add_argument('paths', nargs='+', help='.py/.ipynb files, or directories to search')
+    parser.add_argument('-n', '--dry-run', action='store_true', help="Print diffs, don't write files")
+    parser.add_argument('-c', '--check', action='store_true', help="Don't write files; exit 1 if any would change")
+    parser.add_argument('-j', '--jobs', type=int, help='Worker processes (default: one per CPU)')
+    parser.add_argument('-r', '--profile-runs', type=int, default=5, help='Runs for the import-time estimate (0: skip it; default: %(default)s)')
+    args = parser.parse_args(args)
+
+    write = not (args.dry_run or args.check)
+    files = list(find_files(args.paths))
+    with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        results = list(executor.map(process_file, files, [write] * len(files), chunksize=8))
+    total_ms, costs = import_costs(args.profile_runs) if args.profile_runs else (None, {})
+
+    changed = [result for result in results if result.get('changed')]
+    saved_total = 0
+    for result in results:
+        if 'error' in result:
+            print(f"⚠️  {result['path']}: {result['error']}", file=sys.stderr)
+            continue
+        if not result['changed']:
+            continue
+        if args.dry_run:
+            print(result['diff'], end='')
+        line = f"{result['path']}: {len(result['names'])} names from {len(result['modules'])} modules"
+        if total_ms is not None:
+            saved = max(0.0, total_ms - sum(costs.get(module, 0) for module in result['modules']))
+            saved_total += saved
+            line += f", saves ~{saved:.1f}ms of {total_ms:.1f}ms"
+        print(line, file=sys.stderr if args.dry_run else sys.stdout)
+
+    verb = 'would rewrite' if not write else 'rewrote'
+    summary = f"{verb} {len(changed)} of {len(files)} files"
+    if total_ms is not None and changed:
+        summary += f" (~{saved_total:.0f}ms of import time saved in total)"
+    print(summary, file=sys.stderr)
+    if args.check and changed:
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
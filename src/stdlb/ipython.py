@@ -0,0 +1,171 @@
+"""IPython extension: bind stdlb names on demand, instead of star-importing all of them.
+
+```
+%load_ext stdlb.ipython
+```
+
+Before each cell runs, the global names it reads but never binds are looked up in
+the export index; any that aren't already defined are imported (only their module)
+and bound in the user namespace, following the same collision resolution as
+`from stdlb import *`. Kernel start pays only for this module, and the namespace
+(and so tab-completion) only holds the stdlb names that cells actually used.
+
+The extension also registers `StdlbCompleter`, which completes bare names from
+the export index, so stdlb names complete before any cell has used them, and
+without Jedi inspecting every global.
+"""
+from ._index import kind_of, load_exports, load_info
+from ._lazy import resolve
+
+
+def global_names(source, filename='<cell>'):
+    """`(read, bound)`: the names `source` reads from, and binds in, the global namespace."""
+    import symtable
+
+    top = symtable.symtable(source, filename, 'exec')
+    bound = {s.get_name() for s in top.get_symbols() if s.is_assigned() or s.is_imported()}
+    read = {s.get_name() for s in top.get_symbols() if s.is_referenced()}
+    scopes = list(top.get_children())
+    while scopes:
+        scope = scopes.pop()
+        scopes.extend(scope.get_children())
+        read.update(s.get_name() for s in scope.get_symbols() if s.is_global() and s.is_referenced())
+    return read, bound
+
+
+def free_globals(source):
+    """Names `source` reads from the global namespace, without binding them itself."""
+    read, bound = global_names(source)
+    return read - bound
+
+
+def bind_names(names, namespace):
+    """Bind the stdlb exports among `names` that `namespace` doesn't already define.
+
+    Returns the names that were bound. Names stdlb resolves to builtins are skipped,
+    as they're already visible.
+    """
+    exports = load_exports()
+    bound = []
+    for name in sorted(names):
+        if name in namespace or name not in exports:
+            continue
+        spec = exports[name]
+        if spec.startswith('builtins:'):
+            continue
+        namespace[name] = resolve(spec, name)
+        bound.append(name)
+    return bound
+
+
+class StdlbNameBinder:
+    """IPython `input_transformers_post` hook that binds a cell's stdlb names before it runs."""
+    def __init__(self, shell):
+        self.shell = shell
+
+    def __call__(self, lines):
+        try:
+            names = free_globals(''.join(lines))
+        except SyntaxError:
+            # Let IPython report it when it compiles the cell
+            return lines
+        bind_names(names, self.shell.user_ns)
+        return lines
+
+
+def prefixed(names, prefix):
+    """The entries of sorted list `names` that start with `prefix` (by bisection)."""
+    from bisect import bisect_left
+
+    start = end = bisect_left(names, prefix)
+    while end < len(names) and names[end].startswith(prefix):
+        end += 1
+    return names[start:end]
+
+
+class StdlbCompleter:
+    """IPython matcher (API v2) completing bare names from a sorted prefix index.
+
+    Jedi completes a bare name by inspecting every global, which is slow with
+    stdlb's 2500 names in the namespace. This matcher answers from the export index
+    (plus builtins, keywords and the user's own globals) by bisection, labels each
+    completion with its kind from `load_info()` without touching the object, and
+    suppresses the matchers in `suppress` for the tokens it completes. Attribute
+    access (`os.pa`), imports and strings are left to IPython's other matchers.
+    """
+    matcher_api_version = 2
+    matcher_priority = 0
+    #: `IPCompleter` matchers to skip when this one has completions: Jedi, and the
+    #: automagic matcher (which scans every global, to hide magics they shadow). Jedi
+    #: also completes keyword arguments and a cell's local variables, which this
+    #: doesn't; magics still complete after `%`
+    suppress = ('_jedi_matcher', 'magic_matcher')
+
+    def __init__(self, shell):
+        import builtins
+        import keyword
+
+        from IPython.core.completer import SimpleCompletion
+
+        self.shell = shell
+        # IPython reads a matcher's id from here (falling back to `__qualname__`)
+        self.matcher_identifier = self.__qualname__ = 'stdlb'
+        self.completion = SimpleCompletion
+        self.kinds = {name: 'keyword' for name in keyword.kwlist}
+        self.kinds.update((name, kind_of(value)) for name, value in vars(builtins).items())
+        self.kinds.update(load_info()[0])
+        self.names = sorted(self.kinds)
+        self.suppressed_ids = {
+            getattr(getattr(shell.Completer, matcher, None), 'matcher_identifier', matcher)
+            for matcher in self.suppress
+        }
+
+    def completes(self, context):
+        """Whether `context`'s token is a bare name in code (not an attribute, import or string)."""
+        token = context.token
+        if not token.isidentifier():
+            return False
+        before = context.text_until_cursor[:-len(token)]
+        if before.endswith('.') or before.lstrip().startswith(('import ', 'from ')):
+            return False
+        return before.count('"') % 2 == 0 and before.count("'") % 2 == 0
+
+    def __call__(self, context):
+        if not self.completes(context):
+            return {'completions': []}
+        token = context.token
+        user_ns = self.shell.user_ns
+        names = set(prefixed(self.names, token))
+        names.update(name for name in user_ns if name.startswith(token))
+        if not token.startswith('_'):
+            # Like Jedi, only offer private names once the token asks for them
+            names = {name for name in names if not name.startswith('_')}
+        completions = [
+            self.completion(name, type=self.kinds.get(name) or kind_of(user_ns[name]))
+            for name in sorted(names)
+        ]
+        return {'completions': completions, 'suppress': self.suppressed_ids}
+
+
+def _binders(ipython):
+    return [t for t in ipython.input_transformers_post if isinstance(t, StdlbNameBinder)]
+
+
+def _completers(ipython):
+    return [m for m in ipython.Completer.custom_matchers if isinstance(m, StdlbCompleter)]
+
+
+def load_ipython_extension(ipython):
+    """`%load_ext stdlb.ipython`: bind stdlb names as cells use them, and complete them from the index."""
+    if not _binders(ipython):
+        ipython.input_transformers_post.append(StdlbNameBinder(ipython))
+    if not _completers(ipython):
+        ipython.Completer.custom_matchers.append(StdlbCompleter(ipython))
+
+
+def unload_ipython_extension(ipython):
+    """`%unload_ext stdlb.ipython`: stop binding and completing names (already-bound names are kept)."""
+    for binder in _binders(ipython):
+        ipython.input_transformers_post.remove(binder)
+    for completer in _completers(ipython):
+        ipython.Completer.custom_matchers.remove(completer)
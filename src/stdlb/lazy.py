@@ -0,0 +1,208 @@
+"""Wildcard-import the Python standard library, deferring each module's import until first use.
+
+`from stdlb.lazy import *` binds every stdlb name in the importing namespace.
+Names whose module is already imported are bound to the real object; the rest
+are bound to a `LazyProxy`, which on first call or attribute access imports the
+real object, replaces itself with it in the importing namespace, and forwards
+the operation. Only the export index is loaded up front, except for exception
+classes, which are imported right away (an `except` clause can't take a proxy).
+"""
+import _operator
+import sys
+from os import fspath as _fspath
+
+from . import _trace
+from ._index import is_exception, load_exports
+from ._lazy import resolve
+
+# Exception classes first: importing their modules lets more names be bound directly
+__all__ = sorted(load_exports(), key=lambda name: not is_exception(name))
+
+
+def _is_loaded(spec):
+    return spec.partition(':')[0] in sys.modules
+
+
+class LazyProxy:
+    """Stand-in for a stdlb export, bound in `namespace` under `name` until first use."""
+    __slots__ = ('_stdlb_name', '_stdlb_spec', '_stdlb_namespace', '_stdlb_value')
+
+    def __init__(self, name, spec, namespace):
+        object.__setattr__(self, '_stdlb_name', name)
+        object.__setattr__(self, '_stdlb_spec', spec)
+        object.__setattr__(self, '_stdlb_namespace', namespace)
+
+    def _stdlb_resolve(self):
+        """Import the real object, and swap it in for this proxy in the importing namespace."""
+        try:
+            return object.__getattribute__(self, '_stdlb_value')
+        except AttributeError:
+            pass
+        value = resolve(self._stdlb_spec, self._stdlb_name)
+        object.__setattr__(self, '_stdlb_value', value)
+        namespace = self._stdlb_namespace
+        if namespace.get(self._stdlb_name) is self:
+            namespace[self._stdlb_name] = value
+        return value
+
+    def __getattr__(self, attr):
+        return getattr(self._stdlb_resolve(), attr)
+
+    def __setattr__(self, attr, value):
+        setattr(self._stdlb_resolve(), attr, value)
+
+    def __delattr__(self, attr):
+        delattr(self._stdlb_resolve(), attr)
+
+    @property
+    def __class__(self):
+        return type(self._stdlb_resolve())
+
+    @property
+    def __doc__(self):
+        return self._stdlb_resolve().__doc__
+
+    def __dir__(self):
+        return dir(self._stdlb_resolve())
+
+    def __repr__(self):
+        return repr(self._stdlb_resolve())
+
+    def __str__(self):
+        return str(self._stdlb_resolve())
+
+    def __call__(self, *args, **kwargs):
+        return self._stdlb_resolve()(*args, **kwargs)
+
+    # Classes: isinstance/issubclass checks, subclassing, and `X | Y` type unions
+    def __instancecheck__(self, obj):
+        return isinstance(obj, self._stdlb_resolve())
+
+    def __subclasscheck__(self, cls):
+        return issubclass(cls, self._stdlb_resolve())
+
+    def __mro_entries__(self, bases):
+        return (self._stdlb_resolve(),)
+
+    def __or__(self, other):
+        return self._stdlb_resolve() | other
+
+    def __ror__(self, other):
+        return other | self._stdlb_resolve()
+
+    def __getitem__(self, key):
+        return self._stdlb_resolve()[key]
+
+    # Constants and containers
+    def __eq__(self, other):
+        return self._stdlb_resolve() == other
+
+    def __ne__(self, other):
+        return self._stdlb_resolve() != other
+
+    def __hash__(self):
+        return hash(self._stdlb_resolve())
+
+    def __bool__(self):
+        return bool(self._stdlb_resolve())
+
+    def __int__(self):
+        return int(self._stdlb_resolve())
+
+    def __index__(self):
+        return self._stdlb_resolve().__index__()
+
+    def __float__(self):
+        return float(self._stdlb_resolve())
+
+    def __len__(self):
+        return len(self._stdlb_resolve())
+
+    def __iter__(self):
+        return iter(self._stdlb_resolve())
+
+    def __contains__(self, item):
+        return item in self._stdlb_resolve()
+
+    def __setitem__(self, key, value):
+        self._stdlb_resolve()[key] = value
+
+    def __delitem__(self, key):
+        del self._stdlb_resolve()[key]
+
+    def __reversed__(self):
+        return reversed(self._stdlb_resolve())
+
+    def __enter__(self):
+        return self._stdlb_resolve().__enter__()
+
+    def __exit__(self, *exc_info):
+        return self._stdlb_resolve().__exit__(*exc_info)
+
+    def __format__(self, spec):
+        return format(self._stdlb_resolve(), spec)
+
+    def __fspath__(self):
+        return _fspath(self._stdlb_resolve())
+
+    def __bytes__(self):
+        return bytes(self._stdlb_resolve())
+
+    def __complex__(self):
+        return complex(self._stdlb_resolve())
+
+    def __round__(self, *ndigits):
+        return round(self._stdlb_resolve(), *ndigits)
+
+    def __trunc__(self):
+        return self._stdlb_resolve().__trunc__()
+
+    def __floor__(self):
+        return self._stdlb_resolve().__floor__()
+
+    def __ceil__(self):
+        return self._stdlb_resolve().__ceil__()
+
+
+def _forward(op, reflected=False):
+    """A `LazyProxy` method applying `op` to the resolved object and the other operands."""
+    if reflected:
+        def method(self, other):
+            return op(other, self._stdlb_resolve())
+    else:
+        def method(self, *args):
+            return op(self._stdlb_resolve(), *args)
+    return method
+
+
+# Arithmetic and bitwise operators, reflected and in-place (`pi * 2`, `2 * pi`,
+# `sep + 'x'`, `path += [...]`), comparisons (`inf > 0`) and unary operators (`-pi`)
+for _name in ('add', 'sub', 'mul', 'matmul', 'truediv', 'floordiv', 'mod', 'pow', 'lshift', 'rshift', 'and', 'xor'):
+    _op = getattr(_operator, f"{_name}_" if _name == 'and' else _name)
+    setattr(LazyProxy, f"__{_name}__", _forward(_op))
+    setattr(LazyProxy, f"__r{_name}__", _forward(_op, reflected=True))
+    setattr(LazyProxy, f"__i{_name}__", _forward(getattr(_operator, f"i{_name}")))
+for _name in ('lt', 'le', 'gt', 'ge', 'neg', 'pos', 'abs', 'invert'):
+    setattr(LazyProxy, f"__{_name}__", _forward(getattr(_operator, _name)))
+LazyProxy.__ior__ = _forward(_operator.ior)
+LazyProxy.__divmod__ = _forward(divmod)
+LazyProxy.__rdivmod__ = _forward(divmod, reflected=True)
+del _name, _op
+
+
+def __getattr__(name):
+    try:
+        spec = load_exports()[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    # When tracing, always proxy, so that only names that are used get recorded. Exception
+    # classes can't be proxied (`except` rejects anything else), so they're recorded here
+    if (_is_loaded(spec) and _trace.names is None) or is_exception(name):
+        return resolve(spec, name)
+    # Called directly by the importer's `from stdlb.lazy import ...` statement
+    namespace = sys._getframe(1).f_globals
+    return LazyProxy(name, spec, namespace)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
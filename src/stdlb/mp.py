@@ -0,0 +1,70 @@
+"""Share one stdlb import across a `multiprocessing` pool's workers.
+
+With the "spawn" and "forkserver" start methods, each worker starts from a fresh
+interpreter, so workers that `from stdlb import *` each pay the full import again.
+`configure` arranges for the import to happen once, before workers are forked:
+
+```python
+import stdlb.mp
+ctx = stdlb.mp.configure('forkserver')     # or configure('forkserver', profile='core')
+with ctx.Pool(32) as pool:                 # workers' `from stdlb import *` is ~free
+    ...
+```
+"""
+from importlib import import_module
+
+from ._config import PROFILES
+from ._index import variant_module
+from ._lazy import import_eager
+
+
+def preload_module(profile=None):
+    """Module whose import does the work of `from stdlb[.<profile>] import *`.
+
+    `import stdlb` may already have happened without the eager import (e.g. `import
+    stdlb.mp`, see `_lazy.install`), so the full namespace is preloaded via the module
+    `stdlb` loads it from (see `_index.variant_module`); a profile module imports eagerly.
+    """
+    if profile is None:
+        return variant_module()
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown stdlb profile {profile!r}; expected one of {sorted(PROFILES)}")
+    return f"{__package__}.{profile}"
+
+
+def configure(context=None, profile=None):
+    """Preload stdlb (or a profile) for the workers of `context`, and return the context.
+
+    `context` is a start method name or a `multiprocessing` context (default:
+    "forkserver" where available, else the default context):
+    - forkserver: registers the module with `set_forkserver_preload`, so the fork
+      server imports it once at startup and every worker is forked with it loaded.
+      This must run before the fork server starts (i.e. before the first pool or
+      process is created), and replaces any previously registered preload list.
+    - fork: imports the module now, in this process, so forked workers inherit it.
+    - spawn: workers share nothing with this process; nothing is preloaded (warns).
+    """
+    import multiprocessing
+
+    if context is None:
+        context = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else None
+    if context is None or isinstance(context, str):
+        context = multiprocessing.get_context(context)
+    module = preload_module(profile)
+    method = context.get_start_method()
+    if method == 'forkserver':
+        context.set_forkserver_preload([module])
+    elif method == 'fork':
+        if profile is None:
+            import_eager()
+        else:
+            import_module(module)
+    else:
+        import warnings
+        warnings.warn(
+            f"stdlb.mp.configure: the {method!r} start method can't share imports with workers; "
+            "use 'forkserver' (or 'fork')",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+    return context
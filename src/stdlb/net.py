@@ -0,0 +1,30 @@
+"""stdlb `net` profile: wildcard-import 5 of stdlb's modules.
+
+`from stdlb.net import *` applies the same builtin preservation and collision
+resolution as `from stdlb import *`, restricted to these modules (see PROFILES in
+_config.py).
+
+This file is auto-generated by scripts/generate_init.py.
+Do not edit manually.
+"""
+import sys
+
+import html
+from html import *
+
+import http
+from http import *
+
+import mimetypes
+from mimetypes import *
+
+import socket
+from socket import *
+
+import urllib
+from urllib import *
+from urllib.parse import *
+
+# Preserve builtins that may be shadowed by module members
+_builtins_dict = __builtins__ if isinstance(__builtins__, dict) else __builtins__.__dict__
+
@@ -0,0 +1,212 @@
+"""Per-module import cost of `from stdlb import *`: `python -m stdlb.profile`.
+
+Runs the star-import under `-X importtime` in fresh interpreters, and attributes each
+module it imports to the stdlb module (one of `MODULES` in `_config.py`) whose import
+pulled it in, e.g. `ssl` and `concurrent.futures` to `asyncio`. Reports the median and
+p95 of each stdlb module's self and cumulative time, as a table and (with `--json`) as
+JSON that can be diffed between releases.
+
+```
+python -m stdlb.profile -n 20 --json profile.json
+python -m stdlb.profile -t stdlb.core
+```
+"""
+import argparse
+import json
+import math
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+from ._index import module_owner
+
+OTHER = '(other)'
+
+
+class ImportNode:
+    """One line of `-X importtime` output, with the imports it triggered."""
+    __slots__ = ('name', 'self_us', 'cumulative_us', 'children')
+
+    def __init__(self, name, self_us, cumulative_us, children):
+        self.name = name
+        self.self_us = self_us
+        self.cumulative_us = cumulative_us
+        self.children = children
+
+    def descendants(self):
+        for child in self.children:
+            yield child
+            yield from child.descendants()
+
+
+def parse_importtime(stderr):
+    """Parse `-X importtime` output into a list of root `ImportNode`s, in import order.
+
+    Lines are printed when each import finishes (children before parents), indented
+    two spaces per nesting level.
+    """
+    pending = []  # (depth, node), awaiting their parent
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, raw_name = line[len('import time:'):].split('|')
+        name = raw_name.strip()
+        depth = (len(raw_name) - len(raw_name.lstrip()) - 1) // 2
+        children = []
+        while pending and pending[-1][0] > depth:
+            children.append(pending.pop()[1])
+        children.reverse()
+        pending.append((depth, ImportNode(name, int(self_us), int(cumulative_us), children)))
+    return [node for _, node in pending]
+
+
+def attribute(roots):
+    """Attribute the imports following interpreter startup to stdlb modules.
+
+    Returns `{stdlb_module: {'self_us', 'cumulative_us', 'transitive': {module: cumulative_us}}}`.
+    Imports made by stdlb's own modules (`stdlb`, `stdlb._eager`, `stdlb.core`, …) are
+    attributed to the stdlib module they import directly; everything below that (its
+    transitive imports) is attributed to the same module. Imports before the first
+    `stdlb` one are interpreter startup, and are ignored.
+    """
+    costs = {}
+
+    def charge(node):
+        owner = module_owner(node.name) or OTHER
+        cost = costs.setdefault(owner, {'self_us': 0, 'cumulative_us': 0, 'transitive': {}})
+        cost['cumulative_us'] += node.cumulative_us
+        if node.name == owner:
+            cost['self_us'] += node.self_us
+        else:
+            cost['transitive'][node.name] = node.cumulative_us
+        for descendant in node.descendants():
+            cost['transitive'][descendant.name] = descendant.cumulative_us
+
+    started = False
+    for root in roots:
+        stdlb_root = root.name == 'stdlb' or root.name.startswith('stdlb.')
+        started = started or stdlb_root
+        if not started:
+            continue
+        if stdlb_root:
+            # Walk through stdlb's own (sub)modules to the stdlib imports they make
+            stack = list(root.children)
+            while stack:
+                node = stack.pop()
+                if node.name.startswith('stdlb.'):
+                    stack.extend(node.children)
+                else:
+                    charge(node)
+        else:
+            # e.g. STDLB_LAZY=1: modules imported on demand from stdlb's __getattr__
+            charge(root)
+    return costs
+
+
+def run_once(target, python=sys.executable):
+    """Import `from <target> import *` under `-X importtime` in a fresh interpreter.
+
+    Returns `(version, platform)` of that interpreter (which may not be this one), and
+    its `attribute`d import costs.
+    """
+    src_dir = str(Path(__file__).parent.parent)
+    pythonpath = os.pathsep.join(filter(None, [src_dir, os.environ.get('PYTHONPATH')]))
+    env = dict(os.environ, PYTHONPATH=pythonpath)
+    # `sys` is imported at startup, so this adds no `-X importtime` lines
+    code = f"from {target} import *\nimport sys\nprint(sys.version.split()[0], sys.platform)"
+    result = subprocess.run(
+        [python, '-X', 'importtime', '-c', code],
+        capture_output=True, text=True, env=env, check=True,
+    )
+    version, platform = result.stdout.split()
+    return (version, platform), attribute(parse_importtime(result.stderr))
+
+
+def percentile(values, q):
+    """Nearest-rank percentile (`q` in [0, 100]) of `values`."""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(values_us):
+    ms = [v / 1000 for v in values_us]
+    return {'median': round(statistics.median(ms), 3), 'p95': round(percentile(ms, 95), 3)}
+
+
+def profile(target='stdlb', runs=10, python=sys.executable):
+    """Aggregate per-module import costs of `from <target> import *` over `runs` fresh interpreters."""
+    results = [run_once(target, python) for _ in range(runs)]
+    (version, platform), _ = results[0]
+    samples = [sample for _, sample in results]
+    owners = sorted({owner for sample in samples for owner in sample})
+    modules = {}
+    for owner in owners:
+        costs = [sample.get(owner, {'self_us': 0, 'cumulative_us': 0, 'transitive': {}}) for sample in samples]
+        transitive = sorted({name for cost in costs for name in cost['transitive']})
+        modules[owner] = {
+            'self_ms': summarize([cost['self_us'] for cost in costs]),
+            'cumulative_ms': summarize([cost['cumulative_us'] for cost in costs]),
+            'transitive_ms': {
+                name: summarize([cost['transitive'].get(name, 0) for cost in costs])['median']
+                for name in transitive
+            },
+        }
+    totals = [sum(cost['cumulative_us'] for cost in sample.values()) for sample in samples]
+    return {
+        'target': target,
+        'python': version,
+        'platform': platform,
+        'runs': runs,
+        'total_ms': summarize(totals),
+        'modules': modules,
+    }
+
+
+def format_table(report, sort='cumulative', top_transitive=3):
+    key = 'self_ms' if sort == 'self' else 'cumulative_ms'
+    rows = sorted(report['modules'].items(), key=lambda item: -item[1][key]['median'])
+    lines = [
+        f"`from {report['target']} import *` on Python {report['python']} ({report['platform']}), "
+        f"{report['runs']} runs: total {report['total_ms']['median']:.2f}ms median, "
+        f"{report['total_ms']['p95']:.2f}ms p95",
+        '',
+        f"{'module':<14} {'self med':>9} {'self p95':>9} {'cum med':>9} {'cum p95':>9}  transitive (heaviest)",
+    ]
+    for name, cost in rows:
+        transitive = sorted(cost['transitive_ms'].items(), key=lambda item: -item[1])
+        heaviest = ', '.join(f"{module} {ms:.1f}" for module, ms in transitive[:top_transitive])
+        if len(transitive) > top_transitive:
+            heaviest += f", … (+{len(transitive) - top_transitive})"
+        lines.append(
+            f"{name:<14} {cost['self_ms']['median']:>9.2f} {cost['self_ms']['p95']:>9.2f} "
+            f"{cost['cumulative_ms']['median']:>9.2f} {cost['cumulative_ms']['p95']:>9.2f}  {heaviest}"
+        )
+    return '\n'.join(lines)
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(prog='python -m stdlb.profile', description=__doc__.split('\n\n')[0])
+    parser.add_argument('-n', '--runs', type=int, default=10, help='Fresh interpreters to run (default: %(default)s)')
+    parser.add_argument('-t', '--target', default='stdlb', help='Module to star-import (default: %(default)s), e.g. stdlb.core')
+    parser.add_argument('-p', '--python', default=sys.executable, help='Interpreter to profile (default: this one)')
+    parser.add_argument('-s', '--sort', choices=['cumulative', 'self'], default='cumulative', help='Table sort order')
+    parser.add_argument('-j', '--json', metavar='PATH', help="Also write the report as JSON ('-' for stdout)")
+    args = parser.parse_args(args)
+
+    report = profile(args.target, args.runs, args.python)
+    if args.json == '-':
+        json.dump(report, sys.stdout, indent=2)
+        print()
+        return
+    print(format_table(report, args.sort))
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+            f.write('\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""Cheap per-evaluation globals for `exec`/`eval`, with stdlb's names available.
+
+```python
+ns = stdlb.namespace()
+exec("p = Path('a') / 'b'", ns)   # `Path` is read from the shared table; only `p` is stored in `ns`
+```
+
+`namespace()` returns an empty `Namespace`, a dict whose missing keys fall back to
+one table of stdlb's exports shared by every namespace, so creating one costs no
+more than an empty dict, and each evaluation only pays for what it writes. Names
+the code binds shadow the table without changing it (deleting a stdlb name the
+code didn't bind raises `NameError`). With `lazy=True`, the table is filled name by
+name on first lookup (importing only that name's module), instead of up front.
+
+Pass the namespace as `exec`/`eval`'s globals, and don't pass a separate locals
+mapping: CPython only falls back to the table when it looks a name up in the
+namespace itself.
+"""
+import sys
+
+from ._index import load_exports
+from ._lazy import resolve
+
+# `types.MappingProxyType`, without importing `types` with the package
+_MappingProxyType = type(type.__dict__)
+
+
+class Namespace(dict):
+    """`exec`/`eval` globals that fall back to `table`, a read-only view of every stdlb export."""
+    __slots__ = ()
+    table = None
+
+    def __missing__(self, name):
+        return self.table[name]
+
+
+class LazyNamespace(Namespace):
+    """`Namespace` whose shared table is filled by resolving names on first lookup."""
+    __slots__ = ()
+    _values = {}
+    table = _MappingProxyType(_values)
+
+    def __missing__(self, name):
+        try:
+            return self._values[name]
+        except KeyError:
+            pass
+        spec = load_exports()[name]
+        value = self._values[name] = resolve(spec, name)
+        return value
+
+
+def namespace(lazy=False):
+    """A new, empty `Namespace` (`LazyNamespace` if `lazy`) for `exec`/`eval` globals.
+
+    The first eager namespace loads stdlb's whole namespace (as `from stdlb import *`
+    does) into the shared table.
+    """
+    if lazy:
+        return LazyNamespace()
+    if Namespace.table is None:
+        package = sys.modules[__package__]
+        Namespace.table = _MappingProxyType({name: getattr(package, name) for name in package.__all__})
+    return Namespace()
@@ -0,0 +1,77 @@
+"""Tell stdlb's bindings apart from user state in a namespace, e.g. to save a session.
+
+`from stdlb import *` binds thousands of modules, classes and functions, many of
+which can't be pickled. `user_globals` drops them (keeping any name the user
+rebound), so tools that snapshot a session with `pickle`/`shelve` only see the
+user's own state:
+
+```python
+with shelve.open('session') as db:
+    db.update(user_globals(globals()))
+```
+"""
+import sys
+
+from ._index import load_exports
+from ._lazy import resolve
+
+_names = None
+
+
+def names():
+    """frozenset of `(name, id(value))` for each binding `from stdlb import *` makes.
+
+    Loads the whole namespace, importing all of stdlb's modules (as the star-import
+    does); cached after first call.
+    """
+    global _names
+    if _names is None:
+        package = sys.modules[__package__]
+        _names = frozenset((name, id(getattr(package, name))) for name in package.__all__)
+    return _names
+
+
+def user_globals(namespace):
+    """`namespace`'s entries, minus the ones stdlb bound.
+
+    An entry is stdlb's if its name is a stdlb export and its value is the object
+    stdlb binds to that name (or a `stdlb.lazy` proxy for it); names the user rebound
+    are kept. Values are checked against the `stdlb` package's own bindings, then the
+    export index; exports whose module isn't imported are skipped without importing it
+    (their objects can't be in `namespace`), so this works the same after
+    `from stdlb import *`, `from stdlb.lazy import *` and `%load_ext stdlb.ipython`.
+    """
+    package = vars(sys.modules[__package__])
+    lazy = sys.modules.get(f"{__package__}.lazy")
+    proxy_type = lazy.LazyProxy if lazy is not None else None
+    exports = None
+    user = {}
+    for name, value in namespace.items():
+        # Fast path: the object the package itself holds (once loaded, or resolved lazily)
+        if package.get(name) is value and not name.startswith('_'):
+            continue
+        if exports is None:
+            exports = load_exports()
+        spec = exports.get(name)
+        if spec is not None and (
+            (proxy_type is not None and type(value) is proxy_type) or _is_resolved(spec, value)
+        ):
+            continue
+        user[name] = value
+    return user
+
+
+def _is_resolved(spec, value):
+    """Whether `value` is the object `spec` names (without importing its module)."""
+    from types import BuiltinMethodType, MethodType
+
+    if spec.partition(':')[0] not in sys.modules:
+        return False
+    try:
+        resolved = resolve(spec)
+    except AttributeError:
+        # Attributes that depend on interpreter state (e.g. `sys.ps1`)
+        return False
+    # Each lookup of a bound method (e.g. `fromtimestamp`, i.e. `datetime.fromtimestamp`)
+    # makes a new object, equal to the others
+    return value is resolved or (isinstance(resolved, (BuiltinMethodType, MethodType)) and value == resolved)
@@ -0,0 +1,22 @@
+"""stdlb `slim` variant: `from stdlb import *`, minus platform-specific constants.
+
+`from stdlb.slim import *` imports the same modules, and binds the same objects, as
+`from stdlb import *`, except for upper-case int constants like `AF_INET`,
+`IPPROTO_TCP`, `SIGINT`, `O_RDONLY` and `CLOCK_MONOTONIC` (see
+PLATFORM_CONSTANT_PREFIXES in _config.py). These remain reachable through their
+modules (`os.O_RDONLY`, `time.CLOCK_MONOTONIC`), or enums where stdlb binds the
+module's name to a member (`AddressFamily.AF_INET`, `Signals.SIGINT`; `socket` and
+`signal` are the class and function, as in `stdlb`). A smaller namespace makes
+`dir()` and IPython/Jedi completion faster.
+
+This file is auto-generated by scripts/generate_init.py.
+Do not edit manually.
+"""
+# The package's own (eager) namespace, so that every object is `stdlb`'s
+from . import *
+from ._index import is_platform_constant as _is_platform_constant
+
+__all__ = [
+    _name for _name, _value in list(globals().items())
+    if not _name.startswith('_') and not _is_platform_constant(_name, _value)
+]
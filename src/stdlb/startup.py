@@ -0,0 +1,14 @@
+"""`PYTHONSTARTUP` target: stdlb's names at the plain `python` prompt, imported on first use.
+
+```bash
+export PYTHONSTARTUP="$(python -c 'import stdlb.startup as s; print(s.__file__)')"
+```
+
+Nothing is imported before the prompt appears; each name's module is imported the
+first time it's used, and the rest are preloaded in the background once the
+prompt is shown (see `stdlb._repl`). Tab-completion includes stdlb's names.
+"""
+from stdlb._repl import install as _stdlb_install
+
+_stdlb_install(globals())
+del _stdlb_install
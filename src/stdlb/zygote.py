@@ -0,0 +1,194 @@
+"""Warm-interpreter "zygote" server: start `from stdlb import *` scripts in milliseconds (Linux).
+
+```bash
+python -m stdlb serve &                  # import everything once, then listen on a Unix socket
+python -m stdlb run script.py [args]     # fork a child of the server to run the script
+```
+
+`serve` imports all of stdlb, freezes the heap (`gc.freeze`, so children share it
+copy-on-write), and listens on `socket_path()` (in a directory only the user can
+access, which it refuses to use otherwise; peers of another uid are refused, and
+clients make the same checks of the server). For each `run`, it forks a child
+which takes over the client's argv, cwd, environment and stdin/stdout/stderr
+(passed as file descriptors), runs the script as `__main__` and sends back its
+exit status; `from stdlb import *` then costs nothing. The client (see
+`_zygote_client.py`) forwards signals to the child, and falls back to running the
+script cold if no server is listening.
+
+Children are forked from a single-threaded interpreter, but share its imported
+state: modules that cache environment-derived state at import (rather than
+reading `os.environ` when used) see the server's.
+"""
+import ast
+import atexit
+import gc
+import io
+import os
+import runpy
+import signal
+import socket
+import sys
+
+from ._zygote_client import check_socket_dir, peer_uid, recv_exactly, socket_path
+
+MAX_FDS = 3
+# Seconds a client has to send its request, so that one which connects and stalls
+# doesn't block the `run`s queued behind it
+RECEIVE_TIMEOUT = 5
+
+
+def receive(conn):
+    """`(request, fds)` from a client: the request dict, and its stdin/stdout/stderr fds.
+
+    The fds are closed if the rest of the request can't be read (or parsed).
+    """
+    data, ancdata, _, _ = conn.recvmsg(65536, socket.CMSG_SPACE(MAX_FDS * 4))
+    fds = []
+    for level, kind, payload in ancdata:
+        if level == socket.SOL_SOCKET and kind == socket.SCM_RIGHTS:
+            fds += [int.from_bytes(payload[i:i + 4], sys.byteorder) for i in range(0, len(payload) - 3, 4)]
+    try:
+        size = int.from_bytes(data[:4], 'little')
+        data = data[4:]
+        if len(data) < size:
+            data += recv_exactly(conn, size - len(data))
+        request = ast.literal_eval(data.decode('utf-8', 'surrogateescape'))
+    except BaseException:
+        for fd in fds:
+            os.close(fd)
+        raise
+    return request, fds
+
+
+def _reopen_stdio():
+    """Rebind `sys.std*` to fds 0-2, buffered for what they now are (e.g. the client's tty)."""
+    for fd, name, mode in ((0, 'stdin', 'r'), (1, 'stdout', 'w'), (2, 'stderr', 'w')):
+        old = getattr(sys, name)
+        line_buffering = name == 'stderr' or os.isatty(fd)
+        stream = io.open(
+            fd, mode, encoding=getattr(old, 'encoding', None), errors=getattr(old, 'errors', None),
+            closefd=False, buffering=-1 if mode == 'r' else 1 if line_buffering else -1,
+        )
+        setattr(sys, name, stream)
+        setattr(sys, f"__{name}__", stream)
+
+
+def _run_child(conn, request, fds):
+    """In the forked child: become the client's process, run its script, and report the exit status.
+
+    The child exits with `os._exit` (the server's state isn't its to tear down), after
+    doing what interpreter shutdown would for the script: running `atexit` handlers,
+    and dropping its globals, so that e.g. files it left open are flushed and closed.
+    """
+    conn.settimeout(None)
+    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+    conn.sendall(os.getpid().to_bytes(4, 'little'))
+    for target, fd in enumerate(fds[:3]):
+        os.dup2(fd, target)
+    for fd in fds:
+        if fd > 2:
+            os.close(fd)
+    _reopen_stdio()
+
+    status = 0
+    namespace = {}
+    try:
+        os.chdir(request['cwd'])
+        os.environ.clear()
+        os.environ.update(request['env'])
+        sys.argv = request['argv']
+        script = sys.argv[0]
+        sys.path[0] = os.path.dirname(os.path.abspath(script))
+        namespace = runpy.run_path(script, run_name='__main__')
+    except SystemExit as e:
+        if e.code is None:
+            status = 0
+        elif isinstance(e.code, int):
+            status = e.code
+        else:
+            print(e.code, file=sys.stderr)
+            status = 1
+    except BaseException as e:
+        import traceback
+        traceback.print_exception(type(e), e, e.__traceback__)
+        status = 1
+    atexit._run_exitfuncs()
+    atexit._clear()
+    namespace.clear()
+    gc.collect()
+    for stream in (sys.stdout, sys.stderr):
+        try:
+            stream.flush()
+        except Exception:
+            pass
+    try:
+        conn.sendall(status.to_bytes(4, 'little', signed=True))
+    finally:
+        os._exit(status)
+
+
+def serve(path=None):
+    """Import stdlb, then fork a child per `stdlb run` request on the Unix socket at `path` (until interrupted)."""
+    if not sys.platform.startswith('linux'):
+        raise RuntimeError('stdlb serve requires Linux')
+    path = path or socket_path()
+    os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+    # `makedirs` leaves an existing directory as it is, e.g. one another user created in /tmp
+    problem = check_socket_dir(path)
+    if problem:
+        raise RuntimeError(f"Refusing to listen on {path}: {problem}")
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except OSError:
+        if os.path.exists(path):
+            os.unlink(path)  # stale, from a server that didn't clean up
+    else:
+        raise RuntimeError(f"A server is already listening on {path}")
+    finally:
+        probe.close()
+
+    import stdlb
+    stdlb.__all__  # the full eager import
+    gc.collect()
+    gc.freeze()
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(path)
+    os.chmod(path, 0o600)
+    server.listen(64)
+    # Children are reaped automatically; each reports its own status to its client
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    # Clean up the socket on `kill`, too
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    print(f"stdlb serve: listening on {path}", file=sys.stderr)
+    try:
+        while True:
+            conn, _ = server.accept()
+            fds = []
+            try:
+                if peer_uid(conn) != os.getuid():
+                    continue
+                conn.settimeout(RECEIVE_TIMEOUT)
+                request, fds = receive(conn)
+                if os.fork() == 0:
+                    try:
+                        server.close()
+                        _run_child(conn, request, fds)
+                    finally:
+                        os._exit(1)
+            except Exception as e:
+                print(f"stdlb serve: {type(e).__name__}: {e}", file=sys.stderr)
+            finally:
+                for fd in fds:
+                    os.close(fd)
+                conn.close()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        if os.path.exists(path):
+            os.unlink(path)
+    return 0
@@ -0,0 +1,54 @@
+"""Test that importing stdlb does no I/O beyond loading modules (see `stdlb.audit_io`)."""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import stdlb
+from stdlb.audit_io import io_beyond_loading, run_audit, summarize
+
+NOISY_MODULE = '''
+import os, subprocess, sys
+with open(os.devnull) as f:
+    pass
+os.listdir(os.curdir)
+
+def query():
+    subprocess.run([sys.executable, '-c', 'pass'])
+
+query()
+'''
+
+
+@pytest.mark.parametrize('target', ['stdlb', 'stdlb.lazy'])
+def test_import_does_no_io_beyond_module_loading(target):
+    records = run_audit(target)
+    # The audit hook saw the import system at work…
+    assert any(record['loading'] and record['event'] == 'open' for record in records)
+    # …and nothing else
+    assert io_beyond_loading(records) == []
+
+
+def test_io_attributed_to_importing_module(tmp_path, monkeypatch):
+    (tmp_path / 'noisy.py').write_text(NOISY_MODULE)
+    monkeypatch.setenv('PYTHONPATH', str(tmp_path))
+    io = summarize(run_audit('noisy'))['noisy']['io']
+    events = [event['event'] for event in io]
+    # From 3.13, `subprocess` may start the child with `os.posix_spawn`, also audited
+    assert events[:3] == ['open', 'os.listdir', 'subprocess.Popen']
+    assert events[3:] in ([], ['os.posix_spawn'])
+    assert io[0]['args'].startswith(repr(__import__('os').devnull))
+
+
+def test_audit_tool_doesnt_shadow_sys_audit():
+    """Importing the tool binds `stdlb.audit_io`, not `stdlb.audit` (which is `sys.audit`)."""
+    assert stdlb.audit is sys.audit
+    namespace = {}
+    exec('from stdlb import *', namespace)
+    assert namespace['audit'] is sys.audit
+    # Lazily, too (where a bound submodule would take precedence over the export index)
+    code = 'import sys, stdlb.audit_io\nfrom stdlb import *\nassert audit is sys.audit'
+    env = dict(os.environ, PYTHONPATH=str(Path(stdlb.__file__).parent.parent), STDLB_LAZY='1')
+    subprocess.run([sys.executable, '-c', code], env=env, check=True)
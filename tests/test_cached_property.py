@@ -0,0 +1,516 @@
+"""Test `stdlb.cached_property` (storage modes, `reserve`, `lock`, `ttl`/`depends_on`), `stdlb.async_cached_property` and `stdlb.invalidate`."""
+import asyncio
+import gc
+import pickle
+import sys
+import threading
+import time
+import tracemalloc
+import weakref
+from dataclasses import dataclass, field
+
+import pytest
+
+import stdlb
+from stdlb import async_cached_property, cached_property
+
+
+class Point:
+    calls = 0
+
+    def __init__(self, x):
+        self.x = x
+
+    @cached_property
+    def square(self):
+        """x²"""
+        Point.calls += 1
+        return self.x ** 2
+
+
+class SlotPoint:
+    __slots__ = ('x', '_square')
+    calls = 0
+
+    def __init__(self, x):
+        self.x = x
+
+    @cached_property(slot='_square')
+    def square(self):
+        SlotPoint.calls += 1
+        return self.x ** 2
+
+
+@dataclass(slots=True)
+class DataclassPoint:
+    x: int
+    _square: int = field(init=False, repr=False, compare=False)
+
+    @cached_property(slot='_square')
+    def square(self):
+        return self.x ** 2
+
+
+class WeakrefPoint:
+    __slots__ = ('x', '__weakref__')
+
+    def __init__(self, x):
+        self.x = x
+
+    @cached_property(table=True)
+    def square(self):
+        return self.x ** 2
+
+
+def test_dict():
+    Point.calls = 0
+    p = Point(3)
+    assert (p.square, p.square, Point.calls) == (9, 9, 1)
+    assert vars(p) == {'x': 3, 'square': 9}
+    assert Point.square.__doc__ == 'x²'
+    del p.square
+    assert (p.square, Point.calls) == (9, 2)
+    assert pickle.loads(pickle.dumps(p)).square == 9
+
+
+def test_slot():
+    SlotPoint.calls = 0
+    p = SlotPoint(3)
+    assert (p.square, p.square, SlotPoint.calls) == (9, 9, 1)
+    # Cached reads are plain slot reads
+    assert SlotPoint.square is SlotPoint.__dict__['_square']
+    assert p._square == 9
+    del p.square
+    assert (p.square, SlotPoint.calls) == (9, 2)
+    assert pickle.loads(pickle.dumps(p))._square == 9
+    with pytest.raises(AttributeError, match="'SlotPoint' object has no attribute 'y'"):
+        p.y
+
+
+def test_slot_dataclass():
+    p = DataclassPoint(4)
+    assert p.square == 16
+    assert repr(p) == 'DataclassPoint(x=4)'
+    assert p == DataclassPoint(4)
+    assert not hasattr(p, '__dict__')
+
+
+def test_slot_subclass_and_getattr():
+    class Base:
+        __slots__ = ('x',)
+
+        def __init__(self, x):
+            self.x = x
+
+        def __getattr__(self, name):
+            return f"<{name}>"
+
+    class Cube(Base):
+        __slots__ = ('_cube', '_double')
+
+        @cached_property(slot='_cube')
+        def cube(self):
+            return self.x ** 3
+
+        @cached_property(slot='_double')
+        def double(self):
+            return self.x * 2
+
+    class Square(Cube):
+        __slots__ = ('_square',)
+
+        @cached_property(slot='_square')
+        def square(self):
+            return self.x ** 2
+
+    s = Square(2)
+    assert (s.square, s.cube, s.double, s.other) == (4, 8, 4, '<other>')
+
+
+def test_table():
+    p = WeakrefPoint(5)
+    assert p.square == p.square == 25
+    table = WeakrefPoint.square._table
+    assert table[id(p)].value == 25
+    q = WeakrefPoint(6)
+    assert q.square == 36
+    del p
+    gc.collect()
+    assert [entry.value for entry in table.values()] == [36]
+
+
+def test_table_requires_weakref():
+    class Compact:
+        __slots__ = ('x',)
+
+        @cached_property(table=True)
+        def square(self):
+            return 1
+
+    with pytest.raises(TypeError, match=r"no __dict__ or __weakref__ slot.*slot=\.\.\."):
+        Compact().square
+
+
+class Child:
+    __slots__ = ('parent', '_self', '__weakref__')
+
+    def __init__(self, parent=None):
+        self.parent = parent
+
+    @cached_property(slot='_self')
+    def me(self):
+        return self
+
+    @cached_property
+    def root(self):
+        return self if self.parent is None else self.parent.root
+
+
+def test_table_not_used_implicitly():
+    """Without `table=True`, values that refer back to their instance can't pin it from the class."""
+    child = Child()
+    with pytest.raises(TypeError, match=r"no __dict__; .*slot=\.\.\..*table=True"):
+        child.root
+    assert Child.__dict__['root']._table is None
+    # A slot is part of the instance, so the gc frees the cycle
+    assert child.me is child
+    ref = weakref.ref(child)
+    del child
+    gc.collect()
+    assert ref() is None
+
+
+def test_table_and_slot_are_exclusive():
+    with pytest.raises(ValueError, match="table and slot"):
+        cached_property(table=True, slot='_value')
+
+
+def test_failed_computation_not_cached():
+    class Flaky:
+        __slots__ = ('_value', '__weakref__')
+        fail = True
+
+        @cached_property(slot='_value')
+        def value(self):
+            if Flaky.fail:
+                raise ValueError('flaky')
+            return 1
+
+    f = Flaky()
+    with pytest.raises(ValueError):
+        f.value
+    Flaky.fail = False
+    assert f.value == 1
+
+
+def make_record(reserve):
+    class Record:
+        def __init__(self, x):
+            self.x = x
+            self.name = str(x)
+
+        @cached_property(reserve=reserve)
+        def a(self):
+            return self.x + 1000
+
+        @cached_property(reserve=reserve)
+        def b(self):
+            return self.x + 2000
+
+    return Record
+
+
+def bytes_per_instance(cls, n=2000):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [cls(i) for i in range(n)]
+    for instance in instances:
+        instance.a, instance.b
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / n
+
+
+Record = make_record(reserve=True)
+Record.__qualname__ = 'Record'  # so pickle finds it here
+
+
+def test_reserve():
+    r = Record(1)
+    assert (r.a, r.b) == (1001, 2001)
+    assert vars(r) == {'x': 1, 'name': '1', 'a': 1001, 'b': 2001}
+    del r.a
+    assert r.a == 1001
+    assert pickle.loads(pickle.dumps(r)).b == 2001
+
+
+@pytest.mark.skipif(sys.version_info < (3, 11), reason="instance values are only stored inline over shared keys from Python 3.11")
+def test_reserve_keeps_dicts_compact():
+    # Values added after instances exist don't fit the instances' shared-key value arrays
+    assert bytes_per_instance(make_record(reserve=True)) < bytes_per_instance(make_record(reserve=False)) - 64
+
+
+def test_reserve_subclass_and_frozen():
+    class Sub(Record):
+        pass
+
+    assert Sub(2).b == 2002
+    assert Sub in Record.b._reserved
+
+    @dataclass(frozen=True)
+    class Frozen:
+        x: int
+
+        @cached_property(reserve=True)
+        def double(self):
+            return self.x * 2
+
+    assert Frozen(3).double == 6
+
+
+class Resource:
+    computed = 0
+
+    def __init__(self, x):
+        self.x = x
+
+    @cached_property(lock=True)
+    def value(self):
+        Resource.computed += 1
+        time.sleep(0.01)
+        return self.x
+
+
+class SlotResource:
+    __slots__ = ('x', '_value', '__weakref__')
+    computed = 0
+
+    def __init__(self, x):
+        self.x = x
+
+    @cached_property(slot='_value', lock=True)
+    def value(self):
+        SlotResource.computed += 1
+        time.sleep(0.01)
+        return self.x
+
+
+@pytest.mark.parametrize('cls', [Resource, SlotResource])
+def test_lock_computes_once(cls):
+    cls.computed = 0
+    instances = [cls(i) for i in range(4)]
+    barrier = threading.Barrier(8)
+    results = []
+
+    def read():
+        barrier.wait()
+        results.append([instance.value for instance in instances])
+
+    threads = [threading.Thread(target=read) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [[0, 1, 2, 3]] * 8
+    assert cls.computed == 4
+    # Locks only live while computing, and not on the instance
+    prop = cls.__getattr__.cached_properties['value'] if cls is SlotResource else cls.value
+    assert not prop._locks
+    assert pickle.loads(pickle.dumps(instances[1])).value == 1
+    assert cls.computed == 4
+
+
+def test_lock_failure_not_cached():
+    class Flaky:
+        fail = True
+
+        @cached_property(lock=True)
+        def value(self):
+            if Flaky.fail:
+                raise ValueError('flaky')
+            return 1
+
+    f = Flaky()
+    with pytest.raises(ValueError):
+        f.value
+    assert not Flaky.value._locks
+    Flaky.fail = False
+    assert f.value == 1
+    assert not Flaky.value._locks
+
+
+class Client:
+    fetches = 0
+
+    def __init__(self, fail=False):
+        self.fail = fail
+
+    @async_cached_property
+    async def config(self):
+        """Fetched once"""
+        Client.fetches += 1
+        await asyncio.sleep(0.01)
+        if self.fail:
+            raise ConnectionError('unreachable')
+        return {'fetches': Client.fetches}
+
+
+def test_async_shares_one_computation():
+    async def main():
+        Client.fetches = 0
+        client = Client()
+        results = await asyncio.gather(*(client.config for _ in range(10)))
+        assert results == [{'fetches': 1}] * 10
+        assert await client.config is results[0]
+        assert Client.fetches == 1
+        return client
+
+    client = asyncio.run(main())
+    assert vars(client) == {'fail': False, 'config': {'fetches': 1}}
+    assert not Client.config._tasks
+    assert Client.config.__doc__ == 'Fetched once'
+    restored = pickle.loads(pickle.dumps(client))
+    assert asyncio.run(_await(restored.config)) == {'fetches': 1}
+    del restored.config
+    assert asyncio.run(_await(restored.config)) == {'fetches': 2}
+
+
+async def _await(awaitable):
+    return await awaitable
+
+
+def test_async_failure_not_cached():
+    async def main():
+        Client.fetches = 0
+        client = Client(fail=True)
+        results = await asyncio.gather(*(client.config for _ in range(3)), return_exceptions=True)
+        assert [type(result) for result in results] == [ConnectionError] * 3
+        assert Client.fetches == 1
+        assert 'config' not in vars(client)
+        client.fail = False
+        assert await client.config == {'fetches': 2}
+
+    asyncio.run(main())
+
+
+def test_async_cancelled_awaiter_doesnt_cancel_others():
+    async def main():
+        Client.fetches = 0
+        client = Client()
+        first = asyncio.ensure_future(_await(client.config))
+        second = asyncio.ensure_future(_await(client.config))
+        await asyncio.sleep(0)
+        first.cancel()
+        assert await second == {'fetches': 1}
+        assert first.cancelled()
+
+    asyncio.run(main())
+
+
+class Config:
+    loads = 0
+
+    def __init__(self, path):
+        self.path = path
+
+    @cached_property(depends_on=('path',))
+    def text(self):
+        Config.loads += 1
+        return f"<{self.path}>"
+
+    @cached_property(ttl=60)
+    def stamp(self):
+        Config.loads += 1
+        return Config.loads
+
+
+def test_depends_on():
+    Config.loads = 0
+    c = Config('a.toml')
+    assert (c.text, c.text, Config.loads) == ('<a.toml>', '<a.toml>', 1)
+    c.path = 'b.toml'
+    assert (c.text, c.text, Config.loads) == ('<b.toml>', '<b.toml>', 2)
+    # Cached under another key of the instance's `__dict__`, with its dependencies
+    assert vars(c).keys() == {'path', 'text@cached'}
+    c2 = pickle.loads(pickle.dumps(c))
+    assert (c2.text, Config.loads) == ('<b.toml>', 2)
+    c2.path = 'c.toml'
+    assert (c2.text, Config.loads) == ('<c.toml>', 3)
+
+
+def test_ttl(monkeypatch):
+    now = [1000.]
+    monkeypatch.setattr(sys.modules['stdlb.cached_property'], '_monotonic', lambda: now[0])
+    Config.loads = 0
+    c = Config('a.toml')
+    assert (c.stamp, c.stamp) == (1, 1)
+    now[0] += 59
+    assert c.stamp == 1
+    now[0] += 1
+    assert (c.stamp, c.stamp) == (2, 2)
+    # Deadlines don't survive pickling
+    assert pickle.loads(pickle.dumps(c)).stamp == 3
+
+
+class Node:
+    def __init__(self):
+        self.parent = None
+
+    @cached_property(depends_on=('parent',))
+    def root(self):
+        return self if self.parent is None else self.parent.root
+
+
+def test_checked_values_dont_keep_instances_alive():
+    node = Node()
+    assert node.root is node
+    ref = weakref.ref(node)
+    del node
+    gc.collect()
+    assert ref() is None
+    assert not Node.__dict__['root']._table
+
+
+def test_checks_require_table():
+    with pytest.raises(ValueError, match="ttl/depends_on can't be combined with slot/reserve"):
+        cached_property(ttl=1, slot='_value')
+    with pytest.raises(ValueError):
+        cached_property(depends_on=('x',), reserve=True)
+
+
+def test_invalidate():
+    Point.calls = SlotPoint.calls = 0
+    Config.loads = 0
+    points = Point(2), SlotPoint(2), WeakrefPoint(2)
+    for p in points:
+        assert p.square == 4
+        stdlb.invalidate(p, 'square')
+        stdlb.invalidate(p)  # nothing cached: no-op
+        assert p.square == 4
+    assert (Point.calls, SlotPoint.calls) == (2, 2)
+    stdlb.invalidate(points[0])
+    assert vars(points[0]) == {'x': 2}
+
+    c = Config('a.toml')
+    assert (c.text, c.stamp, Config.loads) == ('<a.toml>', 2, 2)
+    stdlb.invalidate(c)
+    assert (c.text, c.stamp, Config.loads) == ('<a.toml>', 4, 4)
+
+    client = Client()
+    assert asyncio.run(_await(client.config)) == {'fetches': Client.fetches}
+    stdlb.invalidate(client, 'config')
+    assert 'config' not in vars(client)
+
+    with pytest.raises(AttributeError, match="'Config' object has no cached property 'path'"):
+        stdlb.invalidate(c, 'path')
+    with pytest.raises(AttributeError, match="no cached property 'nope'"):
+        stdlb.invalidate(c, 'text', 'nope')
+
+
+def test_invalidate_is_not_star_exported():
+    """`stdlb.invalidate` is a package attribute, like `stdlb.preload`, not a flat-namespace name."""
+    assert stdlb.invalidate is cached_property.invalidate
+    assert 'invalidate' not in stdlb.__all__
+    namespace = {}
+    exec('from stdlb import *', namespace)
+    assert 'invalidate' not in namespace
@@ -0,0 +1,95 @@
+"""Test the `python -m stdlb.explicit` codemod."""
+import json
+
+import pytest
+
+import stdlb
+from stdlb.explicit import import_statements, process_file, rewrite_file, rewrite_source
+
+MODULE = '''"""Example."""
+from stdlb import *
+
+def main():
+    local = Path(join('a', 'b'))
+    Counter = 1
+    return list(repeat(local, 2)), dt.now(), fromtimestamp(0), sqrt(2), open, sys.argv, Counter
+
+X = compress('abc', [1, 0, 1])
+'''
+
+
+def test_import_statements_follow_collision_resolution():
+    assert import_statements(['join', 'repeat', 'Path', 'dt', 'open', 'path', 'error', 'fromtimestamp', 'not_exported']) == [
+        'import datetime',
+        'from datetime import datetime as dt',
+        'from itertools import repeat',
+        'from os import path',
+        'from os.path import join',
+        'from pathlib import Path',
+        'from re import error',
+        'fromtimestamp = datetime.datetime.fromtimestamp',
+    ]
+
+
+def test_rewrite_binds_same_objects_as_star_import():
+    (new,), names = rewrite_source([MODULE])
+    assert 'import *' not in new
+    # `Counter` is bound locally, and `open` resolves to the builtin
+    assert names == {'Path', 'join', 'repeat', 'dt', 'fromtimestamp', 'sqrt', 'open', 'sys', 'compress'}
+    namespace = {}
+    exec(new, namespace)
+    for name in names - {'open'}:
+        expected = getattr(stdlb, name)
+        assert namespace[name] is expected or namespace[name] == expected, name
+    assert 'open' not in namespace
+
+
+def test_rewrite_without_star_import_is_noop():
+    source = 'import os\nprint(Path)\n'
+    assert rewrite_source([source]) == ([source], set())
+
+
+def test_rewrite_notebook(tmp_path):
+    notebook = {
+        'cells': [
+            {'cell_type': 'code', 'source': ['%load_ext autoreload\n', 'from stdlb.lazy import *\n', 'x = 1'], 'metadata': {}, 'outputs': [], 'execution_count': None},
+            {'cell_type': 'markdown', 'source': ['Counter'], 'metadata': {}},
+            {'cell_type': 'code', 'source': ['!ls\n', 'print(sqrt(x), Decimal(1))'], 'metadata': {}, 'outputs': [], 'execution_count': None},
+            {'cell_type': 'code', 'source': 'from stdlb import *', 'metadata': {}, 'outputs': [], 'execution_count': None},
+        ],
+        'metadata': {}, 'nbformat': 4, 'nbformat_minor': 5,
+    }
+    path = tmp_path / 'nb.ipynb'
+    path.write_text(json.dumps(notebook))
+    _, new, names = rewrite_file(path)
+    assert names == {'sqrt', 'Decimal'}
+    cells = json.loads(new)['cells']
+    assert cells[0]['source'] == ['%load_ext autoreload\n', 'from decimal import Decimal\n', 'from math import sqrt\n', 'x = 1']
+    assert cells[2]['source'] == notebook['cells'][2]['source']
+    assert cells[3]['source'] == ''
+
+
+def test_rewrite_notebook_ipython_syntax():
+    cells = ['from stdlb import *', 'sqrt?\n??Path\nx = 1  # ?', '%%time\nprint(Decimal(1))']
+    new_cells, names = rewrite_source(cells)
+    assert names == {'sqrt', 'Path'}
+    assert new_cells[0] == 'from math import sqrt\nfrom pathlib import Path'
+
+
+def test_rewrite_refuses_unparsable_cells(tmp_path):
+    cells = ['from stdlb import *', 'print(sqrt(2))', 'def f(:\n    pass', 'print(Path(']
+    with pytest.raises(SyntaxError, match=r"code cell 3, line 1 and 1 more\), so the names used there are unknown"):
+        rewrite_source(cells)
+    # Without a star-import there's nothing to rewrite
+    assert rewrite_source(cells[1:]) == (cells[1:], set())
+
+    notebook = {
+        'cells': [{'cell_type': 'code', 'source': source, 'metadata': {}, 'outputs': [], 'execution_count': None} for source in cells],
+        'metadata': {}, 'nbformat': 4, 'nbformat_minor': 5,
+    }
+    path = tmp_path / 'nb.ipynb'
+    text = json.dumps(notebook)
+    path.write_text(text)
+    result = process_file(path)
+    assert result['error'].startswith('SyntaxError: ')
+    assert path.read_text() == text
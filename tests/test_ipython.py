@@ -0,0 +1,95 @@
+"""Test the `%load_ext stdlb.ipython` IPython extension."""
+import pytest
+
+from stdlb.ipython import free_globals, prefixed
+
+IPython = pytest.importorskip('IPython')
+
+
+@pytest.fixture
+def shell():
+    from IPython.core.interactiveshell import InteractiveShell
+    shell = InteractiveShell.instance()
+    shell.run_line_magic('load_ext', 'stdlb.ipython')
+    yield shell
+    shell.run_line_magic('unload_ext', 'stdlb.ipython')
+    shell.reset()
+
+
+def test_free_globals():
+    """Only names read from (and never bound in) the global scope are free."""
+    source = (
+        "x = dumps(1)\n"
+        "def f(path, *args):\n"
+        "    return join(path, *args)\n"
+        "class C:\n"
+        "    y = [Decimal(n) for n in range(3)]\n"
+    )
+    assert free_globals(source) == {'dumps', 'join', 'Decimal', 'range'}
+
+
+def test_cell_names_bound_on_demand(shell):
+    """Names a cell uses are bound with stdlb's collision resolution; others aren't."""
+    import os.path
+    import pickle
+
+    result = shell.run_cell("s = dumps({'a': 1}); p = join('a', 'b')")
+    result.raise_error()
+    ns = shell.user_ns
+    assert ns['dumps'] is pickle.dumps
+    assert ns['p'] == os.path.join('a', 'b')
+    assert 'loads' not in ns
+    # Builtins stay builtins
+    shell.run_cell("c = compile").raise_error()
+    assert 'compile' not in ns
+
+
+def test_user_bindings_win(shell):
+    """Names the user defined (or binds in the same cell) are left alone."""
+    shell.run_cell("dumps = 'mine'").raise_error()
+    shell.run_cell("x = dumps").raise_error()
+    assert shell.user_ns['x'] == 'mine'
+
+    shell.run_cell("def g(path):\n    return path\n").raise_error()
+    assert 'path' not in shell.user_ns
+
+
+def test_prefixed():
+    names = ['Path', 'PathLike', 'Pattern', 'path', 'pathsep']
+    assert prefixed(names, 'Path') == ['Path', 'PathLike']
+    assert prefixed(names, 'pat') == ['path', 'pathsep']
+    assert prefixed(names, 'Q') == []
+
+
+def complete(shell, text):
+    from IPython.core.completer import provisionalcompleter
+    with provisionalcompleter():
+        return {(c.text, c.type, c._origin) for c in shell.Completer.completions(text, len(text))}
+
+
+def test_completer_answers_bare_names_from_index(shell):
+    """stdlb names complete (with their kinds) before any cell binds them, and Jedi is skipped."""
+    assert 'urljoin' not in shell.user_ns
+    assert complete(shell, 'urlj') == {('urljoin', 'function', 'stdlb')}
+    assert ('OrderedDict', 'class', 'stdlb') in complete(shell, 'Ordered')
+    assert ('os', 'module', 'stdlb') in complete(shell, 'o')
+    shell.run_cell("url_count = 1").raise_error()
+    assert {text for text, _, _ in complete(shell, 'url_')} == {'url_count'}
+    assert ('while', 'keyword', 'stdlb') in complete(shell, 'whil')
+
+
+def test_completer_leaves_attributes_imports_and_strings(shell):
+    shell.run_cell("import collections").raise_error()
+    assert all(origin != 'stdlb' for _, _, origin in complete(shell, 'collections.Ord'))
+    assert all(origin != 'stdlb' for _, _, origin in complete(shell, 'from os import pa'))
+    assert all(origin != 'stdlb' for _, _, origin in complete(shell, 'x = "urlj'))
+
+
+def test_unload_removes_completer(shell):
+    from stdlb.ipython import StdlbCompleter
+
+    shell.run_line_magic('load_ext', 'stdlb')
+    assert sum(isinstance(m, StdlbCompleter) for m in shell.Completer.custom_matchers) == 1
+    shell.run_line_magic('unload_ext', 'stdlb')
+    assert not any(isinstance(m, StdlbCompleter) for m in shell.Completer.custom_matchers)
+    shell.run_line_magic('load_ext', 'stdlb')
@@ -0,0 +1,308 @@
+"""Test that lazy (STDLB_LAZY=1) resolution matches the eager star-import."""
+import json
+import os
+import subprocess
+import sys
+import threading
+import types
+from importlib.machinery import ModuleSpec
+from pathlib import Path
+
+import pytest
+
+import stdlb
+from stdlb import _index
+from stdlb._lazy import _import_lock, preload_order, resolve
+
+EXPORTS = _index.load_exports()
+
+# Indexes are generated per interpreter (scripts/generate_init.py --index); others introspect
+requires_index = pytest.mark.skipif(
+    _index._load_index() is None,
+    reason=f"No export index shipped for {_index.index_key()}",
+)
+
+SRC_DIR = str(Path(stdlb.__file__).parent.parent)
+
+# Dump `from stdlb import *` as {name: FQN}, like scripts/snapshot_exports.py
+EXPORTS_SCRIPT = """
+import json
+_before = set(globals())
+from stdlb import *
+snapshot = {}
+for name in sorted(set(globals()) - _before - {'_before'}):
+    obj = globals()[name]
+    if type(obj).__name__ == 'LazyProxy':
+        obj = obj._stdlb_resolve()
+    fqn = None
+    if hasattr(obj, '__module__'):
+        if hasattr(obj, '__qualname__'):
+            fqn = f"{obj.__module__}.{obj.__qualname__}"
+        elif hasattr(obj, '__name__'):
+            fqn = f"{obj.__module__}.{obj.__name__}"
+        else:
+            fqn = f"{obj.__module__}.{type(obj).__name__}"
+    snapshot[name] = fqn
+print(json.dumps(snapshot))
+"""
+
+
+def run_python(code, lazy):
+    """Run `code` in a fresh interpreter, in lazy or eager mode."""
+    env = dict(os.environ, PYTHONPATH=SRC_DIR, STDLB_LAZY='1' if lazy else '0')
+    result = subprocess.run(
+        [sys.executable, '-c', code],
+        capture_output=True, text=True, env=env, check=True,
+    )
+    return result.stdout
+
+
+def test_export_index_matches_eager_namespace():
+    """Every eagerly-exported name is indexed, and resolves to the same object."""
+    assert set(EXPORTS) == set(stdlb.__all__)
+    mismatched = []
+    for name, spec in EXPORTS.items():
+        expected = getattr(stdlb, name)
+        actual = resolve(spec)
+        # Bound classmethods (e.g. `fromtimestamp`) are re-created on each access
+        if actual is not expected and actual != expected:
+            mismatched.append(f"{name}: {spec}")
+    assert not mismatched, mismatched
+
+
+def test_lazy_attribute_imports_only_owner():
+    """`stdlb.JSONDecoder` imports json, but not unrelated heavy modules."""
+    out = run_python(
+        "import sys, stdlb\n"
+        "assert 'asyncio' not in sys.modules\n"
+        "assert stdlb.JSONDecoder is sys.modules['json'].JSONDecoder\n"
+        "assert stdlb.join is sys.modules['os'].path.join\n"
+        "print(len(dir(stdlb)), len(stdlb.__all__), 'asyncio' in sys.modules, 'sqlite3' in sys.modules)\n",
+        lazy=True,
+    )
+    n_dir, n_all, asyncio_loaded, sqlite3_loaded = out.split()
+    assert int(n_dir) >= int(n_all) == len(EXPORTS)
+    assert asyncio_loaded == sqlite3_loaded == 'False'
+
+
+def test_eager_import_deferred_until_namespace_used():
+    """Importing a submodule doesn't pay for the eager import; using `stdlb` does."""
+    run_python(
+        "import sys, stdlb.cached_property\n"
+        "assert 'asyncio' not in sys.modules\n"
+        "assert isinstance(stdlb.cached_property, type)\n"
+        "stdlb.getcwd\n"
+        "assert 'asyncio' in sys.modules and 'sqlite3' in sys.modules\n",
+        lazy=False,
+    )
+
+
+def test_lazy_star_import_matches_eager():
+    """`from stdlb import *` binds the same names to the same objects in both modes."""
+    eager = json.loads(run_python(EXPORTS_SCRIPT, lazy=False))
+    lazy = json.loads(run_python(EXPORTS_SCRIPT, lazy=True))
+    assert lazy == eager
+
+
+def test_lazy_proxies_defer_imports():
+    """`from stdlb.lazy import *` imports no more than it must until a name is used."""
+    run_python(
+        "import sys\n"
+        "from stdlb.lazy import *\n"
+        "from stdlb.lazy import LazyProxy\n"
+        "for module in ('uuid', 'csv', 'difflib', 'hashlib'):\n"
+        "    assert module not in sys.modules, module\n"
+        # Already-imported modules' members are bound directly
+        "assert getcwd is sys.modules['os'].getcwd\n"
+        "assert isinstance(globals()['SequenceMatcher'], LazyProxy)\n"
+        "assert SequenceMatcher(None, 'ab', 'ac').ratio() == 0.5\n"
+        "assert globals()['SequenceMatcher'] is sys.modules['difflib'].SequenceMatcher\n"
+        "assert 'csv' not in sys.modules\n"
+        "class Id(UUID): pass\n"
+        "assert Id.__mro__[1] is sys.modules['uuid'].UUID\n"
+        "assert isinstance(Id(int=1), UUID)\n",
+        lazy=False,
+    )
+
+
+def test_lazy_exception_classes_are_bound_directly():
+    """An `except` clause can be the first use of an exception class."""
+    run_python(
+        "import sys\n"
+        "from stdlb.lazy import *\n"
+        "try:\n"
+        "    JSONDecoder().decode('{')\n"
+        "except JSONDecodeError as e:\n"
+        "    assert type(e) is sys.modules['json'].JSONDecodeError\n"
+        "try:\n"
+        "    run([sys.executable, '-c', 'raise SystemExit(3)'], check=True)\n"
+        "except (CancelledError, CalledProcessError) as e:\n"
+        "    assert e.returncode == 3\n",
+        lazy=False,
+    )
+
+
+def test_lazy_proxies_support_operators():
+    """Proxied constants work as operands (and are swapped out) like the real objects."""
+    run_python(
+        "import sys\n"
+        "from stdlb.lazy import *\n"
+        "from stdlb.lazy import LazyProxy\n"
+        "assert 'csv' not in sys.modules\n"
+        "assert isinstance(globals()['QUOTE_NONE'], LazyProxy)\n"
+        "assert (QUOTE_NONE * 2, 2 * QUOTE_NONE, -QUOTE_NONE, abs(-QUOTE_NONE), QUOTE_NONE > 2, 2 < QUOTE_NONE) == (6, 6, -3, 3, True, True)\n"
+        "assert (f'{QUOTE_NONE:.2f}', round(QUOTE_ALL, 2), divmod(7, QUOTE_NONNUMERIC), 2 ** QUOTE_NONE) == ('3.00', 1, (3, 1), 8)\n"
+        "assert sys.modules['os'].fspath(globals()['unidata_version']) == sys.modules['unicodedata'].unidata_version\n"
+        "assert ('v' + unidata_version)[1:] == unidata_version\n"
+        "assert type(globals()['QUOTE_NONE']) is type(sys.modules['csv'].QUOTE_NONE)\n"
+        "x = QUOTE_MINIMAL\n"
+        "x += 1\n"
+        "assert x == 1\n",
+        lazy=False,
+    )
+
+
+def test_eager_import_populates_package():
+    """`import stdlb` binds every name; importing only a submodule (`stdlb.lazy`) defers that."""
+    out = run_python(
+        "import sys, stdlb\n"
+        "print('dumps' in vars(stdlb), len(vars(stdlb)) > 1000)",
+        lazy=False,
+    )
+    assert out.split() == ['True', 'True']
+    out = run_python(
+        "import sys, stdlb.lazy\n"
+        "package = sys.modules['stdlb']\n"
+        "print('dumps' in vars(package), 'asyncio' in sys.modules, package.dumps is sys.modules['pickle'].dumps)",
+        lazy=False,
+    )
+    assert out.split() == ['False', 'False', 'True']
+
+
+def test_lazy_proxies_match_eager():
+    """Once resolved, `from stdlb.lazy import *` names match `from stdlb import *`."""
+    eager = json.loads(run_python(EXPORTS_SCRIPT, lazy=False))
+    proxied = json.loads(run_python(EXPORTS_SCRIPT.replace('from stdlb import', 'from stdlb.lazy import'), lazy=False))
+    assert proxied == eager
+
+
+@requires_index
+def test_precomputed_index_matches_live_introspection():
+    """The shipped index for this interpreter is current, so no fallback is needed."""
+    # Star-imports of modules without __all__ (sys, urllib) depend on interpreter state
+    # (e.g. IPython sets sys.ps1), so introspect in a fresh interpreter, like the generator
+    live_exports, live_candidates = json.loads(run_python(
+        "import json\nfrom stdlb._index import build_candidates, build_exports\n"
+        "print(json.dumps([build_exports(), build_candidates()]))",
+        lazy=True,
+    ))
+    assert EXPORTS == live_exports
+    assert _index.load_candidates() == live_candidates
+
+
+def test_precomputed_info_matches_live_introspection():
+    """The shipped kinds/signatures companion is current, and covers every export."""
+    kinds, signatures = _index.load_info()
+    live_kinds, live_signatures = json.loads(run_python(
+        "import json\nfrom stdlb._index import build_info\nprint(json.dumps(build_info()))",
+        lazy=True,
+    ))
+    assert kinds == live_kinds
+    assert signatures == live_signatures
+    # The interpreter's path (`platform.architecture`'s default) isn't baked in
+    assert signatures['architecture'].startswith('(executable=sys.executable,')
+    assert (kinds['join'], signatures['join']) == ('function', '(a, *p)')
+    assert signatures['copytree'].count('<function copy2>') == 1
+
+
+def test_fingerprint_mismatch_falls_back_to_live_introspection(monkeypatch):
+    """An interpreter without a matching index builds one by introspection."""
+    monkeypatch.setattr(_index, '_exports', None)
+    monkeypatch.setattr(_index, 'fingerprint', lambda: ('cpython', (3, 99), 'plan9'))
+    assert _index.index_key() == 'cpython399_plan9'
+    assert _index.load_exports() == _index.build_exports()
+
+
+@requires_index
+def test_variant_matches_eager_module():
+    """This interpreter's generated variant binds exactly the indexed names, to `_eager.py`'s objects."""
+    assert _index.variant_module() == f"stdlb._variants.{_index.index_key()}"
+    out = run_python(
+        "import json, stdlb._eager as eager\n"
+        "from importlib import import_module\n"
+        "from stdlb._index import load_exports, variant_module\n"
+        "variant = import_module(variant_module())\n"
+        "names = {name for name in vars(variant) if not name.startswith('_')}\n"
+        "mismatched = [\n"
+        "    name for name in names\n"
+        "    if getattr(variant, name) is not getattr(eager, name, None) and getattr(variant, name) != getattr(eager, name, None)\n"
+        "]\n"
+        "print(json.dumps([sorted(names ^ {n for n in vars(eager) if not n.startswith('_')}), mismatched, names == set(load_exports())]))",
+        lazy=True,
+    )
+    assert json.loads(out) == [[], [], True]
+
+
+def test_eager_import_falls_back_when_variant_fails():
+    """A build lacking a name its variant imports (e.g. `os.memfd_create`) star-imports via `_eager.py`."""
+    out = run_python(
+        "import os\n"
+        "for name in ('memfd_create', 'pidfd_open', 'login_tty'):\n"
+        "    os.__dict__.pop(name, None)\n"
+        "    if name in os.__all__:\n"
+        "        os.__all__.remove(name)\n"
+        "from stdlb import *\n"
+        "import sys\n"
+        "print('memfd_create' in globals(), 'stdlb._eager' in sys.modules, dumps is sys.modules['pickle'].dumps)",
+        lazy=False,
+    )
+    assert out.split() == ['False', 'True', 'True']
+
+
+def test_variant_falls_back_to_eager_module(monkeypatch):
+    """An interpreter without a generated variant star-imports via `_eager.py`."""
+    monkeypatch.setattr(_index, 'fingerprint', lambda: ('cpython', (3, 99), 'plan9'))
+    assert _index.variant_module() == 'stdlb._eager'
+
+
+def test_preload_order():
+    """Priority modules come first (submodules with their package), then the rest by name."""
+    order = preload_order(['zlib', 'os.path', 'asyncio', 'xml.dom', 'abc'], priority=['asyncio', 'os'])
+    assert order == [m for m in ['asyncio', 'os.path', 'abc', 'xml.dom', 'zlib'] if m not in sys.modules]
+
+
+def test_resolve_waits_for_module_being_preloaded(monkeypatch):
+    """A module `preload`'s thread is still initializing is already in `sys.modules`: wait for it."""
+    module = types.ModuleType('stdlb_half_imported')
+    module.__spec__ = ModuleSpec(module.__name__, None)
+    module.__spec__._initializing = True
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    results = []
+    with _import_lock:
+        thread = threading.Thread(target=lambda: results.append(resolve(f"{module.__name__}:value")))
+        thread.start()
+        thread.join(.2)
+        assert thread.is_alive()
+        module.value = 1
+        module.__spec__._initializing = False
+    thread.join()
+    assert results == [1]
+
+
+@pytest.mark.parametrize('lazy', [True, False])
+def test_preload_imports_in_background(lazy):
+    """Lookups racing the preload thread see fully-initialized modules."""
+    out = run_python(
+        "import sys, stdlb\n"
+        "from stdlb._lazy import preload_order\n"
+        "order = preload_order(priority=['sqlite3', 'asyncio'])\n"
+        "thread = stdlb.preload(priority=['sqlite3', 'asyncio'])\n"
+        "# Main-thread lookups while the thread imports the same modules\n"
+        "assert stdlb.connect is sys.modules['sqlite3'].connect\n"
+        "assert stdlb.create_task.__module__ == 'asyncio.tasks'\n"
+        "thread.join()\n"
+        "# Eagerly, everything is imported already\n"
+        "print(thread.name, bool(order), [m for m in order if m not in sys.modules])",
+        lazy=lazy,
+    )
+    assert out.split() == ['stdlb-preload', str(lazy), '[]']
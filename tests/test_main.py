@@ -0,0 +1,62 @@
+"""Test `python -m stdlb`'s index queries."""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import stdlb
+from stdlb.__main__ import main, search, which
+
+SRC_DIR = str(Path(stdlb.__file__).parent.parent)
+
+
+def test_which_reports_candidates_and_winner():
+    assert which('join') == {
+        'name': 'join',
+        'spec': 'os.path:join',
+        'kind': 'function',
+        'signature': '(a, *p)',
+        'candidates': ['shlex:join', 'os.path:join'],
+        'reason': 'collision preference (join = os.path.join)',
+    }
+    assert which('open')['candidates'][-1] == 'builtins:open'
+    assert which('open')['reason'] == 'preserved builtin'
+    assert which('repeat')['candidates'] == ['timeit:repeat', 'itertools:repeat']
+    assert which('Path')['candidates'] == ['zipfile:Path', 'pathlib:Path']
+    assert which('error')['spec'] == 're:error'
+    assert which('getcwd') == {
+        'name': 'getcwd', 'spec': 'os:getcwd', 'kind': 'function', 'signature': '()', 'candidates': ['os:getcwd'], 'reason': None,
+    }
+    assert (which('dt')['kind'], which('dt')['signature']) == ('class', None)
+    assert which('os')['kind'] == 'module'
+    assert which('AF_INET')['kind'] == 'constant'
+    assert which('nope') is None
+
+
+def test_search():
+    assert search(prefix='urlj') == ['urljoin']
+    assert search('^url(en|de)code$') == ['urlencode']
+    assert set(search('Decoder$', prefix='JSON')) == {'JSONDecoder'}
+
+
+def test_cli(capsys):
+    assert main(['complete', 'zip_l']) == 0
+    assert capsys.readouterr().out == 'zip_longest\n'
+    assert main(['which', 'nope']) == 1
+    capsys.readouterr()
+    assert main(['search', '-p']) == 2
+    assert capsys.readouterr().err == 'usage: python -m stdlb search [-p PREFIX] [PATTERN]\n'
+
+
+def test_cli_imports_no_stdlib_modules():
+    code = (
+        "import sys\n"
+        "before = set(sys.modules)\n"
+        "from stdlb.__main__ import main\n"
+        "main(['which', 'join', 'open'])\n"
+        "main(['search', '-p', 'url'])\n"
+        "print(sorted(m for m in set(sys.modules) - before if not m.startswith('stdlb')), file=sys.stderr)\n"
+    )
+    env = dict(os.environ, PYTHONPATH=SRC_DIR)
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, env=env, check=True)
+    assert result.stderr.strip() == '[]'
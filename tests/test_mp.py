@@ -0,0 +1,55 @@
+"""Test `stdlb.mp.configure`, which preloads stdlb for multiprocessing workers."""
+import multiprocessing
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import stdlb
+from stdlb import mp
+from stdlb._index import _load_index, index_key
+
+SRC_DIR = str(Path(stdlb.__file__).parent.parent)
+
+# Reports whether pool workers start with the preloaded module already imported
+WORKER_SCRIPT = '''
+import sys
+import stdlb.mp
+
+def loaded(module):
+    return module in sys.modules
+
+if __name__ == '__main__':
+    method, profile = sys.argv[1], sys.argv[2]
+    ctx = stdlb.mp.configure(method, profile=profile)
+    with ctx.Pool(1) as pool:
+        print(pool.apply(loaded, (stdlb.mp.preload_module(profile),)))
+'''
+
+
+def test_preload_module():
+    assert mp.preload_module('net') == 'stdlb.net'
+    with pytest.raises(ValueError, match='Unknown stdlb profile'):
+        mp.preload_module('nope')
+
+
+@pytest.mark.skipif(_load_index() is None, reason=f"No export index shipped for {index_key()}")
+def test_preload_module_is_variant():
+    assert mp.preload_module() == f"stdlb._variants.{index_key()}"
+
+
+@pytest.mark.parametrize('method', [m for m in ('fork', 'forkserver') if m in multiprocessing.get_all_start_methods()])
+def test_workers_start_with_stdlb_imported(method, tmp_path):
+    script = tmp_path / 'workers.py'
+    script.write_text(WORKER_SCRIPT)
+    env = dict(os.environ, PYTHONPATH=SRC_DIR)
+    result = subprocess.run([sys.executable, str(script), method, 'net'], capture_output=True, text=True, env=env, check=True)
+    assert result.stdout.strip() == 'True'
+
+
+def test_spawn_warns():
+    with pytest.warns(RuntimeWarning, match="'spawn' start method"):
+        ctx = mp.configure('spawn')
+    assert ctx.get_start_method() == 'spawn'
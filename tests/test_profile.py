@@ -0,0 +1,80 @@
+"""Test `python -m stdlb.profile` import-time attribution."""
+import sys
+
+from stdlb.profile import OTHER, attribute, parse_importtime, percentile, profile
+
+# Trimmed `python -X importtime -c 'from stdlb import *'` output
+IMPORTTIME = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 |   encodings.aliases
+import time:       500 |        600 | encodings
+import time:       200 |        200 |   stdlb.cached_property
+import time:        50 |         50 |     stdlb._config
+import time:       150 |        200 |   stdlb._index
+import time:       300 |        700 | stdlb
+import time:        40 |         40 |       _ssl
+import time:       900 |        940 |     ssl
+import time:       400 |        400 |     concurrent.futures
+import time:      1000 |       2340 |   asyncio
+import time:       200 |        200 |   xml.dom
+import time:        30 |         30 |   xml
+import time:       100 |        100 |   weakref
+import time:       500 |       3170 | stdlb._eager
+"""
+
+
+def test_parse_importtime():
+    """Post-order, indented lines become a tree of roots."""
+    roots = parse_importtime(IMPORTTIME)
+    assert [root.name for root in roots] == ['encodings', 'stdlb', 'stdlb._eager']
+    eager = roots[2]
+    assert [child.name for child in eager.children] == ['asyncio', 'xml.dom', 'xml', 'weakref']
+    asyncio = eager.children[0]
+    assert (asyncio.self_us, asyncio.cumulative_us) == (1000, 2340)
+    assert [node.name for node in asyncio.descendants()] == ['ssl', '_ssl', 'concurrent.futures']
+
+
+def test_attribute():
+    """Transitive imports are charged to the stdlb module that triggered them; startup is ignored."""
+    costs = attribute(parse_importtime(IMPORTTIME))
+    assert set(costs) == {'asyncio', 'xml', 'weakref'}
+    assert costs['asyncio'] == {
+        'self_us': 1000,
+        'cumulative_us': 2340,
+        'transitive': {'ssl': 940, '_ssl': 40, 'concurrent.futures': 400},
+    }
+    # Submodules star-imported by a package count towards the package
+    assert costs['xml'] == {'self_us': 30, 'cumulative_us': 230, 'transitive': {'xml.dom': 200}}
+
+
+def test_attribute_lazy_roots():
+    """Modules imported on demand (STDLB_LAZY=1) are top-level imports after stdlb."""
+    costs = attribute(parse_importtime(IMPORTTIME.replace('  xml.dom', 'xml.dom').replace('  _', '_') + """\
+import time:        70 |         70 | json.decoder
+import time:        20 |         20 | symtable
+"""))
+    assert costs['json']['cumulative_us'] == 70
+    assert costs[OTHER]['transitive'] == {'symtable': 20}
+
+
+def test_percentile():
+    assert percentile([5, 1, 3, 2, 4], 50) == 3
+    assert percentile(range(1, 101), 95) == 95
+    assert percentile([7], 95) == 7
+
+
+def test_profile_net():
+    """A real run attributes socket's imports to socket."""
+    report = profile('stdlb.net', runs=2)
+    assert (report['runs'], report['python'], report['platform']) == (2, sys.version.split()[0], sys.platform)
+    assert 'socket' in report['modules']
+    socket = report['modules']['socket']
+    assert socket['cumulative_ms']['median'] >= socket['self_ms']['median'] > 0
+
+
+
+def test_profile_reports_target_interpreter(monkeypatch):
+    """The version comes from the profiled interpreter, not this one."""
+    version = sys.version.split()[0]
+    monkeypatch.setattr(sys, 'version', '0.0.0 (profiler)')
+    assert profile('stdlb.net', runs=1)['python'] == version
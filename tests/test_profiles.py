@@ -0,0 +1,65 @@
+"""Test the generated `stdlb.<profile>` subsets."""
+import importlib
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import stdlb
+from stdlb._config import MODULES, PROFILES
+from stdlb._index import build_exports
+from stdlb._lazy import resolve
+
+
+def public_names(module):
+    return {name for name in vars(module) if not name.startswith('_')}
+
+
+def test_profiles_partition_modules():
+    """Every module belongs to exactly one profile."""
+    profiled = [module for modules in PROFILES.values() for module in modules]
+    assert sorted(profiled) == sorted(MODULES)
+
+
+def test_stdlb_is_union_of_profiles():
+    """`from stdlb import *` binds exactly the names the profiles bind between them."""
+    # In a fresh interpreter: urllib's star-export depends on which submodules are loaded
+    code = (
+        "import importlib, json, stdlb\n"
+        f"profiles = {list(PROFILES)!r}\n"
+        "union = set()\n"
+        "for profile in profiles:\n"
+        "    union |= {n for n in vars(importlib.import_module(f'stdlb.{profile}')) if not n.startswith('_')}\n"
+        "print(json.dumps([sorted(union), sorted(stdlb.__all__)]))\n"
+    )
+    env = dict(os.environ, PYTHONPATH=str(Path(stdlb.__file__).parent.parent))
+    out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, env=env, check=True).stdout
+    union, exported = json.loads(out)
+    assert union == exported
+
+
+@pytest.mark.parametrize('profile', PROFILES)
+def test_profile_collision_resolution(profile):
+    """Each profile resolves collisions among its own modules like the eager path would."""
+    module = importlib.import_module(f"stdlb.{profile}")
+    expected = build_exports(PROFILES[profile], custom=profile == 'core')
+    assert public_names(module) == set(expected)
+    mismatched = [
+        name for name, spec in expected.items()
+        if getattr(module, name) is not resolve(spec) and getattr(module, name) != resolve(spec)
+    ]
+    assert not mismatched
+
+
+def test_core_profile_preferences():
+    """`core` keeps the top-level preferences for the modules it includes."""
+    from stdlb import core
+    import os.path
+    import pathlib
+    assert core.join is os.path.join
+    assert core.Path is pathlib.Path
+    assert core.open is open
+    assert core.dt is core.datetime.datetime
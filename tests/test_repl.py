@@ -0,0 +1,76 @@
+"""Test `python -m stdlb` (REPL, `-c`, scripts) and the `stdlb.startup` PYTHONSTARTUP target."""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import stdlb
+from stdlb._repl import completer, install
+
+SRC_DIR = str(Path(stdlb.__file__).parent.parent)
+
+
+def run_python(*args, stdin=None, **env):
+    env = dict(os.environ, PYTHONPATH=SRC_DIR, **env)
+    for var in ('STDLB_LAZY', 'STDLB_TRACE'):
+        env.pop(var, None)
+    return subprocess.run([sys.executable, *args], input=stdin, capture_output=True, text=True, env=env)
+
+
+def test_install_resolves_names_like_star_import():
+    namespace = install({}, preload=False)
+    exec("f, j, o, e = format, join, open, Ellipsis\ndef g():\n    return sqrt(4)\n", namespace)
+    # `locale.format` until 3.12 (which removed it), then the builtin
+    assert namespace['f'] is getattr(stdlb, 'format', format)
+    assert namespace['j'] is stdlb.join
+    assert namespace['o'] is open
+    assert namespace['e'] is getattr(stdlb, 'Ellipsis', Ellipsis)
+    assert namespace['g']() == 2.0
+    assert set(namespace) == {'__builtins__', 'f', 'j', 'o', 'e', 'g'}
+    # Builtins that look names up directly (e.g. iterators' __reduce__) still find them
+    exec("it = iter([1, 2]); next(it); r = it.__reduce__()", namespace)
+
+
+def test_completer_offers_unbound_names():
+    namespace = install({}, preload=False)
+    complete = completer(namespace).complete
+    matches = []
+    while (match := complete('urlj', len(matches))) is not None:
+        matches.append(match)
+    assert matches == ['urljoin']
+
+
+def test_command_and_script(tmp_path):
+    result = run_python('-m', 'stdlb', '-c', "import sys; print(sys.argv[1:], urljoin('http://a/b', 'c'))", 'x')
+    assert result.stdout == "['x'] http://a/c\n"
+
+    script = tmp_path / 'script.py'
+    script.write_text(
+        "import pickle, sys\n"
+        "class C:\n"
+        "    pass\n"
+        "print(__name__, sys.argv[1], type(pickle.loads(pickle.dumps(C()))).__name__, dedent('  x'))\n"
+        "print('asyncio' in sys.modules)\n"
+    )
+    result = run_python('-m', 'stdlb', str(script), 'arg')
+    assert result.stdout.split() == ['__main__', 'arg', 'C', 'x', 'False']
+
+    result = run_python('-m', 'stdlb', '-c', '1/0')
+    assert result.returncode == 1
+    assert result.stderr.splitlines()[-1] == 'ZeroDivisionError: division by zero'
+
+
+def test_interactive():
+    result = run_python('-m', 'stdlb', '-i', '-c', "x = Counter('aab')", stdin="x['a']\nPath('a') / 'b'\n")
+    assert 'stdlb:' in result.stderr
+    # `code.InteractiveConsole` writes prompts to stdout
+    assert result.stdout.replace('>>> ', '').split('\n')[:2] == ['2', repr(Path('a/b'))]
+
+
+def test_pythonstartup():
+    startup = str(Path(stdlb.__file__).parent / 'startup.py')
+    result = run_python(
+        '-i', stdin="print(sqrt(16), format is getattr(__import__('stdlb'), 'format', format))\n1 + 1\nprint(_)\n", PYTHONSTARTUP=startup,
+    )
+    assert result.stdout.split() == ['4.0', 'True', '2', '2']
+    assert 'Error' not in result.stderr
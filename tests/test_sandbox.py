@@ -0,0 +1,44 @@
+"""Test `stdlb.namespace()`: copy-on-write `exec`/`eval` globals over a shared table of stdlb's exports."""
+import os.path
+
+import pytest
+
+import stdlb
+from stdlb.sandbox import LazyNamespace, Namespace
+
+
+@pytest.mark.parametrize('lazy', [False, True])
+def test_names_resolve_like_star_import(lazy):
+    ns = stdlb.namespace(lazy=lazy)
+    exec(
+        "def f(parts):\n"
+        "    return join(*parts)\n"
+        "x = f(['a', 'b'])\n"
+        "n = Counter('aab')['a']\n"
+        "o = open\n",
+        ns,
+    )
+    assert ns['x'] == os.path.join('a', 'b')
+    assert ns['n'] == 2
+    assert ns['o'] is open
+    assert eval("dt(2024, 1, 2).year", ns) == 2024
+    with pytest.raises(NameError):
+        eval("not_a_stdlb_name", ns)
+
+
+@pytest.mark.parametrize('lazy', [False, True])
+def test_writes_stay_in_each_namespace(lazy):
+    first, second = stdlb.namespace(lazy=lazy), stdlb.namespace(lazy=lazy)
+    exec("Path = 'mine'\ny = 1", first)
+    assert set(first) == {'__builtins__', 'Path', 'y'}
+    assert eval("Path", first) == 'mine'
+    assert eval("Path", second) is stdlb.Path
+    assert 'Path' not in second and 'y' not in second
+
+
+def test_shared_tables_are_read_only():
+    stdlb.namespace()
+    for table in (Namespace.table, LazyNamespace.table):
+        with pytest.raises(TypeError):
+            table['Path'] = 'mine'
+    assert Namespace.table['join'] is stdlb.join
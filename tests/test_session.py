@@ -0,0 +1,40 @@
+"""Test `stdlb.names()` and `stdlb.user_globals()`, for saving sessions without stdlb's bindings."""
+import os.path
+import pickle
+import shelve
+import shlex
+
+import stdlb
+from stdlb import names, user_globals
+
+
+def test_names_identify_star_import_bindings():
+    injected = names()
+    assert ('join', id(os.path.join)) in injected
+    assert ('join', id(shlex.join)) not in injected
+    assert ('sys', id(stdlb.sys)) in injected
+    assert len({name for name, _ in injected}) == len(injected) == len(stdlb.__all__)
+
+
+def test_user_globals_strips_stdlb_bindings():
+    namespace = {}
+    exec("from stdlb import *\nx = [1, 2]\njoin = 'mine'\ndef f(): pass\n", namespace)
+    user = user_globals(namespace)
+    assert user.keys() == {'__builtins__', 'x', 'join', 'f'}
+    del user['__builtins__'], user['f']
+    assert pickle.loads(pickle.dumps(user)) == {'x': [1, 2], 'join': 'mine'}
+
+
+def test_user_globals_strips_lazy_proxies():
+    namespace = {}
+    exec("from stdlb.lazy import *\ny = 1\n", namespace)
+    assert user_globals(namespace).keys() == {'__builtins__', 'y'}
+
+
+def test_shelve_round_trip(tmp_path):
+    namespace = {}
+    exec("from stdlb import *\ncounts = Counter('abca')\nwhen = dt(2024, 1, 2)\n", namespace)
+    with shelve.open(str(tmp_path / 'session')) as db:
+        db.update({k: v for k, v in user_globals(namespace).items() if not k.startswith('_')})
+    with shelve.open(str(tmp_path / 'session')) as db:
+        assert dict(db) == {'counts': {'a': 2, 'b': 1, 'c': 1}, 'when': namespace['when']}
@@ -0,0 +1,34 @@
+"""Test `stdlb.slim`: `from stdlb import *` minus platform-specific constants."""
+import sys
+
+import stdlb
+import stdlb.slim
+
+
+def test_slim_drops_only_platform_constants():
+    full, slim = set(stdlb.__all__), set(stdlb.slim.__all__)
+    assert slim < full
+    dropped = full - slim
+    assert {'AF_INET', 'IPPROTO_TCP', 'SO_REUSEADDR', 'SIGINT', 'O_RDONLY', 'LC_ALL'} <= dropped
+    if sys.platform != 'win32':
+        assert {'CLOCK_MONOTONIC', 'WNOHANG'} <= dropped
+    # Portable constants stay, including ones that merely look like platform constants' prefixes
+    assert {'WARNING', 'WARN', 'INFO', 'WEDNESDAY', 'W_OK', 'pi', 'maxsize'} <= slim
+    # Functions and enums with the same prefixes stay
+    assert {'Signals', 'AddressFamily', 'SocketKind'} <= slim
+    if sys.platform != 'win32':
+        assert 'WCOREDUMP' in slim
+
+
+def test_slim_binds_same_objects():
+    for name in stdlb.slim.__all__:
+        assert getattr(stdlb.slim, name) is getattr(stdlb, name), name
+
+
+def test_dropped_constants_reachable():
+    namespace = {}
+    exec('from stdlb.slim import *', namespace)
+    assert 'AF_INET' not in namespace
+    assert namespace['AddressFamily'].AF_INET == stdlb.AF_INET
+    assert namespace['Signals'].SIGINT == stdlb.SIGINT
+    assert namespace['os'].O_RDONLY == stdlb.O_RDONLY
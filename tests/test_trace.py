@@ -0,0 +1,102 @@
+"""Test usage tracing (STDLB_TRACE), and the trimmed profiles built from traces."""
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import stdlb
+from stdlb import _trace
+from stdlb._index import build_exports, export_owners, is_exception
+
+SRC_DIR = str(Path(stdlb.__file__).parent.parent)
+
+
+def run_traced(code, path):
+    env = dict(os.environ, PYTHONPATH=SRC_DIR, STDLB_TRACE=str(path))
+    env.pop('STDLB_LAZY', None)
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, env=env, check=True)
+    return result.stdout
+
+
+def test_merge():
+    trace = {'runs': 1, 'names': {'Path': {'spec': 'pathlib:Path', 'sessions': 1}}}
+    _trace.merge(trace, {'sqrt': 'math:sqrt', 'Path': 'pathlib:Path'})
+    assert trace == {
+        'runs': 2,
+        'names': {
+            'Path': {'spec': 'pathlib:Path', 'sessions': 2},
+            'sqrt': {'spec': 'math:sqrt', 'sessions': 1},
+        },
+    }
+
+
+def test_trace_path():
+    assert _trace.trace_path(None) is None
+    assert _trace.trace_path('0') is None
+    assert _trace.trace_path('1') == _trace.default_path()
+    assert _trace.trace_path('/tmp/t.json') == '/tmp/t.json'
+
+
+def test_traces_only_used_names(tmp_path):
+    path = tmp_path / 'trace.json'
+    out = run_traced(
+        "from stdlb import *\n"
+        "print(Path('a/b').name, join('a', 'b'), cached_property.__name__, 'uuid' in sys.modules)",
+        path,
+    )
+    assert out.split() == ['b', 'a/b', 'cached_property', 'False']
+    # Attribute access returns a proxy too: only names that are then used are recorded
+    run_traced("import stdlb; stdlb.sqrt(4); stdlb.Path('a'); stdlb.Decimal", path)
+    trace = json.loads(path.read_text())
+    assert trace['runs'] == 2
+    # Exception classes aren't proxied (see `test_traces_exception_classes`)
+    names = {name: use for name, use in trace['names'].items() if not is_exception(name)}
+    assert names == {
+        'Path': {'spec': 'pathlib:Path', 'sessions': 2},
+        'cached_property': {'spec': 'stdlb.cached_property:cached_property', 'sessions': 1},
+        'join': {'spec': 'os.path:join', 'sessions': 1},
+        'sqrt': {'spec': 'math:sqrt', 'sessions': 1},
+        'sys': {'spec': 'sys', 'sessions': 1},
+    }
+
+
+def test_traces_names_used_as_operands(tmp_path):
+    """Proxies support operators, and record the names they stand in for when used."""
+    path = tmp_path / 'trace.json'
+    out = run_traced("from stdlb import *\nprint(sep + 'x', pi * 2 > 6, maxsize > 1, -inf < 0, f'{e:.1f}')", path)
+    assert out.split() == ['/x' if os.sep == '/' else '\\x', 'True', 'True', 'True', '2.7']
+    names = json.loads(path.read_text())['names']
+    assert sorted(name for name in names if not is_exception(name)) == ['e', 'inf', 'maxsize', 'pi', 'sep']
+
+
+def test_traces_exception_classes(tmp_path):
+    """Exception classes are bound as themselves (for `except`), and recorded when bound."""
+    path = tmp_path / 'trace.json'
+    out = run_traced(
+        "from stdlb import *\n"
+        "try:\n"
+        "    JSONDecoder().decode('{')\n"
+        "except JSONDecodeError:\n"
+        "    print('caught')",
+        path,
+    )
+    assert out == 'caught\n'
+    names = json.loads(path.read_text())['names']
+    assert names['JSONDecodeError'] == {'spec': 'json:JSONDecodeError', 'sessions': 1}
+    assert names['CalledProcessError'] == {'spec': 'subprocess:CalledProcessError', 'sessions': 1}
+
+
+def test_owner_subsets_bind_names_like_full_namespace():
+    """Star-importing just the module that owns a name binds it to the same object."""
+    full = build_exports()
+    owners = export_owners()
+    by_owner = {}
+    for name, owner in owners.items():
+        if owner not in ('builtins', None):
+            by_owner.setdefault(owner, []).append(name)
+    changed = []
+    for owner, names in by_owner.items():
+        subset = build_exports([owner], custom=False)
+        changed += [name for name in names if subset.get(name) != full[name]]
+    assert not changed, changed
@@ -0,0 +1,165 @@
+"""Test `stdlb serve`/`stdlb run`: scripts forked from a warm server, and the cold fallback."""
+import os
+import select
+import socket
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import stdlb
+from stdlb._zygote_client import check_server
+
+SRC_DIR = str(Path(stdlb.__file__).parent.parent)
+CLIENT = str(Path(stdlb.__file__).parent / '_zygote_client.py')
+
+pytestmark = pytest.mark.skipif(not sys.platform.startswith('linux'), reason='stdlb serve requires Linux')
+
+SCRIPT = """from stdlb import *
+import sys
+print(getppid(), file=sys.stderr)
+print(sys.argv[1:], Path.cwd().name, environ.get('FOO'), sys.stdin.read().strip(), sqrt(16))
+sys.exit(int(sys.argv[1]))
+"""
+
+
+@pytest.fixture
+def env(tmp_path):
+    env = dict(os.environ, PYTHONPATH=SRC_DIR, STDLB_ZYGOTE_SOCKET=str(tmp_path / 'run' / 'zygote.sock'))
+    for var in ('STDLB_LAZY', 'STDLB_TRACE'):
+        env.pop(var, None)
+    return env
+
+
+@pytest.fixture
+def server(env):
+    socket = Path(env['STDLB_ZYGOTE_SOCKET'])
+    proc = subprocess.Popen([sys.executable, '-m', 'stdlb', 'serve'], env=env, stderr=subprocess.PIPE, text=True)
+    assert 'listening on' in proc.stderr.readline()
+    yield proc
+    proc.terminate()
+    proc.wait(timeout=10)
+    assert not socket.exists()
+
+
+@pytest.fixture
+def script(tmp_path):
+    cwd = tmp_path / 'cwd'
+    cwd.mkdir()
+    path = tmp_path / 'script.py'
+    path.write_text(SCRIPT)
+    return path
+
+
+def run(args, env, script):
+    return subprocess.run(
+        [*args, str(script), '3', 'x'], input='piped', capture_output=True, text=True,
+        env=dict(env, FOO='bar'), cwd=script.parent / 'cwd', timeout=60,
+    )
+
+
+@pytest.mark.parametrize('args', [
+    [sys.executable, '-m', 'stdlb', 'run'],
+    [sys.executable, '-S', '-E', CLIENT],
+])
+def test_run_via_server(server, env, script, args):
+    proc = run(args, env, script)
+    assert proc.stdout == "['3', 'x'] cwd bar piped 4.0\n"
+    assert proc.returncode == 3
+    # Forked by the server
+    assert proc.stderr == f"{server.pid}\n"
+
+
+EXIT_SCRIPT = """import atexit, sys
+log = open(sys.argv[1], 'w')
+log.write('never closed')
+atexit.register(print, 'atexit ran')
+"""
+
+
+def test_run_finalizes_like_interpreter_exit(server, env, tmp_path):
+    """`atexit` handlers run, and files the script leaves open are flushed."""
+    script = tmp_path / 'exit.py'
+    script.write_text(EXIT_SCRIPT)
+    log = tmp_path / 'log.txt'
+    proc = subprocess.run(
+        [sys.executable, '-m', 'stdlb', 'run', str(script), str(log)],
+        capture_output=True, text=True, env=env, timeout=60,
+    )
+    assert (proc.returncode, proc.stdout, proc.stderr) == (0, 'atexit ran\n', '')
+    assert log.read_text() == 'never closed'
+
+
+def test_serve_survives_bad_and_stalled_clients(server, env, script):
+    """A malformed request's fds are closed, and a client that sends nothing times out."""
+    path = env['STDLB_ZYGOTE_SOCKET']
+    r, w = os.pipe()
+    with socket.socket(socket.AF_UNIX) as bad:
+        bad.connect(path)
+        fds = w.to_bytes(4, sys.byteorder)
+        bad.sendmsg([(1).to_bytes(4, 'little') + b'{'], [(socket.SOL_SOCKET, socket.SCM_RIGHTS, fds)])
+        os.close(w)
+        # EOF once the server has closed its copy of `w`, too
+        assert select.select([r], [], [], 30)[0] == [r]
+        assert os.read(r, 1) == b''
+    os.close(r)
+    assert 'SyntaxError' in server.stderr.readline()
+
+    with socket.socket(socket.AF_UNIX) as stalled:
+        stalled.connect(path)
+        proc = run([sys.executable, '-m', 'stdlb', 'run'], env, script)
+    assert proc.stdout == "['3', 'x'] cwd bar piped 4.0\n"
+    assert 'timed out' in server.stderr.readline()
+
+
+def test_run_without_server_runs_cold(env, script):
+    proc = run([sys.executable, '-m', 'stdlb', 'run'], env, script)
+    assert proc.stdout == "['3', 'x'] cwd bar piped 4.0\n"
+    assert proc.returncode == 3
+
+
+def test_serve_refuses_second_server(server, env):
+    proc = subprocess.run([sys.executable, '-m', 'stdlb', 'serve'], env=env, capture_output=True, text=True, timeout=60)
+    assert proc.returncode == 1
+    assert proc.stderr == f"stdlb serve: A server is already listening on {env['STDLB_ZYGOTE_SOCKET']}\n"
+
+
+def test_run_refuses_shared_socket_dir(server, env, script):
+    directory = Path(env['STDLB_ZYGOTE_SOCKET']).parent
+    directory.chmod(0o755)
+    proc = run([sys.executable, '-m', 'stdlb', 'run'], env, script)
+    assert proc.stdout == "['3', 'x'] cwd bar piped 4.0\n"
+    assert proc.returncode == 3
+    # Run cold, not by the server
+    warning, ppid = proc.stderr.splitlines()
+    assert warning == (
+        f"stdlb run: not using the server at {env['STDLB_ZYGOTE_SOCKET']}: "
+        f"{directory} is accessible to other users (mode 755, should be 700)"
+    )
+    assert ppid != str(server.pid)
+
+
+def test_serve_refuses_shared_socket_dir(env):
+    directory = Path(env['STDLB_ZYGOTE_SOCKET']).parent
+    directory.mkdir(mode=0o777)
+    directory.chmod(0o777)
+    proc = subprocess.run([sys.executable, '-m', 'stdlb', 'serve'], env=env, capture_output=True, text=True, timeout=60)
+    assert proc.returncode == 1
+    assert proc.stderr == (
+        f"stdlb serve: Refusing to listen on {env['STDLB_ZYGOTE_SOCKET']}: "
+        f"{directory} is accessible to other users (mode 777, should be 700)\n"
+    )
+
+
+def test_check_server(tmp_path, monkeypatch):
+    path = str(tmp_path / 'run' / 'zygote.sock')
+    (tmp_path / 'run').mkdir(mode=0o700)
+    a, b = socket.socketpair(socket.AF_UNIX)
+    with a, b:
+        assert check_server(a, path) is None
+        uid = os.getuid()
+        monkeypatch.setattr(os, 'getuid', lambda: uid + 1)
+        assert check_server(a, path) == f"{tmp_path / 'run'} is owned by uid {uid}, not {uid + 1}"
+        monkeypatch.setattr('stdlb._zygote_client.check_socket_dir', lambda path: None)
+        assert check_server(a, path) == f"the server runs as uid {uid}, not {uid + 1}"